@@ -0,0 +1,98 @@
+"""
+Per-URL cost of the subresource blocklist check.
+
+Times adblockparser's `AdblockRules.should_block` against `AdblockMatcher` on the fanboy list
+shipped in src/assets, over a corpus of URLs derived from the list's own rules (so most
+are blocked) plus ordinary page assets. The matcher is timed cold (a fresh engine per
+pass, so every URL misses the memo) and warm (every URL already memoized, the steady state
+when a browser re-requests the same assets across pages of one site). Run from the
+AscendWebSearch directory:
+
+    python -m benchmarks.bench_adblock_matcher [--urls N]
+"""
+
+import argparse
+import json
+import sys
+import time
+from collections.abc import Callable
+
+from adblockparser import AdblockRules
+
+from src.config.blocklist_loader import BlocklistLoader
+from src.validator.adblock_matcher import AdblockMatcher
+
+_PAGE_ASSETS = [
+    "https://www.example.com/static/css/main.3f2a1c.css",
+    "https://www.example.com/static/js/vendor.bundle.js?v=20240101",
+    "https://fonts.gstatic.com/s/roboto/v30/KFOmCnqEu92Fr1Mu4mxK.woff2",
+    "https://cdn.jsdelivr.net/npm/bootstrap@5.3.0/dist/js/bootstrap.bundle.min.js",
+    "https://images.example.org/photos/2024/06/article-hero-1200x630.jpg",
+    "https://api.example.com/v1/articles/12345/comments?page=2",
+]
+
+
+def _corpus(rules: AdblockRules, size: int) -> list[str]:
+    urls = list(_PAGE_ASSETS)
+    for rule in rules.rules:
+        text = rule.rule_text.removesuffix("|")
+        if text.startswith("/") and text.endswith("/"):
+            continue
+        if text.startswith("||"):
+            url = f"https://{text[2:]}"
+        elif text.startswith("|"):
+            url = text[1:]
+        else:
+            url = f"https://www.example.com{'' if text.startswith('/') else '/'}{text}"
+        urls.append(url.replace("^", "/").replace("*", "abc"))
+
+    # Browsers hand route handlers percent-encoded URLs; non-ASCII ones take the adblockparser path.
+    return [url for url in dict.fromkeys(urls) if url.isascii()][:size]
+
+
+def _us_per_url(check: Callable[[str], bool], urls: list[str]) -> float:
+    started = time.perf_counter()
+    for url in urls:
+        check(url)
+
+    return (time.perf_counter() - started) / len(urls) * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--urls", type=int, default=2000)
+    args = parser.parse_args()
+
+    rules = BlocklistLoader().parse_rules()
+    # Distinct URLs, so the cold passes never hit the memo.
+    urls = _corpus(rules, args.urls)
+
+    started = time.perf_counter()
+    matcher = AdblockMatcher.from_rules(rules)
+    build_ms = (time.perf_counter() - started) * 1000
+
+    # Also fills the memo for the warm pass.
+    blocked = sum(map(matcher.should_block, urls))
+    # Best of five; a fresh matcher per cold pass, since the first pass also fills the memo.
+    adblockparser_us = min(_us_per_url(rules.should_block, urls) for _ in range(5))
+    cold_us = min(_us_per_url(AdblockMatcher.from_rules(rules).should_block, urls) for _ in range(5))
+    warm_us = min(_us_per_url(matcher.should_block, urls) for _ in range(5))
+
+    report = {
+        "urls": len(urls),
+        "blocked": blocked,
+        "matcher_build_ms": round(build_ms, 1),
+        "us_per_url": {
+            "adblockparser": round(adblockparser_us, 2),
+            "matcher_cold": round(cold_us, 2),
+            "matcher_memoized": round(warm_us, 2),
+        },
+        "speedup_cold": round(adblockparser_us / cold_us, 1),
+    }
+    sys.stdout.write(json.dumps(report, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
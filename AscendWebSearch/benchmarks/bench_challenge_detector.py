@@ -0,0 +1,143 @@
+"""
+Per-poll cost of the challenge checks the browser tiers run on every `page.content()`.
+
+Times the pre-compilation `ChallengeDetector` (reproduced below: a dictionary walk per call, a
+case-insensitive Ray ID regex, and a hard skip of pages over 50 KB) against the current one,
+calling `is_login_required` then `is_blocked` the way `PlaywrightStrategy` polls. The corpus is
+fixtures/challenge_pages (Cloudflare interstitial and Turnstile, DataDome, PerimeterX, a login
+wall and a normal article), the SearXNG results page, and two long pages built from the article:
+a clean one and one carrying a Turnstile widget at the end of <body>. The report also lists each
+detector's verdict per page, so a regression in what is caught shows next to the timing. Run
+from the AscendWebSearch directory:
+
+    python -m benchmarks.bench_challenge_detector [--iterations N] [--long-page-kb K]
+"""
+
+import argparse
+import json
+import re
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from src.reader.cloudflare.challenge_detector import _BOT_DICT, ChallengeDetector
+
+_FIXTURES = Path(__file__).parent / "fixtures"
+_URL = "https://www.example.com/page"
+
+# Verdict each page should get: "login", "blocked" or "clean".
+_EXPECTED = {
+    "cloudflare_interstitial": "blocked",
+    "cloudflare_turnstile": "blocked",
+    "datadome_block": "blocked",
+    "perimeterx_block": "blocked",
+    "login_wall": "login",
+    "article": "clean",
+    "searxng_results": "clean",
+    "long_article": "clean",
+    "long_article_turnstile": "blocked",
+}
+
+
+def _legacy_is_blocked(status_code: int, html_content: str) -> bool:
+    if not html_content:
+        return status_code in (403, 429, 503)
+    if len(html_content) > 50000:
+        return False
+    for signature in _BOT_DICT.get("waf_script_signatures", []):
+        if signature in html_content:
+            return True
+    for phrase in _BOT_DICT.get("waf_strict_phrases", []):
+        if phrase in html_content:
+            return True
+    if re.search(r"Ray ID: \w+", html_content, re.IGNORECASE):
+        return True
+    if "cf-turnstile" in html_content:
+        return True
+
+    return "cf_clearance" in html_content
+
+
+def _legacy_is_login_required(url: str, html_content: str) -> bool:  # noqa: ARG001
+    if not html_content or len(html_content) > 50000:
+        return False
+    for match in re.finditer(r"<title[^>]*>(.*?)</title>", html_content, re.IGNORECASE | re.DOTALL):
+        title_text = match.group(1).strip().lower()
+        if any(pattern in title_text for pattern in _BOT_DICT.get("login_title_patterns", [])):
+            return True
+
+    return False
+
+
+Detector = tuple[Callable[[str, str], bool], Callable[[int, str], bool]]
+_DETECTORS: dict[str, Detector] = {
+    "legacy": (_legacy_is_login_required, _legacy_is_blocked),
+    "compiled": (ChallengeDetector.is_login_required, ChallengeDetector.is_blocked),
+}
+
+
+def _corpus(long_page_kb: int) -> dict[str, str]:
+    pages = {
+        path.stem: path.read_text(encoding="utf-8") for path in (_FIXTURES / "challenge_pages").glob("*.html")
+    }
+    pages["searxng_results"] = (_FIXTURES / "searxng_results.html").read_text(encoding="utf-8")
+
+    head, _, rest = pages["article"].partition("<article>")
+    body, _, tail = rest.partition("</article>")
+    repeats = long_page_kb * 1024 // len(body) + 1
+    long_article = f"{head}<article>{body * repeats}</article>{tail}"
+    pages["long_article"] = long_article
+    pages["long_article_turnstile"] = long_article.replace(
+        "</body>", '<div class="cf-turnstile" data-sitekey="0x4AAAAAAAB1cD2eF3gH4iJ5"></div></body>'
+    )
+
+    return {name: pages[name] for name in _EXPECTED}
+
+
+def _verdict(detector: Detector, html: str) -> str:
+    is_login_required, is_blocked = detector
+    if is_login_required(_URL, html):
+        return "login"
+
+    return "blocked" if is_blocked(200, html) else "clean"
+
+
+def _us_per_poll(detector: Detector, html: str, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        _verdict(detector, html)
+
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--long-page-kb", type=int, default=400)
+    args = parser.parse_args()
+
+    pages = _corpus(args.long_page_kb)
+    report: dict[str, object] = {}
+    for name, html in pages.items():
+        entry: dict[str, object] = {"chars": len(html), "expected": _EXPECTED[name]}
+        for variant, detector in _DETECTORS.items():
+            entry[f"{variant}_verdict"] = _verdict(detector, html)
+            # Best of five.
+            entry[f"{variant}_us_per_poll"] = round(
+                min(_us_per_poll(detector, html, args.iterations) for _ in range(5)), 2
+            )
+        report[name] = entry
+
+    totals = {
+        f"{variant}_correct": sum(_verdict(d, html) == _EXPECTED[name] for name, html in pages.items())
+        for variant, d in _DETECTORS.items()
+    }
+    json.dump({"iterations": args.iterations, "pages": len(pages), **totals, **report}, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
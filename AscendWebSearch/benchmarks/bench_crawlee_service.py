@@ -0,0 +1,131 @@
+"""
+Tier-5 read latency: a new AdaptivePlaywrightCrawler (and browser) per read versus the
+long-lived CrawleeService on the pooled Chromium.
+
+Serves the fixture article from a local stand-in server and reads it `--reads` times in a row
+with each variant. The per-read variant is the old CrawleeStrategy.get_html reproduced below:
+build a crawler, run it for one URL, tear it down. The service variant starts the BrowserPool
+once, then calls crawlee_service.fetch. The report gives the median and first read in ms;
+the first service read includes starting the crawler, later ones only the request itself.
+Both variants follow PLAYWRIGHT_HEADLESS and need a Chromium that Playwright can launch
+(`playwright install chromium`). Run from the AscendWebSearch directory:
+
+    python -m benchmarks.bench_crawlee_service [--reads N]
+"""
+
+from src.config.compat import apply_compatibility_patches
+
+apply_compatibility_patches()
+
+import argparse  # noqa: E402
+import asyncio  # noqa: E402
+import json  # noqa: E402
+import statistics  # noqa: E402
+import sys  # noqa: E402
+import threading  # noqa: E402
+import time  # noqa: E402
+from collections.abc import Awaitable, Callable  # noqa: E402
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer  # noqa: E402
+from pathlib import Path  # noqa: E402
+from typing import Any  # noqa: E402
+
+from crawlee.crawlers import AdaptivePlaywrightCrawler  # noqa: E402
+
+from src.config.config import settings  # noqa: E402
+from src.runtime.browser_pool import browser_pool  # noqa: E402
+from src.runtime.crawlee_service import CrawleeService  # noqa: E402
+
+_ARTICLE = (Path(__file__).parent / "fixtures" / "challenge_pages" / "article.html").read_bytes()
+
+Read = Callable[[str], Awaitable[str]]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(_ARTICLE)))
+        self.end_headers()
+        self.wfile.write(_ARTICLE)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002, ARG002 - quiets the per-request access log
+        return
+
+
+async def _per_read_crawler(url: str) -> str:
+    result = {"html": ""}
+    playwright_kwargs: Any = {
+        "headless": settings.PLAYWRIGHT_HEADLESS,
+        "browser_launch_options": {"chromium_sandbox": False},
+    }
+    crawler = AdaptivePlaywrightCrawler.with_beautifulsoup_static_parser(
+        max_requests_per_crawl=5, playwright_crawler_specific_kwargs=playwright_kwargs
+    )
+
+    @crawler.router.default_handler
+    async def request_handler(context: Any) -> None:
+        result["html"] = await CrawleeService._context_html(context)
+
+    await crawler.run([url])
+
+    return result["html"]
+
+
+async def _measure(read: Read, url: str, reads: int) -> dict[str, object]:
+    durations = []
+    for _ in range(reads):
+        started = time.perf_counter()
+        html = await read(url)
+        durations.append(time.perf_counter() - started)
+        if not html:
+            raise SystemExit("bench_crawlee_service: a read returned no HTML")
+
+    return {
+        "first_read_ms": round(durations[0] * 1000, 1),
+        "median_ms": round(statistics.median(durations) * 1000, 1),
+    }
+
+
+async def _run(url: str, reads: int) -> dict[str, object]:
+    report: dict[str, object] = {"per_read_crawler": await _measure(_per_read_crawler, url, reads)}
+
+    await browser_pool.start()
+    service = CrawleeService()
+    try:
+        report["crawlee_service"] = await _measure(service.fetch, url, reads)
+    finally:
+        await service.stop()
+        await browser_pool.stop()
+
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--reads", type=int, default=10)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    try:
+        report = asyncio.run(_run(f"http://127.0.0.1:{server.server_address[1]}/article", args.reads))
+    finally:
+        server.shutdown()
+
+    json.dump(
+        {"reads": args.reads, "headless": settings.PLAYWRIGHT_HEADLESS, **report},
+        sys.stdout,
+        indent=2,
+    )
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
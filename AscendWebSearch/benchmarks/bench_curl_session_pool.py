@@ -0,0 +1,170 @@
+"""
+Per-fetch cost of a fresh curl_cffi session versus the pooled, keep-alive session.
+
+Serves a ~50 KB page over TLS from a local stand-in server (a throwaway self-signed
+certificate made with the `openssl` CLI) and fetches it sequentially, the way an agent reads
+several pages of one site in a row, and in concurrent bursts, the way batch reads and hedged
+tiers do. The server counts accepted TCP connections, so the report shows how many
+handshakes each variant paid for. A loopback handshake is far cheaper than one across the
+internet, so the absolute saving here is a lower bound. Run from the AscendWebSearch
+directory:
+
+    python -m benchmarks.bench_curl_session_pool [--fetches N] [--concurrency C]
+"""
+
+import argparse
+import asyncio
+import json
+import shutil
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from curl_cffi import requests
+
+from src.runtime.curl_session_pool import CurlSessionPool
+
+_BODY = (
+    b"<html><body>" + b"<p>Lorem ipsum dolor sit amet, consectetur adipiscing.</p>" * 900 + b"</body></html>"
+)
+_IMPERSONATE = "chrome120"
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are separate writes; with Nagle on, delayed ACKs add ~40 ms per response.
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(_BODY)))
+        self.end_headers()
+        self.wfile.write(_BODY)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002, ARG002 - quiets the per-request access log
+        return
+
+
+class _CountingServer(ThreadingHTTPServer):
+    daemon_threads = True
+    connections = 0
+
+    def get_request(self):  # type: ignore[no-untyped-def]
+        request = super().get_request()
+        self.connections += 1
+
+        return request
+
+
+def _self_signed_context(directory: Path) -> ssl.SSLContext:
+    cert, key = directory / "cert.pem", directory / "key.pem"
+    openssl = shutil.which("openssl")
+    if openssl is None:
+        raise SystemExit("bench_curl_session_pool needs the openssl CLI to make a throwaway certificate")
+
+    # Fixed argument list; nothing user-supplied reaches the command.
+    subprocess.run(  # noqa: S603
+        [
+            openssl,
+            "req",
+            "-x509",
+            "-newkey",
+            "rsa:2048",
+            "-nodes",
+            "-days",
+            "1",
+            "-subj",
+            "/CN=localhost",
+            "-keyout",
+            str(key),
+            "-out",
+            str(cert),
+        ],
+        check=True,
+        capture_output=True,
+    )
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert, key)
+
+    return context
+
+
+async def _fresh_session_fetch(url: str) -> None:
+    # The pre-pool behaviour: a new session, and so a new connection, per fetch.
+    async with requests.AsyncSession(impersonate=_IMPERSONATE) as session:  # type: ignore[arg-type]
+        (await session.get(url, verify=False)).raise_for_status()
+
+
+def _pooled_fetch(pool: CurlSessionPool) -> Callable[[str], Awaitable[None]]:
+    async def fetch(url: str) -> None:
+        async with pool.session(url, impersonate=_IMPERSONATE) as session:
+            (await session.get(url, verify=False, discard_cookies=True)).raise_for_status()
+
+    return fetch
+
+
+async def _ms_per_fetch(
+    fetch: Callable[[str], Awaitable[None]], url: str, fetches: int, concurrency: int
+) -> float:
+    started = time.perf_counter()
+    for _ in range(fetches // concurrency):
+        await asyncio.gather(*(fetch(url) for _ in range(concurrency)))
+
+    return (time.perf_counter() - started) / (fetches // concurrency * concurrency) * 1000
+
+
+async def _run(server: _CountingServer, url: str, fetches: int, concurrency: int) -> dict[str, object]:
+    report: dict[str, object] = {}
+    for mode, burst in (("sequential", 1), ("concurrent", concurrency)):
+        for variant in ("fresh_session", "pooled_session"):
+            pool = CurlSessionPool()
+            fetch = _fresh_session_fetch if variant == "fresh_session" else _pooled_fetch(pool)
+            await fetch(url)  # warm-up: imports, first handshake, page cache
+            server.connections = 0
+            ms = await _ms_per_fetch(fetch, url, fetches, burst)
+            report[f"{mode}_{variant}"] = {
+                "ms_per_fetch": round(ms, 3),
+                "tcp_connections": server.connections,
+            }
+            await pool.close()
+
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--fetches", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        context = _self_signed_context(Path(directory))
+    server = _CountingServer(("127.0.0.1", 0), _Handler)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"https://localhost:{server.server_address[1]}/article"
+
+    try:
+        report = asyncio.run(_run(server, url, args.fetches, args.concurrency))
+    finally:
+        server.shutdown()
+
+    json.dump(
+        {"fetches": args.fetches, "concurrency": args.concurrency, "body_bytes": len(_BODY), **report},
+        sys.stdout,
+        indent=2,
+    )
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
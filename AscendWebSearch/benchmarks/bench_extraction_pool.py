@@ -0,0 +1,119 @@
+"""
+Event-loop stalls while extracting large pages: inline trafilatura versus the ExtractionPool.
+
+Builds a page of roughly `--kb` KB from the article fixture and extracts it `--pages` times,
+`--concurrency` at a time, the way a batch read or a research call handles several big pages
+at once. A probe task sleeps 10 ms in a loop alongside and records how late each wake-up is,
+which is what every concurrent search and read on the loop experiences. The report gives the
+wall time, and the median and worst probe lag, per variant. Run from the AscendWebSearch
+directory:
+
+    python -m benchmarks.bench_extraction_pool [--kb 1000] [--pages 8] [--concurrency 4]
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from pathlib import Path
+
+from src.config.config import settings
+from src.reader.html_utils import extract_main_text
+from src.runtime.extraction_pool import ExtractionPool
+
+_ARTICLE = (Path(__file__).parent / "fixtures" / "challenge_pages" / "article.html").read_text(
+    encoding="utf-8"
+)
+_PARAGRAPH = "<p>The service keeps one crawler alive and hands every result back through a future.</p>"
+_PROBE_INTERVAL_S = 0.01
+
+Extract = Callable[[str], Awaitable[str]]
+
+
+def _page(kb: int) -> str:
+    head, tail = _ARTICLE.split("</main>", 1)
+    repeats = max(1, kb * 1024 // len(_PARAGRAPH))
+
+    return f"{head}{_PARAGRAPH * repeats}</main>{tail}"
+
+
+async def _inline(html: str) -> str:
+    # The pre-pool behaviour: the strategy called trafilatura directly inside its coroutine.
+    return extract_main_text(html)
+
+
+async def _probe(lags: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(_PROBE_INTERVAL_S)
+        lags.append(time.perf_counter() - started - _PROBE_INTERVAL_S)
+
+
+async def _measure(extract: Extract, html: str, pages: int, concurrency: int) -> dict[str, object]:
+    lags: list[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe(lags, stop))
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one() -> None:
+        async with semaphore:
+            await extract(html)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(pages)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await probe
+
+    return {
+        "wall_ms": round(elapsed * 1000, 1),
+        "median_loop_lag_ms": round(statistics.median(lags) * 1000, 2),
+        "max_loop_lag_ms": round(max(lags) * 1000, 2),
+    }
+
+
+async def _run(html: str, pages: int, concurrency: int) -> dict[str, object]:
+    pool = ExtractionPool()
+    try:
+        await pool.run(extract_main_text, html)  # warm-up: spawn the workers, import trafilatura
+        return {
+            "inline": await _measure(_inline, html, pages, concurrency),
+            "extraction_pool": await _measure(
+                lambda page: pool.run(extract_main_text, page), html, pages, concurrency
+            ),
+        }
+    finally:
+        pool.close()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--kb", type=int, default=1000)
+    parser.add_argument("--pages", type=int, default=8)
+    parser.add_argument("--concurrency", type=int, default=4)
+    args = parser.parse_args()
+
+    html = _page(args.kb)
+    report = asyncio.run(_run(html, args.pages, args.concurrency))
+
+    json.dump(
+        {
+            "page_chars": len(html),
+            "pages": args.pages,
+            "concurrency": args.concurrency,
+            "workers": settings.EXTRACTION_POOL_WORKERS,
+            **report,
+        },
+        sys.stdout,
+        indent=2,
+    )
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
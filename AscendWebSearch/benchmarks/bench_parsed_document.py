@@ -0,0 +1,137 @@
+"""
+Link annotation and text extraction on large pages: BeautifulSoup with html.parser versus
+the single lxml ParsedDocument.
+
+Builds a page of roughly `--kb` KB from the article fixture, padded with paragraphs that
+each carry a link, an inline script and a comment, and times each text product `--repeat`
+times. The BeautifulSoup variants are the old annotate_links and extract_visible_text
+reproduced below; main_text compares trafilatura on the raw string with trafilatura on the
+ParsedDocument tree. Every variant pair must produce identical output or the run aborts.
+The report gives the median ms per call. Run from the AscendWebSearch directory:
+
+    python -m benchmarks.bench_parsed_document [--kb 1000] [--repeat 5]
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+import trafilatura
+from bs4 import BeautifulSoup
+
+from src.reader.html_utils import NOISE_TAGS, extract_main_text, extract_visible_text
+from src.reader.link_annotator import LINK_MARKER_TEMPLATE, _resolve_absolute_url, annotate_links
+
+_ARTICLE = (Path(__file__).parent / "fixtures" / "challenge_pages" / "article.html").read_text(
+    encoding="utf-8"
+)
+_PARAGRAPH = (
+    "<p>The service keeps one crawler alive<script>track()</script> and hands every"
+    ' <a href="/docs/{n}">result <b>{n}</b></a> back<!-- slot --> through a future.</p>'
+)
+_BASE_URL = "https://example.com/article"
+
+
+def _page(kb: int) -> str:
+    head, tail = _ARTICLE.split("</main>", 1)
+    repeats = max(1, kb * 1024 // len(_PARAGRAPH))
+    body = "".join(_PARAGRAPH.format(n=n) for n in range(repeats))
+
+    return f"{head}{body}</main>{tail}"
+
+
+def _soup_without_noise(html: str) -> BeautifulSoup:
+    soup = BeautifulSoup(html, "html.parser")
+    for tag in soup(list(NOISE_TAGS)):
+        tag.decompose()
+
+    return soup
+
+
+def _bs4_annotate_links(html: str) -> tuple[str, dict[int, str]]:
+    soup = _soup_without_noise(html)
+    link_map: dict[int, str] = {}
+    for anchor in soup.find_all("a", href=True):
+        absolute_url = _resolve_absolute_url(str(anchor["href"]), _BASE_URL)
+        if not absolute_url:
+            continue
+        anchor.string = (
+            f"{anchor.get_text(strip=True)} {LINK_MARKER_TEMPLATE.format(index=len(link_map) + 1)}"
+        )
+        link_map[len(link_map) + 1] = absolute_url
+
+    return soup.get_text(separator=" ", strip=True), link_map
+
+
+def _bs4_visible_text(html: str) -> str:
+    return _soup_without_noise(html).get_text(separator=" ", strip=True)
+
+
+def _raw_main_text(html: str) -> str:
+    return trafilatura.extract(html) or ""
+
+
+def _median_ms(func: Callable[[str], object], html: str, repeat: int) -> tuple[float, object]:
+    durations = []
+    result: object = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = func(html)
+        durations.append(time.perf_counter() - started)
+
+    return round(statistics.median(durations) * 1000, 1), result
+
+
+def _compare(
+    name: str,
+    old: tuple[str, Callable[[str], object]],
+    new: Callable[[str], object],
+    html: str,
+    repeat: int,
+) -> dict[str, float]:
+    old_label, old_func = old
+    old_ms, old_result = _median_ms(old_func, html, repeat)
+    new_ms, new_result = _median_ms(new, html, repeat)
+    if old_result != new_result:
+        raise SystemExit(f"bench_parsed_document: {name} output differs from the {old_label} path")
+
+    return {f"{old_label}_ms": old_ms, "parsed_document_ms": new_ms}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--kb", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    html = _page(args.kb)
+    report = {
+        "page_chars": len(html),
+        "repeat": args.repeat,
+        "annotate_links": _compare(
+            "annotate_links",
+            ("beautifulsoup", _bs4_annotate_links),
+            lambda page: annotate_links(page, _BASE_URL),
+            html,
+            args.repeat,
+        ),
+        "visible_text": _compare(
+            "visible_text", ("beautifulsoup", _bs4_visible_text), extract_visible_text, html, args.repeat
+        ),
+        "main_text": _compare(
+            "main_text", ("raw_string", _raw_main_text), extract_main_text, html, args.repeat
+        ),
+    }
+
+    json.dump(report, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,198 @@
+"""
+Render time and CPU of the Playwright tier: the old page.content() polling loop versus the
+event-driven readiness observer.
+
+Serves two pages from a local stand-in server: the fixture article with a script that
+hydrates more content 300 ms after load (the usual client-rendered shape), and the
+Cloudflare interstitial fixture. Each page is rendered `--renders` times with each variant on
+one warm page. The legacy variant is the old loop reproduced below: page.content() plus a
+one-second networkidle wait per round, then a fixed DYNAMIC_CONTENT_WAIT sleep. The readiness
+variant is PlaywrightStrategy's wait on PageReadiness events. The report gives the median
+render time, and the CPU per render spent in this process and in its children (the
+Playwright driver and Chromium). Needs a Chromium that Playwright can launch
+(`playwright install chromium`, or pass `--executable-path`). Run from the AscendWebSearch
+directory:
+
+    python -m benchmarks.bench_playwright_readiness [--renders N] [--executable-path PATH]
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import sys
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import psutil
+from playwright.async_api import Page, async_playwright
+
+from src.api.exceptions import ChallengeDetectedException
+from src.config.config import settings
+from src.reader.cloudflare.challenge_detector import ChallengeDetector
+from src.reader.page_readiness import PageReadiness
+from src.reader.strategies.playwright_strategy import PlaywrightStrategy
+
+_FIXTURES = Path(__file__).parent / "fixtures" / "challenge_pages"
+_HYDRATE = (
+    "<script>window.addEventListener('load', () => setTimeout(() => {"
+    "const section = document.createElement('section');"
+    "section.innerHTML = '<h2>Comments</h2>' + '<p>Great write-up, thanks.</p>'.repeat(40);"
+    "document.querySelector('main').append(section);}, 300));</script>"
+)
+_ARTICLE = (_FIXTURES / "article.html").read_text(encoding="utf-8")
+_PAGES = {
+    "/article": _ARTICLE.replace("</body>", f"{_HYDRATE}</body>"),
+    "/challenge": (_FIXTURES / "cloudflare_interstitial.html").read_text(encoding="utf-8"),
+}
+
+Render = Callable[[Page, str], Awaitable[str]]
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self) -> None:
+        page = _PAGES.get(self.path)
+        body = page.encode() if page else b"not found"
+        self.send_response(200 if page else 404)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002, ARG002 - quiets the per-request access log
+        return
+
+
+async def _legacy_render(page: Page, url: str) -> str:
+    initial_response = await page.goto(url, wait_until="domcontentloaded")
+    for _ in range(int(settings.EXTRACT_TIMEOUT)):
+        content = await page.content()
+        status = initial_response.status if initial_response else 200
+        if ChallengeDetector.is_login_required(page.url, content):
+            raise ChallengeDetectedException(intervention_type="login")
+        if ChallengeDetector.is_blocked(status, content):
+            raise ChallengeDetectedException(intervention_type="captcha")
+        try:
+            await page.wait_for_load_state("networkidle", timeout=1000)
+            break
+        except Exception:
+            pass
+    await page.wait_for_timeout(settings.DYNAMIC_CONTENT_WAIT)
+
+    return await page.content()
+
+
+def _readiness_render(readiness: PageReadiness) -> Render:
+    async def render(page: Page, url: str) -> str:
+        with readiness.watch(page) as watch:
+            initial_response = await page.goto(url, wait_until="domcontentloaded")
+            status = initial_response.status if initial_response else 200
+            await PlaywrightStrategy._await_ready(url, page, watch, status, settings.EXTRACT_TIMEOUT)
+
+        return await page.content()
+
+    return render
+
+
+def _cpu_seconds() -> tuple[float, float]:
+    own = psutil.Process()
+    children = 0.0
+    for child in own.children(recursive=True):
+        try:
+            times = child.cpu_times()
+        except psutil.NoSuchProcess:
+            continue
+        children += times.user + times.system
+    times = own.cpu_times()
+
+    return times.user + times.system, children
+
+
+async def _measure(render: Render, page: Page, url: str, renders: int) -> dict[str, object]:
+    durations = []
+    outcome = "ok"
+    own_before, children_before = _cpu_seconds()
+    for _ in range(renders):
+        started = time.perf_counter()
+        try:
+            await render(page, url)
+        except ChallengeDetectedException as exc:
+            outcome = exc.intervention_type
+        durations.append(time.perf_counter() - started)
+        await page.goto("about:blank")
+    own_after, children_after = _cpu_seconds()
+
+    return {
+        "outcome": outcome,
+        "median_ms": round(statistics.median(durations) * 1000, 1),
+        "python_cpu_ms_per_render": round((own_after - own_before) / renders * 1000, 2),
+        "browser_cpu_ms_per_render": round((children_after - children_before) / renders * 1000, 2),
+    }
+
+
+async def _run(base_url: str, renders: int, executable_path: str | None) -> dict[str, object]:
+    report: dict[str, object] = {}
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(
+            headless=True, executable_path=executable_path, args=["--no-sandbox"]
+        )
+        readiness = PageReadiness()
+        variants: dict[str, Render] = {
+            "legacy_poll": _legacy_render,
+            "readiness": _readiness_render(readiness),
+        }
+        for variant, render in variants.items():
+            page = await browser.new_page()
+            if variant == "readiness":
+                await readiness.attach(page)
+            for path in _PAGES:
+                await _measure(render, page, base_url + path, 1)  # warm-up
+                report[f"{path.strip('/')}_{variant}"] = await _measure(
+                    render, page, base_url + path, renders
+                )
+            await page.close()
+        await browser.close()
+
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--renders", type=int, default=10)
+    parser.add_argument("--executable-path", default=None)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    try:
+        report = asyncio.run(
+            _run(f"http://127.0.0.1:{server.server_address[1]}", args.renders, args.executable_path)
+        )
+    finally:
+        server.shutdown()
+
+    json.dump(
+        {
+            "renders": args.renders,
+            "dynamic_content_wait_ms": settings.DYNAMIC_CONTENT_WAIT,
+            "dom_quiet_ms": settings.BROWSER_DOM_QUIET_MS,
+            **report,
+        },
+        sys.stdout,
+        indent=2,
+    )
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
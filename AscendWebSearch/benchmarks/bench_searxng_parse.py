@@ -0,0 +1,84 @@
+"""
+Parse micro-benchmark for SearXNG result pages.
+
+Times the client's JSON (orjson) and HTML (lxml) parsers against the saved fixtures in
+benchmarks/fixtures, alongside the BeautifulSoup html.parser implementation they replaced.
+Run from the AscendWebSearch directory:
+
+    python -m benchmarks.bench_searxng_parse [--iterations N]
+"""
+
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+from typing import Any
+
+from bs4 import BeautifulSoup
+
+from src.search.search_client import SearxngClient
+
+_FIXTURES = Path(__file__).parent / "fixtures"
+_LIMIT = 50
+
+
+def _parse_html_bs4(html_content: str, limit: int) -> list[dict[str, Any]]:
+    """The pre-JSON implementation, kept here only as the baseline."""
+    soup = BeautifulSoup(html_content, "html.parser")
+    results: list[dict[str, Any]] = []
+
+    for article in soup.select("article.result"):
+        if len(results) >= limit:
+            break
+
+        title_tag = article.select_one("h3 a")
+        if not title_tag:
+            continue
+
+        content_tag = article.select_one("p.content")
+        results.append(
+            {
+                "title": title_tag.get_text(strip=True),
+                "url": title_tag.get("href"),
+                "content": content_tag.get_text(strip=True) if content_tag else "",
+            }
+        )
+
+    return results
+
+
+def _time_per_call_ms(func: Any, iterations: int) -> float:
+    # Best of five repeats: the minimum is the least noisy estimate of the parser's own cost.
+    best = min(timeit.repeat(func, number=iterations, repeat=5))
+    return best / iterations * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    json_payload = (_FIXTURES / "searxng_results.json").read_bytes()
+    html_content = (_FIXTURES / "searxng_results.html").read_text(encoding="utf-8")
+
+    cases = {
+        "json_orjson": lambda: SearxngClient._parse_json_results(json_payload, _LIMIT),
+        "html_lxml": lambda: SearxngClient._parse_html_results(html_content, _LIMIT),
+        "html_bs4_baseline": lambda: _parse_html_bs4(html_content, _LIMIT),
+    }
+
+    report = {
+        name: {
+            "results": len(case()),
+            "ms_per_parse": round(_time_per_call_ms(case, args.iterations), 4),
+        }
+        for name, case in cases.items()
+    }
+    sys.stdout.write(json.dumps(report, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,407 @@
+"""
+End-to-end WebReader benchmark against a local origin stand-in, without the internet.
+
+A local origin serves five kinds of fixture page:
+
+- `static`: the article fixture.
+- `js`: a near-empty shell whose article only appears once a script runs.
+- `challenge`: the Cloudflare interstitial fixture with a 403.
+- `slow`: the article after `--slow-ms`.
+- `huge`: the article padded to `--huge-kb` KB.
+
+A FlareSolverr stub answers tier 3 after `--solve-ms`, returning each page as a browser would
+render it. Every kind is read `--reads` times, `--concurrency` at a time, through
+`WebReader.read` and `WebReader.read_with_links`, each read on a distinct URL.
+
+Per kind and mode the report gives:
+
+- throughput and median / p95 read latency;
+- which tier answered, and the bytes the origin served;
+- CPU per read, in this process and in its children (extraction workers, Chromium);
+- the median and worst lag of a 10 ms probe on the event loop;
+- per tier: attempts, median / p95 latency, how each attempt ended, and the characters
+  it returned.
+
+Results are JSON on stdout, for diffing between commits.
+
+Tiers 1-3 run by default. `--browser` adds the Playwright and Crawlee tiers and needs a
+Chromium that Playwright can launch. NoVNC is replaced by a stand-in that asks for a human
+at once, which is what a real read answers with. The read cache, strategy memory and the
+politeness limits are off unless asked for: every fixture page sits on one origin, so the
+first two would carry results from one kind into the next, and the third would measure the
+per-domain rate limit rather than the chain. The Redis-backed stores use their in-process
+fallback. Run from the AscendWebSearch directory:
+
+    python -m benchmarks.bench_web_reader [--reads 20] [--concurrency 4] [--browser]
+"""
+
+from src.config.compat import apply_compatibility_patches
+
+apply_compatibility_patches()
+
+import argparse  # noqa: E402
+import asyncio  # noqa: E402
+import json  # noqa: E402
+import statistics  # noqa: E402
+import sys  # noqa: E402
+import threading  # noqa: E402
+import time  # noqa: E402
+from collections import Counter  # noqa: E402
+from collections.abc import Awaitable, Callable  # noqa: E402
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer  # noqa: E402
+from pathlib import Path  # noqa: E402
+from typing import Any  # noqa: E402
+from urllib.parse import parse_qs, urlsplit  # noqa: E402
+from urllib.request import urlopen  # noqa: E402
+
+import psutil  # noqa: E402
+
+from src.api.exceptions import HumanInterventionRequiredException  # noqa: E402
+from src.config.config import settings  # noqa: E402
+from src.reader.cloudflare.cookie_manager import cookie_manager  # noqa: E402
+from src.reader.read_cache import read_cache  # noqa: E402
+from src.reader.strategies.base_strategy import BaseStrategy  # noqa: E402
+from src.reader.strategy_memory import strategy_memory  # noqa: E402
+from src.reader.web_reader import NOVNC_STRATEGY_NAME, WebReader  # noqa: E402
+from src.runtime.browser_pool import browser_pool  # noqa: E402
+from src.runtime.crawlee_service import crawlee_service  # noqa: E402
+from src.runtime.curl_session_pool import curl_session_pool  # noqa: E402
+from src.runtime.extraction_pool import extraction_pool  # noqa: E402
+
+_FIXTURES = Path(__file__).parent / "fixtures" / "challenge_pages"
+_ARTICLE = (_FIXTURES / "article.html").read_text(encoding="utf-8")
+_CHALLENGE = (_FIXTURES / "cloudflare_interstitial.html").read_text(encoding="utf-8")
+_BROWSER_TIERS = ("4-playwright_stealth", "5-crawlee_adaptive")
+_KINDS = ("static", "js", "challenge", "slow", "huge")
+_PROBE_INTERVAL_S = 0.01
+
+
+def _js_shell() -> str:
+    # What an un-rendered single-page app serves: the article only exists once the script runs.
+    payload = json.dumps(_ARTICLE).replace("</", "<\\/")
+
+    return (
+        "<!doctype html><html><head><title>Loading</title></head><body><div id='app'>Loading...</div>"
+        f"<script>document.open(); document.write({payload}); document.close();</script></body></html>"
+    )
+
+
+def _huge(kb: int) -> str:
+    head, tail = _ARTICLE.split("</main>", 1)
+    start = head.index("<main")
+    body = head[head.index(">", start) + 1 :]
+    repeats = max(1, kb * 1024 // len(body))
+    sections = "".join(f"<section id='part-{i}'>{body}</section>" for i in range(repeats))
+
+    return f"{head}{sections}</main>{tail}"
+
+
+class _Origin(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, slow_s: float, huge_kb: int) -> None:
+        super().__init__(("127.0.0.1", 0), _OriginHandler)
+        self.slow_s = slow_s
+        self.pages = {"static": _ARTICLE, "js": _js_shell(), "slow": _ARTICLE, "huge": _huge(huge_kb)}
+        self.bytes_served: Counter[str] = Counter()
+        self.lock = threading.Lock()
+
+
+class _OriginHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: _Origin
+
+    def do_HEAD(self) -> None:
+        self._respond(head=True)
+
+    def do_GET(self) -> None:
+        self._respond(head=False)
+
+    def _respond(self, head: bool) -> None:
+        parts = urlsplit(self.path)
+        kind = parts.path.strip("/").split("/", 1)[0]
+        rendered = "rendered" in parse_qs(parts.query)
+        status, page = 200, self.server.pages.get(kind)
+        if kind == "challenge":
+            status, page = 403, _CHALLENGE
+        elif kind == "js" and rendered:
+            page = _ARTICLE
+        elif page is None:
+            status, page = 404, "not found"
+        if kind == "slow":
+            time.sleep(self.server.slow_s)
+
+        body = page.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if not head:
+            self.wfile.write(body)
+            with self.server.lock:
+                self.server.bytes_served[kind] += len(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002, ARG002 - quiets the per-request access log
+        return
+
+
+class _FlareSolverrStub(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, solve_s: float) -> None:
+        super().__init__(("127.0.0.1", 0), _FlareSolverrHandler)
+        self.solve_s = solve_s
+
+
+class _FlareSolverrHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    server: _FlareSolverrStub
+
+    def do_POST(self) -> None:
+        request = json.loads(self.rfile.read(int(self.headers.get("Content-Length") or 0)))
+        time.sleep(self.server.solve_s)
+        # The solver's browser runs the page's scripts; the origin serves that result on ?rendered.
+        separator = "&" if "?" in request["url"] else "?"
+        try:
+            with urlopen(f"{request['url']}{separator}rendered=1", timeout=30) as response:  # noqa: S310 - local origin
+                status, html = response.status, response.read().decode()
+        except OSError as exc:
+            status, html = getattr(exc, "code", 502), ""
+        body = json.dumps(
+            {
+                "status": "ok",
+                "solution": {
+                    "url": request["url"],
+                    "status": status,
+                    "response": html,
+                    "headers": {},
+                    "cookies": [{"name": "cf_clearance", "value": "bench"}],
+                    "userAgent": settings.SEARXNG_USER_AGENT,
+                },
+            }
+        ).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:  # noqa: A002, ARG002 - quiets the per-request access log
+        return
+
+
+class _NoHuman:
+    """NoVNC without a browser or a human: every escalation ends in a request for intervention."""
+
+    async def extract(self, url: str) -> str:  # noqa: ARG002 - BaseStrategy signature
+        raise HumanInterventionRequiredException(settings.PUBLIC_VNC_URL)
+
+    async def get_html(self, url: str) -> str:
+        return await self.extract(url)
+
+
+class _TimedTier:
+    """Records the duration, ending and output size of every call to one tier."""
+
+    def __init__(self, strategy: BaseStrategy) -> None:
+        self.strategy = strategy
+        self.durations: list[float] = []
+        self.endings: Counter[str] = Counter()
+        self.output_chars = 0
+
+    async def extract(self, url: str) -> str:
+        return await self._timed(self.strategy.extract, url)
+
+    async def get_html(self, url: str) -> str:
+        return await self._timed(self.strategy.get_html, url)
+
+    async def _timed(self, call: Callable[[str], Awaitable[str]], url: str) -> str:
+        started = time.perf_counter()
+        ending = "empty"
+        try:
+            output = await call(url)
+            ending = "returned" if output else "empty"
+            self.output_chars += len(output)
+
+            return output
+        except BaseException as exc:
+            ending = type(exc).__name__
+            raise
+        finally:
+            self.durations.append(time.perf_counter() - started)
+            self.endings[ending] += 1
+
+    def report(self) -> dict[str, object]:
+        return {
+            "attempts": len(self.durations),
+            "median_ms": _ms(statistics.median(self.durations)),
+            "p95_ms": _ms(_p95(self.durations)),
+            "endings": dict(self.endings),
+            "output_chars": self.output_chars,
+        }
+
+
+def _ms(seconds: float) -> float:
+    return round(seconds * 1000, 1)
+
+
+def _p95(values: list[float]) -> float:
+    ordered = sorted(values)
+
+    return ordered[min(len(ordered) - 1, round(0.95 * (len(ordered) - 1)))]
+
+
+def _cpu_seconds() -> tuple[float, float]:
+    own = psutil.Process()
+    children = 0.0
+    for child in own.children(recursive=True):
+        try:
+            times = child.cpu_times()
+        except psutil.NoSuchProcess:
+            continue
+        children += times.user + times.system
+    times = own.cpu_times()
+
+    return times.user + times.system, children
+
+
+async def _probe(lags: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(_PROBE_INTERVAL_S)
+        lags.append(time.perf_counter() - started - _PROBE_INTERVAL_S)
+
+
+async def _measure(
+    reader: WebReader, read: Callable[[str], Awaitable[dict[str, Any]]], urls: list[str], concurrency: int
+) -> dict[str, object]:
+    tiers = {name: _TimedTier(strategy) for name, strategy in reader.strategies.items()}
+    originals, reader.strategies = reader.strategies, dict(tiers)
+    answered: Counter[str] = Counter()
+    latencies: list[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(url: str) -> None:
+        async with semaphore:
+            started = time.perf_counter()
+            try:
+                result = await read(url)
+                answered[result["mode"] if result["status"] == "success" else result["reason"]] += 1
+            except HumanInterventionRequiredException:
+                # What a read that reached NoVNC ends in: the caller is handed the VNC link.
+                answered["human_intervention"] += 1
+            latencies.append(time.perf_counter() - started)
+
+    lags: list[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(_probe(lags, stop))
+    own_before, children_before = _cpu_seconds()
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(one(url) for url in urls))
+    finally:
+        reader.strategies = originals
+    elapsed = time.perf_counter() - started
+    own_after, children_after = _cpu_seconds()
+    stop.set()
+    await probe
+
+    return {
+        "reads_per_s": round(len(urls) / elapsed, 2),
+        "median_ms": _ms(statistics.median(latencies)),
+        "p95_ms": _ms(_p95(latencies)),
+        "answered_by": dict(answered),
+        "python_cpu_ms_per_read": _ms((own_after - own_before) / len(urls)),
+        "child_cpu_ms_per_read": _ms((children_after - children_before) / len(urls)),
+        "median_loop_lag_ms": round(statistics.median(lags) * 1000, 2),
+        "max_loop_lag_ms": round(max(lags) * 1000, 2),
+        "tiers": {name: tier.report() for name, tier in tiers.items() if tier.durations},
+    }
+
+
+async def _run(
+    origin: _Origin, reads: int, concurrency: int, modes: list[str], browser: bool
+) -> dict[str, object]:
+    # Offline: without a client the stores fall back to their in-process tables.
+    for store in (read_cache, strategy_memory, cookie_manager):
+        store.redis_client = None
+    reader = WebReader()
+    reader.strategies[NOVNC_STRATEGY_NAME] = _NoHuman()
+    if not browser:
+        for name in _BROWSER_TIERS:
+            del reader.strategies[name]
+
+    base_url = f"http://127.0.0.1:{origin.server_address[1]}"
+    calls: dict[str, Callable[[str], Awaitable[dict[str, Any]]]] = {
+        "read": reader.read,
+        "read_with_links": reader.read_with_links,
+    }
+    report: dict[str, object] = {"tiers_run": list(reader.strategies)}
+    try:
+        await reader.read(f"{base_url}/static/warm-up")
+        for mode in modes:
+            for kind in _KINDS:
+                urls = [f"{base_url}/{kind}/{mode}-{i}" for i in range(reads)]
+                served = origin.bytes_served[kind]
+                result = await _measure(reader, calls[mode], urls, concurrency)
+                report[f"{kind}_{mode}"] = {**result, "origin_bytes": origin.bytes_served[kind] - served}
+    finally:
+        await crawlee_service.stop()
+        await browser_pool.stop()
+        await curl_session_pool.close()
+        extraction_pool.close()
+
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--reads", type=int, default=20, help="reads per page kind and mode")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--mode", choices=("read", "read_with_links", "both"), default="both")
+    parser.add_argument("--slow-ms", type=int, default=1500)
+    parser.add_argument("--huge-kb", type=int, default=1500)
+    parser.add_argument("--solve-ms", type=int, default=500)
+    parser.add_argument("--browser", action="store_true", help="also run the Playwright and Crawlee tiers")
+    parser.add_argument("--strategy-memory", action="store_true")
+    parser.add_argument("--politeness", action="store_true")
+    args = parser.parse_args()
+
+    origin = _Origin(args.slow_ms / 1000, args.huge_kb)
+    solver = _FlareSolverrStub(args.solve_ms / 1000)
+    for server in (origin, solver):
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    settings.FLARESOLVERR_URL = f"http://127.0.0.1:{solver.server_address[1]}/v1"
+    settings.READ_CACHE_ENABLED = False
+    settings.STRATEGY_MEMORY_ENABLED = args.strategy_memory
+    settings.POLITENESS_ENABLED = args.politeness
+    modes = ["read", "read_with_links"] if args.mode == "both" else [args.mode]
+
+    try:
+        report = asyncio.run(_run(origin, args.reads, args.concurrency, modes, args.browser))
+    finally:
+        origin.shutdown()
+        solver.shutdown()
+
+    json.dump(
+        {
+            "reads": args.reads,
+            "concurrency": args.concurrency,
+            "slow_ms": args.slow_ms,
+            "huge_page_bytes": len(origin.pages["huge"].encode()),
+            "solve_ms": args.solve_ms,
+            **report,
+        },
+        sys.stdout,
+        indent=2,
+    )
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,11 @@
 import logging
+import math
 
 import httpx
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
 
-from src.api.exceptions import HumanInterventionRequiredException
+from src.api.exceptions import CircuitOpenException, HumanInterventionRequiredException
 from src.observability.metrics import HUMAN_INTERVENTION_TOTAL
 
 logger = logging.getLogger(__name__)
@@ -36,6 +37,27 @@ async def httpx_exception_handler(request: Request, exc: httpx.HTTPError) -> JSO
     )
 
 
+async def circuit_open_exception_handler(request: Request, exc: CircuitOpenException) -> JSONResponse:
+    """
+    Returns 503 with Retry-After when a request needed an upstream whose circuit breaker
+    is open; the caller learns when to come back instead of waiting out a timeout.
+    """
+    logger.warning(f"Circuit open for {exc.name} during {request.method} {request.url}")
+
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        media_type=PROBLEM_JSON,
+        headers={"Retry-After": str(max(1, math.ceil(exc.retry_after)))},
+        content={
+            "type": f"{_PROBLEM_TYPE_BASE}/external-service-unavailable",
+            "title": "External Service Unavailable",
+            "status": status.HTTP_503_SERVICE_UNAVAILABLE,
+            "detail": "An upstream dependency is failing; requests to it are paused.",
+            "instance": str(request.url.path),
+        },
+    )
+
+
 async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
     """
     Catch-all handler for unhandled exceptions.
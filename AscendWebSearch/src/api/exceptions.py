@@ -19,3 +19,31 @@ class ChallengeDetectedException(Exception):
         self.intervention_type = intervention_type
         self.message = f"Challenge detected: {intervention_type}"
         super().__init__(self.message)
+
+
+class NonHtmlContentException(Exception):
+    """
+    Raised by a fetch whose response is not an HTML page (JSON, text, PDF, binary, or over
+    the byte cap), so the read answers from the body instead of escalating to browser tiers.
+    """
+
+    def __init__(self, kind: str, content_type: str, body: bytes = b"", encoding: str | None = None):
+        self.kind = kind
+        self.content_type = content_type
+        self.body = body
+        self.encoding = encoding
+        self.message = f"Non-HTML content: {kind} ({content_type or 'no Content-Type'})"
+        super().__init__(self.message)
+
+
+class CircuitOpenException(Exception):
+    """
+    Raised instead of calling a strategy or upstream whose circuit breaker is open,
+    so callers fail over at once rather than waiting out another timeout.
+    """
+
+    def __init__(self, name: str, retry_after: float):
+        self.name = name
+        self.retry_after = retry_after
+        self.message = f"Circuit open: {name} (retry in {retry_after:.0f}s)"
+        super().__init__(self.message)
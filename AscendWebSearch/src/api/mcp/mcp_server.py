@@ -1,16 +1,22 @@
 from typing import Any
 
-from fastmcp import FastMCP
+from fastmcp import Context, FastMCP
 
 from src.api.exceptions import HumanInterventionRequiredException
+from src.config.config import settings
 from src.observability.metrics import HUMAN_INTERVENTION_TOTAL
+from src.reader.batch_reader import BatchReader
+from src.reader.read_chunker import chunk_budget, read_chunker
 from src.reader.web_reader import WebReader
+from src.search.research_pipeline import ResearchPipeline
 from src.search.search_client import SearxngClient
 from src.validator.url_validator import is_safe_external_url
 
 mcp = FastMCP("AscendWebSearch")
 search_client = SearxngClient()
 web_reader = WebReader()
+batch_reader = BatchReader(web_reader)
+research_pipeline = ResearchPipeline(search_client, batch_reader)
 
 MAX_QUERY_LENGTH = 500
 
@@ -37,6 +43,9 @@ async def web_read(
     include_links: bool = False,
     link_filter: str | None = None,
     heavy_mode: bool = False,
+    max_chars: int | None = None,
+    max_tokens: int | None = None,
+    cursor: str | None = None,
 ) -> dict[str, Any]:
     """
     Read (scrape) the content of a web page.
@@ -49,15 +58,29 @@ async def web_read(
         link_filter: Optional URL substring - when set, only links whose href contains
                      this string are included in the link map (e.g. '/job-offer/').
         heavy_mode: If True, skips lightweight strategies and jumps straight to advanced browser strategies.
+        max_chars: Optional chunk size in characters. Longer content is returned in chunks split on
+                   paragraph boundaries, with `next_cursor` set while more remains.
+        max_tokens: Optional chunk size in tokens (about 4 characters each); the tighter limit wins.
+        cursor: The `next_cursor` of the previous chunk; pass the same `url`. Continuations are served
+                from the server's copy of the page, without reading it again.
     """
-    if not is_safe_external_url(url):
+    if (max_chars is not None and max_chars < 1) or (max_tokens is not None and max_tokens < 1):
+        raise ValueError("max_chars and max_tokens must be at least 1")
+
+    budget = chunk_budget(max_chars, max_tokens)
+    if cursor:
+        return await read_chunker.resume(url, cursor, budget)
+
+    if not await is_safe_external_url(url):
         raise ValueError("URL resolves to a private, loopback, link-local, or otherwise non-routable address")
 
     try:
         if include_links:
-            return await web_reader.read_with_links(url, link_filter, heavy_mode=heavy_mode)
+            result = await web_reader.read_with_links(url, link_filter, heavy_mode=heavy_mode)
+        else:
+            result = await web_reader.read(url, heavy_mode=heavy_mode)
 
-        return await web_reader.read(url, heavy_mode=heavy_mode)
+        return await read_chunker.first(url, result, budget)
     except HumanInterventionRequiredException as exc:
         # The REST surface returns 428 via human_intervention_exception_handler; MCP has no HTTP
         # status to mirror, so we surface the same payload as a structured tool result. Without
@@ -71,3 +94,84 @@ async def web_read(
             "vnc_url": exc.vnc_url,
             "message": exc.message,
         }
+
+
+@mcp.tool()
+async def web_read_many(
+    urls: list[str],
+    include_links: bool = False,
+    link_filter: str | None = None,
+    heavy_mode: bool = False,
+    ctx: Context | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Read (scrape) several web pages concurrently. Prefer this over repeated web_read calls.
+    Returns one item per URL, in the order given, each with its own `status`: `success`,
+    `error`, `human_intervention_required` (display its `vnc_url` to the user), `rejected`
+    (non-routable address) or `timeout` (batch deadline reached). One failing URL never
+    fails the whole call. Progress is reported as each URL finishes.
+    Args:
+        urls: The URLs to read.
+        include_links: When True, each result has inline [N] link markers and a numbered link map.
+        link_filter: Optional URL substring - only links whose href contains it are kept.
+        heavy_mode: If True, skips lightweight strategies and jumps straight to advanced browser strategies.
+    """
+    if not urls:
+        raise ValueError("urls must not be empty")
+    if len(urls) > settings.BATCH_READ_MAX_URLS:
+        raise ValueError(f"urls exceeds the maximum of {settings.BATCH_READ_MAX_URLS} per call")
+
+    items: list[dict[str, Any]] = []
+    async for item in batch_reader.read_many(
+        urls, include_links=include_links, link_filter=link_filter, heavy_mode=heavy_mode
+    ):
+        items.append(item)
+        if ctx is not None:
+            await ctx.report_progress(progress=len(items), total=len(urls), message=item["url"])
+
+    return sorted(items, key=lambda item: item["index"])
+
+
+@mcp.tool()
+async def web_research(
+    query: str,
+    k: int = 5,
+    max_chars: int | None = None,
+    include_links: bool = False,
+    heavy_mode: bool = False,
+    ctx: Context | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Search the web and read the top `k` distinct results in one call. Prefer this over
+    web_search followed by web_read on each hit.
+    Returns one document per hit in rank order: the page `content` plus the hit's `title`,
+    `snippet`, `engine`, `score` and `published_date`, each with its own `status` (same values
+    as web_read_many; display `vnc_url` to the user on `human_intervention_required`).
+    Args:
+        query: The search query.
+        k: How many distinct results to read (default 5).
+        max_chars: Optional per-document character budget; longer content is cut and marked `truncated`.
+        include_links: When True, each document has inline [N] link markers and a numbered link map.
+        heavy_mode: If True, skips lightweight strategies and jumps straight to advanced browser strategies.
+    """
+    if not query or not query.strip():
+        raise ValueError("query must not be empty")
+    if len(query) > MAX_QUERY_LENGTH:
+        raise ValueError(f"query exceeds maximum length of {MAX_QUERY_LENGTH} characters")
+    if not 1 <= k <= settings.BATCH_READ_MAX_URLS:
+        raise ValueError(f"k must be between 1 and {settings.BATCH_READ_MAX_URLS}")
+
+    documents: list[dict[str, Any]] = []
+    async for document in research_pipeline.research(
+        query,
+        k,
+        settings.RESEARCH_DEADLINE_SECONDS,
+        max_chars=max_chars,
+        include_links=include_links,
+        heavy_mode=heavy_mode,
+    ):
+        documents.append(document)
+        if ctx is not None:
+            await ctx.report_progress(progress=len(documents), total=k, message=document["url"])
+
+    return sorted(documents, key=lambda document: document["index"])
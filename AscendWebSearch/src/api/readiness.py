@@ -7,6 +7,7 @@ from fastapi import APIRouter, status
 from fastapi.responses import JSONResponse
 
 from src.config.config import settings
+from src.runtime.circuit_breaker import circuit_breakers
 
 logger = logging.getLogger(__name__)
 
@@ -76,14 +77,20 @@ async def _probe_flaresolverr() -> dict[str, str]:
 
 @readiness_router.get("/ready")
 async def ready() -> JSONResponse:
-    """Readiness probe. /health is liveness; this is readiness."""
+    """Readiness probe. /health is liveness; this is readiness. Circuit breaker state rides along."""
     checks = {
         "redis": await _probe_redis(),
         "searxng": await _probe_searxng(),
         "flaresolverr": await _probe_flaresolverr(),
     }
     ok = all(c.get("status") in ("ok", "skipped") for c in checks.values())
-    body = {"status": "ready" if ok else "degraded", "checks": checks}
+    # Reported, not gated on: an open tier or upstream circuit means reads skip it, not
+    # that this instance cannot serve.
+    body = {
+        "status": "ready" if ok else "degraded",
+        "checks": checks,
+        "circuits": circuit_breakers.snapshot(),
+    }
 
     return JSONResponse(
         status_code=status.HTTP_200_OK if ok else status.HTTP_503_SERVICE_UNAVAILABLE,
@@ -1,9 +1,17 @@
-from typing import Any
-
-from fastapi import APIRouter, HTTPException
-from pydantic import BaseModel, HttpUrl
-
+import json
+import time
+from collections.abc import AsyncIterator
+from typing import Annotated, Any
+
+from fastapi import APIRouter, Header, HTTPException
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, Field, HttpUrl
+
+from src.config.config import settings
+from src.reader.batch_reader import BatchReader
+from src.reader.read_chunker import chunk_budget, read_chunker
 from src.reader.web_reader import WebReader
+from src.search.research_pipeline import ResearchPipeline
 from src.search.search_client import SearxngClient
 from src.validator.url_validator import is_safe_external_url
 
@@ -14,6 +22,8 @@ MAX_QUERY_LENGTH = 500
 
 search_client = SearxngClient()
 web_reader = WebReader()
+batch_reader = BatchReader(web_reader)
+research_pipeline = ResearchPipeline(search_client, batch_reader)
 
 
 class ReadRequest(BaseModel):
@@ -21,13 +31,27 @@ class ReadRequest(BaseModel):
     include_links: bool = False
     link_filter: str | None = None
     heavy_mode: bool = False
+    max_chars: int | None = Field(default=None, ge=1)
+    max_tokens: int | None = Field(default=None, ge=1)
+    cursor: str | None = None
 
 
-@rest_router.get("/search")
-async def search(query: str, limit: int = 5) -> list[dict[str, Any]]:
-    """
-    Search the web.
-    """
+class BatchReadRequest(BaseModel):
+    urls: list[HttpUrl] = Field(min_length=1, max_length=settings.BATCH_READ_MAX_URLS)
+    include_links: bool = False
+    link_filter: str | None = None
+    heavy_mode: bool = False
+
+
+class ResearchRequest(BaseModel):
+    query: str
+    k: int = Field(default=5, ge=1, le=settings.BATCH_READ_MAX_URLS)
+    max_chars: int | None = Field(default=None, ge=1)
+    include_links: bool = False
+    heavy_mode: bool = False
+
+
+def _validate_query(query: str) -> None:
     if not query or not query.strip():
         raise HTTPException(status_code=400, detail="query must not be empty")
     if len(query) > MAX_QUERY_LENGTH:
@@ -36,6 +60,14 @@ async def search(query: str, limit: int = 5) -> list[dict[str, Any]]:
             detail=f"query exceeds maximum length of {MAX_QUERY_LENGTH} characters",
         )
 
+
+@rest_router.get("/search")
+async def search(query: str, limit: int = 5) -> list[dict[str, Any]]:
+    """
+    Search the web.
+    """
+    _validate_query(query)
+
     return await search_client.search(query=query, limit=limit)
 
 
@@ -44,6 +76,7 @@ _SUCCESS_EXAMPLE = {
     "content": "Text...",
     "status": "success",
     "mode": "1-beautifulsoup",
+    "cache": "miss",
 }
 _CAPTCHA_EXAMPLE = {
     "url": "https://example.com",
@@ -84,9 +117,22 @@ async def read_url_v2(request: ReadRequest) -> dict[str, Any]:
 
     Recommended endpoint: protects complex URL parameters (& or ?continue=) from
     being hijacked by the HTTP router.
+
+    With `max_chars` and/or `max_tokens`, content over budget comes back as its first
+    chunk, split on a paragraph boundary, with `offset`, `total_chars` and `next_cursor`.
+    Send the same URL with `cursor` set to `next_cursor` for the next chunk; it is served
+    from a server-side snapshot without reading the page again. `next_cursor` is null on
+    the last chunk.
     """
     url_str = str(request.url)
-    if not is_safe_external_url(url_str):
+    budget = chunk_budget(request.max_chars, request.max_tokens)
+    if request.cursor:
+        try:
+            return {"url": url_str, **await read_chunker.resume(url_str, request.cursor, budget)}
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e)) from e
+
+    if not await is_safe_external_url(url_str):
         raise HTTPException(
             status_code=400,
             detail="URL resolves to a private, loopback, link-local, or otherwise non-routable address",
@@ -96,4 +142,107 @@ async def read_url_v2(request: ReadRequest) -> dict[str, Any]:
     else:
         result = await web_reader.read(url_str, heavy_mode=request.heavy_mode)
 
-    return {"url": url_str, **result}
+    return {"url": url_str, **await read_chunker.first(url_str, result, budget)}
+
+
+@rest_router_v2.post(
+    "/read/batch",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "One JSON item per URL, streamed in completion order",
+            "content": {"application/x-ndjson": {}, "text/event-stream": {}},
+        },
+    },
+)
+async def read_batch_v2(
+    request: BatchReadRequest, accept: Annotated[str | None, Header()] = None
+) -> StreamingResponse:
+    """
+    Read several URLs concurrently and stream each result as soon as it finishes.
+
+    NDJSON by default; send `Accept: text/event-stream` for SSE (`item` events followed
+    by a final `done` event). Every item carries `index` (position in `urls`), `url` and
+    its own `status` - `success`, `error`, `human_intervention_required`, `rejected`
+    (non-routable address) or `timeout` (batch deadline reached).
+    """
+    items = batch_reader.read_many(
+        [str(url) for url in request.urls],
+        include_links=request.include_links,
+        link_filter=request.link_filter,
+        heavy_mode=request.heavy_mode,
+    )
+
+    return _streaming_response(items, accept)
+
+
+@rest_router_v2.post(
+    "/research",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "One JSON document per search hit, streamed in completion order",
+            "content": {"application/x-ndjson": {}, "text/event-stream": {}},
+        },
+    },
+)
+async def research_v2(
+    request: ResearchRequest, accept: Annotated[str | None, Header()] = None
+) -> StreamingResponse:
+    """
+    Search, then read the top `k` distinct hits concurrently, streaming each document as
+    soon as it is extracted. Search and reads share RESEARCH_DEADLINE_SECONDS.
+
+    Items have the batch-read shape (`index` is the hit's rank) plus the hit's `title`,
+    `snippet`, `engine`, `score` and `published_date`. With `max_chars`, each `content` is
+    cut to that many characters and flagged `truncated`.
+    """
+    _validate_query(request.query)
+
+    deadline = time.monotonic() + settings.RESEARCH_DEADLINE_SECONDS
+    # Searched before the stream starts so a SearXNG failure still maps to a 503.
+    sources = await research_pipeline.find_sources(request.query, request.k)
+    documents = research_pipeline.read_sources(
+        sources,
+        deadline,
+        max_chars=request.max_chars,
+        include_links=request.include_links,
+        heavy_mode=request.heavy_mode,
+    )
+
+    return _streaming_response(documents, accept)
+
+
+def _streaming_response(items: AsyncIterator[dict[str, Any]], accept: str | None) -> StreamingResponse:
+    if accept and "text/event-stream" in accept:
+        return StreamingResponse(
+            _sse_events(items),
+            media_type="text/event-stream",
+            # Reverse proxies (nginx) otherwise buffer the stream and defeat incremental delivery.
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
+    return StreamingResponse(_ndjson_lines(items), media_type="application/x-ndjson")
+
+
+async def _ndjson_lines(items: AsyncIterator[dict[str, Any]]) -> AsyncIterator[str]:
+    async for item in items:
+        yield json.dumps(item) + "\n"
+
+
+async def _sse_events(items: AsyncIterator[dict[str, Any]]) -> AsyncIterator[str]:
+    count = 0
+    async for item in items:
+        count += 1
+        yield f"event: item\ndata: {json.dumps(item)}\n\n"
+
+    yield f"event: done\ndata: {json.dumps({'count': count})}\n\n"
+
+
+@rest_router_v2.get("/debug/strategy-memory")
+async def strategy_memory_table() -> dict[str, dict[str, Any]]:
+    """
+    Learned per-domain strategy table: last successful tier plus per-tier failure
+    counts and cumulative failure seconds. Read-only; intended for operators.
+    """
+    return await web_reader.strategy_memory.snapshot()
@@ -1,15 +1,34 @@
+import asyncio
+import hashlib
+import json
 import logging
+import threading
+import time
+from collections.abc import Iterable
 from pathlib import Path
 
 import httpx
 from adblockparser import AdblockRules
 
 from src.config.config import settings
+from src.observability.metrics import BLOCKLIST_REFRESH_TOTAL
+from src.validator.adblock_matcher import AdblockMatcher
 
 logger = logging.getLogger(__name__)
 
 
 class BlocklistLoader:
+    """
+    Process-wide owner of the adblock rules.
+
+    The matcher is built from an on-disk snapshot of BLOCKLIST_URL, so startup never needs
+    the network once a snapshot exists (the image ships one in src/assets). Parsing the
+    list is ~0.4 s, so the compiled matcher is also kept next to the snapshot as a dump
+    keyed by the snapshot's SHA-256; a warm start loads that in milliseconds. refresh()
+    revalidates the snapshot with a conditional GET (ETag / Last-Modified) and swaps in a
+    rebuilt matcher only when the list actually changed.
+    """
+
     def __init__(self, assets_dir: str | None = None):
         if assets_dir:
             self.assets_dir = Path(assets_dir)
@@ -17,15 +36,127 @@ class BlocklistLoader:
             self.assets_dir = Path(__file__).parent.parent / "assets"
 
         self.blocklist_path = self.assets_dir / "fanboy-annoyance.txt"
+        self.validators_path = self.assets_dir / "fanboy-annoyance.validators.json"
+        self.matcher_cache_path = self.assets_dir / "fanboy-annoyance.matcher.json"
         self._ensure_assets_dir()
 
+        self._matcher: AdblockMatcher | None = None
+        self._load_lock = threading.Lock()
+
     def _ensure_assets_dir(self) -> None:
         if not self.assets_dir.exists():
             self.assets_dir.mkdir(parents=True, exist_ok=True)
 
-    def load_rules(self) -> AdblockRules:
-        self._download_blocklist()
-        return self._parse_rules()
+    @property
+    def matcher(self) -> AdblockMatcher:
+        if self._matcher is None:
+            return self.load_matcher()
+
+        return self._matcher
+
+    def should_block(self, url: str) -> bool:
+        return self.matcher.should_block(url)
+
+    def load_matcher(self) -> AdblockMatcher:
+        """Loads the matcher once per process; later calls return the same instance."""
+        with self._load_lock:
+            if self._matcher is not None:
+                return self._matcher
+
+            if not self.blocklist_path.exists():
+                # First boot without a snapshot is the only time startup needs the network.
+                self._download_blocklist()
+
+            started = time.perf_counter()
+            snapshot = self.blocklist_path.read_bytes()
+            digest = _sha256(snapshot)
+
+            matcher, build_ms = self._load_cached_matcher(digest)
+            load_ms = (time.perf_counter() - started) * 1000
+            if matcher is not None:
+                logger.info(
+                    f"Blocklist: matcher loaded from cache in {load_ms:.0f} ms "
+                    f"(a cold parse of this snapshot took {build_ms:.0f} ms)"
+                )
+            else:
+                matcher = self._build_matcher(snapshot, digest)
+                logger.info(
+                    f"Blocklist: parsed snapshot and built matcher in "
+                    f"{(time.perf_counter() - started) * 1000:.0f} ms; cached for the next start"
+                )
+
+            self._matcher = matcher
+
+            return matcher
+
+    async def refresh(self) -> bool:
+        """Revalidates the snapshot against BLOCKLIST_URL. Returns True when new rules were loaded."""
+        validators = self._read_validators()
+        headers = {}
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+        try:
+            async with httpx.AsyncClient(follow_redirects=True) as client:
+                response = await client.get(settings.BLOCKLIST_URL, headers=headers)
+                response.raise_for_status()
+        except Exception as e:
+            BLOCKLIST_REFRESH_TOTAL.labels(result="error").inc()
+            logger.warning(f"Blocklist: refresh from {settings.BLOCKLIST_URL} failed, keeping snapshot: {e}")
+            return False
+
+        if response.status_code == httpx.codes.NOT_MODIFIED:
+            BLOCKLIST_REFRESH_TOTAL.labels(result="not_modified").inc()
+            logger.debug("Blocklist: snapshot is current (304)")
+            return False
+
+        snapshot = response.content
+        digest = _sha256(snapshot)
+        if self.blocklist_path.exists() and digest == _sha256(self.blocklist_path.read_bytes()):
+            # Origins without validators send the whole list every time; don't rebuild for nothing.
+            self._write_validators(response.headers)
+            BLOCKLIST_REFRESH_TOTAL.labels(result="not_modified").inc()
+            return False
+
+        # Parse before touching the snapshot, so a malformed download never replaces good rules.
+        try:
+            matcher = await asyncio.to_thread(self._build_matcher, snapshot, digest)
+        except Exception as e:
+            BLOCKLIST_REFRESH_TOTAL.labels(result="error").inc()
+            logger.warning(f"Blocklist: downloaded list could not be parsed, keeping snapshot: {e}")
+            return False
+
+        self._write_atomic(self.blocklist_path, snapshot)
+        self._write_validators(response.headers)
+        self._matcher = matcher
+        BLOCKLIST_REFRESH_TOTAL.labels(result="updated").inc()
+        logger.info(f"Blocklist: rules updated from {settings.BLOCKLIST_URL}")
+
+        return True
+
+    async def run_refresh_loop(self) -> None:
+        """Refreshes now and then every BLOCKLIST_REFRESH_INTERVAL_SECONDS until cancelled."""
+        while True:
+            await self.refresh()
+            await asyncio.sleep(settings.BLOCKLIST_REFRESH_INTERVAL_SECONDS)
+
+    def parse_rules(self) -> AdblockRules:
+        """
+        The snapshot's rules as adblockparser rules, parsed the way the matcher is built from
+        them. Uncached and slow (~0.4 s); the reader itself only needs load_matcher().
+        """
+        if not self.blocklist_path.exists():
+            raise FileNotFoundError(f"Blocklist file not found at {self.blocklist_path}")
+
+        logger.info("Parsing blocklist rules...")
+        try:
+            with self.blocklist_path.open(encoding="utf-8", errors="ignore") as f:
+                return self._rules_from_lines(f)
+        except Exception as e:
+            logger.exception("Failed to parse blocklist rules")
+            raise RuntimeError("Critical: Could not parse blocklist rules") from e
 
     def _download_blocklist(self) -> None:
         logger.info(f"Downloading blocklist from {settings.BLOCKLIST_URL}...")
@@ -33,24 +164,79 @@ class BlocklistLoader:
             with httpx.Client() as client:
                 response = client.get(settings.BLOCKLIST_URL, follow_redirects=True)
                 response.raise_for_status()
-                with self.blocklist_path.open("wb") as f:
-                    f.write(response.content)
+                self._write_atomic(self.blocklist_path, response.content)
+                self._write_validators(response.headers)
             logger.info("Blocklist downloaded successfully.")
         except Exception as e:
             logger.exception("Failed to download blocklist")
             raise RuntimeError(f"Critical: Could not download blocklist from {settings.BLOCKLIST_URL}") from e
 
-    def _parse_rules(self) -> AdblockRules:
-        if not self.blocklist_path.exists():
-            raise FileNotFoundError(f"Blocklist file not found at {self.blocklist_path}")
+    @staticmethod
+    def _rules_from_lines(lines: Iterable[str]) -> AdblockRules:
+        raw_rules = [line.strip() for line in lines if line.strip() and not line.strip().startswith("!")]
+        logger.info(f"Loaded {len(raw_rules)} rules.")
 
-        logger.info("Parsing blocklist rules...")
+        return AdblockRules(raw_rules)
+
+    def _build_matcher(self, snapshot: bytes, digest: str) -> AdblockMatcher:
+        started = time.perf_counter()
+        rules = self._rules_from_lines(snapshot.decode("utf-8", errors="ignore").splitlines())
+        if not rules.rules:
+            raise ValueError("Blocklist contains no usable rules")
+        matcher = AdblockMatcher.from_rules(rules)
+        build_ms = (time.perf_counter() - started) * 1000
+
+        header = json.dumps({"sha256": digest, "build_ms": round(build_ms, 1)}).encode()
         try:
-            with self.blocklist_path.open(encoding="utf-8", errors="ignore") as f:
-                raw_rules = [line.strip() for line in f if line.strip() and not line.strip().startswith("!")]
-                rules = AdblockRules(raw_rules)
-            logger.info(f"Loaded {len(raw_rules)} rules.")
-            return rules
+            self._write_atomic(self.matcher_cache_path, header + b"\n" + matcher.dump())
+        except OSError as e:
+            # A read-only assets dir only costs the fast start; the rules themselves are fine.
+            logger.warning(f"Blocklist: could not write matcher cache {self.matcher_cache_path}: {e}")
+
+        return matcher
+
+    def _load_cached_matcher(self, digest: str) -> tuple[AdblockMatcher | None, float]:
+        try:
+            header, _, body = self.matcher_cache_path.read_bytes().partition(b"\n")
+            meta = json.loads(header)
+            if meta.get("sha256") != digest:
+                return None, 0.0
+
+            return AdblockMatcher.load(body), float(meta.get("build_ms", 0.0))
+        except FileNotFoundError:
+            return None, 0.0
         except Exception as e:
-            logger.exception("Failed to parse blocklist rules")
-            raise RuntimeError("Critical: Could not parse blocklist rules") from e
+            logger.warning(f"Blocklist: ignoring unreadable matcher cache: {e}")
+            return None, 0.0
+
+    def _read_validators(self) -> dict[str, str]:
+        try:
+            validators: dict[str, str] = json.loads(self.validators_path.read_text(encoding="utf-8"))
+            return validators
+        except (OSError, ValueError):
+            return {}
+
+    def _write_validators(self, headers: httpx.Headers) -> None:
+        validators = {
+            key: value
+            for key, value in (("etag", headers.get("ETag")), ("last_modified", headers.get("Last-Modified")))
+            if value
+        }
+        try:
+            self._write_atomic(self.validators_path, json.dumps(validators).encode())
+        except OSError as e:
+            logger.warning(f"Blocklist: could not store ETag / Last-Modified: {e}")
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        # Readers (another worker starting up) never see a half-written snapshot or cache.
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        tmp_path.write_bytes(data)
+        tmp_path.replace(path)
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+blocklist_loader = BlocklistLoader()
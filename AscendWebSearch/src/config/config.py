@@ -32,10 +32,32 @@ class Settings(BaseSettings):
         description="X-Forwarded-For header for SearXNG requests",
     )
 
+    SEARXNG_RESPONSE_FORMAT: str = Field(
+        default="json",
+        description="Result format requested from SearXNG (json or html); json falls back to html on 403",
+    )
+
+    SEARXNG_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="Cache SearXNG results and coalesce concurrent identical searches",
+    )
+    SEARXNG_CACHE_TTL_SECONDS: int = Field(
+        default=600,
+        description="Lifetime of a cached SearXNG result list",
+    )
+    SEARXNG_CACHE_MAX_ENTRIES: int = Field(
+        default=1024,
+        description="In-process LRU capacity for SearXNG results (Redis holds the shared copy)",
+    )
+
     BLOCKLIST_URL: str = Field(
         default="https://secure.fanboy.co.nz/fanboy-annoyance.txt",
         description="URL for adblock list",
     )
+    BLOCKLIST_REFRESH_INTERVAL_SECONDS: float = Field(
+        default=21600.0,
+        description="How often the blocklist snapshot is revalidated against BLOCKLIST_URL (conditional GET)",
+    )
     VALIDATION_MIN_WORDS: int = Field(
         default=10,
         description="Minimum word count for valid content",
@@ -55,6 +77,21 @@ class Settings(BaseSettings):
     DEFAULT_TIMEOUT: float = Field(default=30.0, description="Default HTTP request timeout in seconds")
     SEARCH_TIMEOUT: float = Field(default=10.0, description="Timeout for search requests")
     EXTRACT_TIMEOUT: float = Field(default=30.0, description="Timeout for web extraction")
+    EXTRACTION_POOL_WORKERS: int = Field(
+        default=2,
+        description="Worker processes for HTML extraction and content validation; 0 runs everything inline",
+    )
+    EXTRACTION_INLINE_MAX_CHARS: int = Field(
+        default=32_000,
+        description="Documents up to this many characters are extracted inline, larger ones in a worker",
+    )
+    FETCH_MAX_BYTES: int = Field(
+        default=20_000_000,
+        description="Largest response body a curl_cffi fetch downloads; bigger ones are abandoned mid-stream",
+    )
+    PDF_MAX_PAGES: int = Field(
+        default=200, description="Pages of a PDF whose text is extracted; later pages are left out"
+    )
     READ_TOTAL_BUDGET: float = Field(
         default=90.0,
         description=(
@@ -63,6 +100,158 @@ class Settings(BaseSettings):
             "NoVNC is exempt because it returns 428 immediately."
         ),
     )
+    READ_HEDGE_ENABLED: bool = Field(
+        default=False,
+        description=(
+            "Hedged strategy execution. When True, tier N+1 starts while tier N is still running "
+            "once tier N exceeds its hedge delay; the first validated result wins and the rest are "
+            "cancelled. NoVNC is never hedged."
+        ),
+    )
+    READ_HEDGE_DELAYS: dict[str, float] = Field(
+        default={
+            "1-beautifulsoup": 3.0,
+            "2-trafilatura": 3.0,
+            "3-flaresolverr": 15.0,
+            "4-playwright_stealth": 20.0,
+        },
+        description="Per-tier hedge delay in seconds, keyed by strategy name (JSON object in env)",
+    )
+    READ_HEDGE_DEFAULT_DELAY: float = Field(
+        default=10.0,
+        description="Hedge delay in seconds for tiers missing from READ_HEDGE_DELAYS",
+    )
+    STRATEGY_MEMORY_ENABLED: bool = Field(
+        default=True,
+        description="Remember per registrable domain which tier last succeeded and start reads there",
+    )
+    STRATEGY_MEMORY_TTL_SECONDS: int = Field(
+        default=86400,
+        description="Idle lifetime of a domain's strategy memory; refreshed on every read of the domain",
+    )
+    STRATEGY_MEMORY_SKIP_AFTER_FAILURES: int = Field(
+        default=3,
+        description="Failures after which a tier ahead of the remembered winner is skipped for the domain",
+    )
+    READ_CACHE_ENABLED: bool = Field(
+        default=True,
+        description="Cache successful read results keyed by normalized URL and read mode",
+    )
+    READ_CACHE_FRESH_TTL_SECONDS: int = Field(
+        default=300,
+        description="Age in seconds below which a cached read is served without contacting the origin",
+    )
+    READ_CACHE_MAX_AGE_SECONDS: int = Field(
+        default=86400,
+        description="Age in seconds after which a cached read is discarded instead of revalidated",
+    )
+    READ_CACHE_MAX_ENTRIES: int = Field(
+        default=512,
+        description="In-process LRU capacity for cached reads (Redis holds the shared copy)",
+    )
+    READ_CHUNK_SNAPSHOT_MAX_CHARS: int = Field(
+        default=20_000_000,
+        description="Content characters the in-process store of chunked-read snapshots may hold",
+    )
+    READ_CHUNK_SNAPSHOT_TTL_SECONDS: int = Field(
+        default=3600,
+        description="Lifetime of a chunked-read snapshot, and so of its continuation cursors",
+    )
+    BATCH_READ_MAX_URLS: int = Field(
+        default=30,
+        description="Maximum number of URLs accepted by one batch read request",
+    )
+    BATCH_READ_MAX_CONCURRENCY: int = Field(
+        default=8,
+        description="URLs of one batch read in flight at the same time",
+    )
+    BATCH_READ_PER_DOMAIN_CONCURRENCY: int = Field(
+        default=2,
+        description="URLs of one batch read in flight at the same time per registrable domain",
+    )
+    BATCH_READ_DEADLINE_SECONDS: float = Field(
+        default=180.0,
+        description="Wall-clock deadline for a whole batch; unfinished URLs are reported as timeout",
+    )
+    RESEARCH_DEADLINE_SECONDS: float = Field(
+        default=120.0,
+        description="Shared budget for web_research: the SearXNG search plus reading the top K results",
+    )
+    DNS_RESOLVE_TIMEOUT_SECONDS: float = Field(
+        default=3.0,
+        description="Deadline for the SSRF guard's A/AAAA lookup; a timed-out host is rejected",
+    )
+    DNS_CACHE_MAX_TTL_SECONDS: float = Field(
+        default=300.0,
+        description="Upper bound on how long a DNS answer is cached; shorter record TTLs are honoured",
+    )
+    DNS_NEGATIVE_CACHE_TTL_SECONDS: float = Field(
+        default=30.0,
+        description="How long NXDOMAIN / no-address answers are cached",
+    )
+    CURL_SESSION_POOL_MAX_SESSIONS: int = Field(
+        default=32,
+        description="Pooled curl_cffi sessions (one per origin and clearance identity) kept open at once",
+    )
+    CURL_SESSION_IDLE_SECONDS: float = Field(
+        default=60.0,
+        description="Idle time after which a pooled curl_cffi session and its connections are closed",
+    )
+    COOKIE_CACHE_TTL_SECONDS: float = Field(
+        default=30.0,
+        description="In-process cache lifetime of a domain's clearance cookies (or their absence)",
+    )
+    CIRCUIT_BREAKER_ENABLED: bool = Field(
+        default=True,
+        description="Skip an upstream (FlareSolverr, Chromium, Crawlee, Redis, SearXNG) while it is failing",
+    )
+    CIRCUIT_WINDOW_SECONDS: float = Field(
+        default=60.0, description="Rolling window over which a circuit's failure and timeout rate is measured"
+    )
+    CIRCUIT_MIN_CALLS: int = Field(
+        default=5, description="Calls a window needs before its failure rate can open the circuit"
+    )
+    CIRCUIT_FAILURE_RATE: float = Field(
+        default=0.5, description="Share of failed or timed-out calls in the window that opens the circuit"
+    )
+    CIRCUIT_COOLDOWN_SECONDS: float = Field(
+        default=30.0, description="How long an open circuit rejects calls before letting trial calls through"
+    )
+    CIRCUIT_HALF_OPEN_TRIALS: int = Field(
+        default=1, description="Trial calls let through per cooldown while a circuit is half-open"
+    )
+    ADAPTIVE_TIMEOUT_ENABLED: bool = Field(
+        default=True,
+        description="Size each tier attempt's timeout from past successful attempts, not EXTRACT_TIMEOUT",
+    )
+    ADAPTIVE_TIMEOUT_PERCENTILE: float = Field(
+        default=0.95, description="Percentile of past successful attempt durations a timeout starts from"
+    )
+    ADAPTIVE_TIMEOUT_MULTIPLIER: float = Field(
+        default=2.0, description="Headroom applied to that percentile before it becomes the timeout"
+    )
+    ADAPTIVE_TIMEOUT_FLOOR_SECONDS: float = Field(
+        default=5.0, description="Shortest adaptive timeout; the static timeout is the ceiling"
+    )
+    ADAPTIVE_TIMEOUT_MIN_SAMPLES: int = Field(
+        default=10, description="Successful attempts needed before a tier or domain gets an adaptive timeout"
+    )
+    ADAPTIVE_TIMEOUT_WINDOW: int = Field(
+        default=100, description="Recent successful attempt durations kept per tier and per tier and domain"
+    )
+    POLITENESS_ENABLED: bool = Field(
+        default=True, description="Queue outbound page fetches per registrable domain, shared by every tier"
+    )
+    POLITENESS_PER_DOMAIN_CONCURRENCY: int = Field(
+        default=4, description="Page fetches in flight at once per registrable domain, across all reads"
+    )
+    POLITENESS_REQUESTS_PER_SECOND: float = Field(
+        default=4.0,
+        description="Page fetches started per second per registrable domain; 0 for no limit",
+    )
+    POLITENESS_MAX_RETRY_AFTER_SECONDS: float = Field(
+        default=60.0, description="Longest a 429 / 503 Retry-After may pause fetches to its domain"
+    )
     NOVNC_TIMEOUT_SECONDS: int = Field(
         default=600,
         description="Timeout in seconds for NoVNC manual intervention (default 10 mins)",
@@ -75,10 +264,52 @@ class Settings(BaseSettings):
         ),
     )
 
-    MAX_REQUESTS_PER_CRAWL: int = Field(default=5, description="Max requests for adaptive crawler")
+    CRAWLEE_RECYCLE_AFTER_READS: int = Field(
+        default=200,
+        description="Reads served by one long-lived Crawlee crawler before it is replaced",
+    )
+    CRAWLEE_MAX_CONCURRENCY: int = Field(
+        default=2,
+        description="Concurrent Crawlee requests; each browser navigation opens its own incognito context",
+    )
+    PLAYWRIGHT_CONTEXT_POOL_SIZE: int = Field(
+        default=4,
+        description="Maximum concurrent Playwright contexts; further checkouts queue",
+    )
+    PLAYWRIGHT_CONTEXT_PREWARM: int = Field(
+        default=2,
+        description="Stealth contexts created at startup so the first browser reads skip context setup",
+    )
+    PLAYWRIGHT_CONTEXT_MAX_USES: int = Field(
+        default=20,
+        description="Reads served by one pooled context before it is closed and replaced",
+    )
+    PLAYWRIGHT_CONTEXTS_PER_BROWSER: int = Field(
+        default=4,
+        description="Contexts per Chromium process before another process is launched",
+    )
+    BROWSER_BLOCKED_RESOURCE_TYPES: list[str] = Field(
+        default=["image", "media", "font"],
+        description=(
+            "Playwright resource types the browser tiers never download (add `stylesheet` to skip CSS; "
+            "some sites hide content until their CSS loads)"
+        ),
+    )
+    BROWSER_PAGE_BYTE_BUDGET: int = Field(
+        default=5_000_000,
+        description="Bytes a browser-tier page may download before its subresources are aborted (0 = off)",
+    )
+    BROWSER_CUT_STREAMS_AFTER_DOMCONTENTLOADED: bool = Field(
+        default=True,
+        description="Close WebSockets and refuse EventSource / long-poll XHRs once DOMContentLoaded fires",
+    )
     DYNAMIC_CONTENT_WAIT: int = Field(
         default=2000,
-        description="Wait time in ms for dynamic content to load",
+        description="Longest wait in ms after the load event for the DOM to go quiet before extracting",
+    )
+    BROWSER_DOM_QUIET_MS: int = Field(
+        default=500,
+        description="A Playwright page is ready once its DOM has not changed for this many ms after load",
     )
     SCROLL_ITERATIONS: int = Field(
         default=5,
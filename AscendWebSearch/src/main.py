@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from contextlib import AsyncExitStack, asynccontextmanager
 
@@ -16,22 +17,28 @@ from fastapi.responses import Response  # noqa: E402
 from prometheus_client import CONTENT_TYPE_LATEST, generate_latest  # noqa: E402
 
 from src.api.exception_handlers import (  # noqa: E402
+    circuit_open_exception_handler,
     global_exception_handler,
     httpx_exception_handler,
     human_intervention_exception_handler,
 )
-from src.api.exceptions import HumanInterventionRequiredException  # noqa: E402
+from src.api.exceptions import CircuitOpenException, HumanInterventionRequiredException  # noqa: E402
 from src.api.mcp.mcp_server import mcp  # noqa: E402
 from src.api.mcp.mcp_server import search_client as mcp_search_client  # noqa: E402
 from src.api.readiness import readiness_router  # noqa: E402
 from src.api.rest.rest_endpoints import rest_router, rest_router_v2  # noqa: E402
 from src.api.rest.rest_endpoints import search_client as rest_search_client  # noqa: E402
-from src.config.blocklist_loader import BlocklistLoader  # noqa: E402
+from src.config.blocklist_loader import blocklist_loader  # noqa: E402
 from src.config.config import settings  # noqa: E402
 from src.config.logging_config import get_uvicorn_log_config, setup_logging  # noqa: E402
 from src.config.startup_banner import log_startup_banner  # noqa: E402
+from src.observability.loop_lag import monitor_event_loop_lag  # noqa: E402
 from src.observability.request_context import RequestIdMiddleware  # noqa: E402
+from src.reader.cloudflare.cookie_manager import cookie_manager  # noqa: E402
 from src.runtime.browser_pool import browser_pool  # noqa: E402
+from src.runtime.crawlee_service import crawlee_service  # noqa: E402
+from src.runtime.curl_session_pool import curl_session_pool  # noqa: E402
+from src.runtime.extraction_pool import extraction_pool  # noqa: E402
 
 setup_logging()
 logger = logging.getLogger("uvicorn")
@@ -44,21 +51,35 @@ def create_app() -> FastAPI:
     async def lifespan(app: FastAPI):  # type: ignore[no-untyped-def]
         setup_logging()
         try:
-            loader = BlocklistLoader()
-            loader.load_rules()
+            await asyncio.to_thread(blocklist_loader.load_matcher)
         except Exception as e:
             logger.critical(f"Startup Warning: Failed to initialize Blocklist: {e}")
             raise RuntimeError("Failed to initialize Blocklist") from e
 
         await browser_pool.start()
 
+        # Startup runs on the snapshot; the network is only needed to pick up list updates.
+        background = [
+            asyncio.create_task(blocklist_loader.run_refresh_loop()),
+            asyncio.create_task(cookie_manager.run_invalidation_listener()),
+            asyncio.create_task(monitor_event_loop_lag()),
+        ]
+
         async with AsyncExitStack() as stack:
-            await stack.enter_async_context(mcp_asgi_app.router.lifespan_context(app))
-            await log_startup_banner()
             try:
+                await stack.enter_async_context(mcp_asgi_app.router.lifespan_context(app))
+                await log_startup_banner()
                 yield
             finally:
+                for task in background:
+                    task.cancel()
+                # Let them unwind before the Redis clients and pools they use are closed.
+                await asyncio.gather(*background, return_exceptions=True)
+                # Crawlee pages live on the pooled Chromium, so its crawler goes first.
+                await crawlee_service.stop()
                 await browser_pool.stop()
+                await curl_session_pool.close()
+                extraction_pool.close()
                 try:
                     await rest_search_client.aclose()
                 except Exception as e:
@@ -72,9 +93,10 @@ def create_app() -> FastAPI:
     app.add_middleware(RequestIdMiddleware)
 
     # Starlette's add_exception_handler signature is variant on the exception type and
-    # mypy can't see that httpx.HTTPError / HumanInterventionRequiredException are
-    # legal narrowings of Exception. Both handlers exist for exactly these subclasses.
+    # mypy can't see that httpx.HTTPError / CircuitOpenException / HumanInterventionRequiredException
+    # are legal narrowings of Exception. The handlers exist for exactly these subclasses.
     app.add_exception_handler(httpx.HTTPError, httpx_exception_handler)  # type: ignore[arg-type]
+    app.add_exception_handler(CircuitOpenException, circuit_open_exception_handler)  # type: ignore[arg-type]
     app.add_exception_handler(
         HumanInterventionRequiredException,
         human_intervention_exception_handler,  # type: ignore[arg-type]
@@ -103,7 +125,6 @@ def create_app() -> FastAPI:
 app = create_app()
 
 if __name__ == "__main__":  # pragma: no cover
-    import asyncio
     import sys
 
     if sys.platform == "win32":
@@ -0,0 +1,16 @@
+import asyncio
+import time
+
+from src.observability.metrics import EVENT_LOOP_LAG_SECONDS
+
+# Probe period. Short enough to catch a 50 ms stall between two probes, long enough that
+# the probe itself is noise.
+_PROBE_INTERVAL_S = 0.25
+
+
+async def monitor_event_loop_lag() -> None:
+    """Records how much later than requested each sleep returns; started from the app lifespan."""
+    while True:
+        started = time.perf_counter()
+        await asyncio.sleep(_PROBE_INTERVAL_S)
+        EVENT_LOOP_LAG_SECONDS.observe(max(0.0, time.perf_counter() - started - _PROBE_INTERVAL_S))
@@ -1,4 +1,4 @@
-from prometheus_client import Counter, Histogram
+from prometheus_client import Counter, Gauge, Histogram
 
 STRATEGY_ATTEMPTS_TOTAL = Counter(
     "strategy_attempts_total",
@@ -33,9 +33,15 @@ SEARXNG_DURATION_SECONDS = Histogram(
     buckets=(0.1, 0.5, 1, 2, 5, 10),
 )
 
+SEARXNG_CACHE_TOTAL = Counter(
+    "searxng_cache_total",
+    "SearXNG result cache lookups: hit, miss (upstream call), coalesced (joined an in-flight call)",
+    ["result"],
+)
+
 REDIS_OPS_TOTAL = Counter(
     "redis_ops_total",
-    "Redis operations from CookieManager",
+    "CookieManager lookups and Redis operations (op=l1_get reports the in-process cache hit ratio)",
     ["op", "result"],
 )
 
@@ -43,3 +49,215 @@ READ_BUDGET_EXHAUSTED_TOTAL = Counter(
     "read_budget_exhausted_total",
     "Reads that exited because READ_TOTAL_BUDGET was exceeded before any strategy succeeded",
 )
+
+READ_WINNING_TIER_TOTAL = Counter(
+    "read_winning_tier_total",
+    "Strategy whose result was returned to the caller, by execution mode (sequential or hedged)",
+    ["strategy", "execution"],
+)
+
+HEDGE_LAUNCHES_TOTAL = Counter(
+    "hedge_launches_total",
+    "Hedged reads that started the next tier because this strategy exceeded its hedge delay",
+    ["strategy"],
+)
+
+STRATEGY_MEMORY_PROMOTIONS_TOTAL = Counter(
+    "strategy_memory_promotions_total",
+    "Reads where per-domain strategy memory moved this strategy to the front of the chain",
+    ["strategy"],
+)
+
+STRATEGY_MEMORY_SKIPS_TOTAL = Counter(
+    "strategy_memory_skips_total",
+    "Tiers skipped because strategy memory recorded repeated failures on the domain",
+    ["strategy"],
+)
+
+STRATEGY_MEMORY_TIME_SAVED_SECONDS = Counter(
+    "strategy_memory_time_saved_seconds",
+    "Estimated seconds saved by starting at the remembered tier (mean failure time of bypassed tiers)",
+)
+
+READ_CACHE_TOTAL = Counter(
+    "read_cache_total",
+    "Read cache lookups (hit, revalidated via 304, stale, miss) and Redis errors",
+    ["result"],
+)
+
+BATCH_READ_ITEMS_TOTAL = Counter(
+    "batch_read_items_total",
+    "Per-URL outcomes of batch reads (success, error, human_intervention_required, rejected, timeout)",
+    ["status"],
+)
+
+BROWSER_POOL_WAIT_SECONDS = Histogram(
+    "browser_pool_wait_seconds",
+    "Time spent waiting for a free Playwright context slot",
+    buckets=(0.005, 0.05, 0.25, 1, 2.5, 5, 10, 30, 60),
+)
+
+BROWSER_POOL_CONTEXTS_IN_USE = Gauge(
+    "browser_pool_contexts_in_use",
+    "Pooled Playwright contexts currently checked out (utilization = this / PLAYWRIGHT_CONTEXT_POOL_SIZE)",
+)
+
+BROWSER_POOL_CONTEXTS = Gauge(
+    "browser_pool_contexts",
+    "Live pooled Playwright contexts, idle plus in use",
+)
+
+BROWSER_POOL_PROCESSES = Gauge(
+    "browser_pool_processes",
+    "Running Chromium processes owned by the browser pool",
+)
+
+BROWSER_POOL_RECYCLES_TOTAL = Counter(
+    "browser_pool_recycles_total",
+    "Pooled contexts closed, by reason (max_uses, failed_use, disconnected, reset_failed, shutdown)",
+    ["reason"],
+)
+
+BROWSER_PAGE_REQUESTS = Histogram(
+    "browser_page_requests",
+    "Requests issued by one browser-tier page read, blocked ones included",
+    ["strategy"],
+    buckets=(5, 10, 25, 50, 100, 200, 400, 800),
+)
+
+BROWSER_PAGE_BYTES = Histogram(
+    "browser_page_bytes",
+    "Bytes (headers plus body) downloaded by one browser-tier page read",
+    ["strategy"],
+    buckets=(50_000, 250_000, 500_000, 1_000_000, 2_500_000, 5_000_000, 10_000_000, 25_000_000),
+)
+
+BROWSER_BLOCKED_REQUESTS_TOTAL = Counter(
+    "browser_blocked_requests_total",
+    "Browser-tier requests aborted by the resource policy (adblock, resource_type, stream, byte_budget)",
+    ["strategy", "reason"],
+)
+
+BLOCKLIST_REFRESH_TOTAL = Counter(
+    "blocklist_refresh_total",
+    "Background blocklist revalidations (updated, not_modified, error)",
+    ["result"],
+)
+
+DNS_CACHE_TOTAL = Counter(
+    "dns_cache_total",
+    "SSRF-guard DNS lookups by cache outcome (hit, negative_hit, miss)",
+    ["result"],
+)
+
+DNS_RESOLVE_SECONDS = Histogram(
+    "dns_resolve_seconds",
+    "Duration of uncached A/AAAA lookups made by the SSRF guard",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 3),
+)
+
+CURL_SESSIONS = Gauge(
+    "curl_sessions",
+    "Pooled curl_cffi sessions currently open",
+)
+
+CURL_SESSION_CHECKOUTS_TOTAL = Counter(
+    "curl_session_checkouts_total",
+    "curl_cffi fetches by whether they reused a pooled session (reused) or opened one (new)",
+    ["result"],
+)
+
+CURL_SESSIONS_CLOSED_TOTAL = Counter(
+    "curl_sessions_closed_total",
+    "Pooled curl_cffi sessions closed, by reason (idle, evicted, repinned, shutdown)",
+    ["reason"],
+)
+
+BROWSER_READINESS_TOTAL = Counter(
+    "browser_readiness_total",
+    "Playwright renders by how the readiness wait ended (quiet, capped, timeout, login, captcha)",
+    ["outcome"],
+)
+
+BROWSER_READINESS_WAIT_SECONDS = Histogram(
+    "browser_readiness_wait_seconds",
+    "Time from DOMContentLoaded until the Playwright page was judged ready",
+    buckets=(0.25, 0.5, 1, 2, 3, 5, 10, 20, 30),
+)
+
+CRAWLEE_CRAWLERS_STARTED_TOTAL = Counter(
+    "crawlee_crawlers_started_total",
+    "Long-lived Crawlee crawlers started, by reason (cold, recycled, crashed)",
+    ["reason"],
+)
+
+CRAWLEE_READS_IN_FLIGHT = Gauge(
+    "crawlee_reads_in_flight",
+    "Tier-5 reads queued on or being crawled by the Crawlee service",
+)
+
+EXTRACTION_SECONDS = Histogram(
+    "extraction_seconds",
+    "HTML extraction / validation time by where it ran (inline, pool, retry after a worker crash)",
+    ["where"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+
+EVENT_LOOP_LAG_SECONDS = Histogram(
+    "event_loop_lag_seconds",
+    "How late the event loop woke a periodic probe; long tails mean synchronous work is stalling it",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+
+READ_CHUNKS_TOTAL = Counter(
+    "read_chunks_total",
+    "Chunked read responses by kind (first, continuation, expired cursor) and snapshot Redis errors",
+    ["kind"],
+)
+
+CONTENT_ROUTES_TOTAL = Counter(
+    "content_routes_total",
+    "Reads answered without the HTML tiers, by sniffed content kind (json, text, pdf, binary, too_large)",
+    ["kind"],
+)
+
+CIRCUIT_BREAKER_STATE = Gauge(
+    "circuit_breaker_state",
+    "Circuit breaker state per strategy or upstream: 0 closed, 1 half-open, 2 open",
+    ["name"],
+)
+
+CIRCUIT_BREAKER_TRANSITIONS_TOTAL = Counter(
+    "circuit_breaker_transitions_total",
+    "Circuit breaker state changes, by the state entered",
+    ["name", "state"],
+)
+
+CIRCUIT_BREAKER_CALLS_TOTAL = Counter(
+    "circuit_breaker_calls_total",
+    "Calls through a circuit breaker by outcome (success, failure, timeout, rejected)",
+    ["name", "outcome"],
+)
+
+ATTEMPT_TIMEOUT_SECONDS = Histogram(
+    "attempt_timeout_seconds",
+    "Timeout each tier fetch ran with, by where it came from (domain, tier or static)",
+    ["strategy", "source"],
+    buckets=(1, 2, 3, 5, 8, 10, 15, 20, 30, 45, 60),
+)
+
+POLITENESS_QUEUE_WAIT_SECONDS = Histogram(
+    "politeness_queue_wait_seconds",
+    "Time a page fetch waited for its domain's concurrency, rate or Retry-After limit",
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+)
+
+POLITENESS_QUEUED = Gauge(
+    "politeness_queued",
+    "Page fetches currently waiting for a per-domain politeness slot",
+)
+
+POLITENESS_PAUSES_TOTAL = Counter(
+    "politeness_pauses_total",
+    "Domains paused because a response carried Retry-After",
+)
@@ -0,0 +1,109 @@
+import math
+from collections import OrderedDict, deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import NamedTuple
+
+from src.config.config import settings
+from src.observability.metrics import ATTEMPT_TIMEOUT_SECONDS
+from src.reader.domain_utils import get_registrable_domain
+
+# Same bound and eviction as StrategyMemory's local table.
+_MAX_KEYS = 5000
+
+# Key suffix of a tier's samples across every domain, used until a domain has its own.
+_ANY_DOMAIN = ""
+
+
+class _AttemptTimeout(NamedTuple):
+    strategy: str
+    seconds: float | None
+    source: str
+
+
+_attempt_timeout_ctx: ContextVar[_AttemptTimeout | None] = ContextVar("attempt_timeout", default=None)
+
+
+def attempt_timeout(static: float) -> float:
+    """
+    Timeout for a fetch made by the running tier attempt: the estimate AdaptiveTimeouts chose
+    for it, capped at `static`, the call site's configured timeout. Outside an attempt, or
+    before the tier has enough history, `static` itself.
+    """
+    chosen = _attempt_timeout_ctx.get()
+    if chosen is None:
+        return static
+
+    timeout = static if chosen.seconds is None else min(chosen.seconds, static)
+    ATTEMPT_TIMEOUT_SECONDS.labels(strategy=chosen.strategy, source=chosen.source).observe(timeout)
+
+    return timeout
+
+
+class AdaptiveTimeouts:
+    """
+    Per-tier, per-domain timeouts sized from how long successful attempts actually took.
+
+    Every tier used to wait out the full EXTRACT_TIMEOUT (60 s for FlareSolverr) even though
+    most successful curl fetches finish in under 2 s, so a dead origin cost each read the
+    whole budget before the chain moved on. The last ADAPTIVE_TIMEOUT_WINDOW successful
+    durations are kept per (tier, registrable domain) and per tier across domains. An
+    attempt gets ADAPTIVE_TIMEOUT_MULTIPLIER times their ADAPTIVE_TIMEOUT_PERCENTILE,
+    from the domain's samples when it has ADAPTIVE_TIMEOUT_MIN_SAMPLES of them, else from
+    the tier's, else none at all: the fetch keeps its static timeout. Estimates never drop
+    below ADAPTIVE_TIMEOUT_FLOOR_SECONDS nor exceed the static timeout. Only successes are
+    sampled, so a timed-out attempt cannot ratchet its own timeout down.
+    """
+
+    def __init__(self) -> None:
+        # (strategy, domain) -> most recent successful durations, oldest-touched key first.
+        self._samples: OrderedDict[tuple[str, str], deque[float]] = OrderedDict()
+
+    @contextmanager
+    def applied(self, strategy: str, url: str) -> Iterator[None]:
+        """Makes attempt_timeout() inside the block answer with this tier's estimate for `url`."""
+        seconds, source = self.estimate(strategy, url)
+        token = _attempt_timeout_ctx.set(_AttemptTimeout(strategy, seconds, source))
+        try:
+            yield
+        finally:
+            _attempt_timeout_ctx.reset(token)
+
+    def estimate(self, strategy: str, url: str) -> tuple[float | None, str]:
+        """(seconds, source): source is "domain", "tier", or "static" with seconds None."""
+        if not settings.ADAPTIVE_TIMEOUT_ENABLED:
+            return None, "static"
+
+        for domain, source in ((get_registrable_domain(url), "domain"), (_ANY_DOMAIN, "tier")):
+            samples = self._samples.get((strategy, domain))
+            if samples is not None and len(samples) >= settings.ADAPTIVE_TIMEOUT_MIN_SAMPLES:
+                seconds = self._percentile(samples) * settings.ADAPTIVE_TIMEOUT_MULTIPLIER
+
+                return max(settings.ADAPTIVE_TIMEOUT_FLOOR_SECONDS, seconds), source
+
+        return None, "static"
+
+    def record_success(self, strategy: str, url: str, seconds: float) -> None:
+        for domain in dict.fromkeys((get_registrable_domain(url), _ANY_DOMAIN)):
+            key = (strategy, domain)
+            samples = self._samples.get(key)
+            if samples is None or samples.maxlen != settings.ADAPTIVE_TIMEOUT_WINDOW:
+                samples = deque(samples or (), maxlen=settings.ADAPTIVE_TIMEOUT_WINDOW)
+            samples.append(seconds)
+            self._samples[key] = samples
+            self._samples.move_to_end(key)
+
+        while len(self._samples) > _MAX_KEYS:
+            self._samples.popitem(last=False)
+
+    @staticmethod
+    def _percentile(samples: deque[float]) -> float:
+        # Nearest rank: the answer is always a duration that was actually observed.
+        ordered = sorted(samples)
+        rank = math.ceil(settings.ADAPTIVE_TIMEOUT_PERCENTILE * len(ordered))
+
+        return ordered[min(len(ordered), max(1, rank)) - 1]
+
+
+adaptive_timeouts = AdaptiveTimeouts()
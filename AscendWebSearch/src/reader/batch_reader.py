@@ -0,0 +1,119 @@
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+from urllib.parse import urlsplit
+
+from src.api.exceptions import HumanInterventionRequiredException
+from src.config.config import settings
+from src.observability.metrics import BATCH_READ_ITEMS_TOTAL, HUMAN_INTERVENTION_TOTAL
+from src.reader.domain_utils import get_registrable_domain
+from src.reader.web_reader import WebReader
+from src.validator.url_validator import is_safe_external_url
+
+logger = logging.getLogger(__name__)
+
+_UNSAFE_URL_MESSAGE = "URL resolves to a private, loopback, link-local, or otherwise non-routable address"
+
+
+class BatchReader:
+    """
+    Reads a list of URLs concurrently and yields one item per URL as soon as it finishes.
+
+    Concurrency is bounded twice per batch: BATCH_READ_MAX_CONCURRENCY overall and
+    BATCH_READ_PER_DOMAIN_CONCURRENCY per registrable domain, so a batch of twenty links
+    from one site does not hit that site twenty times at once. BATCH_READ_DEADLINE_SECONDS
+    caps the whole batch; URLs still running at the deadline are cancelled and reported
+    as `timeout`. A failing URL never fails the batch - every item carries its own status.
+    """
+
+    def __init__(self, web_reader: WebReader) -> None:
+        self.web_reader = web_reader
+
+    async def read_many(
+        self,
+        urls: list[str],
+        include_links: bool = False,
+        link_filter: str | None = None,
+        heavy_mode: bool = False,
+        deadline: float | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """`deadline` is a time.monotonic() timestamp; callers sharing a budget pass their own."""
+        global_limit = asyncio.Semaphore(settings.BATCH_READ_MAX_CONCURRENCY)
+        domain_limits: dict[str, asyncio.Semaphore] = {}
+
+        async def read_one(index: int, url: str) -> dict[str, Any]:
+            domain = get_registrable_domain(url) or urlsplit(url).hostname or url
+            domain_limit = domain_limits.setdefault(
+                domain, asyncio.Semaphore(settings.BATCH_READ_PER_DOMAIN_CONCURRENCY)
+            )
+            # Domain slot first: a URL queued behind its own domain must not hold a global
+            # slot that a URL from another domain could be using.
+            async with domain_limit, global_limit:
+                return {
+                    "index": index,
+                    "url": url,
+                    **await self._read_item(url, include_links, link_filter, heavy_mode),
+                }
+
+        tasks = {asyncio.create_task(read_one(index, url)): (index, url) for index, url in enumerate(urls)}
+        if deadline is None:
+            deadline = time.monotonic() + settings.BATCH_READ_DEADLINE_SECONDS
+        pending = set(tasks)
+
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending,
+                    timeout=max(0.0, deadline - time.monotonic()),
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                if not done:
+                    break
+
+                for task in done:
+                    item = task.result()
+                    BATCH_READ_ITEMS_TOTAL.labels(status=item["status"]).inc()
+                    yield item
+
+            for task in pending:
+                index, url = tasks[task]
+                BATCH_READ_ITEMS_TOTAL.labels(status="timeout").inc()
+                yield {
+                    "index": index,
+                    "url": url,
+                    "status": "timeout",
+                    "message": "Batch deadline reached before the read finished",
+                }
+        finally:
+            # Also runs when the client disconnects mid-stream and the generator is closed.
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+    async def _read_item(
+        self, url: str, include_links: bool, link_filter: str | None, heavy_mode: bool
+    ) -> dict[str, Any]:
+        if not await is_safe_external_url(url):
+            return {"status": "rejected", "message": _UNSAFE_URL_MESSAGE}
+
+        try:
+            if include_links:
+                return await self.web_reader.read_with_links(url, link_filter, heavy_mode=heavy_mode)
+
+            return await self.web_reader.read(url, heavy_mode=heavy_mode)
+        except HumanInterventionRequiredException as exc:
+            # Same payload the single-URL MCP tool returns; one captcha must not abort the batch.
+            HUMAN_INTERVENTION_TOTAL.labels(intervention_type=exc.intervention_type).inc()
+
+            return {
+                "status": "human_intervention_required",
+                "intervention_type": exc.intervention_type,
+                "vnc_url": exc.vnc_url,
+                "message": exc.message,
+            }
+        except Exception:
+            logger.exception(f"BatchReader: unexpected error reading {url}")
+
+            return {"status": "error", "message": "Unexpected error while reading the URL"}
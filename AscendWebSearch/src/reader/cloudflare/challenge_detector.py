@@ -1,6 +1,7 @@
 import json
 import re
 from pathlib import Path
+from typing import Any, NamedTuple
 
 DICT_PATH = Path(__file__).parent / "challenge_dictionary.json"
 try:
@@ -13,6 +14,52 @@ except Exception:
         "login_title_patterns": [],
     }
 
+# Pages up to twice this size are scanned whole; larger ones only in their first and last
+# _SCAN_WINDOW_CHARS. Interstitials are small, and on a full page the markers sit in <head>
+# (title, challenge scripts) or just before </body>, so the middle is article text. Together
+# the two windows cost what the old 50 KB cut-off did, without skipping big pages outright.
+_SCAN_WINDOW_CHARS = 25_000
+
+# Case-insensitive "Ray ID: <id>". Anchoring on the literal ": " keeps re's fast substring
+# search; a plain re.IGNORECASE pattern has no literal prefix and steps through every char.
+_RAY_ID = re.compile(r": (?<=(?i:ray id): )\w")
+_TITLE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+
+
+class _Markers(NamedTuple):
+    block: tuple[str, ...]
+    login_title: re.Pattern[str] | None
+
+
+def _compile_markers(bot_dict: dict[str, Any]) -> _Markers:
+    """
+    Flattens the dictionary once at import instead of on every check.
+
+    Block markers stay plain substrings: str's `in` is a memchr-driven fast search, and on
+    CPython it beats a single `re` alternation of the same literals by 2-3x (the alternation
+    re-enters every branch at each candidate char). Login patterns only ever run against
+    short <title> text, so they are folded into one pattern.
+    """
+    block = [*bot_dict.get("waf_script_signatures", []), *bot_dict.get("waf_strict_phrases", [])]
+    block += ["cf-turnstile", "cf_clearance"]
+    login = [re.escape(pattern.lower()) for pattern in bot_dict.get("login_title_patterns", [])]
+
+    return _Markers(
+        block=tuple(dict.fromkeys(block)),
+        login_title=re.compile("|".join(login)) if login else None,
+    )
+
+
+_MARKERS = _compile_markers(_BOT_DICT)
+
+
+def _scan_windows(html_content: str) -> tuple[str, ...]:
+    if len(html_content) <= 2 * _SCAN_WINDOW_CHARS:
+        return (html_content,)
+
+    # Scanned separately so a match cannot be stitched together across the cut.
+    return html_content[:_SCAN_WINDOW_CHARS], html_content[-_SCAN_WINDOW_CHARS:]
+
 
 class ChallengeDetector:
     @staticmethod
@@ -23,24 +70,14 @@ class ChallengeDetector:
         if not html_content:
             return status_code in (403, 429, 503)
 
-        if len(html_content) > 50000:
-            return False
-
-        for signature in _BOT_DICT.get("waf_script_signatures", []):
-            if signature in html_content:
+        for window in _scan_windows(html_content):
+            if any(marker in window for marker in _MARKERS.block):
                 return True
 
-        for phrase in _BOT_DICT.get("waf_strict_phrases", []):
-            if phrase in html_content:
+            if _RAY_ID.search(window):
                 return True
 
-        if re.search(r"Ray ID: \w+", html_content, re.IGNORECASE):
-            return True
-
-        if "cf-turnstile" in html_content:
-            return True
-
-        return "cf_clearance" in html_content
+        return False
 
     @staticmethod
     def is_login_required(url: str, html_content: str) -> bool:  # noqa: ARG004
@@ -50,18 +87,30 @@ class ChallengeDetector:
         if not html_content:
             return False
 
-        if len(html_content) > 50000:
-            return False
-
-        title_matches = re.finditer(r"<title[^>]*>(.*?)</title>", html_content, re.IGNORECASE | re.DOTALL)
-        for match in title_matches:
-            title_text = match.group(1).strip().lower()
-            for pattern in _BOT_DICT.get("login_title_patterns", []):
-                if pattern in title_text:
+        for window in _scan_windows(html_content):
+            for match in _TITLE.finditer(window):
+                if ChallengeDetector.is_login_title(match.group(1)):
                     return True
 
         return False
 
+    @staticmethod
+    def is_login_title(title: str) -> bool:
+        """
+        Checks a page title on its own, e.g. one reported by the in-page readiness observer.
+        """
+        return (
+            _MARKERS.login_title is not None
+            and _MARKERS.login_title.search(title.strip().lower()) is not None
+        )
+
+    @staticmethod
+    def block_markers() -> tuple[str, ...]:
+        """
+        The literal WAF markers is_blocked looks for, for matching outside Python.
+        """
+        return _MARKERS.block
+
     @staticmethod
     def is_login_redirect_url(url: str) -> bool:
         """
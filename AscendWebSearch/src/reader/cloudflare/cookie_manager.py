@@ -1,24 +1,37 @@
+import asyncio
 import json
 import logging
+import time
+from collections import OrderedDict
 from typing import Any
-from urllib.parse import urlparse
 
 import redis.asyncio as redis
-import tldextract
 
 from src.config.config import settings
 from src.observability.metrics import REDIS_OPS_TOTAL
+from src.reader.domain_utils import get_registrable_domain
+from src.runtime.circuit_breaker import circuit_breakers
 
 logger = logging.getLogger(__name__)
 
-
-# suffix_list_urls=() disables remote PSL fetches and falls back to the bundled
-# snapshot. cache_dir=None means in-memory only so we don't write to a default
-# platform-dependent directory.
-_TLD_EXTRACT = tldextract.TLDExtract(suffix_list_urls=(), cache_dir=None)
+# Other workers publish a domain here after saving new cookies for it; every worker drops
+# that domain from its L1 cache.
+_INVALIDATION_CHANNEL = "session_cookies:invalidate"
+_L1_MAX_DOMAINS = 4096
+_RESUBSCRIBE_DELAY_SECONDS = 5.0
 
 
 class CookieManager:
+    """
+    Cloudflare clearance cookies and the user agent that earned them, per registrable domain.
+
+    Redis is the shared store; every curl_cffi fetch asks for its domain, and almost all
+    domains never have clearance. An in-process L1 therefore caches answers - including
+    "no cookies" - for COOKIE_CACHE_TTL_SECONDS. A save drops the domain from the local L1
+    and publishes it on a Redis channel so the other workers drop it too; the TTL bounds
+    staleness while the subscription is down.
+    """
+
     _instance: "CookieManager | None" = None
     _initialized: bool
 
@@ -49,6 +62,9 @@ class CookieManager:
                 self._handle_error("Failed to connect to Redis for CookieManager", e)
 
         self._memory_store: dict[str, dict[str, Any]] = {}
+        self._l1_cache: OrderedDict[str, tuple[float, dict[str, Any] | None]] = OrderedDict()
+        # Bumped by every invalidation; a lookup that raced one must not cache its answer.
+        self._l1_epoch = 0
         self._initialized = True
 
     @staticmethod
@@ -57,44 +73,40 @@ class CookieManager:
 
     @staticmethod
     def _get_domain(url: str) -> str:
-        # PSL-aware registrable-domain extraction so that cookies set on
-        # www.linkedin.com and login.linkedin.com hit linkedin.com, while
-        # attacker.co.uk and victim.co.uk remain distinct keys (the naive
-        # last-two-labels approach collapsed all *.co.uk into one bucket
-        # and let one tenant overwrite another's cookies via NoVNC).
-        parsed = urlparse(url)
-        # Schemeless input (e.g. `evil.com/path`) lands in parsed.path as one string.
-        # Re-parse with a synthetic scheme so we extract the host cleanly instead of
-        # keying cookies under literal `evil.com/path`, which would create a parallel
-        # poisoned bucket distinct from the legitimate `evil.com` entry.
-        host = parsed.netloc or urlparse(f"//{url}", scheme="http").netloc or url.split("/", 1)[0]
-        host = host.lower().split(":", 1)[0]
-        if not host or "/" in host:
-            return ""
-
-        extracted = _TLD_EXTRACT(host)
-        if extracted.domain and extracted.suffix:
-            return f"{extracted.domain}.{extracted.suffix}"
-
-        return host
+        return get_registrable_domain(url)
 
     async def get_session_data(self, url: str) -> dict[str, Any] | None:
         domain = self._get_domain(url)
 
+        cached = self._l1_cache.get(domain)
+        if cached is not None and cached[0] > time.monotonic():
+            self._l1_cache.move_to_end(domain)
+            REDIS_OPS_TOTAL.labels(op="l1_get", result="hit" if cached[1] else "negative_hit").inc()
+            return cached[1]
+        REDIS_OPS_TOTAL.labels(op="l1_get", result="miss").inc()
+        epoch = self._l1_epoch
+
         if self.redis_client:
             try:
-                data = await self.redis_client.get(f"session_cookies:{domain}")
+                async with circuit_breakers.get("redis").guard():
+                    data = await self.redis_client.get(f"session_cookies:{domain}")
                 if data:
                     REDIS_OPS_TOTAL.labels(op="get", result="hit").inc()
                     parsed: dict[str, Any] = json.loads(data)
+                    self._cache_locally(domain, parsed, epoch)
 
                     return parsed
                 REDIS_OPS_TOTAL.labels(op="get", result="miss").inc()
             except Exception as e:
                 REDIS_OPS_TOTAL.labels(op="get", result="error").inc()
                 self._handle_error("Failed to get session data from Redis", e)
+                # Not cached: an outage says nothing about the domain.
+                return self._memory_store.get(domain)
 
-        return self._memory_store.get(domain)
+        session_data = self._memory_store.get(domain)
+        self._cache_locally(domain, session_data, epoch)
+
+        return session_data
 
     async def save_session_data(
         self,
@@ -108,12 +120,15 @@ class CookieManager:
 
         if self.redis_client:
             try:
-                await self.redis_client.setex(
-                    f"session_cookies:{domain}",
-                    ttl_seconds,
-                    json.dumps(payload),
-                )
+                async with circuit_breakers.get("redis").guard():
+                    await self.redis_client.setex(
+                        f"session_cookies:{domain}",
+                        ttl_seconds,
+                        json.dumps(payload),
+                    )
                 REDIS_OPS_TOTAL.labels(op="set", result="success").inc()
+                self._invalidate_locally(domain)
+                await self._publish_invalidation(domain)
 
                 logger.info(f"Saved session data to Redis for {domain}")
 
@@ -123,8 +138,59 @@ class CookieManager:
                 self._handle_error("Failed to save session data to Redis", e)
 
         self._memory_store[domain] = payload
+        self._invalidate_locally(domain)
 
         logger.info(f"Saved session data to memory for {domain}")
 
+    async def run_invalidation_listener(self) -> None:
+        """Drops domains other workers saved cookies for from the L1 cache; runs until cancelled."""
+        if self.redis_client is None:
+            return
+
+        while True:
+            try:
+                async with self.redis_client.pubsub() as pubsub:
+                    await pubsub.subscribe(_INVALIDATION_CHANNEL)
+                    # Saves published while we were not subscribed were missed.
+                    self._invalidate_locally()
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            REDIS_OPS_TOTAL.labels(op="invalidate", result="received").inc()
+                            self._invalidate_locally(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                REDIS_OPS_TOTAL.labels(op="invalidate", result="error").inc()
+                self._handle_error("Cookie invalidation subscription lost, resubscribing", e)
+                await asyncio.sleep(_RESUBSCRIBE_DELAY_SECONDS)
+
+    async def _publish_invalidation(self, domain: str) -> None:
+        if self.redis_client is None:
+            return
+
+        try:
+            async with circuit_breakers.get("redis").guard():
+                await self.redis_client.publish(_INVALIDATION_CHANNEL, domain)
+            REDIS_OPS_TOTAL.labels(op="invalidate", result="published").inc()
+        except Exception as e:
+            REDIS_OPS_TOTAL.labels(op="invalidate", result="error").inc()
+            self._handle_error("Failed to publish cookie invalidation", e)
+
+    def _invalidate_locally(self, domain: str | None = None) -> None:
+        self._l1_epoch += 1
+        if domain is None:
+            self._l1_cache.clear()
+        else:
+            self._l1_cache.pop(domain, None)
+
+    def _cache_locally(self, domain: str, session_data: dict[str, Any] | None, epoch: int) -> None:
+        if epoch != self._l1_epoch:
+            return
+
+        self._l1_cache[domain] = (time.monotonic() + settings.COOKIE_CACHE_TTL_SECONDS, session_data)
+        self._l1_cache.move_to_end(domain)
+        while len(self._l1_cache) > _L1_MAX_DOMAINS:
+            self._l1_cache.popitem(last=False)
+
 
 cookie_manager = CookieManager()
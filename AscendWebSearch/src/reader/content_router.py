@@ -0,0 +1,82 @@
+import io
+import logging
+from concurrent.futures.process import BrokenProcessPool
+from itertools import islice
+from typing import Any
+
+from pypdf import PdfReader
+
+from src.api.exceptions import NonHtmlContentException
+from src.config.config import settings
+from src.observability.metrics import CONTENT_ROUTES_TOTAL
+from src.reader.content_sniffer import BINARY, PDF, TOO_LARGE, decode, media_type
+from src.runtime.extraction_pool import extraction_pool
+
+logger = logging.getLogger(__name__)
+
+
+def extract_pdf_text(data: bytes, max_pages: int) -> str:
+    """
+    Text of the first `max_pages` pages, one paragraph per page. Pages are parsed one at a
+    time as they are reached, so a page that fails to extract only loses its own text.
+    Module-level so ExtractionPool workers can run it.
+    """
+    try:
+        reader = PdfReader(io.BytesIO(data))
+        pages = list(islice(reader.pages, max_pages))
+    except Exception as e:
+        logger.warning(f"PDF could not be opened: {e}")
+
+        return ""
+
+    texts: list[str] = []
+    for number, page in enumerate(pages, start=1):
+        try:
+            texts.append(page.extract_text().strip())
+        except Exception as e:
+            logger.warning(f"PDF page {number} could not be extracted: {e}")
+
+    return "\n\n".join(text for text in texts if text)
+
+
+async def answer_non_html(url: str, exc: NonHtmlContentException) -> dict[str, Any]:
+    """
+    The read result for a response the fetch recognised as something other than an HTML
+    page: JSON and text bodies are returned as they are, PDFs as their extracted text, and
+    binary or oversized responses as an error, none of them touching a browser tier.
+    """
+    CONTENT_ROUTES_TOTAL.labels(kind=exc.kind).inc()
+    content_type = media_type(exc.content_type)
+    logger.info(f"WebReader: {url} is {exc.kind} ({content_type or 'no Content-Type'}), skipping HTML tiers")
+
+    if exc.kind == TOO_LARGE:
+        return _error_response(
+            "too_large", f"{url} is larger than FETCH_MAX_BYTES={settings.FETCH_MAX_BYTES}", content_type
+        )
+    if exc.kind == BINARY:
+        served = content_type or "binary data"
+        return _error_response("unsupported_content_type", f"{url} serves {served}, not text", content_type)
+
+    if exc.kind == PDF:
+        try:
+            content = await extraction_pool.run(extract_pdf_text, exc.body, settings.PDF_MAX_PAGES)
+        except BrokenProcessPool:
+            # Crashed two extraction workers: answered like a PDF without extractable text.
+            logger.warning(f"PDF at {url} crashed the extraction workers")
+            content = ""
+    else:
+        content = decode(exc.body, exc.encoding).strip()
+
+    if not content:
+        return _error_response("no_text", f"{url} contains no extractable text", content_type)
+
+    return {
+        "content": content,
+        "status": "success",
+        "mode": f"content-{exc.kind}",
+        "content_type": content_type,
+    }
+
+
+def _error_response(reason: str, error: str, content_type: str) -> dict[str, Any]:
+    return {"content": "", "status": "error", "reason": reason, "error": error, "content_type": content_type}
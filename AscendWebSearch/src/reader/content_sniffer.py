@@ -0,0 +1,100 @@
+HTML = "html"
+JSON = "json"
+TEXT = "text"
+PDF = "pdf"
+BINARY = "binary"
+TOO_LARGE = "too_large"
+
+# Signatures checked before the declared type: servers routinely label PDFs and images
+# application/octet-stream, or even text/html when a download script serves them.
+_PDF_MAGIC = b"%PDF-"
+_BINARY_MAGIC = (
+    b"\x89PNG\r\n\x1a\n",
+    b"\xff\xd8\xff",  # JPEG
+    b"GIF87a",
+    b"GIF89a",
+    b"PK\x03\x04",  # zip, docx, xlsx, epub
+    b"\x1f\x8b",  # gzip
+    b"7z\xbc\xaf\x27\x1c",
+    b"Rar!\x1a\x07",
+    b"\x7fELF",
+    b"MZ",  # Windows executables
+    b"OggS",
+    b"ID3",  # mp3
+    b"\x1aE\xdf\xa3",  # webm, mkv
+    b"wOFF",
+    b"wOF2",
+)
+_RIFF_BINARY = (b"WEBP", b"WAVE", b"AVI ")
+
+_HTML_TYPES = frozenset({"text/html", "application/xhtml+xml"})
+_JSON_TYPES = frozenset({"application/json", "text/json", "application/ld+json"})
+_TEXT_TYPES = frozenset({"text/plain", "text/markdown", "text/x-markdown", "text/csv"})
+_BINARY_PREFIXES = ("image/", "audio/", "video/", "font/")
+_BINARY_TYPES = frozenset(
+    {
+        "application/octet-stream",
+        "application/zip",
+        "application/gzip",
+        "application/x-gzip",
+        "application/x-tar",
+        "application/x-7z-compressed",
+        "application/vnd.rar",
+        "application/wasm",
+        "application/msword",
+        "application/vnd.ms-excel",
+    }
+)
+_BINARY_VENDOR_PREFIX = "application/vnd.openxmlformats-officedocument."
+
+_HTML_MARKERS = (b"<!doctype html", b"<html", b"<head", b"<body")
+
+
+def media_type(content_type: str) -> str:
+    """The bare, lower-cased media type of a Content-Type header value."""
+    return content_type.split(";", 1)[0].strip().lower()
+
+
+def sniff(content_type: str, head: bytes) -> str:
+    """
+    What a response holds, from its Content-Type header and its first bytes: one of HTML,
+    JSON, TEXT, PDF or BINARY. Anything unrecognised, including XML feeds and a missing
+    header, is HTML, so the tiers handle it exactly as they did before routing existed.
+    """
+    if head.startswith(_PDF_MAGIC):
+        return PDF
+    if head.startswith(_BINARY_MAGIC) or (head[:4] == b"RIFF" and head[8:12] in _RIFF_BINARY):
+        return BINARY
+    if len(head) >= 12 and head[4:8] == b"ftyp":  # mp4, mov, heic
+        return BINARY
+
+    declared = media_type(content_type)
+    if declared in _HTML_TYPES:
+        return HTML
+    if declared == "application/pdf":
+        return PDF
+    if declared in _JSON_TYPES or declared.endswith("+json"):
+        return JSON
+    if declared in _TEXT_TYPES:
+        # Some servers send every page as text/plain; a browser would still render it.
+        return HTML if _looks_like_html(head) else TEXT
+    if declared.startswith(_BINARY_PREFIXES) or declared in _BINARY_TYPES:
+        return BINARY
+    if declared.startswith(_BINARY_VENDOR_PREFIX):
+        return BINARY
+
+    return HTML
+
+
+def decode(body: bytes, encoding: str | None) -> str:
+    """`body` decoded with the response's charset, falling back to UTF-8 on an unknown one."""
+    try:
+        return body.decode(encoding or "utf-8", errors="replace")
+    except LookupError:
+        return body.decode("utf-8", errors="replace")
+
+
+def _looks_like_html(head: bytes) -> bool:
+    start = head[:512].lstrip(b"\xef\xbb\xbf \t\r\n").lower()
+
+    return start.startswith(_HTML_MARKERS)
@@ -0,0 +1,39 @@
+from functools import lru_cache
+from urllib.parse import urlparse
+
+import tldextract
+
+# suffix_list_urls=() disables remote PSL fetches and falls back to the bundled
+# snapshot. cache_dir=None means in-memory only so we don't write to a default
+# platform-dependent directory.
+_TLD_EXTRACT = tldextract.TLDExtract(suffix_list_urls=(), cache_dir=None)
+
+
+def get_registrable_domain(url: str) -> str:
+    # PSL-aware registrable-domain extraction so that www.linkedin.com and
+    # login.linkedin.com both key to linkedin.com, while attacker.co.uk and
+    # victim.co.uk remain distinct keys (the naive last-two-labels approach
+    # collapsed all *.co.uk into one bucket and let one tenant overwrite
+    # another's cookies via NoVNC).
+    parsed = urlparse(url)
+    # Schemeless input (e.g. `evil.com/path`) lands in parsed.path as one string.
+    # Re-parse with a synthetic scheme so we extract the host cleanly instead of
+    # keying under literal `evil.com/path`, which would create a parallel
+    # poisoned bucket distinct from the legitimate `evil.com` entry.
+    host = parsed.netloc or urlparse(f"//{url}", scheme="http").netloc or url.split("/", 1)[0]
+    host = host.lower().split(":", 1)[0]
+    if not host or "/" in host:
+        return ""
+
+    return _registrable_domain_of_host(host)
+
+
+# Every fetch, batch slot and strategy-memory update asks for a domain; a PSL walk per call
+# is measurable, while a site's hosts repeat across all of its pages.
+@lru_cache(maxsize=4096)
+def _registrable_domain_of_host(host: str) -> str:
+    extracted = _TLD_EXTRACT(host)
+    if extracted.domain and extracted.suffix:
+        return f"{extracted.domain}.{extracted.suffix}"
+
+    return host
@@ -1,8 +1,6 @@
 from urllib.parse import urljoin, urlparse
 
-from bs4 import BeautifulSoup
-
-from src.reader.html_utils import remove_noise_tags
+from src.reader.html_utils import ParsedDocument
 
 LINK_MARKER_TEMPLATE = "[{index}]"
 VALID_SCHEMES = ("http", "https")
@@ -14,23 +12,22 @@ def annotate_links(
     base_url: str,
     link_filter: str | None = None,
 ) -> tuple[str, dict[int, str]]:
-    soup = BeautifulSoup(html, "html.parser")
-    remove_noise_tags(soup)
+    document = ParsedDocument(html)
     link_map: dict[int, str] = {}
     link_index = 1
 
-    for anchor in soup.find_all("a", href=True):
-        absolute_url = _resolve_absolute_url(str(anchor["href"]), base_url)
+    for anchor in document.anchors():
+        absolute_url = _resolve_absolute_url(str(anchor.get("href")), base_url)
         if not absolute_url:
             continue
         if link_filter and link_filter not in absolute_url:
             continue
         marker = LINK_MARKER_TEMPLATE.format(index=link_index)
-        anchor.string = f"{anchor.get_text(strip=True)} {marker}"
+        document.replace_text(anchor, f"{document.element_text(anchor)} {marker}")
         link_map[link_index] = absolute_url
         link_index += 1
 
-    return soup.get_text(separator=" ", strip=True), link_map
+    return document.visible_text(), link_map
 
 
 def _resolve_absolute_url(href: str, base_url: str) -> str:
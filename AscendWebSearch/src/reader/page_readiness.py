@@ -0,0 +1,163 @@
+import asyncio
+import json
+import logging
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, TypedDict
+from weakref import WeakKeyDictionary
+
+from playwright.async_api import Page
+
+from src.config.config import settings
+from src.reader.cloudflare.challenge_detector import ChallengeDetector
+
+logger = logging.getLogger(__name__)
+
+_BINDING = "__ascendReadiness"
+
+# Only these attribute changes are inspected and count as DOM activity; style / aria churn
+# from animations would otherwise keep a page from ever going quiet.
+_WATCHED_ATTRIBUTES = ["src", "href", "class", "id", "action"]
+
+# Runs in the top frame of every document before its own scripts. Markers are matched
+# against each inserted text node and attribute value once, as the parser or a script adds
+# them, so no event ever needs the serialized DOM.
+_OBSERVER_JS = """
+(config) => {
+  if (window !== window.top) return;
+  const send = (kind, value) => {
+    try { window[config.binding]({ kind, value, url: location.href }); } catch (e) {}
+  };
+  const rayId = /ray id: \\w/i;
+  const seen = new Set();
+  const inspect = (text) => {
+    if (!text) return;
+    for (const marker of config.markers) {
+      if (!seen.has(marker) && text.includes(marker)) { seen.add(marker); send("marker", marker); }
+    }
+    if (!seen.has("Ray ID") && rayId.test(text)) { seen.add("Ray ID"); send("marker", "Ray ID"); }
+  };
+  const inspectTree = (node) => {
+    if (node.nodeType === Node.TEXT_NODE) { inspect(node.data); return; }
+    if (node.nodeType !== Node.ELEMENT_NODE) return;
+    const walker = document.createTreeWalker(node, NodeFilter.SHOW_ELEMENT | NodeFilter.SHOW_TEXT);
+    for (let current = node; current; current = walker.nextNode()) {
+      if (current.nodeType === Node.TEXT_NODE) inspect(current.data);
+      else for (const attribute of current.attributes) inspect(attribute.value);
+    }
+  };
+
+  let title = "";
+  let loaded = false;
+  let ready = false;
+  let quietTimer = 0;
+  const finish = (reason) => {
+    if (ready) return;
+    ready = true;
+    clearTimeout(quietTimer);
+    send("ready", reason);
+  };
+  const settle = () => {
+    if (!loaded || ready) return;
+    clearTimeout(quietTimer);
+    quietTimer = setTimeout(() => finish("quiet"), config.quietMs);
+  };
+
+  new MutationObserver((records) => {
+    for (const record of records) {
+      if (record.type === "childList") record.addedNodes.forEach(inspectTree);
+      else if (record.type === "characterData") inspect(record.target.data);
+      else inspect(record.target.getAttribute(record.attributeName));
+    }
+    if (document.title && document.title !== title) {
+      title = document.title;
+      send("title", title);
+    }
+    settle();
+  }).observe(document, {
+    childList: true,
+    subtree: true,
+    characterData: true,
+    attributes: true,
+    attributeFilter: config.attributes,
+  });
+  window.addEventListener("load", () => {
+    loaded = true;
+    settle();
+    setTimeout(() => finish("capped"), config.maxWaitMs);
+  });
+}
+"""
+
+
+class ReadinessEvent(TypedDict):
+    kind: str  # "title", "marker" or "ready"
+    value: str
+    url: str
+
+
+class ReadinessWatch:
+    """Events reported by the observer during one read of one page."""
+
+    def __init__(self) -> None:
+        self.events: asyncio.Queue[ReadinessEvent] = asyncio.Queue()
+
+    async def next_event(self, deadline: float) -> ReadinessEvent | None:
+        """Waits for the next event until `deadline` (a time.monotonic() timestamp); None on timeout."""
+        try:
+            return await asyncio.wait_for(self.events.get(), timeout=max(0.0, deadline - time.monotonic()))
+        except TimeoutError:
+            return None
+
+
+class PageReadiness:
+    """
+    Event-driven readiness for the Playwright tier.
+
+    The old render loop serialized the whole DOM with page.content() once a second to look
+    for challenge walls, then slept a fixed DYNAMIC_CONTENT_WAIT. Instead, an observer
+    injected into every document reports through an exposed binding: title changes, the
+    first sighting of each challenge marker in inserted nodes, and readiness once the DOM
+    has been quiet for BROWSER_DOM_QUIET_MS after the load event (or DYNAMIC_CONTENT_WAIT
+    after it, for pages that never settle). The strategy reacts to those events and pulls
+    the HTML once at the end. Pooled pages are attached once; each read opens a watch().
+    """
+
+    def __init__(self) -> None:
+        self._watches: WeakKeyDictionary[Page, ReadinessWatch] = WeakKeyDictionary()
+        self._script = f"({_OBSERVER_JS})({json.dumps(self._config())})"
+
+    async def attach(self, page: Page) -> None:
+        """Installs the binding and observer; they persist across the page's navigations."""
+        await page.expose_binding(_BINDING, self._on_event)
+        await page.add_init_script(script=self._script)
+
+    @contextmanager
+    def watch(self, page: Page) -> Iterator[ReadinessWatch]:
+        """Collects `page`'s events for one read; open it before navigating."""
+        watch = ReadinessWatch()
+        self._watches[page] = watch
+        try:
+            yield watch
+        finally:
+            if self._watches.get(page) is watch:
+                del self._watches[page]
+
+    async def _on_event(self, source: dict[str, Any], event: ReadinessEvent) -> None:
+        watch = self._watches.get(source["page"])
+        # The pool parks pages on about:blank between reads; its late "ready" must not end the next read.
+        if watch is None or event.get("url") == "about:blank":
+            return
+
+        watch.events.put_nowait(event)
+
+    @staticmethod
+    def _config() -> dict[str, Any]:
+        return {
+            "binding": _BINDING,
+            "markers": list(ChallengeDetector.block_markers()),
+            "attributes": _WATCHED_ATTRIBUTES,
+            "quietMs": settings.BROWSER_DOM_QUIET_MS,
+            "maxWaitMs": settings.DYNAMIC_CONTENT_WAIT,
+        }
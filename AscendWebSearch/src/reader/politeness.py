@@ -0,0 +1,203 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Mapping
+from contextlib import asynccontextmanager
+from email.utils import parsedate_to_datetime
+from typing import Any
+from urllib.parse import urlsplit
+
+from src.config.config import settings
+from src.observability.metrics import (
+    POLITENESS_PAUSES_TOTAL,
+    POLITENESS_QUEUE_WAIT_SECONDS,
+    POLITENESS_QUEUED,
+)
+from src.observability.request_context import request_id_ctx
+from src.reader.domain_utils import get_registrable_domain
+
+logger = logging.getLogger(__name__)
+
+# Statuses whose Retry-After asks us to slow down; on a 3xx it only delays a redirect.
+_BACKOFF_STATUSES = frozenset({429, 503})
+
+# Idle domains are only swept once the table grows this large.
+_SWEEP_AT_DOMAINS = 5000
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Seconds a Retry-After header asks for: delta-seconds or an HTTP-date. None if unusable."""
+    if not value:
+        return None
+
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class _DomainQueue:
+    def __init__(self) -> None:
+        self.active = 0
+        self.next_start = 0.0
+        self.paused_until = 0.0
+        # caller -> its queued fetches; callers take turns in insertion order.
+        self.waiters: OrderedDict[str, deque[asyncio.Future[None]]] = OrderedDict()
+        self.timer: asyncio.TimerHandle | None = None
+
+    def idle(self, now: float) -> bool:
+        return not self.active and not self.waiters and max(self.next_start, self.paused_until) <= now
+
+
+class PolitenessScheduler:
+    """
+    Per-registrable-domain admission for outbound page fetches, shared by every tier.
+
+    Hedged tiers, concurrent reads and batch items each fetched on their own, so one origin
+    could see a burst of parallel requests from us and answer with a 429 or a WAF challenge
+    that then cost a FlareSolverr or NoVNC escalation. A fetch runs inside slot(url), which
+    admits at most POLITENESS_PER_DOMAIN_CONCURRENCY fetches per domain at once, starts them
+    at most POLITENESS_REQUESTS_PER_SECOND apart, and holds the domain while a 429 / 503
+    Retry-After (capped at POLITENESS_MAX_RETRY_AFTER_SECONDS) runs. Excess fetches queue per
+    caller - the request ID - and callers are served round-robin, so a 30-URL batch against
+    one site cannot starve a single read of it from another request.
+    """
+
+    def __init__(self) -> None:
+        self._domains: dict[str, _DomainQueue] = {}
+
+    @asynccontextmanager
+    async def slot(self, url: str) -> AsyncIterator[None]:
+        """Waits for `url`'s domain to admit one more fetch, and holds that admission for the block."""
+        if not settings.POLITENESS_ENABLED:
+            yield
+            return
+
+        key = _domain_key(url)
+        domain = self._domain(key)
+        started = time.monotonic()
+        await self._acquire(domain)
+        POLITENESS_QUEUE_WAIT_SECONDS.observe(time.monotonic() - started)
+        try:
+            yield
+        finally:
+            self._release(domain)
+
+    def note_response(self, url: str, status: int, headers: Mapping[str, Any]) -> None:
+        """Pauses `url`'s domain for a 429 / 503 response's Retry-After, if it sent one."""
+        if status not in _BACKOFF_STATUSES:
+            return
+
+        seconds = parse_retry_after(headers.get("Retry-After") or headers.get("retry-after"))
+        if seconds is None:
+            return
+
+        key = _domain_key(url)
+        domain = self._domain(key)
+        seconds = min(seconds, settings.POLITENESS_MAX_RETRY_AFTER_SECONDS)
+        domain.paused_until = max(domain.paused_until, time.monotonic() + seconds)
+        POLITENESS_PAUSES_TOTAL.inc()
+        logger.info(f"Politeness: {key} answered {status}, pausing fetches to it for {seconds:.0f}s")
+
+    def _domain(self, key: str) -> _DomainQueue:
+        domain = self._domains.get(key)
+        if domain is None:
+            if len(self._domains) >= _SWEEP_AT_DOMAINS:
+                now = time.monotonic()
+                self._domains = {name: queue for name, queue in self._domains.items() if not queue.idle(now)}
+            domain = self._domains[key] = _DomainQueue()
+
+        return domain
+
+    async def _acquire(self, domain: _DomainQueue) -> None:
+        if not domain.waiters and self._startable(domain, time.monotonic()):
+            self._start(domain)
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        caller = request_id_ctx.get()
+        domain.waiters.setdefault(caller, deque()).append(future)
+        POLITENESS_QUEUED.inc()
+        self._dispatch(domain)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Admitted in the same loop iteration that cancelled us: give the slot back.
+                self._release(domain)
+            else:
+                self._discard(domain, caller, future)
+            raise
+
+    def _release(self, domain: _DomainQueue) -> None:
+        domain.active -= 1
+        self._dispatch(domain)
+
+    def _dispatch(self, domain: _DomainQueue) -> None:
+        while domain.waiters and domain.active < settings.POLITENESS_PER_DOMAIN_CONCURRENCY:
+            now = time.monotonic()
+            if not self._startable(domain, now):
+                self._wake_later(domain, max(domain.next_start, domain.paused_until) - now)
+                return
+
+            caller, queue = next(iter(domain.waiters.items()))
+            future = queue.popleft()
+            if queue:
+                domain.waiters.move_to_end(caller)
+            else:
+                del domain.waiters[caller]
+            POLITENESS_QUEUED.dec()
+            if future.done():
+                continue
+
+            self._start(domain)
+            future.set_result(None)
+
+    def _wake_later(self, domain: _DomainQueue, delay: float) -> None:
+        # next_start and paused_until only move forward, so a pending timer is never late;
+        # if it fires early (a pause was extended) _dispatch simply sets the next one.
+        if domain.timer is None:
+            domain.timer = asyncio.get_running_loop().call_later(delay, self._on_timer, domain)
+
+    def _on_timer(self, domain: _DomainQueue) -> None:
+        domain.timer = None
+        self._dispatch(domain)
+
+    @staticmethod
+    def _startable(domain: _DomainQueue, now: float) -> bool:
+        return (
+            domain.active < settings.POLITENESS_PER_DOMAIN_CONCURRENCY
+            and now >= domain.next_start
+            and now >= domain.paused_until
+        )
+
+    @staticmethod
+    def _start(domain: _DomainQueue) -> None:
+        domain.active += 1
+        rate = settings.POLITENESS_REQUESTS_PER_SECOND
+        if rate > 0:
+            domain.next_start = time.monotonic() + 1.0 / rate
+
+    @staticmethod
+    def _discard(domain: _DomainQueue, caller: str, future: asyncio.Future[None]) -> None:
+        queue = domain.waiters.get(caller)
+        if queue is None or future not in queue:
+            return
+
+        queue.remove(future)
+        POLITENESS_QUEUED.dec()
+        if not queue:
+            del domain.waiters[caller]
+
+
+def _domain_key(url: str) -> str:
+    # Same fallback as BatchReader: IPs and single-label hosts have no registrable domain.
+    return get_registrable_domain(url) or urlsplit(url).hostname or url
+
+
+politeness_scheduler = PolitenessScheduler()
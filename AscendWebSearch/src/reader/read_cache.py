@@ -0,0 +1,114 @@
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any
+
+import redis.asyncio as redis
+
+from src.config.config import settings
+from src.observability.metrics import READ_CACHE_TOTAL
+from src.reader.url_normalizer import normalize_url
+from src.runtime.circuit_breaker import circuit_breakers
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "read_cache:"
+
+
+class ReadCache:
+    """
+    Cache of successful read results keyed by normalized URL plus read mode.
+
+    In-process LRU in front of optional Redis (shared across workers). Each entry keeps
+    the origin's ETag / Last-Modified so that, once READ_CACHE_FRESH_TTL_SECONDS has
+    passed, the caller can revalidate with a conditional GET instead of re-running the
+    strategy chain. Entries are dropped entirely after READ_CACHE_MAX_AGE_SECONDS.
+    """
+
+    def __init__(self) -> None:
+        self.redis_client = None
+        if settings.REDIS_URL:
+            try:
+                self.redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+            except Exception as e:
+                logger.warning(f"Failed to connect to Redis for ReadCache: {e}")
+
+        self._memory_store: OrderedDict[str, dict[str, Any]] = OrderedDict()
+
+    @staticmethod
+    def build_key(url: str, mode: str) -> str:
+        return f"{mode}|{normalize_url(url)}"
+
+    @staticmethod
+    def is_fresh(entry: dict[str, Any]) -> bool:
+        return time.time() - float(entry["stored_at"]) < settings.READ_CACHE_FRESH_TTL_SECONDS
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        entry = self._get_local(key)
+        if entry is not None:
+            return entry
+
+        if self.redis_client:
+            try:
+                async with circuit_breakers.get("redis").guard():
+                    data = await self.redis_client.get(f"{_KEY_PREFIX}{key}")
+                if data:
+                    parsed: dict[str, Any] = json.loads(data)
+                    # JSON object keys are always strings; restore the int link-map indices.
+                    links = parsed["result"].get("links")
+                    if isinstance(links, dict):
+                        parsed["result"]["links"] = {int(index): href for index, href in links.items()}
+                    self._put_local(key, parsed)
+
+                    return parsed
+            except Exception as e:
+                READ_CACHE_TOTAL.labels(result="redis_error").inc()
+                logger.warning(f"Failed to get read cache entry from Redis: {e}")
+
+        return None
+
+    async def put(self, key: str, result: dict[str, Any], validators: dict[str, str] | None = None) -> None:
+        entry = {"result": result, "stored_at": time.time(), "validators": validators or {}}
+        await self._write(key, entry)
+
+    async def touch(self, key: str, entry: dict[str, Any]) -> None:
+        """Restarts the freshness window after a 304 without touching the stored result."""
+        await self._write(key, {**entry, "stored_at": time.time()})
+
+    async def _write(self, key: str, entry: dict[str, Any]) -> None:
+        self._put_local(key, entry)
+
+        if self.redis_client:
+            try:
+                async with circuit_breakers.get("redis").guard():
+                    await self.redis_client.setex(
+                        f"{_KEY_PREFIX}{key}",
+                        settings.READ_CACHE_MAX_AGE_SECONDS,
+                        json.dumps(entry),
+                    )
+            except Exception as e:
+                READ_CACHE_TOTAL.labels(result="redis_error").inc()
+                logger.warning(f"Failed to save read cache entry to Redis: {e}")
+
+    def _get_local(self, key: str) -> dict[str, Any] | None:
+        entry = self._memory_store.get(key)
+        if entry is None:
+            return None
+
+        if time.time() - float(entry["stored_at"]) >= settings.READ_CACHE_MAX_AGE_SECONDS:
+            del self._memory_store[key]
+            return None
+
+        self._memory_store.move_to_end(key)
+
+        return entry
+
+    def _put_local(self, key: str, entry: dict[str, Any]) -> None:
+        self._memory_store[key] = entry
+        self._memory_store.move_to_end(key)
+        while len(self._memory_store) > settings.READ_CACHE_MAX_ENTRIES:
+            self._memory_store.popitem(last=False)
+
+
+read_cache = ReadCache()
@@ -0,0 +1,229 @@
+import json
+import logging
+import re
+import time
+import uuid
+from collections import OrderedDict
+from typing import Any
+
+import redis.asyncio as redis
+
+from src.config.config import settings
+from src.observability.metrics import READ_CHUNKS_TOTAL
+from src.reader.read_cache import ReadCache
+from src.runtime.circuit_breaker import circuit_breakers
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "read_chunks:"
+
+# Budgets given in tokens are converted at this rate: close to what common LLM tokenizers
+# average on English prose, and erring towards smaller chunks on code or non-Latin text.
+CHARS_PER_TOKEN = 4
+
+# Boundaries a chunk prefers to end on, best first. A chunk may stop short of its budget
+# to reach one, but never by more than this share of the budget.
+_BOUNDARIES = ("\n\n", "\n", ". ", " ")
+_BOUNDARY_SLACK = 0.5
+
+_LINK_MARKER = re.compile(r"\[(\d+)\]")
+
+
+def chunk_budget(max_chars: int | None, max_tokens: int | None) -> int | None:
+    """The character budget per chunk: the tighter of the two limits, None if neither is set."""
+    budgets = [] if max_chars is None else [max_chars]
+    if max_tokens is not None:
+        budgets.append(max_tokens * CHARS_PER_TOKEN)
+
+    return min(budgets) if budgets else None
+
+
+class SnapshotStore:
+    """
+    Snapshots of chunked reads, kept apart from the ReadCache.
+
+    In the read cache's LRU, paging through one long document could push out unrelated
+    cached reads, and a busy read cache could drop a snapshot while a client still held its
+    cursor. Snapshots get their own in-process LRU, bounded by the characters of content it
+    holds (READ_CHUNK_SNAPSHOT_MAX_CHARS) rather than by entry count, since one snapshot can
+    run to megabytes; the newest snapshot is always kept, whatever its size. Redis, when
+    configured, holds the shared copy so a continuation can land on another worker. Entries
+    expire after READ_CHUNK_SNAPSHOT_TTL_SECONDS.
+    """
+
+    def __init__(self) -> None:
+        self.redis_client = None
+        if settings.REDIS_URL:
+            try:
+                self.redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+            except Exception as e:
+                logger.warning(f"Failed to connect to Redis for SnapshotStore: {e}")
+
+        self._memory_store: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._chars = 0
+
+    async def get(self, key: str) -> dict[str, Any] | None:
+        """The stored result, or None once it expired or was evicted everywhere."""
+        entry = self._get_local(key)
+        if entry is not None:
+            return entry
+
+        if self.redis_client:
+            try:
+                async with circuit_breakers.get("redis").guard():
+                    data = await self.redis_client.get(f"{_KEY_PREFIX}{key}")
+                if data:
+                    parsed: dict[str, Any] = json.loads(data)
+                    # JSON object keys are always strings; restore the int link-map indices.
+                    links = parsed.get("links")
+                    if isinstance(links, dict):
+                        parsed["links"] = {int(index): href for index, href in links.items()}
+                    self._put_local(key, parsed)
+
+                    return parsed
+            except Exception as e:
+                READ_CHUNKS_TOTAL.labels(kind="redis_error").inc()
+                logger.warning(f"Failed to get chunk snapshot from Redis: {e}")
+
+        return None
+
+    async def put(self, key: str, result: dict[str, Any]) -> None:
+        self._put_local(key, result)
+
+        if self.redis_client:
+            try:
+                async with circuit_breakers.get("redis").guard():
+                    await self.redis_client.setex(
+                        f"{_KEY_PREFIX}{key}", settings.READ_CHUNK_SNAPSHOT_TTL_SECONDS, json.dumps(result)
+                    )
+            except Exception as e:
+                READ_CHUNKS_TOTAL.labels(kind="redis_error").inc()
+                logger.warning(f"Failed to save chunk snapshot to Redis: {e}")
+
+    def _get_local(self, key: str) -> dict[str, Any] | None:
+        entry = self._memory_store.get(key)
+        if entry is None:
+            return None
+
+        if time.time() - float(entry["stored_at"]) >= settings.READ_CHUNK_SNAPSHOT_TTL_SECONDS:
+            self._evict(key)
+            return None
+
+        self._memory_store.move_to_end(key)
+        result: dict[str, Any] = entry["result"]
+
+        return result
+
+    def _put_local(self, key: str, result: dict[str, Any]) -> None:
+        if key in self._memory_store:
+            self._evict(key)
+        self._memory_store[key] = {"result": result, "stored_at": time.time()}
+        self._chars += len(result["content"])
+        while self._chars > settings.READ_CHUNK_SNAPSHOT_MAX_CHARS and len(self._memory_store) > 1:
+            self._evict(next(iter(self._memory_store)))
+
+    def _evict(self, key: str) -> None:
+        entry = self._memory_store.pop(key)
+        self._chars -= len(entry["result"]["content"])
+
+
+class ReadChunker:
+    """
+    Splits long read results into chunks with continuation cursors.
+
+    A read over budget is stored once as a snapshot in the SnapshotStore under its own
+    document id, and the first chunk is returned with a `next_cursor`. The cursor names
+    the snapshot, the next offset and the budget, so a continuation is served from the
+    snapshot without re-running the strategy chain, and stays consistent even if the
+    page's regular cache entry is revalidated in between. Chunks end on a paragraph,
+    line, sentence or word boundary; concatenated, they give back the whole content.
+    With include_links, each chunk carries only the links whose markers it contains.
+    """
+
+    def __init__(self, snapshots: SnapshotStore) -> None:
+        self.snapshots = snapshots
+
+    async def first(self, url: str, result: dict[str, Any], budget: int | None) -> dict[str, Any]:
+        """The result itself when it fits the budget (or has none), else its first chunk."""
+        content = result.get("content")
+        if budget is None or result.get("status") != "success" or not isinstance(content, str):
+            return result
+
+        if len(content) <= budget:
+            return {**result, "offset": 0, "total_chars": len(content), "next_cursor": None}
+
+        document_id = uuid.uuid4().hex
+        await self.snapshots.put(self._key(url, document_id), result)
+        READ_CHUNKS_TOTAL.labels(kind="first").inc()
+
+        return self._chunk(result, document_id, 0, budget)
+
+    async def resume(self, url: str, cursor: str, budget: int | None) -> dict[str, Any]:
+        """
+        The chunk `cursor` points at; `budget` overrides the one the cursor carries.
+        Raises ValueError for a malformed cursor, or one that expired or belongs to another URL.
+        """
+        document_id, offset, cursor_budget = _parse_cursor(cursor)
+        result = await self.snapshots.get(self._key(url, document_id))
+        if result is None:
+            READ_CHUNKS_TOTAL.labels(kind="expired").inc()
+            raise ValueError("cursor has expired or does not belong to this URL; read the URL again")
+
+        if offset > len(result["content"]):
+            raise ValueError("cursor points past the end of the document")
+
+        READ_CHUNKS_TOTAL.labels(kind="continuation").inc()
+
+        return {**self._chunk(result, document_id, offset, budget or cursor_budget), "cache": "hit"}
+
+    @staticmethod
+    def _key(url: str, document_id: str) -> str:
+        return ReadCache.build_key(url, f"chunks:{document_id}")
+
+    @staticmethod
+    def _chunk(result: dict[str, Any], document_id: str, offset: int, budget: int) -> dict[str, Any]:
+        content: str = result["content"]
+        end = _chunk_end(content, offset, budget)
+        chunk = content[offset:end]
+        chunked = {
+            **result,
+            "content": chunk,
+            "offset": offset,
+            "total_chars": len(content),
+            "next_cursor": f"{document_id}:{end}:{budget}" if end < len(content) else None,
+        }
+
+        links = result.get("links")
+        if isinstance(links, dict):
+            markers = {int(index) for index in _LINK_MARKER.findall(chunk)}
+            chunked["links"] = {index: href for index, href in links.items() if index in markers}
+
+        return chunked
+
+
+def _chunk_end(content: str, offset: int, budget: int) -> int:
+    end = offset + budget
+    if end >= len(content):
+        return len(content)
+
+    window = content[offset:end]
+    floor = int(budget * _BOUNDARY_SLACK)
+    for boundary in _BOUNDARIES:
+        cut = window.rfind(boundary)
+        if cut >= floor:
+            return offset + cut + len(boundary)
+
+    return end
+
+
+def _parse_cursor(cursor: str) -> tuple[str, int, int]:
+    document_id, _, rest = cursor.partition(":")
+    offset, _, budget = rest.partition(":")
+    if not document_id or not offset.isdigit() or not budget.isdigit() or int(budget) < 1:
+        raise ValueError("malformed cursor")
+
+    return document_id, int(offset), int(budget)
+
+
+chunk_snapshots = SnapshotStore()
+read_chunker = ReadChunker(chunk_snapshots)
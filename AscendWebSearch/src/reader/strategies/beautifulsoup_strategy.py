@@ -1,10 +1,9 @@
 from collections.abc import Callable
 
-from bs4 import BeautifulSoup
-
-from src.reader.html_utils import remove_noise_tags
+from src.reader.html_utils import extract_visible_text
 from src.reader.strategies.base_strategy import BaseStrategy
 from src.reader.strategies.curl_cffi_fetcher import fetch_with_curl_cffi
+from src.runtime.extraction_pool import extraction_pool
 
 
 class BeautifulSoupStrategy(BaseStrategy):
@@ -16,10 +15,7 @@ class BeautifulSoupStrategy(BaseStrategy):
         if not html:
             return ""
 
-        soup = BeautifulSoup(html, "html.parser")
-        remove_noise_tags(soup)
-
-        return soup.get_text(separator=" ", strip=True)
+        return await extraction_pool.run(extract_visible_text, html)
 
     async def get_html(self, url: str) -> str:
         return await fetch_with_curl_cffi(url, self.user_agent_provider, "BeautifulSoupStrategy")
@@ -1,55 +1,34 @@
 import logging
-from typing import Any
 
-import trafilatura
-from crawlee.crawlers import AdaptivePlaywrightCrawler, PlaywrightCrawlingContext
+from playwright.async_api import Page
 
 from src.api.exceptions import ChallengeDetectedException
-from src.config.config import settings
 from src.reader.cloudflare.challenge_detector import ChallengeDetector
+from src.reader.html_utils import extract_main_text
+from src.reader.politeness import politeness_scheduler
 from src.reader.strategies.base_strategy import BaseStrategy
-from src.validator.url_validator import URLValidator
+from src.runtime.crawlee_service import crawlee_service
+from src.runtime.extraction_pool import extraction_pool
+from src.validator.resource_policy import ResourcePolicy
 
 logger = logging.getLogger(__name__)
 
+# Strategy label on the resource-policy metrics; matches the WebReader tier key.
+_STRATEGY_NAME = "5-crawlee_adaptive"
+
 
 class CrawleeStrategy(BaseStrategy):
-    def __init__(self, url_validator: URLValidator) -> None:
-        self.url_validator = url_validator
+    def __init__(self, resource_policy: ResourcePolicy) -> None:
+        self.resource_policy = resource_policy
+        crawlee_service.configure_pages(self._setup_page, resource_policy.record)
 
     async def extract(self, url: str) -> str:
         html = await self.get_html(url)
-        extracted: str | None = trafilatura.extract(html)
-        return extracted or ""
+        return await extraction_pool.run(extract_main_text, html)
 
     async def get_html(self, url: str) -> str:
-        result_container: dict[str, str] = {"html": ""}
-
-        playwright_kwargs: Any = {
-            "headless": False,
-            "browser_launch_options": {"chromium_sandbox": False},
-            "browser_context_options": {
-                "locale": "en-US",
-                "timezone_id": "America/New_York",
-                "geolocation": {"latitude": 37.7749, "longitude": -122.4194},
-                "permissions": ["geolocation"],
-            },
-        }
-        crawler = AdaptivePlaywrightCrawler.with_beautifulsoup_static_parser(
-            max_requests_per_crawl=settings.MAX_REQUESTS_PER_CRAWL,
-            playwright_crawler_specific_kwargs=playwright_kwargs,
-        )
-
-        @crawler.router.default_handler
-        async def request_handler(context: Any) -> None:
-            await self._handle_crawlee_request(context, result_container)
-
-        @crawler.pre_navigation_hook  # type: ignore[arg-type]
-        async def enable_adblock(context: PlaywrightCrawlingContext) -> None:
-            await context.page.route("**/*", self.url_validator.route_handler)
-
-        await crawler.run([url])
-        html = result_container.get("html", "")
+        async with politeness_scheduler.slot(url):
+            html = await crawlee_service.fetch(url)
 
         if ChallengeDetector.is_login_required(url, html):
             logger.warning(f"CrawleeStrategy: Login wall detected on {url}")
@@ -61,11 +40,5 @@ class CrawleeStrategy(BaseStrategy):
 
         return html
 
-    @staticmethod
-    async def _handle_crawlee_request(context: Any, result_container: dict[str, str]) -> None:
-        if isinstance(context, PlaywrightCrawlingContext):
-            result_container["html"] = await context.page.content()
-        elif hasattr(context, "soup"):
-            result_container["html"] = str(context.soup)
-        elif hasattr(context, "response"):
-            result_container["html"] = context.response.text
+    async def _setup_page(self, page: Page) -> None:
+        await self.resource_policy.attach(page, _STRATEGY_NAME)
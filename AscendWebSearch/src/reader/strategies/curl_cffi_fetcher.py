@@ -1,26 +1,39 @@
 import logging
 from collections.abc import Callable
+from contextvars import ContextVar
+from typing import Any
+from urllib.parse import urlsplit
 
-from curl_cffi import requests
+from curl_cffi import CurlOpt
 
-from src.api.exceptions import ChallengeDetectedException
+from src.api.exceptions import ChallengeDetectedException, NonHtmlContentException
 from src.config.config import settings
+from src.reader.adaptive_timeouts import attempt_timeout
 from src.reader.cloudflare.challenge_detector import ChallengeDetector
 from src.reader.cloudflare.cookie_manager import cookie_manager
+from src.reader.content_sniffer import BINARY, HTML, TOO_LARGE, decode, sniff
+from src.reader.politeness import politeness_scheduler
+from src.runtime.curl_session_pool import curl_session_pool
+from src.validator.dns_resolver import pinned_addresses_ctx
 
 logger = logging.getLogger(__name__)
 
+# Set by the read cache around a read. When present, fetch_with_curl_cffi copies the
+# origin's ETag / Last-Modified into it so the cached result can be revalidated later.
+# The dict is shared by reference, so hedged tiers running in child tasks still fill it.
+response_validators_ctx: ContextVar[dict[str, str] | None] = ContextVar("response_validators", default=None)
 
-async def fetch_with_curl_cffi(
-    url: str,
-    user_agent_provider: Callable[[], str],
-    strategy_label: str,
-) -> str:
-    """
-    Shared curl_cffi fetch used by BeautifulSoupStrategy and TrafilaturaStrategy.
-    Applies cached Cloudflare clearance cookies if any, raises ChallengeDetectedException
-    on detected login/WAF walls, returns empty string on transport errors.
-    """
+_NOT_MODIFIED = 304
+_IMPERSONATE = "chrome120"
+# Enough for every signature content_sniffer checks and for a doctype behind a BOM.
+_SNIFF_BYTES = 512
+# A HEAD answers in one round trip or not at all; the probe must not eat the read budget.
+_PROBE_TIMEOUT = 10.0
+
+
+async def _build_session_args(
+    url: str, user_agent_provider: Callable[[], str]
+) -> tuple[dict[str, str], dict[str, str]]:
     clearance_data = await cookie_manager.get_session_data(url)
     headers: dict[str, str] = {}
     cookies: dict[str, str] = {}
@@ -31,31 +44,214 @@ async def fetch_with_curl_cffi(
     else:
         headers["User-Agent"] = user_agent_provider()
 
+    return headers, cookies
+
+
+def _clearance_identity(headers: dict[str, str], cookies: dict[str, str]) -> str:
+    # cf_clearance is bound to the UA (and TLS fingerprint) that solved the challenge, so
+    # cleared reads get their own connections; uncleared ones share a session per origin.
+    clearance = cookies.get("cf_clearance")
+    if not clearance:
+        return ""
+
+    return f"{headers['User-Agent']}|{clearance}"
+
+
+def _pinned_resolve_options(url: str) -> dict[CurlOpt, Any]:
+    """CURLOPT_RESOLVE entries for the host is_safe_external_url vetted, if it pinned one."""
+    pins = pinned_addresses_ctx.get()
+    parts = urlsplit(url)
+    addresses = pins.get(parts.hostname or "") if pins else None
+    if not addresses:
+        return {}
+
+    joined = ",".join(f"[{address}]" if ":" in address else address for address in addresses)
+    # Both default ports as well, so an http -> https redirect on the same host stays pinned.
+    ports = {80, 443} | ({parts.port} if parts.port else set())
+
+    return {CurlOpt.RESOLVE: [f"{parts.hostname}:{port}:{joined}" for port in sorted(ports)]}
+
+
+def _capture_validators(response: Any) -> None:
+    captured = response_validators_ctx.get()
+    if captured is None:
+        return
+
+    etag = response.headers.get("ETag")
+    last_modified = response.headers.get("Last-Modified")
+    if etag:
+        captured["etag"] = etag
+    if last_modified:
+        captured["last_modified"] = last_modified
+
+
+async def _read_body(response: Any) -> tuple[str, bytes]:
+    """
+    Streams the body up to FETCH_MAX_BYTES and sniffs its kind from the first bytes.
+    Binary and oversized bodies are abandoned as soon as they are recognised.
+    """
+    content_type = response.headers.get("Content-Type") or ""
+    declared_length = response.headers.get("Content-Length") or ""
+    if declared_length.isdigit() and int(declared_length) > settings.FETCH_MAX_BYTES:
+        response.quit_now.set()
+        await response.aclose()
+        return TOO_LARGE, b""
+
+    body = bytearray()
+    kind = ""
     try:
-        # noinspection PyArgumentList
-        async with requests.AsyncSession(impersonate="chrome120") as session:
+        async for chunk in response.aiter_content():
+            body += chunk
+            if len(body) > settings.FETCH_MAX_BYTES:
+                return TOO_LARGE, b""
+            if not kind and len(body) >= _SNIFF_BYTES:
+                kind = sniff(content_type, bytes(body[:_SNIFF_BYTES]))
+                if kind == BINARY:
+                    return BINARY, b""
+    finally:
+        # Makes curl's write callback fail, so returning early stops the transfer instead
+        # of aclose() waiting for the rest of it. A no-op once the stream has ended.
+        response.quit_now.set()
+        await response.aclose()
+
+    return kind or sniff(content_type, bytes(body)), bytes(body)
+
+
+async def fetch_with_curl_cffi(
+    url: str,
+    user_agent_provider: Callable[[], str],
+    strategy_label: str,
+) -> str:
+    """
+    Shared curl_cffi fetch used by BeautifulSoupStrategy and TrafilaturaStrategy.
+    Applies cached Cloudflare clearance cookies if any, raises ChallengeDetectedException
+    on detected login/WAF walls, raises NonHtmlContentException when the response is not
+    an HTML page or exceeds FETCH_MAX_BYTES, returns empty string on transport errors.
+    """
+    headers, cookies = await _build_session_args(url, user_agent_provider)
+
+    try:
+        async with (
+            politeness_scheduler.slot(url),
+            curl_session_pool.session(
+                url,
+                impersonate=_IMPERSONATE,
+                identity=_clearance_identity(headers, cookies),
+                curl_options=_pinned_resolve_options(url),
+            ) as session,
+        ):
             response = await session.get(
                 url,
                 headers=headers,
                 cookies=cookies,
-                timeout=settings.EXTRACT_TIMEOUT,
+                timeout=attempt_timeout(settings.EXTRACT_TIMEOUT),
                 allow_redirects=True,
+                # Reads stay stateless: nothing a page sets leaks into the next read of the origin.
+                discard_cookies=True,
+                stream=True,
             )
+            politeness_scheduler.note_response(url, response.status_code, response.headers)
+            kind, body = await _read_body(response)
+
+            if kind != HTML:
+                response.raise_for_status()
+                _capture_validators(response)
+                raise NonHtmlContentException(
+                    kind, response.headers.get("Content-Type") or "", body, response.encoding
+                )
 
-            if ChallengeDetector.is_login_required(response.url, response.text):
+            text = decode(body, response.encoding)
+            if ChallengeDetector.is_login_required(response.url, text):
                 logger.warning(f"{strategy_label}: Login wall detected on {url}")
                 raise ChallengeDetectedException(intervention_type="login")
 
-            if ChallengeDetector.is_blocked(response.status_code, response.text):
+            if ChallengeDetector.is_blocked(response.status_code, text):
                 logger.warning(f"{strategy_label}: WAF/Cloudflare block detected on {url}")
                 raise ChallengeDetectedException(intervention_type="captcha")
 
             response.raise_for_status()
+            _capture_validators(response)
 
-            return str(response.text)
-    except ChallengeDetectedException:
+            return text
+    except (ChallengeDetectedException, NonHtmlContentException):
         raise
     except Exception as e:
         logger.warning(f"{strategy_label} failed to fetch URL {url}: {e}")
 
         return ""
+
+
+async def probe_content_type(url: str, user_agent_provider: Callable[[], str]) -> str:
+    """Content-Type from a HEAD request; "" when the server refuses HEAD or the request fails."""
+    headers, cookies = await _build_session_args(url, user_agent_provider)
+
+    try:
+        async with (
+            politeness_scheduler.slot(url),
+            curl_session_pool.session(
+                url,
+                impersonate=_IMPERSONATE,
+                identity=_clearance_identity(headers, cookies),
+                curl_options=_pinned_resolve_options(url),
+            ) as session,
+        ):
+            response = await session.head(
+                url,
+                headers=headers,
+                cookies=cookies,
+                timeout=min(settings.EXTRACT_TIMEOUT, _PROBE_TIMEOUT),
+                allow_redirects=True,
+                discard_cookies=True,
+            )
+            politeness_scheduler.note_response(url, response.status_code, response.headers)
+            if response.status_code >= 400:
+                return ""
+
+            return str(response.headers.get("Content-Type") or "")
+    except Exception as e:
+        logger.warning(f"Content-Type probe failed for {url}: {e}")
+
+        return ""
+
+
+async def revalidate_with_curl_cffi(
+    url: str,
+    user_agent_provider: Callable[[], str],
+    validators: dict[str, str],
+) -> bool:
+    """
+    Conditional GET with If-None-Match / If-Modified-Since. Returns True only on
+    304 Not Modified; any other status or a transport error means "refetch".
+    """
+    headers, cookies = await _build_session_args(url, user_agent_provider)
+    if validators.get("etag"):
+        headers["If-None-Match"] = validators["etag"]
+    if validators.get("last_modified"):
+        headers["If-Modified-Since"] = validators["last_modified"]
+
+    try:
+        async with (
+            politeness_scheduler.slot(url),
+            curl_session_pool.session(
+                url,
+                impersonate=_IMPERSONATE,
+                identity=_clearance_identity(headers, cookies),
+                curl_options=_pinned_resolve_options(url),
+            ) as session,
+        ):
+            response = await session.get(
+                url,
+                headers=headers,
+                cookies=cookies,
+                timeout=settings.EXTRACT_TIMEOUT,
+                allow_redirects=True,
+                # Reads stay stateless: nothing a page sets leaks into the next read of the origin.
+                discard_cookies=True,
+            )
+            politeness_scheduler.note_response(url, response.status_code, response.headers)
+
+            return bool(response.status_code == _NOT_MODIFIED)
+    except Exception as e:
+        logger.warning(f"Conditional revalidation failed for {url}: {e}")
+
+        return False
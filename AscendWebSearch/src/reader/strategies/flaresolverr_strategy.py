@@ -1,13 +1,16 @@
 import logging
 
-import trafilatura
-from curl_cffi import requests
-
-from src.api.exceptions import ChallengeDetectedException
+from src.api.exceptions import ChallengeDetectedException, CircuitOpenException
 from src.config.config import settings
+from src.reader.adaptive_timeouts import attempt_timeout
 from src.reader.cloudflare.challenge_detector import ChallengeDetector
 from src.reader.cloudflare.cookie_manager import cookie_manager
+from src.reader.html_utils import extract_main_text
+from src.reader.politeness import politeness_scheduler
 from src.reader.strategies.base_strategy import BaseStrategy
+from src.runtime.circuit_breaker import circuit_breakers
+from src.runtime.curl_session_pool import curl_session_pool
+from src.runtime.extraction_pool import extraction_pool
 
 logger = logging.getLogger(__name__)
 
@@ -18,27 +21,33 @@ class FlareSolverrStrategy(BaseStrategy):
         if not html:
             return ""
 
-        extracted: str | None = trafilatura.extract(html)
-        return extracted or ""
+        return await extraction_pool.run(extract_main_text, html)
 
     async def get_html(self, url: str) -> str:
         if not settings.FLARESOLVERR_URL:
             logger.warning("FlareSolverrStrategy skipped: FLARESOLVERR_URL not configured")
             return ""
 
-        timeout = settings.EXTRACT_TIMEOUT * 2
-        payload = {"cmd": "request.get", "url": url, "maxTimeout": int((timeout - 2) * 1000)}
+        timeout = attempt_timeout(settings.EXTRACT_TIMEOUT * 2)
+        # FlareSolverr gives up 2 s before we do, so its own error comes back instead of our timeout.
+        payload = {"cmd": "request.get", "url": url, "maxTimeout": int(max(1.0, timeout - 2) * 1000)}
 
         try:
-            # noinspection PyArgumentList
-            async with requests.AsyncSession() as session:
-                response = await session.post(settings.FLARESOLVERR_URL, json=payload, timeout=timeout)
-                response.raise_for_status()
-                data = response.json()
+            async with curl_session_pool.session(settings.FLARESOLVERR_URL) as session:
+                # Only the solver round trip counts: a down or saturated FlareSolverr makes every
+                # read wait out `timeout`, while what the solved page contains is the site's doing.
+                # The solver fetches the page itself, so it queues for the page's domain.
+                async with circuit_breakers.get("flaresolverr").guard(), politeness_scheduler.slot(url):
+                    response = await session.post(settings.FLARESOLVERR_URL, json=payload, timeout=timeout)
+                    response.raise_for_status()
+                    data = response.json()
 
                 if data.get("status") == "ok":
                     solution = data.get("solution", {})
                     html = solution.get("response", "")
+                    politeness_scheduler.note_response(
+                        url, solution.get("status", 200), solution.get("headers") or {}
+                    )
 
                     cookies_list = solution.get("cookies", [])
                     user_agent = solution.get("userAgent", "")
@@ -66,9 +75,10 @@ class FlareSolverrStrategy(BaseStrategy):
                 logger.warning(f"FlareSolverr failed on {url}: {data.get('message')}")
                 return ""
 
-        except ChallengeDetectedException:
-            # Must not be swallowed by the broad except below; the orchestrator
-            # uses ChallengeDetectedException as an explicit escalation signal.
+        except (ChallengeDetectedException, CircuitOpenException):
+            # Must not be swallowed by the broad except below; the orchestrator uses
+            # ChallengeDetectedException as an explicit escalation signal and counts an
+            # open circuit as a skipped tier, not an empty one.
             raise
         except Exception as e:
             return self._handle_error(url, e)
@@ -1,117 +1,126 @@
 import logging
-import random
+import time
 from collections.abc import Callable
 
-import trafilatura
-from playwright.async_api import Browser, BrowserContext, Page, ViewportSize
+from playwright.async_api import Page
 from playwright_stealth import Stealth
 
 from src.api.exceptions import ChallengeDetectedException
 from src.config.config import settings
+from src.observability.metrics import BROWSER_READINESS_TOTAL, BROWSER_READINESS_WAIT_SECONDS
+from src.reader.adaptive_timeouts import attempt_timeout
 from src.reader.cloudflare.challenge_detector import ChallengeDetector
+from src.reader.html_utils import extract_main_text
+from src.reader.page_readiness import PageReadiness, ReadinessWatch
+from src.reader.politeness import politeness_scheduler
 from src.reader.strategies.base_strategy import BaseStrategy
 from src.runtime.browser_pool import browser_pool
-from src.validator.url_validator import URLValidator
+from src.runtime.extraction_pool import extraction_pool
+from src.validator.resource_policy import ResourcePolicy
 
 logger = logging.getLogger(__name__)
 
-# Viewport jitter — desktop ranges that look human, not bot-perfect.
-_VIEWPORT_MIN_WIDTH_PX = 1280
-_VIEWPORT_MAX_WIDTH_PX = 1920
-_VIEWPORT_MIN_HEIGHT_PX = 720
-_VIEWPORT_MAX_HEIGHT_PX = 1080
-
-# Networkidle is polled in 1-second windows so the loop can early-exit on
-# detected challenge walls instead of blocking for the full extraction window.
-_NETWORKIDLE_POLL_MS = 1000
-
 # Convert the per-strategy timeout from seconds to milliseconds.
 _MS_PER_SECOND = 1000
 
+# Strategy label on the resource-policy metrics; matches the WebReader tier key.
+_STRATEGY_NAME = "4-playwright_stealth"
+
 
 class PlaywrightStrategy(BaseStrategy):
     def __init__(
         self,
         user_agent_provider: Callable[[], str],
-        url_validator: URLValidator,
+        resource_policy: ResourcePolicy,
     ) -> None:
         self.user_agent_provider = user_agent_provider
-        self.url_validator = url_validator
+        self.resource_policy = resource_policy
+        self.readiness = PageReadiness()
+        # Stealth and routing are applied once per pooled page, not once per read.
+        browser_pool.configure_contexts(user_agent_provider, self._apply_protections)
 
     async def extract(self, url: str) -> str:
         html = await self.get_html(url)
-        extracted: str | None = trafilatura.extract(html)
-
-        return extracted or ""
+        return await extraction_pool.run(extract_main_text, html)
 
     async def get_html(self, url: str) -> str:
-        browser = await browser_pool.get_browser()
-        context = await self._create_stealth_context(browser)
-        page = await context.new_page()
-
-        await self._apply_protections(page)
-
-        try:
-            if ChallengeDetector.is_login_redirect_url(url):
-                logger.warning(f"PlaywrightStrategy: Pre-emptive redirect login URI detected on {url}")
-                raise ChallengeDetectedException(intervention_type="login")
-
-            timeout_ms = settings.EXTRACT_TIMEOUT * _MS_PER_SECOND
-            initial_response = await page.goto(url, wait_until="domcontentloaded", timeout=timeout_ms)
-
-            # Poll incrementally for networkidle to allow early-exit on known block walls
-            for _ in range(int(settings.EXTRACT_TIMEOUT)):
-                content = await page.content()
+        if ChallengeDetector.is_login_redirect_url(url):
+            logger.warning(f"PlaywrightStrategy: Pre-emptive redirect login URI detected on {url}")
+            raise ChallengeDetectedException(intervention_type="login")
+
+        async with browser_pool.page() as page:
+            self.resource_policy.reset(page)
+            try:
+                return await self._render(url, page)
+            finally:
+                self.resource_policy.record(page)
+
+    async def _render(self, url: str, page: Page) -> str:
+        timeout = attempt_timeout(settings.EXTRACT_TIMEOUT)
+        async with politeness_scheduler.slot(url):
+            with self.readiness.watch(page) as watch:
+                initial_response = await page.goto(
+                    url, wait_until="domcontentloaded", timeout=timeout * _MS_PER_SECOND
+                )
                 response_status = initial_response.status if initial_response else 200
+                response_headers = initial_response.headers if initial_response else {}
+                politeness_scheduler.note_response(url, response_status, response_headers)
+                await self._await_ready(url, page, watch, response_status, timeout)
 
-                if ChallengeDetector.is_login_required(page.url, content):
-                    logger.warning(f"PlaywrightStrategy: Login wall detected on {url} (early exit)")
-                    raise ChallengeDetectedException(intervention_type="login")
+        content = await page.content()
 
-                if ChallengeDetector.is_blocked(response_status, content):
-                    logger.warning(f"PlaywrightStrategy: WAF/Cloudflare block detected on {url} (early exit)")
-                    raise ChallengeDetectedException(intervention_type="captcha")
+        logger.info(f"PlaywrightStrategy: Finished rendering {url}. Extracted HTML Length: {len(content)}")
 
-                try:
-                    await page.wait_for_load_state("networkidle", timeout=_NETWORKIDLE_POLL_MS)
-                    break
-                except Exception:
-                    pass
+        # The observer only sees what is inserted while it runs; the final HTML has the last word.
+        if ChallengeDetector.is_login_required(page.url, content):
+            logger.warning(
+                f"PlaywrightStrategy: Late-stage Login wall detected on {url}. Content Length: {len(content)}"
+            )
+            raise ChallengeDetectedException(intervention_type="login")
 
-            await page.wait_for_timeout(settings.DYNAMIC_CONTENT_WAIT)
+        if ChallengeDetector.is_blocked(response_status, content):
+            logger.warning(f"PlaywrightStrategy: Late-stage WAF/Cloudflare block detected on {url}")
+            raise ChallengeDetectedException(intervention_type="captcha")
 
-            content = await page.content()
+        return content
 
-            logger.info(
-                f"PlaywrightStrategy: Finished rendering {url}. Extracted HTML Length: {len(content)}"
-            )
+    @staticmethod
+    async def _await_ready(
+        url: str, page: Page, watch: ReadinessWatch, status: int, wait_seconds: float
+    ) -> None:
+        started = time.monotonic()
+        deadline = started + wait_seconds
+        while True:
+            event = await watch.next_event(deadline)
+            if event is None:
+                # Same as the old loop running out of networkidle polls: extract what rendered.
+                outcome = "timeout"
+                break
+
+            if event["kind"] == "title" and ChallengeDetector.is_login_title(event["value"]):
+                BROWSER_READINESS_TOTAL.labels(outcome="login").inc()
+                logger.warning(f"PlaywrightStrategy: Login wall detected on {url} (early exit)")
+                raise ChallengeDetectedException(intervention_type="login")
 
-            if ChallengeDetector.is_login_required(page.url, content):
+            # The observer sees every node, the detector only the head and tail of huge pages
+            # (a long article may quote "Just a moment..."): let the detector confirm.
+            if event["kind"] == "marker" and ChallengeDetector.is_blocked(status, await page.content()):
+                BROWSER_READINESS_TOTAL.labels(outcome="captcha").inc()
                 logger.warning(
-                    f"PlaywrightStrategy: Late-stage Login wall detected on {url}. "
-                    f"Content Length: {len(content)}"
+                    f"PlaywrightStrategy: WAF/Cloudflare block detected on {url} "
+                    f"(early exit on {event['value']!r})"
                 )
-                raise ChallengeDetectedException(intervention_type="login")
-
-            return content
-        finally:
-            # Only the context is torn down. The browser process lives across requests.
-            await context.close()
+                raise ChallengeDetectedException(intervention_type="captcha")
 
-    async def _create_stealth_context(self, browser: Browser) -> BrowserContext:
-        viewport: ViewportSize = {
-            "width": random.randint(_VIEWPORT_MIN_WIDTH_PX, _VIEWPORT_MAX_WIDTH_PX),
-            "height": random.randint(_VIEWPORT_MIN_HEIGHT_PX, _VIEWPORT_MAX_HEIGHT_PX),
-        }
+            if event["kind"] == "ready":
+                outcome = event["value"]
+                break
 
-        return await browser.new_context(
-            user_agent=self.user_agent_provider(),
-            viewport=viewport,
-            locale="en-US",
-            timezone_id="UTC",
-        )
+        BROWSER_READINESS_TOTAL.labels(outcome=outcome).inc()
+        BROWSER_READINESS_WAIT_SECONDS.observe(time.monotonic() - started)
 
     async def _apply_protections(self, page: Page) -> None:
         stealth = Stealth()
         await stealth.apply_stealth_async(page)
-        await page.route("**/*", self.url_validator.route_handler)
+        await self.readiness.attach(page)
+        await self.resource_policy.attach(page, _STRATEGY_NAME)
@@ -1,9 +1,9 @@
 from collections.abc import Callable
 
-import trafilatura
-
+from src.reader.html_utils import extract_main_text
 from src.reader.strategies.base_strategy import BaseStrategy
 from src.reader.strategies.curl_cffi_fetcher import fetch_with_curl_cffi
+from src.runtime.extraction_pool import extraction_pool
 
 
 class TrafilaturaStrategy(BaseStrategy):
@@ -15,9 +15,7 @@ class TrafilaturaStrategy(BaseStrategy):
         if not html:
             return ""
 
-        extracted: str | None = trafilatura.extract(html)
-
-        return extracted or ""
+        return await extraction_pool.run(extract_main_text, html)
 
     async def get_html(self, url: str) -> str:
         return await fetch_with_curl_cffi(url, self.user_agent_provider, "TrafilaturaStrategy")
@@ -0,0 +1,185 @@
+import logging
+import time
+from collections import OrderedDict
+from typing import Any
+
+import redis.asyncio as redis
+
+from src.config.config import settings
+from src.reader.domain_utils import get_registrable_domain
+from src.runtime.circuit_breaker import circuit_breakers
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "strategy_memory:"
+_LAST_SUCCESS_FIELD = "last_success"
+_FAILURES_FIELD_PREFIX = "fail:"
+_FAILURE_SECONDS_FIELD_PREFIX = "fail_seconds:"
+
+# Bounded so a crawl over thousands of one-off domains can't grow the local
+# fallback table without limit. Oldest-touched domains are evicted first.
+_LOCAL_MAX_DOMAINS = 5000
+
+# The debug snapshot walks Redis with SCAN; cap it so the endpoint stays cheap.
+_SNAPSHOT_MAX_DOMAINS = 500
+
+
+class StrategyMemory:
+    """
+    Per-registrable-domain record of which tier last succeeded and how often (and for
+    how long) each tier failed. Stored as one Redis hash per domain whose TTL is
+    refreshed on every write, so domains that stop being read decay out of the table.
+    Falls back to a bounded in-process table when Redis is unavailable.
+    """
+
+    def __init__(self) -> None:
+        self.redis_client = None
+        if settings.REDIS_URL:
+            try:
+                self.redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+            except Exception as e:
+                logger.warning(f"Failed to connect to Redis for StrategyMemory: {e}")
+
+        # domain -> (expires_at, profile)
+        self._memory_store: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    async def get_profile(self, url: str) -> dict[str, Any] | None:
+        domain = get_registrable_domain(url)
+        if not domain:
+            return None
+
+        if self.redis_client:
+            try:
+                async with circuit_breakers.get("redis").guard():
+                    raw = await self.redis_client.hgetall(f"{_KEY_PREFIX}{domain}")
+                if raw:
+                    return self._profile_from_hash(raw)
+            except Exception as e:
+                logger.warning(f"Failed to get strategy memory from Redis: {e}")
+
+        return self._get_local(domain)
+
+    async def record_success(self, url: str, name: str) -> None:
+        domain = get_registrable_domain(url)
+        if not domain:
+            return
+
+        if self.redis_client:
+            try:
+                key = f"{_KEY_PREFIX}{domain}"
+                async with (
+                    circuit_breakers.get("redis").guard(),
+                    self.redis_client.pipeline(transaction=False) as pipe,
+                ):
+                    pipe.hset(key, _LAST_SUCCESS_FIELD, name)
+                    pipe.hdel(
+                        key, f"{_FAILURES_FIELD_PREFIX}{name}", f"{_FAILURE_SECONDS_FIELD_PREFIX}{name}"
+                    )
+                    pipe.expire(key, settings.STRATEGY_MEMORY_TTL_SECONDS)
+                    await pipe.execute()
+
+                return
+            except Exception as e:
+                logger.warning(f"Failed to save strategy memory to Redis: {e}")
+
+        profile = self._get_local(domain) or self._empty_profile()
+        profile["last_success"] = name
+        profile["failures"].pop(name, None)
+        profile["failure_seconds"].pop(name, None)
+        self._put_local(domain, profile)
+
+    async def record_failure(self, url: str, name: str, duration: float) -> None:
+        domain = get_registrable_domain(url)
+        if not domain:
+            return
+
+        if self.redis_client:
+            try:
+                key = f"{_KEY_PREFIX}{domain}"
+                async with (
+                    circuit_breakers.get("redis").guard(),
+                    self.redis_client.pipeline(transaction=False) as pipe,
+                ):
+                    pipe.hincrby(key, f"{_FAILURES_FIELD_PREFIX}{name}", 1)
+                    pipe.hincrbyfloat(key, f"{_FAILURE_SECONDS_FIELD_PREFIX}{name}", duration)
+                    pipe.expire(key, settings.STRATEGY_MEMORY_TTL_SECONDS)
+                    await pipe.execute()
+
+                return
+            except Exception as e:
+                logger.warning(f"Failed to save strategy memory to Redis: {e}")
+
+        profile = self._get_local(domain) or self._empty_profile()
+        profile["failures"][name] = profile["failures"].get(name, 0) + 1
+        profile["failure_seconds"][name] = profile["failure_seconds"].get(name, 0.0) + duration
+        self._put_local(domain, profile)
+
+    async def snapshot(self) -> dict[str, dict[str, Any]]:
+        """Learned table for the debug endpoint: Redis entries first, then local-only ones."""
+        table: dict[str, dict[str, Any]] = {}
+
+        if self.redis_client:
+            try:
+                async for key in self.redis_client.scan_iter(match=f"{_KEY_PREFIX}*", count=100):
+                    raw = await self.redis_client.hgetall(key)
+                    if raw:
+                        table[key.removeprefix(_KEY_PREFIX)] = self._profile_from_hash(raw)
+                    if len(table) >= _SNAPSHOT_MAX_DOMAINS:
+                        return table
+            except Exception as e:
+                logger.warning(f"Failed to scan strategy memory in Redis: {e}")
+
+        for domain in list(self._memory_store):
+            profile = self._get_local(domain)
+            if profile is not None and domain not in table:
+                table[domain] = profile
+            if len(table) >= _SNAPSHOT_MAX_DOMAINS:
+                break
+
+        return table
+
+    @staticmethod
+    def mean_failure_seconds(profile: dict[str, Any], name: str) -> float:
+        failures = profile["failures"].get(name, 0)
+        if not failures:
+            return 0.0
+
+        return float(profile["failure_seconds"].get(name, 0.0)) / int(failures)
+
+    @staticmethod
+    def _empty_profile() -> dict[str, Any]:
+        return {"last_success": None, "failures": {}, "failure_seconds": {}}
+
+    @classmethod
+    def _profile_from_hash(cls, raw: dict[Any, Any]) -> dict[str, Any]:
+        profile = cls._empty_profile()
+        for field, value in raw.items():
+            if field == _LAST_SUCCESS_FIELD:
+                profile["last_success"] = value
+            elif field.startswith(_FAILURE_SECONDS_FIELD_PREFIX):
+                profile["failure_seconds"][field.removeprefix(_FAILURE_SECONDS_FIELD_PREFIX)] = float(value)
+            elif field.startswith(_FAILURES_FIELD_PREFIX):
+                profile["failures"][field.removeprefix(_FAILURES_FIELD_PREFIX)] = int(value)
+
+        return profile
+
+    def _get_local(self, domain: str) -> dict[str, Any] | None:
+        entry = self._memory_store.get(domain)
+        if entry is None:
+            return None
+
+        expires_at, profile = entry
+        if expires_at <= time.monotonic():
+            del self._memory_store[domain]
+            return None
+
+        return profile
+
+    def _put_local(self, domain: str, profile: dict[str, Any]) -> None:
+        self._memory_store[domain] = (time.monotonic() + settings.STRATEGY_MEMORY_TTL_SECONDS, profile)
+        self._memory_store.move_to_end(domain)
+        while len(self._memory_store) > _LOCAL_MAX_DOMAINS:
+            self._memory_store.popitem(last=False)
+
+
+strategy_memory = StrategyMemory()
@@ -0,0 +1,33 @@
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+_DEFAULT_PORTS = {"http": 80, "https": 443}
+
+# Click-tracking parameters that never change what the origin serves.
+_TRACKING_PARAM_PREFIXES = ("utm_",)
+_TRACKING_PARAMS = frozenset({"fbclid", "gclid", "dclid", "msclkid", "mc_cid", "mc_eid", "_ga", "yclid"})
+
+
+def normalize_url(url: str) -> str:
+    """
+    Canonical form used as a cache / dedupe key: lowercased scheme and host, default
+    port and fragment dropped, empty path mapped to "/", tracking parameters removed
+    and the remaining query parameters sorted. Unparseable input is returned as-is.
+    """
+    try:
+        parts = urlsplit(url.strip())
+        port = parts.port
+    except ValueError:
+        return url
+
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if port is not None and port != _DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{port}"
+
+    query = sorted(
+        (key, value)
+        for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in _TRACKING_PARAMS and not key.lower().startswith(_TRACKING_PARAM_PREFIXES)
+    )
+
+    return urlunsplit((scheme, host, parts.path or "/", urlencode(query), ""))
@@ -1,34 +1,85 @@
+import asyncio
 import json
 import logging
 import random
 import time
+from collections import deque
+from collections.abc import Callable, Coroutine
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Any
 
-from src.api.exceptions import ChallengeDetectedException, HumanInterventionRequiredException
-from src.config.blocklist_loader import BlocklistLoader
+from src.api.exceptions import (
+    ChallengeDetectedException,
+    CircuitOpenException,
+    HumanInterventionRequiredException,
+    NonHtmlContentException,
+)
+from src.config.blocklist_loader import blocklist_loader
 from src.config.config import settings
 from src.observability.metrics import (
+    HEDGE_LAUNCHES_TOTAL,
     READ_BUDGET_EXHAUSTED_TOTAL,
+    READ_CACHE_TOTAL,
+    READ_WINNING_TIER_TOTAL,
     STRATEGY_ATTEMPTS_TOTAL,
     STRATEGY_DURATION_SECONDS,
+    STRATEGY_MEMORY_PROMOTIONS_TOTAL,
+    STRATEGY_MEMORY_SKIPS_TOTAL,
+    STRATEGY_MEMORY_TIME_SAVED_SECONDS,
 )
+from src.reader.adaptive_timeouts import adaptive_timeouts
 from src.reader.cloudflare.challenge_detector import ChallengeDetector
+from src.reader.content_router import answer_non_html
+from src.reader.content_sniffer import HTML, sniff
 from src.reader.link_annotator import annotate_links
+from src.reader.read_cache import read_cache
 from src.reader.strategies.base_strategy import BaseStrategy
 from src.reader.strategies.beautifulsoup_strategy import BeautifulSoupStrategy
 from src.reader.strategies.crawlee_strategy import CrawleeStrategy
+from src.reader.strategies.curl_cffi_fetcher import (
+    fetch_with_curl_cffi,
+    probe_content_type,
+    response_validators_ctx,
+    revalidate_with_curl_cffi,
+)
 from src.reader.strategies.flaresolverr_strategy import FlareSolverrStrategy
 from src.reader.strategies.novnc_strategy import NoVNCStrategy
 from src.reader.strategies.playwright_strategy import PlaywrightStrategy
 from src.reader.strategies.trafilatura_strategy import TrafilaturaStrategy
+from src.reader.strategy_memory import strategy_memory
+from src.runtime.circuit_breaker import OPEN, circuit_breakers
+from src.runtime.extraction_pool import extraction_pool
 from src.validator.content_validator import ContentValidator
+from src.validator.resource_policy import ResourcePolicy
 from src.validator.url_validator import URLValidator
 
 logger = logging.getLogger(__name__)
 
 NOVNC_STRATEGY_NAME = "6-novnc"
 
+# Tiers that fetch with curl_cffi and sniff the response's content type as they go.
+_CURL_TIERS = frozenset({"1-beautifulsoup", "2-trafilatura"})
+
+# Modes whose output is a pure function of the origin's raw response. Only their results
+# are stored with ETag / Last-Modified: a 304 on the raw document says nothing about what
+# a browser tier would render from it.
+_REVALIDATABLE_MODES = _CURL_TIERS | {"content-json", "content-text", "content-pdf"}
+
+# The circuit each tier's infrastructure answers to. Only what the tier depends on is
+# judged - a dead FlareSolverr, a Chromium that will not launch, a crashing crawler - never a
+# page's errors or timeouts, so one hostile domain cannot close a tier for every other one.
+# Tiers 1-2 have none: their only dependency is the origin itself.
+_TIER_CIRCUITS = {
+    "3-flaresolverr": "flaresolverr",
+    "4-playwright_stealth": "chromium",
+    "5-crawlee_adaptive": "crawlee",
+}
+
+# One tier attempt: (name, strategy) -> accepted result or None. Shared by read() and
+# read_with_links() so sequential and hedged execution run the exact same tier logic.
+StrategyAttempt = Callable[[str, BaseStrategy], Coroutine[Any, Any, dict[str, Any] | None]]
+
 
 class WebReader:
     """
@@ -41,16 +92,18 @@ class WebReader:
         self.validator = ContentValidator()
         self.user_agents = self._load_user_agents()
 
-        blocklist_loader = BlocklistLoader()
-        rules = blocklist_loader.load_rules()
-        self.url_validator = URLValidator(rules)
+        # The process-wide loader, not a snapshot of its matcher: background refreshes swap the rules.
+        self.url_validator = URLValidator(blocklist_loader)
+        self.resource_policy = ResourcePolicy(self.url_validator)
+        self.strategy_memory = strategy_memory
+        self.read_cache = read_cache
 
         self.strategies: dict[str, BaseStrategy] = {
             "1-beautifulsoup": BeautifulSoupStrategy(self._get_random_user_agent),
             "2-trafilatura": TrafilaturaStrategy(self._get_random_user_agent),
             "3-flaresolverr": FlareSolverrStrategy(),
-            "4-playwright_stealth": PlaywrightStrategy(self._get_random_user_agent, self.url_validator),
-            "5-crawlee_adaptive": CrawleeStrategy(self.url_validator),
+            "4-playwright_stealth": PlaywrightStrategy(self._get_random_user_agent, self.resource_policy),
+            "5-crawlee_adaptive": CrawleeStrategy(self.resource_policy),
             NOVNC_STRATEGY_NAME: NoVNCStrategy(),
         }
 
@@ -75,7 +128,9 @@ class WebReader:
     def _get_random_user_agent(self) -> str:
         return random.choice(self.user_agents)
 
-    def _select_strategies(self, url: str, heavy_mode: bool) -> dict[str, BaseStrategy]:
+    def _select_strategies(
+        self, url: str, heavy_mode: bool, profile: dict[str, Any] | None = None
+    ) -> dict[str, BaseStrategy]:
         if ChallengeDetector.is_login_redirect_url(url):
             logger.warning(
                 f"WebReader: Pre-emptive URL redirect login detected on {url}. Forcing NoVNC strategy."
@@ -83,13 +138,50 @@ class WebReader:
             return {NOVNC_STRATEGY_NAME: self.strategies[NOVNC_STRATEGY_NAME]}
 
         if heavy_mode:
-            return {
+            selected = {
                 "4-playwright_stealth": self.strategies["4-playwright_stealth"],
                 "5-crawlee_adaptive": self.strategies["5-crawlee_adaptive"],
                 NOVNC_STRATEGY_NAME: self.strategies[NOVNC_STRATEGY_NAME],
             }
+        else:
+            selected = dict(self.strategies)
 
-        return dict(self.strategies)
+        if profile and settings.STRATEGY_MEMORY_ENABLED:
+            return self._apply_strategy_memory(url, selected, profile)
+
+        return selected
+
+    @staticmethod
+    def _apply_strategy_memory(
+        url: str, strategies: dict[str, BaseStrategy], profile: dict[str, Any]
+    ) -> dict[str, BaseStrategy]:
+        """
+        Moves the domain's last successful tier to the front. Cheaper tiers that sat ahead
+        of it and have failed at least STRATEGY_MEMORY_SKIP_AFTER_FAILURES times are
+        dropped; the remaining tiers keep their order behind the promoted one.
+        """
+        winner = profile.get("last_success")
+        if not winner or winner not in strategies or winner == NOVNC_STRATEGY_NAME:
+            return strategies
+
+        names = list(strategies)
+        ahead = names[: names.index(winner)]
+        if not ahead:
+            return strategies
+
+        threshold = settings.STRATEGY_MEMORY_SKIP_AFTER_FAILURES
+        skipped = {name for name in ahead if profile["failures"].get(name, 0) >= threshold}
+        reordered = {winner: strategies[winner]}
+        reordered.update((name, strategies[name]) for name in names if name != winner and name not in skipped)
+
+        STRATEGY_MEMORY_PROMOTIONS_TOTAL.labels(strategy=winner).inc()
+        for name in skipped:
+            STRATEGY_MEMORY_SKIPS_TOTAL.labels(strategy=name).inc()
+        logger.info(
+            f"WebReader: strategy memory promotes {winner} for {url} (skipping: {sorted(skipped) or 'none'})"
+        )
+
+        return reordered
 
     @staticmethod
     def _budget_exceeded(started_at: float, name: str) -> bool:
@@ -110,45 +202,275 @@ class WebReader:
         return False
 
     async def read(self, url: str, heavy_mode: bool = False) -> dict[str, Any]:
-        logger.info(f"Reading URL: {url} (heavy_mode: {heavy_mode})")
-        strategies_to_run = self._select_strategies(url, heavy_mode)
-        started_at = time.perf_counter()
-        budget_exhausted = False
+        return await self._read_through_cache(
+            url, f"read:heavy={heavy_mode}", lambda: self._read_uncached(url, heavy_mode)
+        )
 
-        for name, strategy in strategies_to_run.items():
-            if self._budget_exceeded(started_at, name):
-                budget_exhausted = True
-                break
+    async def read_with_links(
+        self, url: str, link_filter: str | None = None, heavy_mode: bool = False
+    ) -> dict[str, Any]:
+        return await self._read_through_cache(
+            url,
+            f"links:heavy={heavy_mode}:filter={link_filter or ''}",
+            lambda: self._read_with_links_uncached(url, link_filter, heavy_mode),
+        )
 
-            result = await self._execute_strategy(name, strategy, url)
-            if result:
-                return result
+    async def _read_uncached(self, url: str, heavy_mode: bool) -> dict[str, Any]:
+        logger.info(f"Reading URL: {url} (heavy_mode: {heavy_mode})")
+        profile = await self._get_strategy_profile(url)
+        strategies_to_run = self._select_strategies(url, heavy_mode, profile)
 
-        return self._create_failure_response(url, budget_exhausted=budget_exhausted)
+        async def attempt(name: str, strategy: BaseStrategy) -> dict[str, Any] | None:
+            return await self._execute_strategy(name, strategy, url)
 
-    async def read_with_links(
-        self, url: str, link_filter: str | None = None, heavy_mode: bool = False
+        return await self._run_chain(url, strategies_to_run, attempt, profile)
+
+    async def _read_with_links_uncached(
+        self, url: str, link_filter: str | None, heavy_mode: bool
     ) -> dict[str, Any]:
         logger.info(f"Reading URL with links: {url} (heavy_mode: {heavy_mode})")
-        strategies_to_run = self._select_strategies(url, heavy_mode)
+        profile = await self._get_strategy_profile(url)
+        strategies_to_run = self._select_strategies(url, heavy_mode, profile)
+
+        async def attempt(name: str, strategy: BaseStrategy) -> dict[str, Any] | None:
+            html = await self._execute_html_strategy(name, strategy, url)
+            if not html:
+                return None
+
+            try:
+                content, links = await extraction_pool.run(annotate_links, html, url, link_filter)
+                valid = await extraction_pool.run(self.validator.validate, content)
+            except BrokenProcessPool:
+                # The page crashed two extraction workers; the next tier's HTML may not.
+                logger.warning(f"Strategy {name}: extraction workers crashed on the HTML of {url}.")
+                return None
+            if valid:
+                return {"content": content, "links": links, "status": "success", "mode": name}
+
+            logger.info(f"Strategy {name} validation failed after annotation.")
+
+            return None
+
+        return await self._run_chain(url, strategies_to_run, attempt, profile)
+
+    async def _read_through_cache(
+        self,
+        url: str,
+        mode: str,
+        read_fn: Callable[[], Coroutine[Any, Any, dict[str, Any]]],
+    ) -> dict[str, Any]:
+        if not settings.READ_CACHE_ENABLED:
+            return {**await read_fn(), "cache": "bypass"}
+
+        key = self.read_cache.build_key(url, mode)
+        entry = await self.read_cache.get(key)
+        if entry is not None:
+            if self.read_cache.is_fresh(entry):
+                READ_CACHE_TOTAL.labels(result="hit").inc()
+                return {**entry["result"], "cache": "hit"}
+
+            validators = entry.get("validators") or {}
+            if validators and await revalidate_with_curl_cffi(url, self._get_random_user_agent, validators):
+                READ_CACHE_TOTAL.labels(result="revalidated").inc()
+                await self.read_cache.touch(key, entry)
+                return {**entry["result"], "cache": "revalidated"}
+
+            READ_CACHE_TOTAL.labels(result="stale").inc()
+        else:
+            READ_CACHE_TOTAL.labels(result="miss").inc()
+
+        captured: dict[str, str] = {}
+        token = response_validators_ctx.set(captured)
+        try:
+            result = await read_fn()
+        finally:
+            response_validators_ctx.reset(token)
+
+        if result.get("status") == "success":
+            validators = captured if result.get("mode") in _REVALIDATABLE_MODES else None
+            await self.read_cache.put(key, result, validators)
+
+        return {**result, "cache": "miss"}
+
+    async def _get_strategy_profile(self, url: str) -> dict[str, Any] | None:
+        if not settings.STRATEGY_MEMORY_ENABLED:
+            return None
+
+        return await self.strategy_memory.get_profile(url)
+
+    async def _run_chain(
+        self,
+        url: str,
+        strategies: dict[str, BaseStrategy],
+        attempt: StrategyAttempt,
+        profile: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
         started_at = time.perf_counter()
-        budget_exhausted = False
+        execution = "hedged" if settings.READ_HEDGE_ENABLED else "sequential"
+        remembered = self._remembering(url, attempt)
 
-        for name, strategy in strategies_to_run.items():
-            if self._budget_exceeded(started_at, name):
-                budget_exhausted = True
-                break
+        try:
+            await self._probe_content_type(url, strategies)
+            if settings.READ_HEDGE_ENABLED:
+                result, budget_exhausted = await self._run_hedged(strategies, remembered, started_at)
+            else:
+                result, budget_exhausted = await self._run_sequential(strategies, remembered, started_at)
+        except NonHtmlContentException as exc:
+            return await answer_non_html(url, exc)
 
-            html = await self._execute_html_strategy(name, strategy, url)
-            if html:
-                content, links = annotate_links(html, url, link_filter)
-                if self.validator.validate(content):
-                    return {"content": content, "links": links, "status": "success", "mode": name}
+        if result:
+            READ_WINNING_TIER_TOTAL.labels(strategy=result["mode"], execution=execution).inc()
+            if profile:
+                self._record_time_saved(profile, result["mode"])
 
-                logger.info(f"Strategy {name} validation failed after annotation.")
+            return result
 
         return self._create_failure_response(url, budget_exhausted=budget_exhausted)
 
+    async def _probe_content_type(self, url: str, strategies: dict[str, BaseStrategy]) -> None:
+        """
+        Tiers 1-2 sniff every response they fetch. A chain that starts elsewhere (heavy mode,
+        or strategy memory promoting a browser tier) would hand a PDF straight to Chromium,
+        so it sends a HEAD first; when that declares something other than HTML, a curl fetch
+        raises the NonHtmlContentException that routes the read.
+        """
+        first = next(iter(strategies), NOVNC_STRATEGY_NAME)
+        if first in _CURL_TIERS or first == NOVNC_STRATEGY_NAME:
+            return
+
+        content_type = await probe_content_type(url, self._get_random_user_agent)
+        if not content_type or sniff(content_type, b"") == HTML:
+            return
+
+        await fetch_with_curl_cffi(url, self._get_random_user_agent, "ContentTypeProbe")
+
+    def _remembering(self, url: str, attempt: StrategyAttempt) -> StrategyAttempt:
+        if not settings.STRATEGY_MEMORY_ENABLED:
+            return attempt
+
+        async def remembered(name: str, strategy: BaseStrategy) -> dict[str, Any] | None:
+            started = time.perf_counter()
+            result = await attempt(name, strategy)
+            # NoVNC only ever hands off to a human, so it says nothing about which tier works,
+            # and a tier skipped by its open circuit says nothing about this domain.
+            circuit = _TIER_CIRCUITS.get(name)
+            skipped = circuit is not None and circuit_breakers.get(circuit).state == OPEN
+            if name == NOVNC_STRATEGY_NAME or (not result and skipped):
+                return result
+
+            if result and result["mode"] == name:
+                await self.strategy_memory.record_success(url, name)
+            else:
+                await self.strategy_memory.record_failure(url, name, time.perf_counter() - started)
+
+            return result
+
+        return remembered
+
+    def _record_time_saved(self, profile: dict[str, Any], winner: str) -> None:
+        # Estimate: every tier the default order would have tried before the winner, at that
+        # tier's mean failure duration on this domain. Only counted when memory promoted the winner.
+        if profile.get("last_success") != winner:
+            return
+
+        default_order = list(self.strategies)
+        if winner not in default_order:
+            return
+
+        saved = sum(
+            self.strategy_memory.mean_failure_seconds(profile, name)
+            for name in default_order[: default_order.index(winner)]
+        )
+        if saved > 0:
+            STRATEGY_MEMORY_TIME_SAVED_SECONDS.inc(saved)
+
+    async def _run_sequential(
+        self,
+        strategies: dict[str, BaseStrategy],
+        attempt: StrategyAttempt,
+        started_at: float,
+    ) -> tuple[dict[str, Any] | None, bool]:
+        for name, strategy in strategies.items():
+            if self._budget_exceeded(started_at, name):
+                return None, True
+
+            result = await attempt(name, strategy)
+            if result:
+                return result, False
+
+        return None, False
+
+    async def _run_hedged(
+        self,
+        strategies: dict[str, BaseStrategy],
+        attempt: StrategyAttempt,
+        started_at: float,
+    ) -> tuple[dict[str, Any] | None, bool]:
+        """
+        Runs tiers 1-5 with hedging: tier N+1 starts as soon as tier N fails, or once
+        tier N has been running for its hedge delay without producing valid content.
+        The first accepted result wins and every other in-flight tier is cancelled.
+        NoVNC is never hedged; it stays the sequential last resort.
+        """
+        queue = deque((name, s) for name, s in strategies.items() if name != NOVNC_STRATEGY_NAME)
+        fallback = {name: s for name, s in strategies.items() if name == NOVNC_STRATEGY_NAME}
+        pending: dict[asyncio.Task[dict[str, Any] | None], str] = {}
+        budget_exhausted = False
+        last_launched = ""
+        launch_next = True
+
+        try:
+            while True:
+                if launch_next and queue:
+                    name, strategy = queue.popleft()
+                    if self._budget_exceeded(started_at, name):
+                        budget_exhausted = True
+                        queue.clear()
+                    else:
+                        pending[asyncio.create_task(attempt(name, strategy))] = name
+                        last_launched = name
+                launch_next = False
+
+                if not pending:
+                    break
+
+                timeout = self._hedge_delay(last_launched) if queue else None
+                done, _ = await asyncio.wait(pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+                if not done:
+                    logger.info(f"WebReader: {last_launched} exceeded its hedge delay, starting next tier.")
+                    HEDGE_LAUNCHES_TOTAL.labels(strategy=last_launched).inc()
+                    launch_next = True
+                    continue
+
+                # Lower tiers win ties so results stay deterministic when several finish together.
+                for task in sorted(done, key=lambda t: pending[t]):
+                    pending.pop(task)
+                    result = task.result()
+                    if result:
+                        return result, False
+
+                launch_next = True
+        finally:
+            await self._cancel_pending(pending)
+
+        if budget_exhausted:
+            return None, True
+
+        return await self._run_sequential(fallback, attempt, started_at)
+
+    @staticmethod
+    def _hedge_delay(name: str) -> float:
+        return settings.READ_HEDGE_DELAYS.get(name, settings.READ_HEDGE_DEFAULT_DELAY)
+
+    @staticmethod
+    async def _cancel_pending(pending: dict[asyncio.Task[dict[str, Any] | None], str]) -> None:
+        # Awaiting the cancelled tasks lets each strategy's finally block run to completion,
+        # which is what closes the losing tiers' Playwright contexts.
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        pending.clear()
+
     async def _execute_strategy(
         self,
         name: str,
@@ -161,8 +483,11 @@ class WebReader:
 
         try:
             logger.info(f"--- Strategy {name} STARTED ---")
-            content = await strategy.extract(url)
-            if self.validator.validate(content):
+            with adaptive_timeouts.applied(name, url):
+                content = await strategy.extract(url)
+            fetched = time.perf_counter() - started
+            if await extraction_pool.run(self.validator.validate, content):
+                adaptive_timeouts.record_success(name, url, fetched)
                 STRATEGY_ATTEMPTS_TOTAL.labels(strategy=name, outcome="success").inc()
                 STRATEGY_DURATION_SECONDS.labels(strategy=name).observe(time.perf_counter() - started)
 
@@ -173,6 +498,11 @@ class WebReader:
 
             logger.info(f"Strategy {name} validation failed.")
 
+            return None
+        except CircuitOpenException as e:
+            STRATEGY_ATTEMPTS_TOTAL.labels(strategy=name, outcome="circuit_open").inc()
+            logger.info(f"Strategy {name} skipped for {url}: circuit open for another {e.retry_after:.0f}s.")
+
             return None
         except ChallengeDetectedException:
             STRATEGY_ATTEMPTS_TOTAL.labels(strategy=name, outcome="challenge_detected").inc()
@@ -191,10 +521,20 @@ class WebReader:
             return await self._execute_strategy(
                 NOVNC_STRATEGY_NAME, self.strategies[NOVNC_STRATEGY_NAME], url, escalating=True
             )
+        except NonHtmlContentException:
+            # Not a failure of this tier: the chain stops and the read answers from the body.
+            STRATEGY_ATTEMPTS_TOTAL.labels(strategy=name, outcome="non_html").inc()
+            STRATEGY_DURATION_SECONDS.labels(strategy=name).observe(time.perf_counter() - started)
+            raise
         except HumanInterventionRequiredException:
             STRATEGY_ATTEMPTS_TOTAL.labels(strategy=name, outcome="human_intervention").inc()
             STRATEGY_DURATION_SECONDS.labels(strategy=name).observe(time.perf_counter() - started)
             raise
+        except asyncio.CancelledError:
+            # A hedged sibling won the race; record the loss and let the cancellation unwind.
+            STRATEGY_ATTEMPTS_TOTAL.labels(strategy=name, outcome="cancelled").inc()
+            STRATEGY_DURATION_SECONDS.labels(strategy=name).observe(time.perf_counter() - started)
+            raise
         except Exception as e:
             STRATEGY_ATTEMPTS_TOTAL.labels(strategy=name, outcome="exception").inc()
             STRATEGY_DURATION_SECONDS.labels(strategy=name).observe(time.perf_counter() - started)
@@ -214,8 +554,10 @@ class WebReader:
 
         try:
             logger.info(f"--- Strategy {name} STARTED ---")
-            html = await strategy.get_html(url)
+            with adaptive_timeouts.applied(name, url):
+                html = await strategy.get_html(url)
             if html:
+                adaptive_timeouts.record_success(name, url, time.perf_counter() - started)
                 STRATEGY_ATTEMPTS_TOTAL.labels(strategy=name, outcome="success").inc()
                 STRATEGY_DURATION_SECONDS.labels(strategy=name).observe(time.perf_counter() - started)
 
@@ -225,6 +567,9 @@ class WebReader:
             STRATEGY_DURATION_SECONDS.labels(strategy=name).observe(time.perf_counter() - started)
 
             logger.info(f"Strategy {name} returned empty HTML.")
+        except CircuitOpenException as e:
+            STRATEGY_ATTEMPTS_TOTAL.labels(strategy=name, outcome="circuit_open").inc()
+            logger.info(f"Strategy {name} skipped for {url}: circuit open for another {e.retry_after:.0f}s.")
         except ChallengeDetectedException:
             STRATEGY_ATTEMPTS_TOTAL.labels(strategy=name, outcome="challenge_detected").inc()
             STRATEGY_DURATION_SECONDS.labels(strategy=name).observe(time.perf_counter() - started)
@@ -242,10 +587,20 @@ class WebReader:
             return await self._execute_html_strategy(
                 NOVNC_STRATEGY_NAME, self.strategies[NOVNC_STRATEGY_NAME], url, escalating=True
             )
+        except NonHtmlContentException:
+            # Not a failure of this tier: the chain stops and the read answers from the body.
+            STRATEGY_ATTEMPTS_TOTAL.labels(strategy=name, outcome="non_html").inc()
+            STRATEGY_DURATION_SECONDS.labels(strategy=name).observe(time.perf_counter() - started)
+            raise
         except HumanInterventionRequiredException:
             STRATEGY_ATTEMPTS_TOTAL.labels(strategy=name, outcome="human_intervention").inc()
             STRATEGY_DURATION_SECONDS.labels(strategy=name).observe(time.perf_counter() - started)
             raise
+        except asyncio.CancelledError:
+            # A hedged sibling won the race; record the loss and let the cancellation unwind.
+            STRATEGY_ATTEMPTS_TOTAL.labels(strategy=name, outcome="cancelled").inc()
+            STRATEGY_DURATION_SECONDS.labels(strategy=name).observe(time.perf_counter() - started)
+            raise
         except Exception as e:
             STRATEGY_ATTEMPTS_TOTAL.labels(strategy=name, outcome="exception").inc()
             STRATEGY_DURATION_SECONDS.labels(strategy=name).observe(time.perf_counter() - started)
@@ -1,27 +1,98 @@
 import asyncio
 import logging
+import random
+import time
+from collections import Counter, deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from urllib.parse import urlsplit
 
-from playwright.async_api import Browser, Playwright, async_playwright
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    CDPSession,
+    Frame,
+    Page,
+    Playwright,
+    ViewportSize,
+    async_playwright,
+)
 
 from src.config.config import settings
+from src.observability.metrics import (
+    BROWSER_POOL_CONTEXTS,
+    BROWSER_POOL_CONTEXTS_IN_USE,
+    BROWSER_POOL_PROCESSES,
+    BROWSER_POOL_RECYCLES_TOTAL,
+    BROWSER_POOL_WAIT_SECONDS,
+)
+from src.runtime.circuit_breaker import circuit_breakers
 
 logger = logging.getLogger(__name__)
 
+# Viewport jitter — desktop ranges that look human, not bot-perfect.
+_VIEWPORT_MIN_WIDTH_PX = 1280
+_VIEWPORT_MAX_WIDTH_PX = 1920
+_VIEWPORT_MIN_HEIGHT_PX = 720
+_VIEWPORT_MAX_HEIGHT_PX = 1080
+
+# Applied once to every new pooled page (stealth init scripts, request routing).
+PageSetup = Callable[[Page], Awaitable[None]]
+
+
+class PooledContext:
+    """One BrowserContext with its single page, plus the browser process that owns it."""
+
+    def __init__(self, browser: Browser, context: BrowserContext, page: Page) -> None:
+        self.browser = browser
+        self.context = context
+        self.page = page
+        self.uses = 0
+        # Origins any frame navigated to since the last reset; their storage is cleared on checkin.
+        self.origins: set[str] = set()
+        self.cdp: CDPSession | None = None
+
+    def note_navigation(self, frame: Frame) -> None:
+        parts = urlsplit(frame.url)
+        if parts.scheme in ("http", "https"):
+            self.origins.add(f"{parts.scheme}://{parts.netloc}")
+
 
 class BrowserPool:
     """
-    Single long-lived Chromium process shared across PlaywrightStrategy requests.
+    Long-lived Chromium processes plus a bounded pool of pre-warmed stealth contexts.
 
-    Per-request browser launch was 600-1500 ms of cold start. With a singleton browser
-    the per-request cost drops to ~50 ms of BrowserContext creation. The browser process
-    is recreated transparently if it disconnects (Chromium OOM, crash, etc.).
+    Per-request browser launch was 600-1500 ms of cold start; per-request context creation
+    plus stealth injection and route registration is still ~50-100 ms and, without a cap,
+    a burst of reads opens enough contexts to OOM Chromium. Checkouts are therefore bounded
+    by PLAYWRIGHT_CONTEXT_POOL_SIZE and queue beyond it. Between uses the page is parked on
+    about:blank, every origin its frames visited has its storage (localStorage, IndexedDB,
+    Cache Storage, service workers) cleared over CDP and cookies are cleared; service workers
+    are blocked outright. A context is still recycled after PLAYWRIGHT_CONTEXT_MAX_USES uses
+    or any failed use, which also drops the HTTP cache a reset leaves. Extra Chromium
+    processes are launched when every running one already holds PLAYWRIGHT_CONTEXTS_PER_BROWSER
+    contexts. The primary browser is recreated transparently if it disconnects (Chromium
+    OOM, crash, etc.); checkouts go through the "chromium" circuit, so a Chromium that keeps
+    failing to launch is skipped for a cooldown.
     """
 
     def __init__(self) -> None:
         self._playwright: Playwright | None = None
         self._browser: Browser | None = None
+        self._extra_browsers: list[Browser] = []
         self._lock = asyncio.Lock()
 
+        self._slots = asyncio.Semaphore(settings.PLAYWRIGHT_CONTEXT_POOL_SIZE)
+        self._idle: deque[PooledContext] = deque()
+        self._contexts: set[PooledContext] = set()
+        self._user_agent_provider: Callable[[], str] | None = None
+        self._page_setup: PageSetup | None = None
+
+    def configure_contexts(self, user_agent_provider: Callable[[], str], page_setup: PageSetup) -> None:
+        """Registers how pooled contexts are built. Called by PlaywrightStrategy; last caller wins."""
+        self._user_agent_provider = user_agent_provider
+        self._page_setup = page_setup
+
     async def start(self) -> None:
         async with self._lock:
             if self._browser is not None and self._browser.is_connected():
@@ -29,14 +100,24 @@ class BrowserPool:
 
             await self._launch_locked()
 
+        await self._prewarm()
+
     async def stop(self) -> None:
+        for pooled in list(self._contexts):
+            await self._discard(pooled, reason="shutdown")
+        self._idle.clear()
+
         async with self._lock:
-            if self._browser is not None:
+            for browser in [*self._extra_browsers, self._browser]:
+                if browser is None:
+                    continue
                 try:
-                    await self._browser.close()
+                    await browser.close()
                 except Exception as e:
                     logger.warning(f"BrowserPool: error closing browser on shutdown: {e}")
-                self._browser = None
+            self._extra_browsers = []
+            self._browser = None
+            BROWSER_POOL_PROCESSES.set(0)
 
             if self._playwright is not None:
                 try:
@@ -59,6 +140,151 @@ class BrowserPool:
 
             return self._browser
 
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Page]:
+        """Checks out a pooled stealth page, waiting for a free slot when the pool is exhausted."""
+        started = time.perf_counter()
+        async with self._slots:
+            BROWSER_POOL_WAIT_SECONDS.observe(time.perf_counter() - started)
+            # Only launching Chromium and opening a context count towards its circuit; what a
+            # page does once checked out is the site's doing.
+            async with circuit_breakers.get("chromium").guard():
+                pooled = await self._checkout()
+            BROWSER_POOL_CONTEXTS_IN_USE.inc()
+            failed = False
+            try:
+                yield pooled.page
+            except BaseException:
+                # Includes cancellation by a winning hedge: the page may be mid-navigation.
+                failed = True
+                raise
+            finally:
+                BROWSER_POOL_CONTEXTS_IN_USE.dec()
+                await self._checkin(pooled, failed)
+
+    async def _checkout(self) -> PooledContext:
+        while self._idle:
+            pooled = self._idle.popleft()
+            if pooled.browser.is_connected():
+                return pooled
+
+            await self._discard(pooled, reason="disconnected")
+
+        return await self._create_context()
+
+    async def _checkin(self, pooled: PooledContext, failed: bool) -> None:
+        pooled.uses += 1
+        if failed:
+            await self._discard(pooled, reason="failed_use")
+            return
+        if pooled.uses >= settings.PLAYWRIGHT_CONTEXT_MAX_USES:
+            await self._discard(pooled, reason="max_uses")
+            return
+        if not pooled.browser.is_connected():
+            await self._discard(pooled, reason="disconnected")
+            return
+
+        try:
+            await pooled.page.goto("about:blank")
+            await self._clear_storage(pooled)
+            await pooled.context.clear_cookies()
+        except Exception as e:
+            logger.warning(f"BrowserPool: failed to reset pooled context, recycling: {e}")
+            await self._discard(pooled, reason="reset_failed")
+            return
+
+        self._idle.append(pooled)
+
+    @staticmethod
+    async def _clear_storage(pooled: PooledContext) -> None:
+        if not pooled.origins:
+            return
+
+        if pooled.cdp is None:
+            pooled.cdp = await pooled.context.new_cdp_session(pooled.page)
+        for origin in pooled.origins:
+            await pooled.cdp.send("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+        pooled.origins.clear()
+
+    async def _create_context(self) -> PooledContext:
+        browser = await self._pick_browser()
+        viewport: ViewportSize = {
+            "width": random.randint(_VIEWPORT_MIN_WIDTH_PX, _VIEWPORT_MAX_WIDTH_PX),
+            "height": random.randint(_VIEWPORT_MIN_HEIGHT_PX, _VIEWPORT_MAX_HEIGHT_PX),
+        }
+        context = await browser.new_context(
+            user_agent=self._user_agent_provider() if self._user_agent_provider else None,
+            viewport=viewport,
+            locale="en-US",
+            timezone_id="UTC",
+            service_workers="block",
+        )
+        try:
+            page = await context.new_page()
+            if self._page_setup is not None:
+                await self._page_setup(page)
+        except BaseException:
+            await context.close()
+            raise
+
+        pooled = PooledContext(browser, context, page)
+        page.on("framenavigated", pooled.note_navigation)
+        self._contexts.add(pooled)
+        BROWSER_POOL_CONTEXTS.set(len(self._contexts))
+
+        return pooled
+
+    async def _discard(self, pooled: PooledContext, reason: str) -> None:
+        self._contexts.discard(pooled)
+        BROWSER_POOL_CONTEXTS.set(len(self._contexts))
+        BROWSER_POOL_RECYCLES_TOTAL.labels(reason=reason).inc()
+        try:
+            await pooled.context.close()
+        except Exception as e:
+            logger.debug(f"BrowserPool: error closing pooled context ({reason}): {e}")
+
+    async def _pick_browser(self) -> Browser:
+        primary = await self.get_browser()
+        browser = self._least_loaded_with_room(primary)
+        if browser is not None:
+            return browser
+
+        async with self._lock:
+            # Another checkout may have launched a process while this one waited for the lock.
+            browser = self._least_loaded_with_room(primary)
+            if browser is not None:
+                return browser
+
+            assert self._playwright is not None
+            browser = await self._launch_browser(self._playwright)
+            self._extra_browsers.append(browser)
+            processes = 1 + len(self._extra_browsers)
+            BROWSER_POOL_PROCESSES.set(processes)
+            logger.info(f"BrowserPool: launched additional Chromium process ({processes} total)")
+
+            return browser
+
+    def _least_loaded_with_room(self, primary: Browser) -> Browser | None:
+        self._extra_browsers = [browser for browser in self._extra_browsers if browser.is_connected()]
+        load = Counter(pooled.browser for pooled in self._contexts)
+        least_loaded = min([primary, *self._extra_browsers], key=lambda browser: load[browser])
+
+        return least_loaded if load[least_loaded] < settings.PLAYWRIGHT_CONTEXTS_PER_BROWSER else None
+
+    async def _prewarm(self) -> None:
+        target = min(settings.PLAYWRIGHT_CONTEXT_PREWARM, settings.PLAYWRIGHT_CONTEXT_POOL_SIZE)
+        if self._page_setup is None or target <= len(self._idle):
+            return
+
+        try:
+            while len(self._idle) < target:
+                self._idle.append(await self._create_context())
+        except Exception as e:
+            # A cold pool only costs latency on the first reads; never fail startup over it.
+            logger.warning(f"BrowserPool: context pre-warm stopped early: {e}")
+
+        logger.info(f"BrowserPool: pre-warmed {len(self._idle)} stealth contexts")
+
     async def _launch_locked(self) -> None:
         # Stop the previous driver subprocess on relaunch; without this the Node bridge
         # process orphans every time get_browser() detects a disconnected browser.
@@ -68,16 +294,23 @@ class BrowserPool:
             except Exception as e:
                 logger.warning(f"BrowserPool: error stopping prior playwright on relaunch: {e}")
             self._playwright = None
+            # Extra processes belonged to the stopped driver.
+            self._extra_browsers = []
 
         self._playwright = await async_playwright().start()
-        self._browser = await self._playwright.chromium.launch(
-            headless=settings.PLAYWRIGHT_HEADLESS,
-            args=["--no-sandbox"],
-        )
+        self._browser = await self._launch_browser(self._playwright)
+        BROWSER_POOL_PROCESSES.set(1)
         logger.info(
             f"BrowserPool: launched Chromium (headless={settings.PLAYWRIGHT_HEADLESS}, "
             f"connected={self._browser.is_connected()})"
         )
 
+    @staticmethod
+    async def _launch_browser(playwright: Playwright) -> Browser:
+        return await playwright.chromium.launch(
+            headless=settings.PLAYWRIGHT_HEADLESS,
+            args=["--no-sandbox"],
+        )
+
 
 browser_pool = BrowserPool()
@@ -0,0 +1,192 @@
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from src.api.exceptions import CircuitOpenException
+from src.config.config import settings
+from src.observability.metrics import (
+    CIRCUIT_BREAKER_CALLS_TOTAL,
+    CIRCUIT_BREAKER_STATE,
+    CIRCUIT_BREAKER_TRANSITIONS_TOTAL,
+)
+
+logger = logging.getLogger(__name__)
+
+CLOSED = "closed"
+HALF_OPEN = "half_open"
+OPEN = "open"
+
+SUCCESS = "success"
+FAILURE = "failure"
+TIMEOUT = "timeout"
+
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+def is_timeout(error: BaseException) -> bool:
+    # curl_cffi, httpx, Playwright and redis each have their own timeout class and only
+    # some derive from the builtin; all of them carry "Timeout" in the name.
+    return isinstance(error, TimeoutError) or "Timeout" in type(error).__name__
+
+
+class CircuitBreaker:
+    """
+    Rolling-window circuit breaker for one strategy or upstream dependency.
+
+    A dead FlareSolverr used to cost every read the full 60 s solve timeout, and a down
+    Redis a connect timeout per cache lookup. Calls made through guard() are recorded as
+    a success, failure or timeout for CIRCUIT_WINDOW_SECONDS; once the window holds
+    CIRCUIT_MIN_CALLS and failures plus timeouts reach CIRCUIT_FAILURE_RATE of them, the
+    circuit opens and guard() raises CircuitOpenException without calling out. After
+    CIRCUIT_COOLDOWN_SECONDS it goes half-open and lets CIRCUIT_HALF_OPEN_TRIALS calls
+    through: the first verdict closes it or opens it for another cooldown. A trial that
+    ends without one (cancelled, or a neutral exception) cannot wedge it half-open, as
+    another batch of trials is admitted once a cooldown has passed.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self._calls: deque[tuple[float, str]] = deque()
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._trials = 0
+        self._trials_started_at = 0.0
+        CIRCUIT_BREAKER_STATE.labels(name=name).set(_STATE_VALUES[CLOSED])
+
+    @property
+    def state(self) -> str:
+        self._refresh(time.monotonic())
+
+        return self._state
+
+    def allow(self) -> bool:
+        """Whether a call may go out now; admitting a half-open trial counts it."""
+        if not settings.CIRCUIT_BREAKER_ENABLED:
+            return True
+
+        now = time.monotonic()
+        self._refresh(now)
+        if self._state == CLOSED:
+            return True
+        if self._state == OPEN:
+            return False
+
+        if self._trials >= settings.CIRCUIT_HALF_OPEN_TRIALS:
+            if now - self._trials_started_at < settings.CIRCUIT_COOLDOWN_SECONDS:
+                return False
+            self._trials = 0
+        if self._trials == 0:
+            self._trials_started_at = now
+        self._trials += 1
+
+        return True
+
+    def record(self, outcome: str) -> None:
+        """Records a call's outcome: SUCCESS, FAILURE or TIMEOUT."""
+        CIRCUIT_BREAKER_CALLS_TOTAL.labels(name=self.name, outcome=outcome).inc()
+        now = time.monotonic()
+        self._refresh(now)
+
+        if self._state == HALF_OPEN:
+            self._transition(CLOSED if outcome == SUCCESS else OPEN, now)
+            return
+        if self._state == OPEN:
+            # A call admitted before the circuit opened; the window it belonged to is gone.
+            return
+
+        self._calls.append((now, outcome))
+        self._prune(now)
+        failed = sum(1 for _, recorded in self._calls if recorded != SUCCESS)
+        if len(self._calls) >= settings.CIRCUIT_MIN_CALLS and failed >= (
+            settings.CIRCUIT_FAILURE_RATE * len(self._calls)
+        ):
+            self._transition(OPEN, now)
+
+    @asynccontextmanager
+    async def guard(self, neutral: tuple[type[BaseException], ...] = ()) -> AsyncIterator[None]:
+        """
+        Runs the block as one call. Raises CircuitOpenException instead when the circuit
+        is open. Exceptions listed in `neutral` (a page's verdict, not the dependency's
+        health) and cancellation pass through unrecorded.
+        """
+        if not self.allow():
+            CIRCUIT_BREAKER_CALLS_TOTAL.labels(name=self.name, outcome="rejected").inc()
+            raise CircuitOpenException(self.name, self.retry_after())
+
+        try:
+            yield
+        except neutral:
+            raise
+        except Exception as e:
+            self.record(TIMEOUT if is_timeout(e) else FAILURE)
+            raise
+        self.record(SUCCESS)
+
+    def retry_after(self) -> float:
+        """Seconds until an open circuit admits trial calls; 0 when it is not open."""
+        if self.state != OPEN:
+            return 0.0
+
+        return max(0.0, self._opened_at + settings.CIRCUIT_COOLDOWN_SECONDS - time.monotonic())
+
+    def snapshot(self) -> dict[str, Any]:
+        now = time.monotonic()
+        self._refresh(now)
+        self._prune(now)
+        calls = len(self._calls)
+        failures = sum(1 for _, outcome in self._calls if outcome == FAILURE)
+        timeouts = sum(1 for _, outcome in self._calls if outcome == TIMEOUT)
+
+        return {
+            "state": self._state,
+            "calls": calls,
+            "failure_rate": round(failures / calls, 3) if calls else 0.0,
+            "timeout_rate": round(timeouts / calls, 3) if calls else 0.0,
+            "retry_after": round(self.retry_after(), 1),
+        }
+
+    def _refresh(self, now: float) -> None:
+        if self._state == OPEN and now - self._opened_at >= settings.CIRCUIT_COOLDOWN_SECONDS:
+            self._transition(HALF_OPEN, now)
+
+    def _prune(self, now: float) -> None:
+        horizon = now - settings.CIRCUIT_WINDOW_SECONDS
+        while self._calls and self._calls[0][0] < horizon:
+            self._calls.popleft()
+
+    def _transition(self, state: str, now: float) -> None:
+        self._state = state
+        self._calls.clear()
+        self._trials = 0
+        if state == OPEN:
+            self._opened_at = now
+            cooldown = settings.CIRCUIT_COOLDOWN_SECONDS
+            logger.warning(f"CircuitBreaker: {self.name} opened; skipping it for {cooldown:.0f}s")
+        else:
+            logger.info(f"CircuitBreaker: {self.name} is {state}")
+
+        CIRCUIT_BREAKER_STATE.labels(name=self.name).set(_STATE_VALUES[state])
+        CIRCUIT_BREAKER_TRANSITIONS_TOTAL.labels(name=self.name, state=state).inc()
+
+
+class CircuitBreakers:
+    """Process-wide registry: one breaker per strategy or upstream name, created on first use."""
+
+    def __init__(self) -> None:
+        self._breakers: dict[str, CircuitBreaker] = {}
+
+    def get(self, name: str) -> CircuitBreaker:
+        breaker = self._breakers.get(name)
+        if breaker is None:
+            breaker = self._breakers[name] = CircuitBreaker(name)
+
+        return breaker
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        return {name: breaker.snapshot() for name, breaker in sorted(self._breakers.items())}
+
+
+circuit_breakers = CircuitBreakers()
@@ -0,0 +1,340 @@
+import asyncio
+import logging
+import signal
+import threading
+import uuid
+from collections.abc import Callable
+from contextlib import suppress
+from types import TracebackType
+from typing import Any
+
+from crawlee import ConcurrencySettings, Request
+from crawlee.browsers import BrowserPool as CrawleeBrowserPool
+from crawlee.browsers import PlaywrightBrowserController, PlaywrightBrowserPlugin
+from crawlee.crawlers import (
+    AdaptivePlaywrightCrawler,
+    AdaptivePlaywrightCrawlingContext,
+    AdaptivePlaywrightPreNavCrawlingContext,
+    BasicCrawlingContext,
+)
+from crawlee.errors import ContextPipelineInterruptedError
+from crawlee.fingerprint_suite import DefaultFingerprintGenerator, HeaderGeneratorOptions
+from crawlee.storage_clients import MemoryStorageClient
+from crawlee.storages import RequestQueue
+from playwright.async_api import Page
+
+from src.config.config import settings
+from src.observability.metrics import CRAWLEE_CRAWLERS_STARTED_TOTAL, CRAWLEE_READS_IN_FLIGHT
+from src.runtime.browser_pool import PageSetup, browser_pool
+from src.runtime.circuit_breaker import FAILURE, circuit_breakers
+
+logger = logging.getLogger(__name__)
+
+# Context options the per-read Crawlee crawler used to launch with; kept so tier 5 still
+# presents a US desktop with a geolocation grant, unlike the Playwright tier's contexts.
+_CONTEXT_OPTIONS: dict[str, Any] = {
+    "locale": "en-US",
+    "timezone_id": "America/New_York",
+    "geolocation": {"latitude": 37.7749, "longitude": -122.4194},
+    "permissions": ["geolocation"],
+}
+
+# Seconds a stop() waits for the crawler's run task before cancelling it.
+_STOP_TIMEOUT_S = 10.0
+
+
+class _SharedChromiumController(PlaywrightBrowserController):
+    """Crawlee controller over the BrowserPool's Chromium: one incognito context per page."""
+
+    @property
+    def has_free_capacity(self) -> bool:
+        # After a Chromium crash the pool relaunches; Crawlee then asks the plugin for a
+        # new controller, which wraps the new process.
+        return super().has_free_capacity and self.is_browser_connected
+
+    async def new_page(self, *args: Any, **kwargs: Any) -> Page:
+        page = await super().new_page(*args, **kwargs)
+        # Crawlee closes the page after each request but leaves its incognito context
+        # open; closing the context with it is what keeps reads isolated and bounded.
+        page.once("close", _close_context)
+
+        return page
+
+    async def close(self, *, force: bool = False) -> None:
+        if self.pages_count > 0 and not force:
+            raise ValueError("Cannot close the browser while there are open pages.")
+
+        # Retiring a controller must never close the shared Chromium.
+        for page in list(self.pages):
+            await _close_context(page)
+
+
+class _SharedChromiumPlugin(PlaywrightBrowserPlugin):
+    """Hands Crawlee the BrowserPool's Chromium instead of launching its own."""
+
+    async def __aenter__(self) -> "_SharedChromiumPlugin":
+        if self._active:
+            raise RuntimeError(f"The {self.__class__.__name__} is already active.")
+
+        self._active = True
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        exc_traceback: TracebackType | None,
+    ) -> None:
+        if not self._active:
+            raise RuntimeError(f"The {self.__class__.__name__} is not active.")
+
+        self._active = False
+
+    async def new_browser(self) -> PlaywrightBrowserController:
+        return _SharedChromiumController(
+            await browser_pool.get_browser(),
+            use_incognito_pages=True,
+            max_open_pages_per_browser=self.max_open_pages_per_browser,
+            fingerprint_generator=self._fingerprint_generator,
+        )
+
+
+class _Crawler:
+    """One keep-alive crawler, its private request queue, and the reads waiting on it."""
+
+    def __init__(self, crawler: AdaptivePlaywrightCrawler, queue: RequestQueue) -> None:
+        self.crawler = crawler
+        self.queue = queue
+        self.pending: dict[str, asyncio.Future[str]] = {}
+        self.reads = 0
+        self.retired = False
+        self.task: asyncio.Task[None] | None = None
+
+
+class CrawleeService:
+    """
+    One long-lived Crawlee crawler shared by every tier-5 read.
+
+    Building an AdaptivePlaywrightCrawler per read launched a Chromium, registered handlers,
+    ran a single request and tore it all down again, so each read paid a browser cold start.
+    The service instead keeps a crawler running with keep_alive, feeds it URLs through its
+    request queue and hands each HTML back to the waiting caller through a future keyed by
+    the request's unique key; a caller that gives up takes its key with it, and the request
+    is dropped before it navigates. Pages come from the BrowserPool's Chromium via a Crawlee
+    plugin that opens one incognito context per page and closes it with the page, so reads
+    still share no cookies or storage. A crawler is replaced after CRAWLEE_RECYCLE_AFTER_READS
+    reads, since Crawlee's statistics and rendering-type predictions grow with every
+    request; it is stopped once its last read resolves, and stop() runs from the lifespan.
+    """
+
+    def __init__(self) -> None:
+        self._current: _Crawler | None = None
+        self._crawlers: set[_Crawler] = set()
+        self._lock = asyncio.Lock()
+        self._started = False
+        self._page_setup: PageSetup | None = None
+        self._page_done: Callable[[Page], object] | None = None
+
+    def configure_pages(self, page_setup: PageSetup, page_done: Callable[[Page], object]) -> None:
+        """Registers per-page hooks: setup before navigation, done once the HTML was read."""
+        self._page_setup = page_setup
+        self._page_done = page_done
+
+    async def fetch(self, url: str) -> str:
+        """
+        Crawls `url` and returns its HTML; raises if Crawlee gave up on the request. Raises
+        CircuitOpenException instead while crawlers keep failing to start or crashing.
+        """
+        # Only starting a crawler counts, with crashes recorded by _run; how a page then fares
+        # (failed navigations, timeouts) is the site's doing.
+        async with circuit_breakers.get("crawlee").guard():
+            crawler = await self._crawler()
+        key = uuid.uuid4().hex
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        crawler.pending[key] = future
+        crawler.reads += 1
+        if crawler.reads >= settings.CRAWLEE_RECYCLE_AFTER_READS:
+            self._retire(crawler)
+
+        CRAWLEE_READS_IN_FLIGHT.inc()
+        try:
+            await crawler.crawler.add_requests([Request.from_url(url, unique_key=key)])
+            return await future
+        finally:
+            CRAWLEE_READS_IN_FLIGHT.dec()
+            crawler.pending.pop(key, None)
+            if crawler.retired and not crawler.pending:
+                crawler.crawler.stop("retired")
+
+    async def stop(self) -> None:
+        self._current = None
+        for crawler in list(self._crawlers):
+            crawler.retired = True
+            crawler.crawler.stop("shutdown")
+            if crawler.task is None:
+                continue
+            try:
+                await asyncio.wait_for(asyncio.shield(crawler.task), timeout=_STOP_TIMEOUT_S)
+            except Exception as e:
+                crawler.task.cancel()
+                logger.warning(f"CrawleeService: crawler did not stop cleanly: {e!r}")
+
+    async def _crawler(self) -> _Crawler:
+        current = self._current
+        if current is not None and current.task is not None and not current.task.done():
+            return current
+
+        async with self._lock:
+            current = self._current
+            if current is not None and current.task is not None and not current.task.done():
+                return current
+
+            if current is not None:
+                reason = "crashed"
+                self._retire(current)
+            else:
+                reason = "recycled" if self._started else "cold"
+            self._current = await self._start(reason)
+            self._started = True
+
+            return self._current
+
+    def _retire(self, crawler: _Crawler) -> None:
+        crawler.retired = True
+        if self._current is crawler:
+            self._current = None
+        if not crawler.pending:
+            crawler.crawler.stop("retired")
+
+    async def _start(self, reason: str) -> _Crawler:
+        storage_client = MemoryStorageClient()
+        # Each crawler gets its own queue: a retiring one still drains while its successor runs.
+        queue = await RequestQueue.open(
+            alias=f"crawlee-service-{uuid.uuid4().hex}", storage_client=storage_client
+        )
+        plugin = _SharedChromiumPlugin(
+            browser_new_context_options=_CONTEXT_OPTIONS,
+            max_open_pages_per_browser=settings.CRAWLEE_MAX_CONCURRENCY,
+            use_incognito_pages=True,
+            fingerprint_generator=DefaultFingerprintGenerator(
+                header_options=HeaderGeneratorOptions(browsers=["chrome"])
+            ),
+        )
+        concurrency = settings.CRAWLEE_MAX_CONCURRENCY
+        crawler = _Crawler(
+            AdaptivePlaywrightCrawler.with_beautifulsoup_static_parser(
+                playwright_crawler_specific_kwargs={"browser_pool": CrawleeBrowserPool(plugins=[plugin])},
+                request_manager=queue,
+                storage_client=storage_client,
+                keep_alive=True,
+                use_session_pool=False,
+                concurrency_settings=ConcurrencySettings(
+                    desired_concurrency=concurrency, max_concurrency=concurrency
+                ),
+            ),
+            queue,
+        )
+        self._register_handlers(crawler)
+        self._crawlers.add(crawler)
+
+        on_main_thread = threading.current_thread() is threading.main_thread()
+        host_sigint = signal.getsignal(signal.SIGINT) if on_main_thread else None
+        crawler.task = asyncio.create_task(self._run(crawler))
+        # run() installs its own SIGINT handler before its first suspension point. In a
+        # long-lived crawler that would swallow the server's Ctrl+C, so hand it back.
+        await asyncio.sleep(0)
+        if on_main_thread:
+            _restore_sigint(host_sigint)
+
+        CRAWLEE_CRAWLERS_STARTED_TOTAL.labels(reason=reason).inc()
+        logger.info(f"CrawleeService: started crawler ({reason})")
+
+        return crawler
+
+    async def _run(self, crawler: _Crawler) -> None:
+        try:
+            await crawler.crawler.run()
+        except Exception as e:
+            logger.warning(f"CrawleeService: crawler run failed: {e!r}")
+        finally:
+            if not crawler.retired:
+                # Only a crash ends a crawler nobody retired.
+                circuit_breakers.get("crawlee").record(FAILURE)
+            self._crawlers.discard(crawler)
+            for future in crawler.pending.values():
+                if not future.done():
+                    future.set_exception(RuntimeError("Crawlee crawler stopped before the read finished"))
+            with suppress(Exception):
+                await crawler.queue.drop()
+
+    def _register_handlers(self, crawler: _Crawler) -> None:
+        @crawler.crawler.router.default_handler
+        async def request_handler(context: AdaptivePlaywrightCrawlingContext) -> None:
+            page = _context_page(context)
+            if page is not None and self._page_done is not None:
+                self._page_done(page)
+            future = crawler.pending.get(context.request.unique_key)
+            if future is not None and not future.done():
+                future.set_result(await self._context_html(context))
+
+        @crawler.crawler.failed_request_handler
+        async def failed_request_handler(context: BasicCrawlingContext, error: Exception) -> None:
+            future = crawler.pending.get(context.request.unique_key)
+            if future is not None and not future.done():
+                future.set_exception(error)
+
+        # fetch() drops its key once the caller is gone (a hedged loser, a deadline); the request
+        # is still queued, so stop it before either sub-crawler navigates. An interrupted
+        # pipeline marks the request handled: no failed-request handling, no retry.
+        @crawler.crawler.pre_navigation_hook()
+        async def skip_abandoned(context: AdaptivePlaywrightPreNavCrawlingContext) -> None:
+            if context.request.unique_key not in crawler.pending:
+                page = _context_page(context)
+                if page is not None:
+                    # Crawlee only closes a page once it navigated; closing it here also
+                    # closes its incognito context.
+                    await page.close()
+                raise ContextPipelineInterruptedError(f"read of {context.request.url} was abandoned")
+
+        # Static sub-crawls have no page; this hook only concerns browser navigations.
+        @crawler.crawler.pre_navigation_hook(playwright_only=True)
+        async def setup_page(context: AdaptivePlaywrightPreNavCrawlingContext) -> None:
+            if self._page_setup is not None:
+                await self._page_setup(context.page)
+
+    @staticmethod
+    async def _context_html(context: AdaptivePlaywrightCrawlingContext) -> str:
+        page = _context_page(context)
+        if page is not None:
+            return await page.content()
+
+        # Served by the static sub-crawler: the HTTP response parsed by BeautifulSoup.
+        return str(context.parsed_content)
+
+
+def _context_page(
+    context: AdaptivePlaywrightCrawlingContext | AdaptivePlaywrightPreNavCrawlingContext,
+) -> Page | None:
+    try:
+        return context.page
+    except RuntimeError:
+        # AdaptiveContextError (not exported): the static sub-crawler served this request.
+        return None
+
+
+async def _close_context(page: Page) -> None:
+    try:
+        await page.context.close()
+    except Exception as e:
+        logger.debug(f"CrawleeService: error closing page context: {e}")
+
+
+def _restore_sigint(handler: Any) -> None:
+    # Event-loop signal handlers are not supported on Windows.
+    with suppress(NotImplementedError):
+        asyncio.get_running_loop().remove_signal_handler(signal.SIGINT)
+    if handler is not None:
+        signal.signal(signal.SIGINT, handler)
+
+
+crawlee_service = CrawleeService()
@@ -0,0 +1,151 @@
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from typing import Any
+from urllib.parse import urlsplit
+
+from curl_cffi import CurlOpt, requests
+
+from src.config.config import settings
+from src.observability.metrics import CURL_SESSION_CHECKOUTS_TOTAL, CURL_SESSIONS, CURL_SESSIONS_CLOSED_TOTAL
+
+logger = logging.getLogger(__name__)
+
+# (impersonation profile, clearance identity, origin)
+SessionKey = tuple[str, str, str]
+
+
+class PooledSession:
+    """One curl_cffi session and the connections it keeps open to a single origin."""
+
+    def __init__(self, session: requests.AsyncSession, curl_options: dict[CurlOpt, Any]) -> None:
+        self.session = session
+        self.curl_options = curl_options
+        self.in_use = 0
+        self.last_used = time.monotonic()
+        self.retired = False
+
+
+class CurlSessionPool:
+    """
+    Long-lived curl_cffi sessions, one per (impersonation profile, clearance identity, origin).
+
+    A fresh AsyncSession per fetch paid a TCP + TLS handshake on every read, even for five
+    pages of one site in a row. Pooled sessions keep their connections alive, and with the
+    chrome profile libcurl negotiates HTTP/2 via ALPN, so parallel reads of one origin share
+    a single connection. Sessions are per origin because CURLOPT_RESOLVE pins can only be set
+    per session: a session whose pinned addresses no longer match the latest SSRF check is
+    retired instead of reused. Sessions idle for CURL_SESSION_IDLE_SECONDS are closed on the
+    next checkout, the least recently used idle one is closed beyond
+    CURL_SESSION_POOL_MAX_SESSIONS, and close() runs from the app lifespan.
+    """
+
+    def __init__(self) -> None:
+        self._sessions: OrderedDict[SessionKey, PooledSession] = OrderedDict()
+
+    @asynccontextmanager
+    async def session(
+        self,
+        url: str,
+        impersonate: str | None = None,
+        identity: str = "",
+        curl_options: dict[CurlOpt, Any] | None = None,
+    ) -> AsyncIterator[requests.AsyncSession]:
+        """Checks out the session for `url`'s origin. Sessions are shared: concurrent checkouts are fine."""
+        curl_options = curl_options or {}
+        await self._close_expired()
+
+        key = (impersonate or "", identity, _origin(url))
+        # From here until in_use is taken nothing awaits: a concurrent checkout of the same
+        # key must see either the old session or this one, never store a third over it.
+        pooled = self._sessions.get(key)
+        repinned = None
+        if pooled is not None and pooled.curl_options != curl_options:
+            # The host was re-checked and resolved elsewhere; connections to the old
+            # addresses must not be reused for it.
+            self._detach(key, pooled, reason="repinned")
+            repinned, pooled = pooled, None
+
+        created = pooled is None
+        if pooled is None:
+            pooled = PooledSession(
+                # noinspection PyArgumentList
+                requests.AsyncSession(impersonate=impersonate, curl_options=curl_options),  # type: ignore[arg-type]
+                curl_options,
+            )
+            self._sessions[key] = pooled
+            CURL_SESSIONS.set(len(self._sessions))
+            CURL_SESSION_CHECKOUTS_TOTAL.labels(result="new").inc()
+        else:
+            CURL_SESSION_CHECKOUTS_TOTAL.labels(result="reused").inc()
+
+        self._sessions.move_to_end(key)
+        pooled.in_use += 1
+        try:
+            if repinned is not None and repinned.in_use == 0:
+                await self._close(repinned)
+            if created:
+                await self._evict_over_capacity()
+            yield pooled.session
+        finally:
+            pooled.in_use -= 1
+            pooled.last_used = time.monotonic()
+            if pooled.retired and pooled.in_use == 0:
+                await self._close(pooled)
+
+    async def close(self) -> None:
+        """Closes every session; called on shutdown."""
+        for key, pooled in list(self._sessions.items()):
+            await self._retire(key, pooled, reason="shutdown")
+
+    async def _close_expired(self) -> None:
+        deadline = time.monotonic() - settings.CURL_SESSION_IDLE_SECONDS
+        expired = [(k, p) for k, p in self._sessions.items() if p.in_use == 0 and p.last_used < deadline]
+        for key, pooled in expired:
+            await self._retire(key, pooled, reason="idle")
+
+    async def _evict_over_capacity(self) -> None:
+        excess = len(self._sessions) - settings.CURL_SESSION_POOL_MAX_SESSIONS
+        if excess <= 0:
+            return
+
+        idle = [(k, p) for k, p in self._sessions.items() if p.in_use == 0]
+        for key, pooled in idle[:excess]:
+            await self._retire(key, pooled, reason="evicted")
+
+    async def _retire(self, key: SessionKey, pooled: PooledSession, reason: str) -> None:
+        # A session still serving a read is closed by that read's checkout on release.
+        if self._detach(key, pooled, reason) and pooled.in_use == 0:
+            await self._close(pooled)
+
+    def _detach(self, key: SessionKey, pooled: PooledSession, reason: str) -> bool:
+        """Takes `pooled` out of the pool; False if it was already retired."""
+        # Callers retire from snapshots held across awaits; a session retired meanwhile may
+        # already have been replaced under `key`, and that replacement must stay.
+        if pooled.retired:
+            return False
+
+        del self._sessions[key]
+        CURL_SESSIONS.set(len(self._sessions))
+        CURL_SESSIONS_CLOSED_TOTAL.labels(reason=reason).inc()
+        pooled.retired = True
+
+        return True
+
+    @staticmethod
+    async def _close(pooled: PooledSession) -> None:
+        try:
+            await pooled.session.close()
+        except Exception as e:
+            logger.debug(f"CurlSessionPool: error closing session: {e}")
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+
+    return f"{parts.scheme}://{parts.netloc.lower()}"
+
+
+curl_session_pool = CurlSessionPool()
@@ -0,0 +1,116 @@
+import asyncio
+import logging
+import multiprocessing
+import time
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Any, TypeVar
+
+from src.config.config import settings
+from src.observability.metrics import EXTRACTION_SECONDS
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+def _warm_worker() -> None:
+    # Importing trafilatura / lxml / bs4 takes ~0.5 s; pay it when the worker starts, not
+    # inside the first read that lands on it.
+    import src.reader.html_utils  # noqa: F401
+
+
+class ExtractionPool:
+    """
+    Worker processes for CPU-bound HTML parsing, extraction and content validation.
+
+    trafilatura, BeautifulSoup and textstat cost ~0.8 ms per KB of HTML and used to run
+    inline in async code, so one 2 MB page froze every concurrent search and read for over
+    a second. run() keeps documents under EXTRACTION_INLINE_MAX_CHARS on the event loop,
+    where a process round trip would cost more than the work, and sends larger ones to
+    EXTRACTION_POOL_WORKERS spawned processes. Waiting for a worker happens on an asyncio
+    semaphore, so a burst of big pages queues without pickling every document up front.
+    A pool broken by a crashed worker is replaced and the call retried once in the new one;
+    it never falls back inline, since the document that broke the pool would now break the
+    service. A second crash raises BrokenProcessPool to the caller.
+    """
+
+    def __init__(self) -> None:
+        self._executor: ProcessPoolExecutor | None = None
+        self._slots = asyncio.Semaphore(max(1, settings.EXTRACTION_POOL_WORKERS))
+
+    async def run(self, func: Callable[..., T], document: str | bytes, *args: Any) -> T:
+        """
+        Returns func(document, *args); `func` must be a picklable module-level callable.
+        Byte documents (PDFs) are measured in bytes against the same threshold. Raises
+        BrokenProcessPool when the document crashes a worker in the fresh pool as well.
+        """
+        if settings.EXTRACTION_POOL_WORKERS <= 0 or len(document) <= settings.EXTRACTION_INLINE_MAX_CHARS:
+            return self._run_inline(func, document, *args)
+
+        async with self._slots:
+            try:
+                return await self._run_in_worker(func, document, *args)
+            except BrokenProcessPool:
+                # Most likely this very document killed the worker (OOM, a parser crash on a
+                # hostile PDF); running it inline would bring that into the service process.
+                logger.warning("ExtractionPool: worker process died, retrying once in a fresh pool")
+
+            try:
+                return await self._run_in_worker(func, document, *args, where="retry")
+            except BrokenProcessPool:
+                logger.warning("ExtractionPool: worker process died again, giving up on the document")
+                raise
+
+    def close(self) -> None:
+        self._discard_executor()
+
+    async def _run_in_worker(
+        self, func: Callable[..., T], document: str | bytes, *args: Any, where: str = "pool"
+    ) -> T:
+        started = time.perf_counter()
+        executor = self._get_executor()
+        try:
+            result = await asyncio.get_running_loop().run_in_executor(
+                executor, partial(func, document, *args)
+            )
+        except BrokenProcessPool:
+            # Every call in flight on the broken pool lands here; only the first may replace
+            # it, or it would shut down the pool the others are already retrying on.
+            if self._executor is executor:
+                self._discard_executor()
+            raise
+
+        EXTRACTION_SECONDS.labels(where=where).observe(time.perf_counter() - started)
+
+        return result
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            # spawn, not fork: forking a process that runs an event loop, Playwright's
+            # driver pipes and Redis connections copies all of them into every worker.
+            self._executor = ProcessPoolExecutor(
+                max_workers=settings.EXTRACTION_POOL_WORKERS,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_warm_worker,
+            )
+
+        return self._executor
+
+    def _discard_executor(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    @staticmethod
+    def _run_inline(func: Callable[..., T], document: str | bytes, *args: Any) -> T:
+        started = time.perf_counter()
+        result = func(document, *args)
+        EXTRACTION_SECONDS.labels(where="inline").observe(time.perf_counter() - started)
+
+        return result
+
+
+extraction_pool = ExtractionPool()
@@ -0,0 +1,105 @@
+import logging
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+from src.reader.batch_reader import BatchReader
+from src.reader.url_normalizer import normalize_url
+from src.search.search_client import SearxngClient
+
+logger = logging.getLogger(__name__)
+
+# A trim may back up to the previous word boundary, but never by more than this share of
+# the budget - a single very long token should not turn a 4000-char budget into 40 chars.
+_WORD_BOUNDARY_SLACK = 0.2
+
+
+class ResearchPipeline:
+    """
+    Search-then-read in one call: run the SearXNG search, dedupe the hits by canonical
+    URL, then read the top K concurrently through BatchReader and yield each document as
+    soon as it finishes. Search and reads share one deadline, so a slow search leaves
+    less time for the reads rather than extending the call.
+    """
+
+    def __init__(self, search_client: SearxngClient, batch_reader: BatchReader) -> None:
+        self.search_client = search_client
+        self.batch_reader = batch_reader
+
+    async def find_sources(self, query: str, k: int) -> list[dict[str, Any]]:
+        """Top `k` distinct hits. Raises on SearXNG errors so the caller can map them before streaming."""
+        # Over-fetch so that duplicates (tracking-parameter variants, http/https twins
+        # collapsing to one canonical URL) don't leave the caller with fewer than k sources.
+        hits = await self.search_client.search(query=query, limit=k * 2)
+
+        sources: list[dict[str, Any]] = []
+        seen: set[str] = set()
+        for hit in hits:
+            canonical = normalize_url(hit["url"])
+            if canonical in seen:
+                continue
+
+            seen.add(canonical)
+            sources.append(hit)
+            if len(sources) == k:
+                break
+
+        return sources
+
+    async def read_sources(
+        self,
+        sources: list[dict[str, Any]],
+        deadline: float,
+        max_chars: int | None = None,
+        include_links: bool = False,
+        heavy_mode: bool = False,
+    ) -> AsyncIterator[dict[str, Any]]:
+        async for item in self.batch_reader.read_many(
+            [source["url"] for source in sources],
+            include_links=include_links,
+            heavy_mode=heavy_mode,
+            deadline=deadline,
+        ):
+            source = sources[item["index"]]
+            document = {
+                **item,
+                "title": source.get("title"),
+                # The search snippet; `content` is the extracted page text.
+                "snippet": source.get("content"),
+                "engine": source.get("engine"),
+                "score": source.get("score"),
+                "published_date": source.get("published_date"),
+            }
+            if max_chars is not None and isinstance(document.get("content"), str):
+                document["content"], document["truncated"] = trim_to_budget(document["content"], max_chars)
+
+            yield document
+
+    async def research(
+        self,
+        query: str,
+        k: int,
+        deadline_seconds: float,
+        max_chars: int | None = None,
+        include_links: bool = False,
+        heavy_mode: bool = False,
+    ) -> AsyncIterator[dict[str, Any]]:
+        deadline = time.monotonic() + deadline_seconds
+        sources = await self.find_sources(query, k)
+        logger.info(f"ResearchPipeline: '{query}' -> reading {len(sources)} sources")
+
+        async for document in self.read_sources(sources, deadline, max_chars, include_links, heavy_mode):
+            yield document
+
+
+def trim_to_budget(content: str, max_chars: int) -> tuple[str, bool]:
+    """Cuts `content` to at most `max_chars`, preferring a word boundary. Returns (text, truncated)."""
+    if len(content) <= max_chars:
+        return content, False
+
+    cut = content[:max_chars]
+    boundary = cut.rfind(" ")
+    if boundary >= max_chars * (1 - _WORD_BOUNDARY_SLACK):
+        cut = cut[:boundary]
+
+    return cut.rstrip(), True
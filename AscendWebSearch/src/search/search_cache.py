@@ -0,0 +1,125 @@
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Coroutine
+from typing import Any
+
+import redis.asyncio as redis
+
+from src.config.config import settings
+from src.observability.metrics import SEARXNG_CACHE_TOTAL
+from src.runtime.circuit_breaker import circuit_breakers
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "searxng_cache:"
+
+# Requested limits are rounded up to one of these so limit=3 and limit=5 share an entry.
+_LIMIT_BUCKETS = (5, 10, 20, 50)
+
+SearchFetch = Callable[[], Coroutine[Any, Any, list[dict[str, Any]]]]
+
+
+class SearchCache:
+    """
+    TTL cache of SearXNG result lists with single-flight coalescing.
+
+    In-process LRU by default, Redis as the shared tier when REDIS_URL is set. Concurrent
+    identical searches share one upstream call: the first caller starts it, later callers
+    await the same task. The task is shielded, so a cancelled caller does not abort the
+    search for the others.
+    """
+
+    def __init__(self) -> None:
+        self.redis_client = None
+        if settings.REDIS_URL:
+            try:
+                self.redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
+            except Exception as e:
+                logger.warning(f"Failed to connect to Redis for SearchCache: {e}")
+
+        self._memory_store: OrderedDict[str, tuple[float, list[dict[str, Any]]]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task[list[dict[str, Any]]]] = {}
+
+    @staticmethod
+    def limit_bucket(limit: int) -> int:
+        return next((bucket for bucket in _LIMIT_BUCKETS if limit <= bucket), limit)
+
+    @staticmethod
+    def build_key(query: str, categories: str | None, language: str, bucket: int) -> str:
+        normalized_query = " ".join(query.lower().split())
+        return json.dumps([normalized_query, categories or "", language, bucket], separators=(",", ":"))
+
+    async def get_or_fetch(self, key: str, fetch: SearchFetch) -> list[dict[str, Any]]:
+        cached = await self._get(key)
+        if cached is not None:
+            SEARXNG_CACHE_TOTAL.labels(result="hit").inc()
+            return cached
+
+        task = self._inflight.get(key)
+        if task is not None:
+            SEARXNG_CACHE_TOTAL.labels(result="coalesced").inc()
+            return await asyncio.shield(task)
+
+        SEARXNG_CACHE_TOTAL.labels(result="miss").inc()
+        task = asyncio.create_task(self._fetch_and_store(key, fetch))
+        self._inflight[key] = task
+        task.add_done_callback(lambda _: self._inflight.pop(key, None))
+
+        return await asyncio.shield(task)
+
+    async def _fetch_and_store(self, key: str, fetch: SearchFetch) -> list[dict[str, Any]]:
+        results = await fetch()
+        # An empty page is usually a transient upstream-engine failure; don't pin it.
+        if results:
+            await self._put(key, results)
+
+        return results
+
+    async def _get(self, key: str) -> list[dict[str, Any]] | None:
+        entry = self._memory_store.get(key)
+        if entry is not None:
+            expires_at, results = entry
+            if expires_at > time.monotonic():
+                self._memory_store.move_to_end(key)
+                return results
+            del self._memory_store[key]
+
+        if self.redis_client:
+            try:
+                async with circuit_breakers.get("redis").guard():
+                    data = await self.redis_client.get(f"{_KEY_PREFIX}{key}")
+                if data:
+                    parsed: list[dict[str, Any]] = json.loads(data)
+                    self._put_local(key, parsed)
+
+                    return parsed
+            except Exception as e:
+                SEARXNG_CACHE_TOTAL.labels(result="redis_error").inc()
+                logger.warning(f"Failed to get SearXNG cache entry from Redis: {e}")
+
+        return None
+
+    async def _put(self, key: str, results: list[dict[str, Any]]) -> None:
+        self._put_local(key, results)
+
+        if self.redis_client:
+            try:
+                async with circuit_breakers.get("redis").guard():
+                    await self.redis_client.setex(
+                        f"{_KEY_PREFIX}{key}", settings.SEARXNG_CACHE_TTL_SECONDS, json.dumps(results)
+                    )
+            except Exception as e:
+                SEARXNG_CACHE_TOTAL.labels(result="redis_error").inc()
+                logger.warning(f"Failed to save SearXNG cache entry to Redis: {e}")
+
+    def _put_local(self, key: str, results: list[dict[str, Any]]) -> None:
+        self._memory_store[key] = (time.monotonic() + settings.SEARXNG_CACHE_TTL_SECONDS, results)
+        self._memory_store.move_to_end(key)
+        while len(self._memory_store) > settings.SEARXNG_CACHE_MAX_ENTRIES:
+            self._memory_store.popitem(last=False)
+
+
+search_cache = SearchCache()
@@ -3,13 +3,27 @@ import time
 from typing import Any
 
 import httpx
-from bs4 import BeautifulSoup
+import lxml.html
+import orjson
+from lxml.cssselect import CSSSelector
+from lxml.etree import ParserError
 
 from src.config.config import settings
 from src.observability.metrics import SEARXNG_DURATION_SECONDS, SEARXNG_REQUESTS_TOTAL
+from src.runtime.circuit_breaker import circuit_breakers
+from src.search.search_cache import search_cache
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_LANGUAGE = "en-US"
+
+# Compiled once: cssselect translation to XPath costs more than the match itself.
+_RESULT_SELECTOR = CSSSelector("article.result", translator="html")
+_TITLE_SELECTOR = CSSSelector("h3 a", translator="html")
+_CONTENT_SELECTOR = CSSSelector("p.content", translator="html")
+_ENGINE_SELECTOR = CSSSelector(".engines span", translator="html")
+_PUBLISHED_SELECTOR = CSSSelector("time", translator="html")
+
 
 class SearxngClient:
     def __init__(self, base_url: str = settings.SEARXNG_BASE_URL):
@@ -18,64 +32,181 @@ class SearxngClient:
         # shutdown is wired via aclose() invoked from main.py's lifespan; without it
         # the connection pool leaks across reloads.
         self.client = httpx.AsyncClient(timeout=settings.SEARCH_TIMEOUT)
+        self.cache = search_cache
+        # SearXNG answers format=json with 403 unless the instance lists json under
+        # search.formats; once seen, stay on HTML rather than paying a failed request per search.
+        self.json_enabled = settings.SEARXNG_RESPONSE_FORMAT == "json"
 
     async def aclose(self) -> None:
         await self.client.aclose()
 
-    async def search(self, query: str, limit: int = 5, categories: str | None = None) -> list[dict[str, Any]]:
-        url = f"{self.base_url}/search"
+    async def search(
+        self,
+        query: str,
+        limit: int = 5,
+        categories: str | None = None,
+        language: str = DEFAULT_LANGUAGE,
+    ) -> list[dict[str, Any]]:
+        if not settings.SEARXNG_CACHE_ENABLED:
+            return await self._fetch(query, limit, categories, language)
+
+        # Fetch at the bucket size so every limit in the bucket can be served from one entry.
+        bucket = self.cache.limit_bucket(limit)
+        key = self.cache.build_key(query, categories, language, bucket)
+        results = await self.cache.get_or_fetch(key, lambda: self._fetch(query, bucket, categories, language))
+
+        return results[:limit]
+
+    async def _fetch(
+        self, query: str, limit: int, categories: str | None, language: str
+    ) -> list[dict[str, Any]]:
         params = {
             "q": query,
-            "format": "html",
-            "language": "en-US",
+            "language": language,
         }
         if categories:
             params["categories"] = categories
 
-        headers = {
-            "User-Agent": settings.SEARXNG_USER_AGENT,
-            "X-Real-IP": settings.SEARXNG_X_REAL_IP,
-            "X-Forwarded-For": settings.SEARXNG_X_FORWARDED_FOR,
-        }
+        if self.json_enabled:
+            payload = await self._request_json({**params, "format": "json"})
+            if payload is not None:
+                return self._parse_json_results(payload, limit)
 
+            self.json_enabled = False
+            logger.warning("SearXNG rejected format=json (403); falling back to HTML result pages.")
+
+        html_content = await self._request_html({**params, "format": "html"})
+
+        return self._parse_html_results(html_content, limit)
+
+    async def _request_json(self, params: dict[str, str]) -> bytes | None:
+        """Returns the raw JSON body, or None when the instance has the JSON format disabled."""
         started = time.perf_counter()
 
         try:
-            response = await self.client.get(url, params=params, headers=headers)
-            response.raise_for_status()
+            # Streamed so a 403 is answered from the status line without pulling the error
+            # page, and the body is handed to orjson as bytes with no str decode in between.
+            async with (
+                circuit_breakers.get("searxng").guard(),
+                self.client.stream(
+                    "GET", f"{self.base_url}/search", params=params, headers=self._headers()
+                ) as response,
+            ):
+                if response.status_code == httpx.codes.FORBIDDEN:
+                    return None
+
+                response.raise_for_status()
+                payload = await response.aread()
             SEARXNG_REQUESTS_TOTAL.labels(outcome="success").inc()
-        except httpx.TimeoutException:
-            SEARXNG_REQUESTS_TOTAL.labels(outcome="timeout").inc()
-            raise
-        except httpx.HTTPStatusError:
-            SEARXNG_REQUESTS_TOTAL.labels(outcome="http_error").inc()
+        except httpx.HTTPError as e:
+            self._record_error(e)
             raise
-        except httpx.HTTPError:
-            SEARXNG_REQUESTS_TOTAL.labels(outcome="transport_error").inc()
+        finally:
+            SEARXNG_DURATION_SECONDS.observe(time.perf_counter() - started)
+
+        return payload
+
+    async def _request_html(self, params: dict[str, str]) -> str:
+        started = time.perf_counter()
+
+        try:
+            async with circuit_breakers.get("searxng").guard():
+                response = await self.client.get(
+                    f"{self.base_url}/search", params=params, headers=self._headers()
+                )
+                response.raise_for_status()
+            SEARXNG_REQUESTS_TOTAL.labels(outcome="success").inc()
+        except httpx.HTTPError as e:
+            self._record_error(e)
             raise
         finally:
             SEARXNG_DURATION_SECONDS.observe(time.perf_counter() - started)
 
-        return self._parse_html_results(response.text, limit)
+        return response.text
 
-    def _parse_html_results(self, html_content: str, limit: int) -> list[dict[str, Any]]:
-        soup = BeautifulSoup(html_content, "html.parser")
+    @staticmethod
+    def _headers() -> dict[str, str]:
+        return {
+            "User-Agent": settings.SEARXNG_USER_AGENT,
+            "X-Real-IP": settings.SEARXNG_X_REAL_IP,
+            "X-Forwarded-For": settings.SEARXNG_X_FORWARDED_FOR,
+        }
+
+    @staticmethod
+    def _record_error(error: httpx.HTTPError) -> None:
+        if isinstance(error, httpx.TimeoutException):
+            SEARXNG_REQUESTS_TOTAL.labels(outcome="timeout").inc()
+        elif isinstance(error, httpx.HTTPStatusError):
+            SEARXNG_REQUESTS_TOTAL.labels(outcome="http_error").inc()
+        else:
+            SEARXNG_REQUESTS_TOTAL.labels(outcome="transport_error").inc()
+
+    @staticmethod
+    def _parse_json_results(payload: bytes, limit: int) -> list[dict[str, Any]]:
+        data = orjson.loads(payload)
         results: list[dict[str, Any]] = []
 
-        for article in soup.select("article.result"):
+        for item in data.get("results") or []:
             if len(results) >= limit:
                 break
 
-            title_tag = article.select_one("h3 a")
-            if not title_tag:
+            url = item.get("url")
+            title = item.get("title")
+            if not url or not title:
                 continue
 
-            url = title_tag.get("href")
-            title = title_tag.get_text(strip=True)
+            results.append(
+                {
+                    "title": title.strip(),
+                    "url": url,
+                    "content": (item.get("content") or "").strip(),
+                    "engine": item.get("engine"),
+                    "score": item.get("score"),
+                    "published_date": item.get("publishedDate"),
+                }
+            )
 
-            content_tag = article.select_one("p.content")
-            content = content_tag.get_text(strip=True) if content_tag else ""
+        return results
 
-            results.append({"title": title, "url": url, "content": content})
+    @staticmethod
+    def _parse_html_results(html_content: str, limit: int) -> list[dict[str, Any]]:
+        if not html_content.strip():
+            return []
+
+        try:
+            document = lxml.html.fromstring(html_content)
+        except ParserError:
+            return []
+
+        results: list[dict[str, Any]] = []
+
+        for article in _RESULT_SELECTOR(document):
+            if len(results) >= limit:
+                break
+
+            title_tags = _TITLE_SELECTOR(article)
+            if not title_tags:
+                continue
+
+            content_tags = _CONTENT_SELECTOR(article)
+            engine_tags = _ENGINE_SELECTOR(article)
+            published_tags = _PUBLISHED_SELECTOR(article)
+
+            results.append(
+                {
+                    "title": _stripped_text(title_tags[0]),
+                    "url": title_tags[0].get("href"),
+                    "content": _stripped_text(content_tags[0]) if content_tags else "",
+                    "engine": _stripped_text(engine_tags[0]) if engine_tags else None,
+                    # The HTML page carries no score; only the JSON format exposes it.
+                    "score": None,
+                    "published_date": published_tags[0].get("datetime") if published_tags else None,
+                }
+            )
 
         return results
+
+
+def _stripped_text(element: Any) -> str:
+    # Same joining rule as BeautifulSoup's get_text(strip=True), which the HTML path used before.
+    return "".join(part.strip() for part in element.itertext())
@@ -0,0 +1,104 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+
+import dns.asyncresolver
+import dns.exception
+import dns.resolver
+
+from src.config.config import settings
+from src.observability.metrics import DNS_CACHE_TOTAL, DNS_RESOLVE_SECONDS
+
+logger = logging.getLogger(__name__)
+
+# Hosts whose addresses is_safe_external_url has vetted for the current read, so the
+# curl_cffi tiers connect to exactly those addresses instead of resolving the name again.
+# Set before the read starts; hedged tiers run in child tasks and inherit it.
+pinned_addresses_ctx: ContextVar[dict[str, tuple[str, ...]] | None] = ContextVar(
+    "pinned_addresses", default=None
+)
+
+_CACHE_MAX_HOSTS = 4096
+
+
+class DNSResolver:
+    """
+    Non-blocking A/AAAA resolution with a TTL-bounded cache.
+
+    Answers are cached for the record's own TTL (capped at DNS_CACHE_MAX_TTL_SECONDS);
+    NXDOMAIN and empty answers are cached for DNS_NEGATIVE_CACHE_TTL_SECONDS. Timeouts and
+    server failures are not cached - they say nothing about the name. Concurrent lookups
+    of the same host share one query, so a batch of links to one site resolves it once.
+    """
+
+    def __init__(self, resolver: dns.asyncresolver.Resolver | None = None) -> None:
+        self._resolver = resolver
+        self._cache: OrderedDict[str, tuple[float, tuple[str, ...]]] = OrderedDict()
+        self._in_flight: dict[str, asyncio.Task[tuple[str, ...]]] = {}
+
+    async def resolve(self, host: str) -> tuple[str, ...]:
+        """Addresses of `host`, IPv6 first; empty when the name does not resolve."""
+        host = host.lower().rstrip(".")
+        cached = self._cache.get(host)
+        if cached is not None and cached[0] > time.monotonic():
+            self._cache.move_to_end(host)
+            DNS_CACHE_TOTAL.labels(result="hit" if cached[1] else "negative_hit").inc()
+            return cached[1]
+
+        lookup = self._in_flight.get(host)
+        if lookup is None:
+            DNS_CACHE_TOTAL.labels(result="miss").inc()
+            lookup = asyncio.create_task(self._lookup(host))
+            self._in_flight[host] = lookup
+            lookup.add_done_callback(lambda _: self._in_flight.pop(host, None))
+
+        # Shielded so one cancelled reader doesn't cancel the lookup the others wait on.
+        return await asyncio.shield(lookup)
+
+    async def _lookup(self, host: str) -> tuple[str, ...]:
+        started = time.perf_counter()
+        try:
+            answers = await self._get_resolver().resolve_name(
+                host, lifetime=settings.DNS_RESOLVE_TIMEOUT_SECONDS
+            )
+        except (dns.resolver.NXDOMAIN, dns.resolver.NoAnswer):
+            self._store(host, (), settings.DNS_NEGATIVE_CACHE_TTL_SECONDS)
+            return ()
+        except dns.exception.DNSException as e:
+            logger.warning(f"DNSResolver: lookup of {host} failed: {e!r}")
+            return ()
+        finally:
+            DNS_RESOLVE_SECONDS.observe(time.perf_counter() - started)
+
+        addresses = tuple(answers.addresses())
+        ttl = min(answer.rrset.ttl for answer in answers.values() if answer.rrset is not None)
+        self._store(host, addresses, min(ttl, settings.DNS_CACHE_MAX_TTL_SECONDS))
+
+        return addresses
+
+    def _store(self, host: str, addresses: tuple[str, ...], ttl: float) -> None:
+        if ttl <= 0:
+            return
+
+        self._cache[host] = (time.monotonic() + ttl, addresses)
+        self._cache.move_to_end(host)
+        while len(self._cache) > _CACHE_MAX_HOSTS:
+            self._cache.popitem(last=False)
+
+    def _get_resolver(self) -> dns.asyncresolver.Resolver:
+        # Built on first use: reading /etc/resolv.conf at import time would break tooling
+        # that imports the app on machines without one.
+        if self._resolver is None:
+            self._resolver = dns.asyncresolver.Resolver()
+
+        return self._resolver
+
+
+def pin_addresses(host: str, addresses: tuple[str, ...]) -> None:
+    """Pins `host` to `addresses` for the rest of the current task and the tasks it starts."""
+    pinned_addresses_ctx.set({**(pinned_addresses_ctx.get() or {}), host.lower(): addresses})
+
+
+dns_resolver = DNSResolver()
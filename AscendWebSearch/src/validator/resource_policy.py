@@ -0,0 +1,200 @@
+import logging
+import re
+from collections import Counter
+from weakref import WeakKeyDictionary
+
+from playwright.async_api import Page, Request, Route, WebSocketRoute
+
+from src.config.config import settings
+from src.observability.metrics import (
+    BROWSER_BLOCKED_REQUESTS_TOTAL,
+    BROWSER_PAGE_BYTES,
+    BROWSER_PAGE_REQUESTS,
+)
+from src.validator.url_validator import URLValidator
+
+logger = logging.getLogger(__name__)
+
+_STREAM_RESOURCE_TYPES = frozenset({"eventsource", "websocket"})
+_POLLING_RESOURCE_TYPES = frozenset({"xhr", "fetch"})
+
+# URL shapes of long-poll transports (socket.io / SockJS / Bayeux / hand-rolled comet).
+# A held-open XHR keeps `networkidle` from ever firing, so every poll costs a full
+# networkidle window of render time.
+_LONG_POLL_URL = re.compile(
+    r"long-?poll|transport=polling|/socket\.io/|/sockjs/|/comet\b|/cometd\b|/poll(?:ing)?(?:[/?]|$)",
+    re.IGNORECASE,
+)
+
+
+class PageTraffic:
+    """Request and byte counters for one read on one page."""
+
+    def __init__(self, tier: str) -> None:
+        self.tier = tier
+        self.requests = 0
+        self.bytes = 0
+        self.blocked: Counter[str] = Counter()
+        self.dom_content_loaded = False
+        self.websockets: list[WebSocketRoute] = []
+
+
+class ResourcePolicy:
+    """
+    Request policy shared by the browser tiers: the adblock list plus what we never need
+    for text extraction.
+
+    Every request on an attached page is aborted when the blocklist matches, when its
+    resource type is in BROWSER_BLOCKED_RESOURCE_TYPES (images, media and fonts by
+    default), or once the page has downloaded BROWSER_PAGE_BYTE_BUDGET bytes. With
+    BROWSER_CUT_STREAMS_AFTER_DOMCONTENTLOADED, WebSockets, EventSource and long-poll XHRs
+    are closed or refused once DOMContentLoaded fires - the text is in the DOM by then and
+    those connections only hold `networkidle` open. The main document is never blocked by
+    type or budget. Per-page request/byte counts and blocks go to Prometheus.
+    """
+
+    def __init__(self, url_validator: URLValidator) -> None:
+        self.url_validator = url_validator
+        self.blocked_resource_types = frozenset(settings.BROWSER_BLOCKED_RESOURCE_TYPES)
+        self.page_byte_budget = settings.BROWSER_PAGE_BYTE_BUDGET
+        self.cut_streams = settings.BROWSER_CUT_STREAMS_AFTER_DOMCONTENTLOADED
+        self._traffic: WeakKeyDictionary[Page, PageTraffic] = WeakKeyDictionary()
+
+    async def attach(self, page: Page, tier: str) -> None:
+        """Routes all of `page`'s traffic through the policy. Pooled pages call reset() between reads."""
+        if page in self._traffic:
+            # Crawlee runs its pre-navigation hook again on retries; a second set of
+            # listeners would count every byte twice.
+            self.reset(page)
+            return
+
+        self._traffic[page] = PageTraffic(tier)
+
+        async def on_dom_content_loaded(_page: Page) -> None:
+            await self._on_dom_content_loaded(page)
+
+        async def on_request_finished(request: Request) -> None:
+            await self._count_bytes(page, request)
+
+        async def on_route(route: Route) -> None:
+            await self.handle_route(page, route)
+
+        async def on_web_socket(ws: WebSocketRoute) -> None:
+            await self.handle_web_socket(page, ws)
+
+        page.on("domcontentloaded", on_dom_content_loaded)
+        page.on("requestfinished", on_request_finished)
+        await page.route("**/*", on_route)
+        await page.route_web_socket("**/*", on_web_socket)
+
+    def reset(self, page: Page) -> None:
+        """Starts fresh counters for the next read on a reused page."""
+        traffic = self._traffic.get(page)
+        if traffic is not None:
+            self._traffic[page] = PageTraffic(traffic.tier)
+
+    def record(self, page: Page) -> PageTraffic | None:
+        """Publishes the read's per-page totals; call once the read on `page` is done."""
+        traffic = self._traffic.get(page)
+        if traffic is None:
+            return None
+
+        BROWSER_PAGE_REQUESTS.labels(strategy=traffic.tier).observe(traffic.requests)
+        BROWSER_PAGE_BYTES.labels(strategy=traffic.tier).observe(traffic.bytes)
+        if traffic.blocked:
+            logger.debug(
+                f"ResourcePolicy: {traffic.tier} page made {traffic.requests} requests, "
+                f"{traffic.bytes} bytes, blocked {dict(traffic.blocked)}"
+            )
+
+        return traffic
+
+    async def handle_route(self, page: Page, route: Route) -> None:
+        traffic = self._traffic.get(page) or PageTraffic("unknown")
+        traffic.requests += 1
+
+        reason = self.block_reason(route.request, traffic)
+        if reason is None:
+            await route.continue_()
+            return
+
+        traffic.blocked[reason] += 1
+        BROWSER_BLOCKED_REQUESTS_TOTAL.labels(strategy=traffic.tier, reason=reason).inc()
+        await route.abort()
+
+    async def handle_web_socket(self, page: Page, ws: WebSocketRoute) -> None:
+        traffic = self._traffic.get(page) or PageTraffic("unknown")
+        traffic.requests += 1
+
+        if self.url_validator.should_block(ws.url):
+            await self._close_web_socket(traffic, ws, reason="adblock")
+            return
+        if self.cut_streams and traffic.dom_content_loaded:
+            await self._close_web_socket(traffic, ws, reason="stream")
+            return
+
+        ws.connect_to_server()
+        traffic.websockets.append(ws)
+
+    def block_reason(self, request: Request, traffic: PageTraffic) -> str | None:
+        """Why `request` should be aborted, or None to let it through."""
+        if self.url_validator.should_block(request.url):
+            return "adblock"
+
+        if request.is_navigation_request() and request.frame.parent_frame is None:
+            return None
+
+        resource_type = request.resource_type
+        if resource_type in self.blocked_resource_types:
+            return "resource_type"
+
+        if self.cut_streams and traffic.dom_content_loaded and self._is_stream(request):
+            return "stream"
+
+        if self.page_byte_budget and traffic.bytes >= self.page_byte_budget:
+            return "byte_budget"
+
+        return None
+
+    @staticmethod
+    def _is_stream(request: Request) -> bool:
+        if request.resource_type in _STREAM_RESOURCE_TYPES:
+            return True
+
+        return request.resource_type in _POLLING_RESOURCE_TYPES and bool(_LONG_POLL_URL.search(request.url))
+
+    async def _on_dom_content_loaded(self, page: Page) -> None:
+        traffic = self._traffic.get(page)
+        if traffic is None:
+            return
+
+        traffic.dom_content_loaded = True
+        if not self.cut_streams:
+            return
+
+        websockets, traffic.websockets = traffic.websockets, []
+        for ws in websockets:
+            await self._close_web_socket(traffic, ws, reason="stream")
+
+    async def _count_bytes(self, page: Page, request: Request) -> None:
+        traffic = self._traffic.get(page)
+        if traffic is None:
+            return
+
+        try:
+            sizes = await request.sizes()
+        except Exception as e:
+            # The page may already be closed or recycled; the count is best-effort.
+            logger.debug(f"ResourcePolicy: no transfer sizes for {request.url}: {e}")
+            return
+
+        traffic.bytes += max(sizes["responseBodySize"], 0) + max(sizes["responseHeadersSize"], 0)
+
+    @staticmethod
+    async def _close_web_socket(traffic: PageTraffic, ws: WebSocketRoute, reason: str) -> None:
+        traffic.blocked[reason] += 1
+        BROWSER_BLOCKED_REQUESTS_TOTAL.labels(strategy=traffic.tier, reason=reason).inc()
+        try:
+            await ws.close()
+        except Exception as e:
+            logger.debug(f"ResourcePolicy: error closing WebSocket {ws.url}: {e}")
@@ -1,10 +1,11 @@
 import ipaddress
 import logging
-import socket
 from typing import Any
 from urllib.parse import urlparse
 
-from adblockparser import AdblockRules
+from src.config.blocklist_loader import BlocklistLoader
+from src.validator.adblock_matcher import AdblockMatcher
+from src.validator.dns_resolver import dns_resolver, pin_addresses
 
 logger = logging.getLogger(__name__)
 
@@ -12,7 +13,7 @@ _SAFE_SCHEMES = {"http", "https"}
 
 
 class URLValidator:
-    def __init__(self, rules: AdblockRules) -> None:
+    def __init__(self, rules: BlocklistLoader | AdblockMatcher) -> None:
         self.rules = rules
 
     def should_block(self, url: str) -> bool:
@@ -27,7 +28,7 @@ class URLValidator:
             await route.continue_()
 
 
-def is_safe_external_url(url: str) -> bool:
+async def is_safe_external_url(url: str) -> bool:
     """
     SSRF guard for endpoints that take user-supplied URLs.
 
@@ -35,6 +36,10 @@ def is_safe_external_url(url: str) -> bool:
     and reserved address space. Callers should reject the request when this returns False.
     Pydantic's HttpUrl validates the scheme/structure but does not resolve the hostname,
     so an attacker can still pass http://127.0.0.1:6379 or http://169.254.169.254 (AWS IMDS).
+
+    Resolution goes through the shared async DNS cache, never the event loop's blocking
+    getaddrinfo. On success the vetted addresses are pinned for the rest of the read (see
+    pinned_addresses_ctx), so the fetch cannot be pointed elsewhere by a second lookup.
     """
     try:
         parsed = urlparse(url)
@@ -49,15 +54,20 @@ def is_safe_external_url(url: str) -> bool:
         return False
 
     try:
-        infos = socket.getaddrinfo(host, None)
-    except socket.gaierror:
+        addresses: tuple[str, ...] = (str(ipaddress.ip_address(host)),)
+    except ValueError:
+        addresses = await dns_resolver.resolve(host)
+    if not addresses:
         return False
 
-    for info in infos:
+    for address in addresses:
         try:
-            ip = ipaddress.ip_address(info[4][0])
+            ip = ipaddress.ip_address(address)
         except ValueError:
             return False
+        if isinstance(ip, ipaddress.IPv6Address) and ip.ipv4_mapped:
+            # ::ffff:127.0.0.1 reaches 127.0.0.1 but is not flagged as loopback itself.
+            ip = ip.ipv4_mapped
         if (
             ip.is_loopback
             or ip.is_private
@@ -67,4 +77,7 @@ def is_safe_external_url(url: str) -> bool:
             or ip.is_unspecified
         ):
             return False
+
+    pin_addresses(host, addresses)
+
     return True
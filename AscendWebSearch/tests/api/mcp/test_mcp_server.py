@@ -3,7 +3,7 @@ from unittest.mock import AsyncMock, patch
 import pytest
 
 from src.api.exceptions import HumanInterventionRequiredException
-from src.api.mcp.mcp_server import web_read, web_search
+from src.api.mcp.mcp_server import web_read, web_read_many, web_research, web_search
 
 
 @pytest.mark.asyncio
@@ -81,6 +81,26 @@ async def test_mcp_web_read_calls_read_with_links_when_include_links_true():
     mock_read.assert_awaited_once_with("http://mcp.com", "/job/", heavy_mode=False)
 
 
+@pytest.mark.asyncio
+async def test_mcp_web_read_returns_chunks_with_a_continuation_cursor():
+    content = "\n\n".join(f"Paragraph {n} " + "text " * 40 for n in range(6))
+    with (
+        patch("src.api.mcp.mcp_server.is_safe_external_url", return_value=True),
+        patch(
+            "src.api.mcp.mcp_server.web_reader.read",
+            new_callable=AsyncMock,
+            return_value={"content": content, "status": "success", "mode": "test"},
+        ) as mock_read,
+    ):
+        first = await web_read("http://mcp.com", max_chars=500)
+        second = await web_read("http://mcp.com", cursor=first["next_cursor"])
+
+    assert first["content"] + second["content"] == content[: len(first["content"]) + len(second["content"])]
+    mock_read.assert_awaited_once()
+    with pytest.raises(ValueError, match="at least 1"):
+        await web_read("http://mcp.com", max_tokens=0)
+
+
 @pytest.mark.asyncio
 async def test_mcp_web_read_catches_human_intervention_and_returns_structured_payload():
     exc = HumanInterventionRequiredException(vnc_url="http://vnc/x", intervention_type="captcha")
@@ -114,3 +134,45 @@ async def test_mcp_web_read_human_intervention_on_links_branch():
         result = await web_read("http://mcp.com", include_links=True)
 
     assert result["intervention_type"] == "login"
+
+
+@pytest.mark.asyncio
+async def test_mcp_web_read_many_returns_items_in_request_order_and_reports_progress():
+    async def out_of_order(urls, include_links=False, link_filter=None, heavy_mode=False):
+        yield {"index": 1, "url": urls[1], "status": "human_intervention_required"}
+        yield {"index": 0, "url": urls[0], "status": "success"}
+
+    ctx = AsyncMock()
+    with patch("src.api.mcp.mcp_server.batch_reader.read_many", side_effect=out_of_order):
+        result = await web_read_many(["http://a.com", "http://b.com"], ctx=ctx)
+
+    assert [item["url"] for item in result] == ["http://a.com", "http://b.com"]
+    assert [call.kwargs["progress"] for call in ctx.report_progress.await_args_list] == [1, 2]
+
+
+@pytest.mark.asyncio
+async def test_mcp_web_read_many_validates_url_count():
+    with pytest.raises(ValueError, match="empty"):
+        await web_read_many([])
+    with pytest.raises(ValueError, match="maximum"):
+        await web_read_many([f"http://a.com/{i}" for i in range(31)])
+
+
+@pytest.mark.asyncio
+async def test_mcp_web_research_returns_documents_in_rank_order():
+    async def out_of_order(query, k, deadline_seconds, max_chars=None, include_links=False, heavy_mode=False):
+        yield {"index": 1, "url": "http://b.com", "status": "success"}
+        yield {"index": 0, "url": "http://a.com", "status": "success"}
+
+    with patch("src.api.mcp.mcp_server.research_pipeline.research", side_effect=out_of_order):
+        result = await web_research("query", k=2)
+
+    assert [document["url"] for document in result] == ["http://a.com", "http://b.com"]
+
+
+@pytest.mark.asyncio
+async def test_mcp_web_research_validates_arguments():
+    with pytest.raises(ValueError, match="empty"):
+        await web_research(" ")
+    with pytest.raises(ValueError, match="k must be"):
+        await web_research("query", k=0)
@@ -1,3 +1,4 @@
+import json
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -105,3 +106,120 @@ async def test_read_post_heavy_mode_forwarded(client: AsyncClient):
         )
     assert resp.status_code == 200
     mock_read.assert_awaited_once_with("http://unit.com/", heavy_mode=True)
+
+
+@pytest.mark.asyncio
+async def test_read_post_chunks_long_content_and_continues_from_the_cursor(client: AsyncClient):
+    content = "\n\n".join(f"Paragraph {n} " + "text " * 40 for n in range(6))
+    with (
+        patch(
+            "src.api.rest.rest_endpoints.web_reader.read",
+            new_callable=AsyncMock,
+            return_value={"content": content, "status": "success", "mode": "test"},
+        ) as mock_read,
+        patch("src.api.rest.rest_endpoints.is_safe_external_url", return_value=True),
+    ):
+        first = (
+            await client.post("/api/v2/web/read", json={"url": "http://unit.com/", "max_tokens": 100})
+        ).json()
+        second = (
+            await client.post(
+                "/api/v2/web/read", json={"url": "http://unit.com/", "cursor": first["next_cursor"]}
+            )
+        ).json()
+        expired = await client.post(
+            "/api/v2/web/read", json={"url": "http://unit.com/", "cursor": "abc:0:10"}
+        )
+
+    assert len(first["content"]) <= 400
+    assert first["total_chars"] == len(content)
+    assert second["offset"] == len(first["content"])
+    assert content.startswith(first["content"] + second["content"])
+    assert expired.status_code == 400
+    mock_read.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_strategy_memory_debug_endpoint_returns_learned_table(client: AsyncClient):
+    table = {"example.com": {"last_success": "2-trafilatura", "failures": {}, "failure_seconds": {}}}
+    with patch(
+        "src.api.rest.rest_endpoints.web_reader.strategy_memory.snapshot",
+        new_callable=AsyncMock,
+        return_value=table,
+    ):
+        resp = await client.get("/api/v2/web/debug/strategy-memory")
+    assert resp.status_code == 200
+    assert resp.json() == table
+
+
+async def _fake_batch(urls, include_links=False, link_filter=None, heavy_mode=False):
+    for index, url in enumerate(urls):
+        yield {"index": index, "url": url, "status": "success", "content": f"c{index}"}
+
+
+@pytest.mark.asyncio
+async def test_read_batch_streams_ndjson_by_default(client: AsyncClient):
+    with patch("src.api.rest.rest_endpoints.batch_reader.read_many", side_effect=_fake_batch):
+        resp = await client.post("/api/v2/web/read/batch", json={"urls": ["http://a.com/", "http://b.com/"]})
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in resp.text.splitlines()]
+    assert [line["url"] for line in lines] == ["http://a.com/", "http://b.com/"]
+
+
+@pytest.mark.asyncio
+async def test_read_batch_streams_sse_when_requested(client: AsyncClient):
+    with patch("src.api.rest.rest_endpoints.batch_reader.read_many", side_effect=_fake_batch):
+        resp = await client.post(
+            "/api/v2/web/read/batch",
+            json={"urls": ["http://a.com/"]},
+            headers={"Accept": "text/event-stream"},
+        )
+
+    assert resp.status_code == 200
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    assert resp.text == (
+        'event: item\ndata: {"index": 0, "url": "http://a.com/", "status": "success", "content": "c0"}\n\n'
+        'event: done\ndata: {"count": 1}\n\n'
+    )
+
+
+@pytest.mark.asyncio
+async def test_read_batch_rejects_empty_and_oversized_lists(client: AsyncClient):
+    empty = await client.post("/api/v2/web/read/batch", json={"urls": []})
+    oversized = await client.post(
+        "/api/v2/web/read/batch", json={"urls": [f"http://a.com/{i}" for i in range(31)]}
+    )
+
+    assert empty.status_code == 422
+    assert oversized.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_research_searches_then_streams_documents(client: AsyncClient):
+    async def fake_read_sources(sources, deadline, max_chars=None, include_links=False, heavy_mode=False):
+        for index, source in enumerate(sources):
+            yield {"index": index, "url": source["url"], "status": "success", "max_chars": max_chars}
+
+    with (
+        patch(
+            "src.api.rest.rest_endpoints.research_pipeline.find_sources",
+            new_callable=AsyncMock,
+            return_value=[{"url": "http://a.com/"}],
+        ) as find_sources,
+        patch("src.api.rest.rest_endpoints.research_pipeline.read_sources", side_effect=fake_read_sources),
+    ):
+        resp = await client.post("/api/v2/web/research", json={"query": "q", "k": 3, "max_chars": 100})
+
+    assert resp.status_code == 200
+    assert [json.loads(line) for line in resp.text.splitlines()] == [
+        {"index": 0, "url": "http://a.com/", "status": "success", "max_chars": 100}
+    ]
+    find_sources.assert_awaited_once_with("q", 3)
+
+
+@pytest.mark.asyncio
+async def test_research_rejects_blank_query(client: AsyncClient):
+    resp = await client.post("/api/v2/web/research", json={"query": "  "})
+    assert resp.status_code == 400
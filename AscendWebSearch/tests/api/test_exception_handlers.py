@@ -3,11 +3,12 @@ import pytest
 from fastapi import Request
 
 from src.api.exception_handlers import (
+    circuit_open_exception_handler,
     global_exception_handler,
     httpx_exception_handler,
     human_intervention_exception_handler,
 )
-from src.api.exceptions import HumanInterventionRequiredException
+from src.api.exceptions import CircuitOpenException, HumanInterventionRequiredException
 
 
 def _make_request() -> Request:
@@ -33,6 +34,13 @@ async def test_httpx_exception_handler_returns_503():
     assert response.status_code == 503
 
 
+@pytest.mark.asyncio
+async def test_circuit_open_handler_returns_503_with_retry_after():
+    response = await circuit_open_exception_handler(_make_request(), CircuitOpenException("searxng", 12.2))
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "13"
+
+
 @pytest.mark.asyncio
 async def test_global_exception_handler_returns_500():
     response = await global_exception_handler(_make_request(), RuntimeError("boom"))
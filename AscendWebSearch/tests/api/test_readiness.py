@@ -19,6 +19,23 @@ async def test_ready_all_ok_returns_200(client: AsyncClient):
     body = resp.json()
     assert body["status"] == "ready"
     assert body["checks"]["redis"]["status"] == "ok"
+    assert body["circuits"] == {}
+
+
+@pytest.mark.asyncio
+async def test_ready_reports_circuit_breakers_without_gating_on_them(client: AsyncClient):
+    from src.runtime.circuit_breaker import FAILURE, circuit_breakers
+
+    for _ in range(5):
+        circuit_breakers.get("flaresolverr").record(FAILURE)
+    with (
+        patch("src.api.readiness._probe_redis", new=AsyncMock(return_value={"status": "ok"})),
+        patch("src.api.readiness._probe_searxng", new=AsyncMock(return_value={"status": "ok"})),
+        patch("src.api.readiness._probe_flaresolverr", new=AsyncMock(return_value={"status": "ok"})),
+    ):
+        resp = await client.get("/ready")
+    assert resp.status_code == 200
+    assert resp.json()["circuits"]["flaresolverr"]["state"] == "open"
 
 
 @pytest.mark.asyncio
@@ -1,10 +1,15 @@
+import asyncio
+import json
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, patch
 
+import httpx
 import pytest
 
 from src.config.blocklist_loader import BlocklistLoader
 
+_SNAPSHOT = b"[Adblock Plus 2.0]\n! Title: test\n||ads.example.com^\n/banner/*/img^\n"
+
 
 def test_assets_dir_resolution():
     loader = BlocklistLoader()
@@ -24,19 +29,6 @@ def test_ensure_assets_dir_creates_when_missing(tmp_path):
     assert target.exists()
 
 
-def test_load_rules_success():
-    loader = BlocklistLoader()
-    mock_content = b"||example.com^\n! Comment\n/ad_path"
-    mock_response = MagicMock()
-    mock_response.status_code = 200
-    mock_response.content = mock_content
-    mock_response.raise_for_status = MagicMock()
-    with patch("httpx.Client.get", return_value=mock_response) as mock_get:
-        rules = loader.load_rules()
-    mock_get.assert_called()
-    assert rules.should_block("http://example.com")
-
-
 def test_download_blocklist_raises_runtime_error_on_network_fail():
     loader = BlocklistLoader()
     with patch("httpx.Client.get", side_effect=Exception("network down")):
@@ -47,7 +39,7 @@ def test_download_blocklist_raises_runtime_error_on_network_fail():
 def test_parse_rules_raises_file_not_found_when_path_missing(tmp_path):
     loader = BlocklistLoader(assets_dir=str(tmp_path))
     with pytest.raises(FileNotFoundError):
-        loader._parse_rules()
+        loader.parse_rules()
 
 
 def test_parse_rules_wraps_open_failure_in_runtime_error(tmp_path):
@@ -55,12 +47,175 @@ def test_parse_rules_wraps_open_failure_in_runtime_error(tmp_path):
     loader.blocklist_path.write_text("||example.com^", encoding="utf-8")
     with patch("pathlib.Path.open", side_effect=PermissionError("read denied")):
         with pytest.raises(RuntimeError):
-            loader._parse_rules()
+            loader.parse_rules()
 
 
 def test_parse_rules_filters_comments_and_blank_lines(tmp_path):
     loader = BlocklistLoader(assets_dir=str(tmp_path))
     blob = "||example.com^\n! comment\n\n||other.com^\n"
     loader.blocklist_path.write_text(blob, encoding="utf-8")
-    rules = loader._parse_rules()
+    rules = loader.parse_rules()
     assert rules.should_block("http://example.com")
+
+
+def _loader(tmp_path, snapshot: bytes | None = _SNAPSHOT) -> BlocklistLoader:
+    loader = BlocklistLoader(assets_dir=str(tmp_path))
+    if snapshot is not None:
+        loader.blocklist_path.write_bytes(snapshot)
+
+    return loader
+
+
+def _response(status: int, content: bytes = b"", headers: dict | None = None) -> httpx.Response:
+    return httpx.Response(
+        status, content=content, headers=headers, request=httpx.Request("GET", "https://lists.test/list.txt")
+    )
+
+
+def test_load_matcher_builds_from_snapshot_without_network(tmp_path):
+    loader = _loader(tmp_path)
+
+    with patch("httpx.Client.get") as mock_get:
+        matcher = loader.load_matcher()
+
+    mock_get.assert_not_called()
+    assert matcher.should_block("https://ads.example.com/x.js")
+    assert loader.should_block("https://site.com/banner/top/img?w=300")
+    assert not loader.should_block("https://example.com/")
+    assert loader.load_matcher() is matcher
+    assert loader.matcher is matcher
+
+
+def test_second_start_loads_the_cached_matcher(tmp_path):
+    _loader(tmp_path).load_matcher()
+    assert (tmp_path / "fanboy-annoyance.matcher.json").exists()
+
+    warm = _loader(tmp_path, snapshot=None)
+    with patch.object(BlocklistLoader, "_build_matcher") as build:
+        matcher = warm.load_matcher()
+
+    build.assert_not_called()
+    assert matcher.should_block("https://ads.example.com/x.js")
+    assert not matcher.should_block("https://example.com/")
+
+
+def test_cache_of_a_different_snapshot_is_rebuilt(tmp_path):
+    _loader(tmp_path).load_matcher()
+
+    changed = _loader(tmp_path, snapshot=b"||tracker.test^\n")
+    matcher = changed.load_matcher()
+
+    assert matcher.should_block("https://tracker.test/p.gif")
+    assert not matcher.should_block("https://ads.example.com/x.js")
+
+
+def test_unreadable_cache_is_ignored(tmp_path):
+    loader = _loader(tmp_path)
+    loader.matcher_cache_path.write_bytes(b"not json\n")
+
+    assert loader.load_matcher().should_block("https://ads.example.com/x.js")
+    assert json.loads(loader.matcher_cache_path.read_bytes().partition(b"\n")[0])["sha256"]
+
+
+def test_read_only_assets_dir_still_loads(tmp_path):
+    loader = _loader(tmp_path)
+
+    with patch.object(BlocklistLoader, "_write_atomic", side_effect=OSError("read-only")):
+        matcher = loader.load_matcher()
+
+    assert matcher.should_block("https://ads.example.com/x.js")
+
+
+def test_missing_snapshot_is_downloaded_once(tmp_path):
+    loader = _loader(tmp_path, snapshot=None)
+    response = _response(200, _SNAPSHOT, {"ETag": '"v1"'})
+
+    with patch("httpx.Client.get", return_value=response) as mock_get:
+        matcher = loader.load_matcher()
+
+    mock_get.assert_called_once()
+    assert loader.blocklist_path.read_bytes() == _SNAPSHOT
+    assert json.loads(loader.validators_path.read_text()) == {"etag": '"v1"'}
+    assert matcher.should_block("https://ads.example.com/x.js")
+
+
+@pytest.mark.asyncio
+async def test_refresh_sends_validators_and_keeps_rules_on_304(tmp_path):
+    loader = _loader(tmp_path)
+    loader.validators_path.write_text(json.dumps({"etag": '"v1"', "last_modified": "Mon, 01 Jan 2024"}))
+    matcher = loader.load_matcher()
+
+    with patch("httpx.AsyncClient.get", AsyncMock(return_value=_response(304))) as mock_get:
+        assert await loader.refresh() is False
+
+    assert mock_get.call_args.kwargs["headers"] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Mon, 01 Jan 2024",
+    }
+    assert loader.matcher is matcher
+
+
+@pytest.mark.asyncio
+async def test_refresh_swaps_in_new_rules_and_stores_snapshot(tmp_path):
+    loader = _loader(tmp_path)
+    loader.load_matcher()
+    updated = b"||tracker.test^\n"
+
+    with patch("httpx.AsyncClient.get", AsyncMock(return_value=_response(200, updated, {"ETag": '"v2"'}))):
+        assert await loader.refresh() is True
+
+    assert loader.should_block("https://tracker.test/p.gif")
+    assert not loader.should_block("https://ads.example.com/x.js")
+    assert loader.blocklist_path.read_bytes() == updated
+    assert json.loads(loader.validators_path.read_text()) == {"etag": '"v2"'}
+    # The next process starts warm on the refreshed list.
+    assert _loader(tmp_path, snapshot=None).load_matcher().should_block("https://tracker.test/p.gif")
+
+
+@pytest.mark.asyncio
+async def test_refresh_with_identical_body_does_not_rebuild(tmp_path):
+    loader = _loader(tmp_path)
+    matcher = loader.load_matcher()
+
+    with patch("httpx.AsyncClient.get", AsyncMock(return_value=_response(200, _SNAPSHOT))):
+        assert await loader.refresh() is False
+
+    assert loader.matcher is matcher
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "get",
+    [
+        AsyncMock(side_effect=httpx.ConnectError("offline")),
+        AsyncMock(return_value=_response(500)),
+        AsyncMock(return_value=_response(200, b"! only comments\n")),
+    ],
+)
+async def test_failed_refresh_keeps_the_snapshot(tmp_path, get):
+    loader = _loader(tmp_path)
+    matcher = loader.load_matcher()
+
+    with patch("httpx.AsyncClient.get", get):
+        assert await loader.refresh() is False
+
+    assert loader.matcher is matcher
+    assert loader.blocklist_path.read_bytes() == _SNAPSHOT
+
+
+@pytest.mark.asyncio
+async def test_refresh_loop_repeats_on_the_configured_interval(tmp_path):
+    loader = _loader(tmp_path)
+    refresh = AsyncMock(return_value=False)
+
+    with (
+        patch.object(loader, "refresh", refresh),
+        patch("src.config.blocklist_loader.settings.BLOCKLIST_REFRESH_INTERVAL_SECONDS", 0.01),
+    ):
+        task = asyncio.create_task(loader.run_refresh_loop())
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    assert refresh.await_count >= 2
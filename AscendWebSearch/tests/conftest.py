@@ -1,4 +1,6 @@
+import asyncio
 import sys
+from collections import OrderedDict, deque
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, MagicMock
@@ -38,6 +40,9 @@ sys.modules["fastmcp"] = mock_fastmcp
 
 from src.main import app  # noqa: E402
 from src.reader.cloudflare.cookie_manager import CookieManager  # noqa: E402
+from src.reader.read_cache import read_cache  # noqa: E402
+from src.reader.strategy_memory import strategy_memory  # noqa: E402
+from src.search.search_cache import search_cache  # noqa: E402
 
 
 @pytest.fixture(autouse=True)
@@ -48,6 +53,97 @@ def reset_cookie_manager_singleton():
     CookieManager._instance = None
 
 
+@pytest.fixture(autouse=True)
+def isolate_strategy_memory(monkeypatch):
+    """Strategy memory is a process-wide singleton; a success recorded by one test
+    would reorder the tier chain of the next. Keep it local-only and empty."""
+    monkeypatch.setattr(strategy_memory, "redis_client", None)
+    strategy_memory._memory_store.clear()
+    yield
+    strategy_memory._memory_store.clear()
+
+
+@pytest.fixture(autouse=True)
+def isolate_read_cache(monkeypatch):
+    """The read cache is process-wide; without this a result cached for
+    http://test.com in one test is served to every later test."""
+    monkeypatch.setattr(read_cache, "redis_client", None)
+    read_cache._memory_store.clear()
+    yield
+    read_cache._memory_store.clear()
+
+
+@pytest.fixture(autouse=True)
+def isolate_chunk_snapshots(monkeypatch):
+    """Chunked-read snapshots live in their own process-wide store; same isolation as the read cache."""
+    from src.reader.read_chunker import chunk_snapshots
+
+    monkeypatch.setattr(chunk_snapshots, "redis_client", None)
+    monkeypatch.setattr(chunk_snapshots, "_memory_store", OrderedDict())
+    monkeypatch.setattr(chunk_snapshots, "_chars", 0)
+
+
+@pytest.fixture(autouse=True)
+def isolate_search_cache(monkeypatch):
+    """Same reasoning as the read cache: identical queries across tests would
+    otherwise be answered from an earlier test's mocked SearXNG response."""
+    monkeypatch.setattr(search_cache, "redis_client", None)
+    search_cache._memory_store.clear()
+    yield
+    search_cache._memory_store.clear()
+
+
+@pytest.fixture(autouse=True)
+def isolate_cookie_manager(monkeypatch):
+    """The lifespan subscribes the cookie singleton to Redis invalidations, and its L1
+    cache would hand one test's clearance cookies (or their absence) to the next."""
+    from src.reader.cloudflare.cookie_manager import cookie_manager
+
+    monkeypatch.setattr(cookie_manager, "redis_client", None)
+    monkeypatch.setattr(cookie_manager, "_l1_cache", OrderedDict())
+
+
+@pytest.fixture(autouse=True)
+def no_blocklist_refresh(monkeypatch):
+    """The app lifespan starts the blocklist refresh loop; unit tests must not fetch the
+    live list or rewrite the snapshot shipped in src/assets."""
+    from src.config.blocklist_loader import blocklist_loader
+
+    monkeypatch.setattr(blocklist_loader, "refresh", AsyncMock(return_value=False))
+
+
+@pytest.fixture(autouse=True)
+def isolate_curl_session_pool(monkeypatch):
+    """Pooled sessions outlive a test; without this one test's mocked AsyncSession
+    would answer the next test's fetch of the same origin."""
+    from src.runtime.curl_session_pool import curl_session_pool
+
+    monkeypatch.setattr(curl_session_pool, "_sessions", OrderedDict())
+
+
+@pytest.fixture(autouse=True)
+def isolate_adaptive_timeouts(monkeypatch):
+    from src.reader.adaptive_timeouts import adaptive_timeouts
+
+    monkeypatch.setattr(adaptive_timeouts, "_samples", OrderedDict())
+
+
+@pytest.fixture(autouse=True)
+def isolate_politeness_scheduler(monkeypatch):
+    from src.reader.politeness import politeness_scheduler
+
+    monkeypatch.setattr(politeness_scheduler, "_domains", {})
+
+
+@pytest.fixture(autouse=True)
+def isolate_circuit_breakers(monkeypatch):
+    """Breakers are process-wide; failures one test provokes must not open a circuit
+    that the next test expects to call through."""
+    from src.runtime.circuit_breaker import circuit_breakers
+
+    monkeypatch.setattr(circuit_breakers, "_breakers", {})
+
+
 @pytest.fixture(autouse=True)
 def stub_browser_pool(monkeypatch):
     """Replace the real BrowserPool with mocks; no Chromium launched in unit tests."""
@@ -56,6 +152,11 @@ def stub_browser_pool(monkeypatch):
     bp = bp_module.browser_pool
     monkeypatch.setattr(bp, "start", AsyncMock())
     monkeypatch.setattr(bp, "stop", AsyncMock())
+    # Pooled pages outlive a test; without fresh pool state the next test would be
+    # handed the previous test's mocked page.
+    monkeypatch.setattr(bp, "_idle", deque())
+    monkeypatch.setattr(bp, "_contexts", set())
+    monkeypatch.setattr(bp, "_slots", asyncio.Semaphore(bp_module.settings.PLAYWRIGHT_CONTEXT_POOL_SIZE))
 
     mock_browser = MagicMock()
     mock_browser.is_connected = MagicMock(return_value=True)
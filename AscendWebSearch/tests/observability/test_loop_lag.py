@@ -0,0 +1,19 @@
+import asyncio
+import time
+from unittest.mock import patch
+
+from src.observability.loop_lag import monitor_event_loop_lag
+
+
+async def test_blocking_the_loop_is_recorded_as_lag():
+    with (
+        patch("src.observability.loop_lag._PROBE_INTERVAL_S", 0.01),
+        patch("src.observability.loop_lag.EVENT_LOOP_LAG_SECONDS") as histogram,
+    ):
+        monitor = asyncio.create_task(monitor_event_loop_lag())
+        await asyncio.sleep(0)
+        time.sleep(0.1)  # noqa: ASYNC251 - stands in for a synchronous parse holding the loop
+        await asyncio.sleep(0.02)
+        monitor.cancel()
+
+    assert max(call.args[0] for call in histogram.observe.call_args_list) >= 0.05
@@ -1,6 +1,6 @@
 from unittest.mock import patch
 
-from src.reader.cloudflare.challenge_detector import ChallengeDetector
+from src.reader.cloudflare.challenge_detector import ChallengeDetector, _compile_markers
 
 
 def test_is_blocked_no_content():
@@ -97,12 +97,14 @@ def test_is_login_required_svg_bypass():
 
 def test_is_blocked_returns_true_for_waf_script_signature():
     with patch(
-        "src.reader.cloudflare.challenge_detector._BOT_DICT",
-        {
-            "waf_script_signatures": ["custom-waf-marker"],
-            "waf_strict_phrases": [],
-            "login_title_patterns": [],
-        },
+        "src.reader.cloudflare.challenge_detector._MARKERS",
+        _compile_markers(
+            {
+                "waf_script_signatures": ["custom-waf-marker"],
+                "waf_strict_phrases": [],
+                "login_title_patterns": [],
+            }
+        ),
     ):
         html = "<html>custom-waf-marker</html>"
         assert ChallengeDetector.is_blocked(200, html) is True
@@ -110,25 +112,48 @@ def test_is_blocked_returns_true_for_waf_script_signature():
 
 def test_is_blocked_returns_true_for_waf_strict_phrase():
     with patch(
-        "src.reader.cloudflare.challenge_detector._BOT_DICT",
-        {
-            "waf_script_signatures": [],
-            "waf_strict_phrases": ["please verify you are human"],
-            "login_title_patterns": [],
-        },
+        "src.reader.cloudflare.challenge_detector._MARKERS",
+        _compile_markers(
+            {
+                "waf_script_signatures": [],
+                "waf_strict_phrases": ["please verify you are human"],
+                "login_title_patterns": [],
+            }
+        ),
     ):
         html = "<html><body>please verify you are human</body></html>"
         assert ChallengeDetector.is_blocked(200, html) is True
 
 
-def test_is_blocked_returns_false_on_huge_content():
-    huge = "a" * 50001
-    assert ChallengeDetector.is_blocked(200, huge) is False
+def test_is_blocked_scans_head_and_tail_of_huge_content():
+    filler = "<p>" + "a" * 100_000 + "</p>"
+    assert ChallengeDetector.is_blocked(200, filler) is False
+    assert ChallengeDetector.is_blocked(200, "<title>Just a moment...</title>" + filler) is True
+    assert ChallengeDetector.is_blocked(200, filler + "<script src='/cf-turnstile.js'></script>") is True
+    assert ChallengeDetector.is_blocked(200, filler + "<footer>Cloudflare Ray ID: 8f2c</footer>") is True
 
 
-def test_is_login_required_returns_false_on_huge_content():
-    huge = "a" * 50001
-    assert ChallengeDetector.is_login_required("https://example.com", huge) is False
+def test_is_blocked_ignores_markers_in_the_middle_of_huge_content():
+    filler = "<p>" + "a" * 50_000 + "</p>"
+    assert ChallengeDetector.is_blocked(200, filler + "Attention Required!" + filler) is False
+
+
+def test_is_blocked_ray_id_is_case_insensitive_and_needs_an_id():
+    assert ChallengeDetector.is_blocked(200, "<p>RAY id: abc</p>") is True
+    assert ChallengeDetector.is_blocked(200, "<p>Ray ID: </p>") is False
+    assert ChallengeDetector.is_blocked(200, "<p>x-ray id:</p>") is False
+
+
+def test_is_login_required_reads_title_of_huge_content():
+    huge = "<html><head><title>Sign in</title></head><body>" + "a" * 100_000 + "</body></html>"
+    assert ChallengeDetector.is_login_required("https://example.com", huge) is True
+    assert ChallengeDetector.is_login_required("https://example.com", "a" * 100_000) is False
+
+
+def test_is_login_required_with_no_title_patterns():
+    markers = _compile_markers({"waf_script_signatures": [], "waf_strict_phrases": []})
+    with patch("src.reader.cloudflare.challenge_detector._MARKERS", markers):
+        assert ChallengeDetector.is_login_required("https://example.com", "<title>Log in</title>") is False
 
 
 def test_is_login_redirect_url_empty_string_returns_false():
@@ -151,3 +176,9 @@ def test_is_login_redirect_url_matches_known_patterns():
     assert ChallengeDetector.is_login_redirect_url("https://example.com/login=true") is True
     assert ChallengeDetector.is_login_redirect_url("https://example.com?auth?data") is True
     assert ChallengeDetector.is_login_redirect_url("https://example.com/dashboard/settings") is False
+
+
+def test_is_login_title_and_block_markers():
+    assert ChallengeDetector.is_login_title("  Sign In | Indeed Accounts ") is True
+    assert ChallengeDetector.is_login_title("Welcome") is False
+    assert "cf-turnstile" in ChallengeDetector.block_markers()
@@ -1,5 +1,7 @@
-from unittest.mock import AsyncMock, patch
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
 
+import fakeredis
 import pytest
 
 from src.reader.cloudflare.cookie_manager import CookieManager
@@ -175,3 +177,136 @@ async def test_schemeless_url_resolves_to_same_apex_as_scheme_qualified():
     data = await manager.get_session_data("evil.com/other")
     assert data is not None
     assert data["cookies"]["k"] == "v"
+
+
+def _redis_manager(redis_client) -> CookieManager:
+    manager = _fresh_manager()
+    manager.redis_client = redis_client
+
+    return manager
+
+
+@pytest.mark.asyncio
+async def test_l1_caches_hits_and_misses_without_redis_round_trips():
+    redis_client = fakeredis.FakeAsyncRedis(decode_responses=True, protocol=2)
+    await redis_client.set(
+        "session_cookies:example.com", '{"cookies": {"cf_clearance": "z"}, "user_agent": "UA"}'
+    )
+    manager = _redis_manager(redis_client)
+
+    real_get = redis_client.get
+
+    async def counted_get(key):
+        return await real_get(key)
+
+    with patch.object(redis_client, "get", new=AsyncMock(side_effect=counted_get)) as redis_get:
+        for _ in range(3):
+            assert (await manager.get_session_data("https://www.example.com/a"))["cookies"] == {
+                "cf_clearance": "z"
+            }
+            assert await manager.get_session_data("https://never-cleared.org/") is None
+
+    assert redis_get.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_l1_entries_expire_after_ttl():
+    redis_client = fakeredis.FakeAsyncRedis(decode_responses=True, protocol=2)
+    manager = _redis_manager(redis_client)
+    now = [1000.0]
+
+    with patch("src.reader.cloudflare.cookie_manager.time.monotonic", side_effect=lambda: now[0]):
+        assert await manager.get_session_data("https://example.com") is None
+        await redis_client.set("session_cookies:example.com", '{"cookies": {}, "user_agent": "UA"}')
+        now[0] += 29
+        assert await manager.get_session_data("https://example.com") is None
+        now[0] += 2
+        assert await manager.get_session_data("https://example.com") is not None
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_are_not_cached():
+    manager = _redis_manager(AsyncMock())
+    manager.redis_client.get = AsyncMock(side_effect=[RuntimeError("down"), None])
+
+    await manager.get_session_data("https://example.com")
+    await manager.get_session_data("https://example.com")
+
+    assert manager.redis_client.get.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_save_invalidates_other_workers_through_pub_sub():
+    server = fakeredis.FakeServer()
+    saver = _redis_manager(fakeredis.FakeAsyncRedis(server=server, decode_responses=True, protocol=2))
+    reader = _redis_manager(fakeredis.FakeAsyncRedis(server=server, decode_responses=True, protocol=2))
+
+    listener = asyncio.create_task(reader.run_invalidation_listener())
+    try:
+        assert await reader.get_session_data("https://example.com") is None
+        # Subscribing clears the L1: anything published before it was missed.
+        await _eventually(lambda: not reader._l1_cache)
+        assert await reader.get_session_data("https://example.com") is None
+
+        await saver.save_session_data("https://example.com", {"cf_clearance": "new"}, "UA")
+        await _eventually(lambda: "example.com" not in reader._l1_cache)
+
+        data = await reader.get_session_data("https://example.com")
+        assert data is not None
+        assert data["cookies"] == {"cf_clearance": "new"}
+    finally:
+        listener.cancel()
+        await asyncio.gather(listener, return_exceptions=True)
+
+
+async def _eventually(predicate) -> None:
+    for _ in range(100):
+        if predicate():
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError("condition not reached")
+
+
+@pytest.mark.asyncio
+async def test_lookup_racing_a_save_does_not_cache_the_old_answer():
+    manager = _redis_manager(AsyncMock())
+
+    async def slow_get(key):
+        await manager.save_session_data("https://example.com", {"cf_clearance": "new"}, "UA")
+        return
+
+    manager.redis_client.get = AsyncMock(side_effect=slow_get)
+    manager.redis_client.setex = AsyncMock()
+
+    assert await manager.get_session_data("https://example.com") is None
+    assert "example.com" not in manager._l1_cache
+
+
+@pytest.mark.asyncio
+async def test_invalidation_listener_resubscribes_after_errors():
+    manager = _redis_manager(MagicMock())
+    manager.redis_client.pubsub = MagicMock(
+        side_effect=[RuntimeError("connection lost"), asyncio.CancelledError()]
+    )
+
+    with patch("src.reader.cloudflare.cookie_manager.asyncio.sleep", new=AsyncMock()) as sleep:
+        with pytest.raises(asyncio.CancelledError):
+            await manager.run_invalidation_listener()
+
+    sleep.assert_awaited_once()
+    assert manager.redis_client.pubsub.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_invalidation_listener_is_a_no_op_without_redis():
+    await _fresh_manager().run_invalidation_listener()
+
+
+def test_registrable_domain_lookup_is_memoized_per_host():
+    from src.reader.domain_utils import _registrable_domain_of_host, get_registrable_domain
+
+    _registrable_domain_of_host.cache_clear()
+    assert get_registrable_domain("https://news.example.co.uk/a") == "example.co.uk"
+    assert get_registrable_domain("https://NEWS.example.co.uk:443/b?page=2") == "example.co.uk"
+
+    assert _registrable_domain_of_host.cache_info().hits == 1
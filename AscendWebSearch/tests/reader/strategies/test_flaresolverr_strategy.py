@@ -2,7 +2,7 @@ from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from src.api.exceptions import ChallengeDetectedException
+from src.api.exceptions import ChallengeDetectedException, CircuitOpenException
 from src.reader.strategies.flaresolverr_strategy import FlareSolverrStrategy
 
 
@@ -39,13 +39,13 @@ async def test_flaresolverr_success_saves_cf_clearance_and_returns_html():
         }
     )
     with (
-        patch("src.reader.strategies.flaresolverr_strategy.requests.AsyncSession", return_value=session),
+        patch("src.runtime.curl_session_pool.requests.AsyncSession", return_value=session),
         patch(
             "src.reader.strategies.flaresolverr_strategy.cookie_manager.save_session_data",
             new=AsyncMock(),
         ) as mock_save,
         patch(
-            "src.reader.strategies.flaresolverr_strategy.trafilatura.extract",
+            "src.reader.html_utils.trafilatura.extract",
             return_value="Cleared",
         ),
     ):
@@ -67,12 +67,12 @@ async def test_flaresolverr_skips_cookie_save_when_cf_clearance_missing():
         }
     )
     with (
-        patch("src.reader.strategies.flaresolverr_strategy.requests.AsyncSession", return_value=session),
+        patch("src.runtime.curl_session_pool.requests.AsyncSession", return_value=session),
         patch(
             "src.reader.strategies.flaresolverr_strategy.cookie_manager.save_session_data",
             new=AsyncMock(),
         ) as mock_save,
-        patch("src.reader.strategies.flaresolverr_strategy.trafilatura.extract", return_value="x"),
+        patch("src.reader.html_utils.trafilatura.extract", return_value="x"),
     ):
         await FlareSolverrStrategy().extract("http://test.com")
     mock_save.assert_not_called()
@@ -91,7 +91,7 @@ async def test_flaresolverr_login_wall_raises_challenge():
         }
     )
     with (
-        patch("src.reader.strategies.flaresolverr_strategy.requests.AsyncSession", return_value=session),
+        patch("src.runtime.curl_session_pool.requests.AsyncSession", return_value=session),
         patch(
             "src.reader.strategies.flaresolverr_strategy.ChallengeDetector.is_login_required",
             return_value=True,
@@ -115,7 +115,7 @@ async def test_flaresolverr_blocked_raises_challenge_for_consistent_escalation()
         }
     )
     with (
-        patch("src.reader.strategies.flaresolverr_strategy.requests.AsyncSession", return_value=session),
+        patch("src.runtime.curl_session_pool.requests.AsyncSession", return_value=session),
         patch(
             "src.reader.strategies.flaresolverr_strategy.ChallengeDetector.is_login_required",
             return_value=False,
@@ -133,7 +133,7 @@ async def test_flaresolverr_blocked_raises_challenge_for_consistent_escalation()
 @pytest.mark.asyncio
 async def test_flaresolverr_status_not_ok_returns_empty():
     session = _make_session({"status": "error", "message": "fail"})
-    with patch("src.reader.strategies.flaresolverr_strategy.requests.AsyncSession", return_value=session):
+    with patch("src.runtime.curl_session_pool.requests.AsyncSession", return_value=session):
         result = await FlareSolverrStrategy().get_html("http://test.com")
     assert result == ""
 
@@ -141,13 +141,29 @@ async def test_flaresolverr_status_not_ok_returns_empty():
 @pytest.mark.asyncio
 async def test_flaresolverr_transport_error_returns_empty():
     with patch(
-        "src.reader.strategies.flaresolverr_strategy.requests.AsyncSession",
+        "src.runtime.curl_session_pool.requests.AsyncSession",
         side_effect=RuntimeError("net"),
     ):
         result = await FlareSolverrStrategy().get_html("http://test.com")
     assert result == ""
 
 
+@pytest.mark.asyncio
+async def test_flaresolverr_open_circuit_raises_without_posting():
+    from src.runtime.circuit_breaker import FAILURE, circuit_breakers
+
+    for _ in range(5):
+        circuit_breakers.get("flaresolverr").record(FAILURE)
+    session = _make_session({"status": "ok", "solution": {}})
+    with (
+        patch("src.runtime.curl_session_pool.requests.AsyncSession", return_value=session),
+        pytest.raises(CircuitOpenException) as exc_info,
+    ):
+        await FlareSolverrStrategy().get_html("http://test.com")
+    assert exc_info.value.retry_after > 0
+    session.post.assert_not_awaited()
+
+
 @pytest.mark.asyncio
 async def test_flaresolverr_extract_returns_empty_when_trafilatura_none():
     session = _make_session(
@@ -161,8 +177,8 @@ async def test_flaresolverr_extract_returns_empty_when_trafilatura_none():
         }
     )
     with (
-        patch("src.reader.strategies.flaresolverr_strategy.requests.AsyncSession", return_value=session),
-        patch("src.reader.strategies.flaresolverr_strategy.trafilatura.extract", return_value=None),
+        patch("src.runtime.curl_session_pool.requests.AsyncSession", return_value=session),
+        patch("src.reader.html_utils.trafilatura.extract", return_value=None),
     ):
         result = await FlareSolverrStrategy().extract("http://test.com")
     assert result == ""
@@ -0,0 +1,84 @@
+from unittest.mock import patch
+
+import pytest
+
+from src.reader import adaptive_timeouts as at_module
+from src.reader.adaptive_timeouts import AdaptiveTimeouts, attempt_timeout
+
+
+@pytest.fixture
+def timeouts(monkeypatch):
+    monkeypatch.setattr(at_module.settings, "ADAPTIVE_TIMEOUT_ENABLED", True)
+    monkeypatch.setattr(at_module.settings, "ADAPTIVE_TIMEOUT_PERCENTILE", 0.9)
+    monkeypatch.setattr(at_module.settings, "ADAPTIVE_TIMEOUT_MULTIPLIER", 2.0)
+    monkeypatch.setattr(at_module.settings, "ADAPTIVE_TIMEOUT_FLOOR_SECONDS", 1.0)
+    monkeypatch.setattr(at_module.settings, "ADAPTIVE_TIMEOUT_MIN_SAMPLES", 3)
+    monkeypatch.setattr(at_module.settings, "ADAPTIVE_TIMEOUT_WINDOW", 10)
+
+    return AdaptiveTimeouts()
+
+
+def _record(timeouts: AdaptiveTimeouts, url: str, *seconds: float) -> None:
+    for value in seconds:
+        timeouts.record_success("1-beautifulsoup", url, value)
+
+
+def test_estimate_is_static_until_enough_successes(timeouts):
+    _record(timeouts, "http://a.com", 1.0, 1.0)
+    assert timeouts.estimate("1-beautifulsoup", "http://a.com") == (None, "static")
+
+
+def test_estimate_uses_the_percentile_of_the_domain_with_headroom(timeouts):
+    _record(timeouts, "http://www.a.com/x", *[1.0] * 9, 4.0)
+    assert timeouts.estimate("1-beautifulsoup", "http://a.com/y") == (2.0, "domain")
+
+    _record(timeouts, "http://a.com", 4.0)  # now two of eleven samples are slow
+    assert timeouts.estimate("1-beautifulsoup", "http://a.com") == (8.0, "domain")
+
+
+def test_new_domain_falls_back_to_the_tier_wide_samples(timeouts):
+    _record(timeouts, "http://a.com", 1.0, 2.0)
+    _record(timeouts, "http://b.com", 1.5)
+    assert timeouts.estimate("1-beautifulsoup", "http://c.com") == (4.0, "tier")
+    assert timeouts.estimate("4-playwright_stealth", "http://c.com") == (None, "static")
+
+
+def test_estimate_respects_the_floor(timeouts):
+    _record(timeouts, "http://a.com", 0.1, 0.2, 0.1)
+    assert timeouts.estimate("1-beautifulsoup", "http://a.com") == (1.0, "domain")
+
+
+def test_window_keeps_only_recent_successes(timeouts, monkeypatch):
+    _record(timeouts, "http://a.com", 10.0, 10.0, 10.0)
+    monkeypatch.setattr(at_module.settings, "ADAPTIVE_TIMEOUT_WINDOW", 3)
+    _record(timeouts, "http://a.com", 1.0, 1.0, 1.0)
+    assert timeouts.estimate("1-beautifulsoup", "http://a.com") == (2.0, "domain")
+
+
+def test_disabled_always_falls_back_to_static(timeouts, monkeypatch):
+    _record(timeouts, "http://a.com", 1.0, 1.0, 1.0)
+    monkeypatch.setattr(at_module.settings, "ADAPTIVE_TIMEOUT_ENABLED", False)
+    assert timeouts.estimate("1-beautifulsoup", "http://a.com") == (None, "static")
+
+
+def test_least_recently_used_keys_are_evicted(timeouts):
+    with patch.object(at_module, "_MAX_KEYS", 2):
+        _record(timeouts, "http://a.com", 1.0)
+        _record(timeouts, "http://b.com", 1.0)
+    assert ("1-beautifulsoup", "a.com") not in timeouts._samples
+    assert ("1-beautifulsoup", "") in timeouts._samples
+
+
+def test_attempt_timeout_applies_the_estimate_capped_at_the_static_timeout(timeouts):
+    assert attempt_timeout(30.0) == 30.0  # outside an attempt
+    _record(timeouts, "http://a.com", 2.0, 3.0, 20.0)
+
+    with timeouts.applied("1-beautifulsoup", "http://a.com"):
+        assert attempt_timeout(30.0) == 30.0
+        assert attempt_timeout(60.0) == 40.0
+    with timeouts.applied("1-beautifulsoup", "http://new.com"):
+        assert attempt_timeout(60.0) == 40.0
+    with timeouts.applied("3-flaresolverr", "http://a.com"):
+        assert attempt_timeout(60.0) == 60.0
+
+    assert attempt_timeout(30.0) == 30.0
@@ -0,0 +1,169 @@
+import asyncio
+from collections import Counter
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.api.exceptions import HumanInterventionRequiredException
+from src.reader.batch_reader import BatchReader
+
+
+def _batch_reader(read) -> BatchReader:
+    web_reader = MagicMock()
+    web_reader.read = read
+    web_reader.read_with_links = read
+
+    return BatchReader(web_reader)
+
+
+async def _collect(batch_reader: BatchReader, urls: list[str], **kwargs) -> list[dict]:
+    return [item async for item in batch_reader.read_many(urls, **kwargs)]
+
+
+@pytest.fixture(autouse=True)
+def allow_all_urls():
+    with patch("src.reader.batch_reader.is_safe_external_url", return_value=True):
+        yield
+
+
+@pytest.mark.asyncio
+async def test_items_stream_in_completion_order_with_original_index():
+    delays = {"https://slow.com/": 0.05, "https://fast.org/": 0.0}
+
+    async def read(url, heavy_mode=False):
+        await asyncio.sleep(delays[url])
+        return {"content": url, "status": "success", "mode": "1-beautifulsoup"}
+
+    items = await _collect(_batch_reader(read), ["https://slow.com/", "https://fast.org/"])
+
+    assert [(item["index"], item["url"]) for item in items] == [
+        (1, "https://fast.org/"),
+        (0, "https://slow.com/"),
+    ]
+    assert all(item["status"] == "success" for item in items)
+
+
+@pytest.mark.asyncio
+async def test_per_domain_and_global_limits_are_respected():
+    in_flight: Counter[str] = Counter()
+    peaks: Counter[str] = Counter()
+
+    async def read(url, heavy_mode=False):
+        domain = url.split("/")[2].removeprefix("www.")
+        in_flight[domain] += 1
+        in_flight["total"] += 1
+        peaks[domain] = max(peaks[domain], in_flight[domain])
+        peaks["total"] = max(peaks["total"], in_flight["total"])
+        await asyncio.sleep(0.01)
+        in_flight[domain] -= 1
+        in_flight["total"] -= 1
+        return {"status": "success"}
+
+    urls = [f"https://www.site{i % 3}.com/{i}" for i in range(12)]
+    with (
+        patch("src.reader.batch_reader.settings.BATCH_READ_MAX_CONCURRENCY", 4),
+        patch("src.reader.batch_reader.settings.BATCH_READ_PER_DOMAIN_CONCURRENCY", 1),
+    ):
+        items = await _collect(_batch_reader(read), urls)
+
+    assert len(items) == 12
+    assert peaks["total"] == 3
+    assert all(peaks[f"site{i}.com"] == 1 for i in range(3))
+
+
+@pytest.mark.asyncio
+async def test_each_item_carries_its_own_status():
+    async def read(url, heavy_mode=False):
+        if "captcha" in url:
+            raise HumanInterventionRequiredException("http://vnc", "captcha")
+        if "boom" in url:
+            raise RuntimeError("secret internal detail")
+        return {"content": "ok", "status": "success"}
+
+    urls = ["https://captcha.com/", "https://boom.com/", "https://ok.com/", "http://10.0.0.1/"]
+    with patch(
+        "src.reader.batch_reader.is_safe_external_url",
+        side_effect=lambda url: not url.startswith("http://10."),
+    ):
+        items = await _collect(_batch_reader(read), urls)
+
+    by_url = {item["url"]: item for item in items}
+    assert by_url["https://captcha.com/"]["status"] == "human_intervention_required"
+    assert by_url["https://captcha.com/"]["vnc_url"] == "http://vnc"
+    assert by_url["https://boom.com/"] == {
+        "index": 1,
+        "url": "https://boom.com/",
+        "status": "error",
+        "message": "Unexpected error while reading the URL",
+    }
+    assert by_url["https://ok.com/"]["status"] == "success"
+    assert by_url["http://10.0.0.1/"]["status"] == "rejected"
+
+
+@pytest.mark.asyncio
+async def test_deadline_reports_unfinished_urls_as_timeout_and_cancels_them():
+    cancelled: list[str] = []
+
+    async def read(url, heavy_mode=False):
+        if "slow" in url:
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(url)
+                raise
+        return {"status": "success"}
+
+    with patch("src.reader.batch_reader.settings.BATCH_READ_DEADLINE_SECONDS", 0.05):
+        items = await _collect(_batch_reader(read), ["https://fast.com/", "https://slow.com/"])
+
+    assert [(item["url"], item["status"]) for item in items] == [
+        ("https://fast.com/", "success"),
+        ("https://slow.com/", "timeout"),
+    ]
+    assert cancelled == ["https://slow.com/"]
+
+
+@pytest.mark.asyncio
+async def test_closing_the_stream_cancels_unfinished_reads():
+    cancelled: list[str] = []
+    slow_started = asyncio.Event()
+
+    async def read(url, heavy_mode=False):
+        if "fast" in url:
+            await slow_started.wait()
+        if "slow" in url:
+            slow_started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(url)
+                raise
+        return {"status": "success"}
+
+    stream = _batch_reader(read).read_many(["https://fast.com/", "https://slow.com/"])
+    first = await anext(stream)
+    await stream.aclose()
+
+    assert first["url"] == "https://fast.com/"
+    assert cancelled == ["https://slow.com/"]
+
+
+@pytest.mark.asyncio
+async def test_include_links_uses_read_with_links():
+    web_reader = MagicMock()
+
+    async def read_with_links(url, link_filter=None, heavy_mode=False):
+        return {
+            "status": "success",
+            "links": {1: "https://x.com"},
+            "filter": link_filter,
+            "heavy": heavy_mode,
+        }
+
+    web_reader.read_with_links = read_with_links
+    items = await _collect(
+        BatchReader(web_reader), ["https://a.com/"], include_links=True, link_filter="/jobs/", heavy_mode=True
+    )
+
+    assert items[0]["filter"] == "/jobs/"
+    assert items[0]["heavy"] is True
@@ -0,0 +1,110 @@
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.api.exceptions import NonHtmlContentException
+from src.reader.content_router import answer_non_html, extract_pdf_text
+
+
+def _pdf(pages: list[str]) -> bytes:
+    """A minimal PDF with one line of Helvetica text per page."""
+    font = 3 + 2 * len(pages)
+    kids = " ".join(f"{3 + 2 * i} 0 R" for i in range(len(pages)))
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {len(pages)} >>",
+    ]
+    for i, text in enumerate(pages):
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET"
+        objects.append(
+            "<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 {font} 0 R >> >> /Contents {4 + 2 * i} 0 R >>"
+        )
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+    objects.append("<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode()
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+
+    return out
+
+
+def test_extract_pdf_text_joins_pages_up_to_the_limit():
+    document = _pdf(["First page", "Second page", "Third page"])
+    assert extract_pdf_text(document, 10) == "First page\n\nSecond page\n\nThird page"
+    assert extract_pdf_text(document, 2) == "First page\n\nSecond page"
+
+
+def test_extract_pdf_text_skips_pages_that_fail(monkeypatch):
+    from pypdf import PageObject
+
+    original = PageObject.extract_text
+    calls = iter([ValueError("bad content stream"), None])
+
+    def flaky(page, *args, **kwargs):
+        error = next(calls)
+        if error:
+            raise error
+        return original(page, *args, **kwargs)
+
+    monkeypatch.setattr(PageObject, "extract_text", flaky)
+    assert extract_pdf_text(_pdf(["Lost", "Kept"]), 10) == "Kept"
+
+
+def test_extract_pdf_text_returns_empty_for_broken_pdf():
+    assert extract_pdf_text(b"%PDF-1.4\nnot really", 10) == ""
+
+
+@pytest.mark.asyncio
+async def test_answer_non_html_returns_text_and_pdf_content():
+    text = await answer_non_html(
+        "http://t.com/a.txt",
+        NonHtmlContentException("text", "text/plain; charset=latin-1", b"caf\xe9\n", "latin-1"),
+    )
+    assert text == {
+        "content": "café",
+        "status": "success",
+        "mode": "content-text",
+        "content_type": "text/plain",
+    }
+
+    pdf = await answer_non_html(
+        "http://t.com/a.pdf", NonHtmlContentException("pdf", "application/pdf", _pdf(["Report body"]))
+    )
+    assert (pdf["content"], pdf["mode"]) == ("Report body", "content-pdf")
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("exc", "reason"),
+    [
+        (NonHtmlContentException("binary", "image/png"), "unsupported_content_type"),
+        (NonHtmlContentException("too_large", "application/pdf"), "too_large"),
+        (NonHtmlContentException("json", "application/json", b"  "), "no_text"),
+    ],
+)
+async def test_answer_non_html_reports_unreadable_responses(exc, reason):
+    result = await answer_non_html("http://t.com/x", exc)
+    assert result["status"] == "error"
+    assert result["reason"] == reason
+    assert result["content"] == ""
+
+
+@pytest.mark.asyncio
+async def test_answer_non_html_reports_a_pdf_that_crashes_the_extraction_workers():
+    with patch(
+        "src.reader.content_router.extraction_pool.run",
+        AsyncMock(side_effect=BrokenProcessPool("worker died again")),
+    ):
+        result = await answer_non_html(
+            "http://t.com/a.pdf", NonHtmlContentException("pdf", "application/pdf", _pdf(["Report body"]))
+        )
+    assert (result["status"], result["reason"]) == ("error", "no_text")
@@ -0,0 +1,38 @@
+import pytest
+
+from src.reader.content_sniffer import decode, media_type, sniff
+
+
+@pytest.mark.parametrize(
+    ("content_type", "head", "expected"),
+    [
+        ("text/html; charset=utf-8", b"<!doctype html>", "html"),
+        ("", b"<html><body>", "html"),
+        ("application/rss+xml", b"<?xml version='1.0'?>", "html"),
+        ("application/octet-stream", b"%PDF-1.7\n", "pdf"),
+        ("text/html", b"%PDF-1.4\n", "pdf"),
+        ("application/pdf", b"", "pdf"),
+        ("application/json; charset=utf-8", b"{}", "json"),
+        ("application/vnd.api+json", b"[]", "json"),
+        ("text/plain", b"Just words.", "text"),
+        ("text/plain", b"\xef\xbb\xbf  <!DOCTYPE html><html>", "html"),
+        ("text/csv", b"a,b\n1,2\n", "text"),
+        ("text/html", b"\x89PNG\r\n\x1a\n\x00", "binary"),
+        ("", b"RIFF\x00\x00\x00\x00WEBPVP8 ", "binary"),
+        ("", b"\x00\x00\x00\x18ftypmp42", "binary"),
+        ("image/svg+xml", b"<svg>", "binary"),
+        ("application/vnd.openxmlformats-officedocument.wordprocessingml.document", b"", "binary"),
+    ],
+)
+def test_sniff(content_type, head, expected):
+    assert sniff(content_type, head) == expected
+
+
+def test_media_type_strips_parameters_and_case():
+    assert media_type(" Application/JSON ; charset=UTF-8") == "application/json"
+
+
+def test_decode_uses_charset_and_falls_back_on_unknown_one():
+    assert decode("café".encode("latin-1"), "latin-1") == "café"
+    assert decode("café".encode(), "no-such-codec") == "café"
+    assert decode(b"ok", None) == "ok"
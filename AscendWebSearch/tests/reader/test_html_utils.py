@@ -0,0 +1,47 @@
+from pathlib import Path
+
+import trafilatura
+
+from src.reader.html_utils import ParsedDocument, extract_main_text, extract_visible_text
+
+ARTICLE = (
+    Path(__file__).parents[2] / "benchmarks" / "fixtures" / "challenge_pages" / "article.html"
+).read_text(encoding="utf-8")
+
+
+def test_main_text_matches_trafilatura_on_the_raw_html():
+    assert extract_main_text(ARTICLE) == trafilatura.extract(ARTICLE)
+
+
+def test_comments_are_dropped_like_trafilatura_drops_them():
+    html = "<html><body><p>a<!-- x -->b</p><!-- y --><p>c</p></body></html>"
+
+    assert extract_main_text(html) == trafilatura.extract(html)
+    assert extract_visible_text(html) == "ab c"
+
+
+def test_visible_text_skips_noise_and_template_content():
+    html = """
+    <html><head><title>Title</title><style>p {}</style></head><body>
+        <nav>Menu</nav><template><p>Later</p></template>
+        <p>Body&nbsp;text</p><footer>Legal</footer>
+    </body></html>
+    """
+
+    assert extract_visible_text(html) == "Title Body\xa0text"
+
+
+def test_anchors_skip_noise_tags_and_missing_hrefs():
+    document = ParsedDocument(
+        '<html><body><nav><a href="/nav">n</a></nav><a>plain</a><a href="/a">a</a></body></html>'
+    )
+
+    assert [anchor.get("href") for anchor in document.anchors()] == ["/a"]
+
+
+def test_parses_input_lxml_rejects_as_str():
+    html = "<?xml version='1.0' encoding='utf-8'?><html><body><p>one\x00two</p></body></html>"
+
+    assert extract_visible_text(html) == "one�two"
+    assert extract_visible_text("   ") == ""
+    assert extract_main_text("") == ""
@@ -88,3 +88,15 @@ def test_annotate_links_no_anchors_returns_empty_map():
 
     assert links == {}
     assert "No links here" in content
+
+
+def test_annotate_links_keeps_text_around_removed_tags_apart():
+    html = """
+    <html><body>
+        <p>Before<script>track()</script>after <!-- ad slot -->the <a href="/x">x <b>link</b></a>.</p>
+    </body></html>
+    """
+    content, links = annotate_links(html, BASE_URL)
+
+    assert content == "Before after the xlink [1] ."
+    assert links == {1: "https://example.com/x"}
@@ -0,0 +1,62 @@
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from src.reader.page_readiness import PageReadiness
+
+
+def _page() -> MagicMock:
+    page = MagicMock()
+    page.expose_binding = AsyncMock()
+    page.add_init_script = AsyncMock()
+
+    return page
+
+
+async def _emit(readiness: PageReadiness, page: MagicMock, kind: str, value: str, url: str) -> None:
+    await readiness._on_event({"page": page}, {"kind": kind, "value": value, "url": url})
+
+
+async def test_attach_installs_binding_and_observer_with_settings():
+    page = _page()
+    with (
+        patch("src.reader.page_readiness.settings.BROWSER_DOM_QUIET_MS", 750),
+        patch("src.reader.page_readiness.settings.DYNAMIC_CONTENT_WAIT", 3000),
+    ):
+        readiness = PageReadiness()
+    await readiness.attach(page)
+
+    name, callback = page.expose_binding.await_args.args
+    script = page.add_init_script.await_args.kwargs["script"]
+    config = json.loads(script[script.rindex(")(") + 2 : -1])
+    assert name == config["binding"]
+    assert callback == readiness._on_event
+    assert config["quietMs"] == 750
+    assert config["maxWaitMs"] == 3000
+    assert "cf-turnstile" in config["markers"]
+
+
+async def test_events_reach_only_the_watch_of_their_page():
+    readiness = PageReadiness()
+    page, other = _page(), _page()
+
+    with readiness.watch(page) as watch:
+        await _emit(readiness, page, "title", "Example", "https://example.com/")
+        await _emit(readiness, other, "ready", "quiet", "https://other.com/")
+        event = await watch.next_event(time.monotonic() + 1)
+        assert event == {"kind": "title", "value": "Example", "url": "https://example.com/"}
+        assert watch.events.empty()
+
+    # Closed watches drop late events instead of leaking them into the next read.
+    await _emit(readiness, page, "ready", "quiet", "https://example.com/")
+    with readiness.watch(page) as watch:
+        assert watch.events.empty()
+
+
+async def test_about_blank_events_are_ignored():
+    readiness = PageReadiness()
+    page = _page()
+
+    with readiness.watch(page) as watch:
+        await _emit(readiness, page, "ready", "quiet", "about:blank")
+        assert await watch.next_event(time.monotonic()) is None
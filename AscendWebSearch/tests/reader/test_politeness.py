@@ -0,0 +1,173 @@
+import asyncio
+import time
+from email.utils import formatdate
+from unittest.mock import patch
+
+import pytest
+
+from src.observability.request_context import request_id_ctx
+from src.reader import politeness as politeness_module
+from src.reader.politeness import PolitenessScheduler, parse_retry_after
+
+
+@pytest.fixture
+def scheduler(monkeypatch):
+    monkeypatch.setattr(politeness_module.settings, "POLITENESS_ENABLED", True)
+    monkeypatch.setattr(politeness_module.settings, "POLITENESS_PER_DOMAIN_CONCURRENCY", 1)
+    monkeypatch.setattr(politeness_module.settings, "POLITENESS_REQUESTS_PER_SECOND", 0.0)
+    monkeypatch.setattr(politeness_module.settings, "POLITENESS_MAX_RETRY_AFTER_SECONDS", 0.1)
+
+    return PolitenessScheduler()
+
+
+async def _fetch(scheduler: PolitenessScheduler, url: str, log: list[str], label: str, hold=None) -> None:
+    request_id_ctx.set(label.rstrip("0123456789"))
+    async with scheduler.slot(url):
+        log.append(label)
+        if hold is not None:
+            await hold.wait()
+
+
+def test_parse_retry_after_accepts_seconds_and_http_dates():
+    assert parse_retry_after(" 120 ") == 120.0
+    assert 8 <= parse_retry_after(formatdate(time.time() + 10, usegmt=True)) <= 10
+    assert parse_retry_after(formatdate(time.time() - 10, usegmt=True)) == 0.0
+    assert parse_retry_after("soon") is None
+    assert parse_retry_after(None) is None
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_capped_per_registrable_domain(scheduler, monkeypatch):
+    monkeypatch.setattr(politeness_module.settings, "POLITENESS_PER_DOMAIN_CONCURRENCY", 2)
+    log: list[str] = []
+    hold = asyncio.Event()
+    tasks = [
+        asyncio.create_task(_fetch(scheduler, f"http://{host}.example.com/", log, f"r{i}", hold))
+        for i, host in enumerate(("www", "blog", "shop"))
+    ]
+    other = asyncio.create_task(_fetch(scheduler, "http://other.org/", log, "o1", hold))
+    await asyncio.sleep(0.01)
+    assert sorted(log) == ["o1", "r0", "r1"]
+
+    hold.set()
+    await asyncio.gather(*tasks, other)
+    assert sorted(log) == ["o1", "r0", "r1", "r2"]
+
+
+@pytest.mark.asyncio
+async def test_queued_fetches_are_served_round_robin_across_callers(scheduler):
+    log: list[str] = []
+    hold = asyncio.Event()
+    holder = asyncio.create_task(_fetch(scheduler, "http://a.com/", log, "h", hold))
+    await asyncio.sleep(0)
+    batch = [asyncio.create_task(_fetch(scheduler, "http://a.com/", log, f"batch{i}")) for i in range(3)]
+    await asyncio.sleep(0)
+    single = asyncio.create_task(_fetch(scheduler, "http://a.com/", log, "single1"))
+    await asyncio.sleep(0)
+
+    hold.set()
+    await asyncio.gather(holder, *batch, single)
+    assert log == ["h", "batch0", "single1", "batch1", "batch2"]
+
+
+@pytest.mark.asyncio
+async def test_starts_are_spaced_by_the_request_rate(scheduler, monkeypatch):
+    monkeypatch.setattr(politeness_module.settings, "POLITENESS_PER_DOMAIN_CONCURRENCY", 5)
+    monkeypatch.setattr(politeness_module.settings, "POLITENESS_REQUESTS_PER_SECOND", 20.0)
+    started: list[float] = []
+
+    async def fetch() -> None:
+        async with scheduler.slot("http://a.com/"):
+            started.append(time.monotonic())
+
+    await asyncio.gather(*(fetch() for _ in range(3)))
+    assert started[1] - started[0] >= 0.045
+    assert started[2] - started[1] >= 0.045
+
+
+@pytest.mark.asyncio
+async def test_retry_after_pauses_the_domain_up_to_the_cap(scheduler):
+    scheduler.note_response("http://a.com/x", 200, {"Retry-After": "30"})
+    scheduler.note_response("http://a.com/x", 429, {})
+    assert "a.com" not in scheduler._domains
+
+    scheduler.note_response("http://www.a.com/x", 429, {"retry-after": "30"})
+    started = time.monotonic()
+    async with scheduler.slot("http://a.com/y"):
+        waited = time.monotonic() - started
+    assert 0.09 <= waited < 1.0
+
+
+@pytest.mark.asyncio
+async def test_disabled_scheduler_admits_everything_untracked(scheduler, monkeypatch):
+    monkeypatch.setattr(politeness_module.settings, "POLITENESS_ENABLED", False)
+    async with scheduler.slot("http://a.com/"), scheduler.slot("http://a.com/"):
+        pass
+    assert scheduler._domains == {}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_leaves_the_queue(scheduler):
+    log: list[str] = []
+    hold = asyncio.Event()
+    holder = asyncio.create_task(_fetch(scheduler, "http://a.com/", log, "h", hold))
+    await asyncio.sleep(0)
+    first = asyncio.create_task(_fetch(scheduler, "http://a.com/", log, "w1"))
+    second = asyncio.create_task(_fetch(scheduler, "http://a.com/", log, "w2"))
+    lone = asyncio.create_task(_fetch(scheduler, "http://a.com/", log, "z1"))
+    await asyncio.sleep(0)
+
+    first.cancel()
+    lone.cancel()
+    for task in (first, lone):
+        with pytest.raises(asyncio.CancelledError):
+            await task
+    assert list(scheduler._domains["a.com"].waiters) == ["w"]
+    assert len(scheduler._domains["a.com"].waiters["w"]) == 1
+
+    hold.set()
+    await asyncio.gather(holder, second)
+    assert log == ["h", "w2"]
+    assert scheduler._domains["a.com"].active == 0
+
+
+@pytest.mark.asyncio
+async def test_waiter_cancelled_as_it_is_admitted_gives_the_slot_back(scheduler):
+    log: list[str] = []
+    held = scheduler.slot("http://a.com/")
+    await held.__aenter__()
+    waiter = asyncio.create_task(_fetch(scheduler, "http://a.com/", log, "w"))
+    await asyncio.sleep(0)
+
+    await held.__aexit__(None, None, None)  # the release admits the waiter...
+    waiter.cancel()  # ...which is cancelled before it runs
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    assert log == []
+    assert scheduler._domains["a.com"].active == 0
+
+
+@pytest.mark.asyncio
+async def test_waiter_cancelled_before_dispatch_is_skipped(scheduler):
+    log: list[str] = []
+    held = scheduler.slot("http://a.com/")
+    await held.__aenter__()
+    cancelled = asyncio.create_task(_fetch(scheduler, "http://a.com/", log, "c"))
+    admitted = asyncio.create_task(_fetch(scheduler, "http://a.com/", log, "n"))
+    await asyncio.sleep(0)
+
+    cancelled.cancel()  # its future is cancelled, but the task has not run its handler yet
+    await held.__aexit__(None, None, None)
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+    await admitted
+    assert log == ["n"]
+
+
+@pytest.mark.asyncio
+async def test_idle_domains_are_swept_when_the_table_is_full(scheduler):
+    with patch.object(politeness_module, "_SWEEP_AT_DOMAINS", 2):
+        async with scheduler.slot("http://a.com/"):
+            pass
+        async with scheduler.slot("http://b.com/"), scheduler.slot("http://c.com/"):
+            assert set(scheduler._domains) == {"b.com", "c.com"}
@@ -0,0 +1,120 @@
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import fakeredis
+import pytest
+
+from src.reader.read_cache import ReadCache
+
+
+def _local_cache() -> ReadCache:
+    cache = ReadCache()
+    cache.redis_client = None
+
+    return cache
+
+
+def _redis_cache() -> ReadCache:
+    cache = ReadCache()
+    cache.redis_client = fakeredis.FakeAsyncRedis(decode_responses=True, protocol=2)
+
+    return cache
+
+
+def test_build_key_normalizes_url_and_keeps_mode():
+    assert ReadCache.build_key("HTTPS://Example.com/a?utm_source=x#top", "read:heavy=False") == (
+        "read:heavy=False|https://example.com/a"
+    )
+    assert ReadCache.build_key("https://example.com/a", "links") != ReadCache.build_key(
+        "https://example.com/a", "read"
+    )
+
+
+@pytest.mark.asyncio
+async def test_put_then_get_returns_fresh_entry_with_validators():
+    cache = _local_cache()
+    await cache.put("k", {"content": "c", "status": "success"}, {"etag": '"v1"'})
+
+    entry = await cache.get("k")
+    assert entry is not None
+    assert entry["result"]["content"] == "c"
+    assert entry["validators"] == {"etag": '"v1"'}
+    assert cache.is_fresh(entry)
+
+
+@pytest.mark.asyncio
+async def test_entry_goes_stale_after_fresh_ttl_and_touch_refreshes_it():
+    cache = _local_cache()
+    await cache.put("k", {"content": "c"})
+    entry = await cache.get("k")
+    assert entry is not None
+    with patch("src.reader.read_cache.settings.READ_CACHE_FRESH_TTL_SECONDS", 0):
+        assert not cache.is_fresh(entry)
+
+    entry["stored_at"] = time.time() - 1000
+    await cache.touch("k", entry)
+    refreshed = await cache.get("k")
+    assert refreshed is not None
+    assert cache.is_fresh(refreshed)
+
+
+@pytest.mark.asyncio
+async def test_local_entries_are_dropped_after_max_age():
+    cache = _local_cache()
+    await cache.put("k", {"content": "c"})
+    with patch("src.reader.read_cache.settings.READ_CACHE_MAX_AGE_SECONDS", 0):
+        assert await cache.get("k") is None
+    assert "k" not in cache._memory_store
+
+
+@pytest.mark.asyncio
+async def test_local_lru_evicts_least_recently_used():
+    cache = _local_cache()
+    with patch("src.reader.read_cache.settings.READ_CACHE_MAX_ENTRIES", 2):
+        await cache.put("a", {})
+        await cache.put("b", {})
+        await cache.get("a")
+        await cache.put("c", {})
+    assert list(cache._memory_store) == ["a", "c"]
+
+
+@pytest.mark.asyncio
+async def test_redis_entry_is_shared_and_restores_int_link_indices():
+    writer = _redis_cache()
+    await writer.put("k", {"content": "c", "links": {1: "https://a.com"}})
+
+    reader = ReadCache()
+    reader.redis_client = writer.redis_client
+    entry = await reader.get("k")
+    assert entry is not None
+    assert entry["result"]["links"] == {1: "https://a.com"}
+    assert "k" in reader._memory_store
+    assert await writer.redis_client.ttl("read_cache:k") > 0
+
+
+@pytest.mark.asyncio
+async def test_redis_miss_returns_none():
+    cache = _redis_cache()
+    assert await cache.get("absent") is None
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_degrade_to_local_only():
+    cache = ReadCache()
+    broken = MagicMock()
+    broken.get = AsyncMock(side_effect=ConnectionError("down"))
+    broken.setex = AsyncMock(side_effect=ConnectionError("down"))
+    cache.redis_client = broken
+
+    assert await cache.get("k") is None
+    await cache.put("k", {"content": "c"})
+    entry = await cache.get("k")
+    assert entry is not None
+    assert json.dumps(entry["result"]) == '{"content": "c"}'
+
+
+def test_init_survives_redis_client_construction_failure():
+    with patch("src.reader.read_cache.redis.from_url", side_effect=ValueError("bad dsn")):
+        cache = ReadCache()
+    assert cache.redis_client is None
@@ -0,0 +1,167 @@
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import fakeredis
+import pytest
+
+from src.reader.read_cache import ReadCache, read_cache
+from src.reader.read_chunker import ReadChunker, SnapshotStore, chunk_budget
+
+URL = "https://example.com/long"
+PARAGRAPHS = [f"Paragraph {n} " + "word " * 30 for n in range(10)]
+CONTENT = "\n\n".join(paragraph.strip() for paragraph in PARAGRAPHS)
+
+
+def _store() -> SnapshotStore:
+    store = SnapshotStore()
+    store.redis_client = None
+
+    return store
+
+
+def _result(content: str = CONTENT, **extra) -> dict:
+    return {"content": content, "status": "success", "mode": "2-trafilatura", "cache": "miss", **extra}
+
+
+async def _read_all(chunker: ReadChunker, budget: int, url: str = URL) -> list[dict]:
+    chunks = [await chunker.first(url, _result(), budget)]
+    while chunks[-1]["next_cursor"]:
+        chunks.append(await chunker.resume(url, chunks[-1]["next_cursor"], None))
+
+    return chunks
+
+
+def test_budget_is_the_tighter_of_chars_and_tokens():
+    assert chunk_budget(None, None) is None
+    assert chunk_budget(1000, None) == 1000
+    assert chunk_budget(None, 100) == 400
+    assert chunk_budget(1000, 100) == 400
+
+
+async def test_content_within_budget_is_returned_whole():
+    store = _store()
+    chunker = ReadChunker(store)
+
+    assert await chunker.first(URL, _result(), None) == _result()
+    result = await chunker.first(URL, _result(), len(CONTENT))
+    assert result["content"] == CONTENT
+    assert result["next_cursor"] is None
+    assert not store._memory_store
+
+
+async def test_chunks_split_on_paragraphs_and_reassemble_the_content():
+    chunks = await _read_all(ReadChunker(_store()), budget=500)
+
+    assert len(chunks) > 1
+    assert "".join(chunk["content"] for chunk in chunks) == CONTENT
+    assert all(chunk["content"].endswith("\n\n") for chunk in chunks[:-1])
+    assert all(len(chunk["content"]) <= 500 for chunk in chunks)
+    assert [chunk["offset"] for chunk in chunks[1:]] == [
+        chunk["offset"] + len(chunk["content"]) for chunk in chunks[:-1]
+    ]
+    assert {chunk["total_chars"] for chunk in chunks} == {len(CONTENT)}
+    assert chunks[0]["cache"] == "miss"
+    assert chunks[1]["cache"] == "hit"
+
+
+async def test_unbroken_text_falls_back_to_a_hard_cut():
+    chunker = ReadChunker(_store())
+    first = await chunker.first(URL, _result("x" * 250), 100)
+
+    assert first["content"] == "x" * 100
+    assert (await chunker.resume(URL, first["next_cursor"], None))["offset"] == 100
+
+
+async def test_each_chunk_carries_only_its_own_links():
+    content = "\n\n".join(f"See page [{n}] for part {n} of the guide." for n in range(1, 7))
+    links = {n: f"https://example.com/{n}" for n in range(1, 7)}
+    chunker = ReadChunker(_store())
+
+    first = await chunker.first(URL, _result(content, links=links), 90)
+    second = await chunker.resume(URL, first["next_cursor"], None)
+
+    assert first["links"] == {1: links[1], 2: links[2]}
+    assert second["links"] == {3: links[3], 4: links[4]}
+
+
+async def test_cursor_is_bound_to_its_url_and_rejects_garbage():
+    chunker = ReadChunker(_store())
+    first = await chunker.first(URL, _result(), 500)
+
+    with pytest.raises(ValueError, match="expired"):
+        await chunker.resume("https://example.com/other", first["next_cursor"], None)
+    with pytest.raises(ValueError, match="malformed"):
+        await chunker.resume(URL, "not-a-cursor", None)
+
+    chunker.snapshots = _store()
+    with pytest.raises(ValueError, match="expired"):
+        await chunker.resume(URL, first["next_cursor"], None)
+
+
+async def test_failed_reads_are_never_chunked():
+    failure = {"content": "", "status": "error", "reason": "all_tiers_failed"}
+
+    assert await ReadChunker(_store()).first(URL, failure, 10) == failure
+
+
+async def test_paging_a_long_document_leaves_cached_reads_alone():
+    key = ReadCache.build_key("https://example.com/other", "read:heavy=False")
+    await read_cache.put(key, _result("other page"))
+
+    with patch("src.reader.read_cache.settings.READ_CACHE_MAX_ENTRIES", 1):
+        for n in range(3):
+            await _read_all(ReadChunker(_store()), budget=100, url=f"{URL}/{n}")
+
+    assert list(read_cache._memory_store) == [key]
+
+
+async def test_snapshots_are_bounded_by_characters_keeping_the_newest():
+    store = _store()
+    with patch("src.reader.read_chunker.settings.READ_CHUNK_SNAPSHOT_MAX_CHARS", 10):
+        await store.put("a", _result("x" * 6))
+        await store.put("b", _result("y" * 4))
+        await store.get("a")
+        await store.put("c", _result("z" * 4))
+        assert list(store._memory_store) == ["a", "c"]
+
+        await store.put("c", _result("z" * 30))
+        assert list(store._memory_store) == ["c"]
+    assert store._chars == 30
+
+
+async def test_snapshots_expire_after_their_ttl():
+    store = _store()
+    await store.put("k", _result())
+    with patch("src.reader.read_chunker.settings.READ_CHUNK_SNAPSHOT_TTL_SECONDS", 0):
+        assert await store.get("k") is None
+    assert store._chars == 0
+
+
+async def test_snapshot_in_redis_serves_another_worker():
+    writer = SnapshotStore()
+    writer.redis_client = fakeredis.FakeAsyncRedis(decode_responses=True, protocol=2)
+    await writer.put("k", _result(links={1: "https://a.com"}))
+
+    reader = _store()
+    reader.redis_client = writer.redis_client
+    assert (await reader.get("k"))["links"] == {1: "https://a.com"}
+    assert "k" in reader._memory_store
+    assert await reader.get("absent") is None
+    assert await writer.redis_client.ttl("read_chunks:k") > 0
+
+
+async def test_snapshot_redis_errors_degrade_to_local_only():
+    store = SnapshotStore()
+    broken = MagicMock()
+    broken.get = AsyncMock(side_effect=ConnectionError("down"))
+    broken.setex = AsyncMock(side_effect=ConnectionError("down"))
+    store.redis_client = broken
+
+    assert await store.get("k") is None
+    await store.put("k", _result())
+    assert json.dumps(await store.get("k")) == json.dumps(_result())
+
+
+def test_snapshot_store_survives_redis_client_construction_failure():
+    with patch("src.reader.read_chunker.redis.from_url", side_effect=ValueError("bad dsn")):
+        assert SnapshotStore().redis_client is None
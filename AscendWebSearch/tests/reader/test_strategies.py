@@ -1,27 +1,46 @@
-from typing import Any
+import asyncio
+import time
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from src.api.exceptions import ChallengeDetectedException
+from src.api.exceptions import ChallengeDetectedException, NonHtmlContentException
 from src.reader.strategies.beautifulsoup_strategy import BeautifulSoupStrategy
 from src.reader.strategies.crawlee_strategy import CrawleeStrategy
 from src.reader.strategies.curl_cffi_fetcher import fetch_with_curl_cffi
 from src.reader.strategies.playwright_strategy import PlaywrightStrategy
 from src.reader.strategies.trafilatura_strategy import TrafilaturaStrategy
+from src.validator.resource_policy import ResourcePolicy
 
 SAMPLE_HTML = "<html><body><p>Text</p><script>bad</script></body></html>"
 
 
 class _MockResponse:
-    def __init__(self, html: str = SAMPLE_HTML, status: int = 200) -> None:
+    def __init__(
+        self, html: str = SAMPLE_HTML, status: int = 200, content_type: str = "text/html; charset=utf-8"
+    ) -> None:
         self.status_code = status
         self.text = html
         self.url = "http://test.com"
+        self.headers = {"Content-Type": content_type}
+        self.encoding = "utf-8"
+        self.body = html.encode()
+        self.quit_now = asyncio.Event()
+        self.chunks_read = 0
 
     def raise_for_status(self):
         return None
 
+    async def aiter_content(self):
+        for start in range(0, len(self.body), 1024):
+            if self.quit_now.is_set():
+                return
+            self.chunks_read += 1
+            yield self.body[start : start + 1024]
+
+    async def aclose(self):
+        return None
+
 
 def _make_curl_session(response: _MockResponse) -> MagicMock:
     session = MagicMock()
@@ -45,7 +64,7 @@ def patch_cookies_none():
 async def test_curl_cffi_fetcher_returns_html(patch_cookies_none):
     session = _make_curl_session(_MockResponse(SAMPLE_HTML))
     with patch(
-        "src.reader.strategies.curl_cffi_fetcher.requests.AsyncSession",
+        "src.runtime.curl_session_pool.requests.AsyncSession",
         return_value=session,
     ):
         result = await fetch_with_curl_cffi("http://test.com", lambda: "ua", "TestStrat")
@@ -61,7 +80,7 @@ async def test_curl_cffi_fetcher_uses_cached_cookies():
             new=AsyncMock(return_value={"cookies": {"cf_clearance": "x"}, "user_agent": "cached-ua"}),
         ),
         patch(
-            "src.reader.strategies.curl_cffi_fetcher.requests.AsyncSession",
+            "src.runtime.curl_session_pool.requests.AsyncSession",
             return_value=session,
         ),
     ):
@@ -77,7 +96,7 @@ async def test_curl_cffi_fetcher_raises_on_login_wall(patch_cookies_none):
     session = _make_curl_session(_MockResponse(SAMPLE_HTML))
     with (
         patch(
-            "src.reader.strategies.curl_cffi_fetcher.requests.AsyncSession",
+            "src.runtime.curl_session_pool.requests.AsyncSession",
             return_value=session,
         ),
         patch(
@@ -95,7 +114,7 @@ async def test_curl_cffi_fetcher_raises_on_waf_block(patch_cookies_none):
     session = _make_curl_session(_MockResponse(SAMPLE_HTML))
     with (
         patch(
-            "src.reader.strategies.curl_cffi_fetcher.requests.AsyncSession",
+            "src.runtime.curl_session_pool.requests.AsyncSession",
             return_value=session,
         ),
         patch(
@@ -115,19 +134,103 @@ async def test_curl_cffi_fetcher_raises_on_waf_block(patch_cookies_none):
 @pytest.mark.asyncio
 async def test_curl_cffi_fetcher_returns_empty_on_transport_error(patch_cookies_none):
     with patch(
-        "src.reader.strategies.curl_cffi_fetcher.requests.AsyncSession",
+        "src.runtime.curl_session_pool.requests.AsyncSession",
         side_effect=RuntimeError("net"),
     ):
         result = await fetch_with_curl_cffi("http://test.com", lambda: "ua", "TestStrat")
     assert result == ""
 
 
+@pytest.mark.asyncio
+async def test_curl_cffi_fetcher_routes_json_with_validators(patch_cookies_none):
+    from src.reader.strategies.curl_cffi_fetcher import response_validators_ctx
+
+    response = _MockResponse('{"items": []}', content_type="application/json")
+    response.headers["ETag"] = '"v2"'
+    captured: dict[str, str] = {}
+    token = response_validators_ctx.set(captured)
+    try:
+        with patch(
+            "src.runtime.curl_session_pool.requests.AsyncSession", return_value=_make_curl_session(response)
+        ):
+            with pytest.raises(NonHtmlContentException) as exc:
+                await fetch_with_curl_cffi("http://test.com/api", lambda: "ua", "TestStrat")
+    finally:
+        response_validators_ctx.reset(token)
+    assert (exc.value.kind, exc.value.body, exc.value.encoding) == ("json", b'{"items": []}', "utf-8")
+    assert captured == {"etag": '"v2"'}
+
+
+@pytest.mark.asyncio
+async def test_curl_cffi_fetcher_abandons_binary_after_sniffing(patch_cookies_none):
+    response = _MockResponse(content_type="text/html")
+    response.body = b"\x89PNG\r\n\x1a\n" + bytes(10_000)
+    with patch(
+        "src.runtime.curl_session_pool.requests.AsyncSession", return_value=_make_curl_session(response)
+    ):
+        with pytest.raises(NonHtmlContentException) as exc:
+            await fetch_with_curl_cffi("http://test.com/logo", lambda: "ua", "TestStrat")
+    assert exc.value.kind == "binary"
+    assert response.chunks_read == 1
+    assert response.quit_now.is_set()
+
+
+@pytest.mark.asyncio
+async def test_curl_cffi_fetcher_enforces_byte_cap(patch_cookies_none, monkeypatch):
+    from src.reader.strategies.curl_cffi_fetcher import settings
+
+    monkeypatch.setattr(settings, "FETCH_MAX_BYTES", 3000)
+    streamed = _MockResponse("<p>" + "x" * 10_000)
+    declared = _MockResponse(SAMPLE_HTML)
+    declared.headers["Content-Length"] = "5000"
+    for origin, response in (("http://a.test", streamed), ("http://b.test", declared)):
+        with patch(
+            "src.runtime.curl_session_pool.requests.AsyncSession", return_value=_make_curl_session(response)
+        ):
+            with pytest.raises(NonHtmlContentException) as exc:
+                await fetch_with_curl_cffi(f"{origin}/huge", lambda: "ua", "TestStrat")
+        assert exc.value.kind == "too_large"
+    assert streamed.chunks_read == 3
+    assert declared.chunks_read == 0
+
+
+@pytest.mark.asyncio
+async def test_curl_cffi_fetcher_honours_retry_after_on_429(patch_cookies_none):
+    from src.reader.politeness import politeness_scheduler
+
+    response = _MockResponse("Too many requests", status=429)
+    response.headers["Retry-After"] = "5"
+    with patch(
+        "src.runtime.curl_session_pool.requests.AsyncSession",
+        return_value=_make_curl_session(response),
+    ):
+        await fetch_with_curl_cffi("http://www.test.com/a", lambda: "ua", "TestStrat")
+    assert politeness_scheduler._domains["test.com"].paused_until > time.monotonic() + 4
+
+
+@pytest.mark.asyncio
+async def test_probe_content_type_reads_head_and_ignores_errors(patch_cookies_none):
+    from src.reader.strategies.curl_cffi_fetcher import probe_content_type
+
+    session = _make_curl_session(_MockResponse(content_type="application/pdf"))
+    session.head = AsyncMock(return_value=_MockResponse(content_type="application/pdf"))
+    with patch("src.runtime.curl_session_pool.requests.AsyncSession", return_value=session):
+        assert await probe_content_type("http://test.com/a.pdf", lambda: "ua") == "application/pdf"
+
+    session.head = AsyncMock(return_value=_MockResponse(status=405))
+    with patch("src.runtime.curl_session_pool.requests.AsyncSession", return_value=session):
+        assert await probe_content_type("http://test.com/a.pdf", lambda: "ua") == ""
+
+    with patch("src.runtime.curl_session_pool.requests.AsyncSession", side_effect=RuntimeError("net")):
+        assert await probe_content_type("http://test.com/a.pdf", lambda: "ua") == ""
+
+
 @pytest.mark.asyncio
 async def test_beautifulsoup_extract_strips_noise(patch_cookies_none):
     session = _make_curl_session(_MockResponse(SAMPLE_HTML))
     strategy = BeautifulSoupStrategy(lambda: "ua")
     with patch(
-        "src.reader.strategies.curl_cffi_fetcher.requests.AsyncSession",
+        "src.runtime.curl_session_pool.requests.AsyncSession",
         return_value=session,
     ):
         result = await strategy.extract("http://test.com")
@@ -154,7 +257,7 @@ async def test_trafilatura_extract(patch_cookies_none):
             new=AsyncMock(return_value=SAMPLE_HTML),
         ),
         patch(
-            "src.reader.strategies.trafilatura_strategy.trafilatura.extract",
+            "src.reader.html_utils.trafilatura.extract",
             return_value="Extracted",
         ),
     ):
@@ -182,7 +285,7 @@ async def test_trafilatura_extract_returns_empty_when_trafilatura_returns_none(p
             new=AsyncMock(return_value=SAMPLE_HTML),
         ),
         patch(
-            "src.reader.strategies.trafilatura_strategy.trafilatura.extract",
+            "src.reader.html_utils.trafilatura.extract",
             return_value=None,
         ),
     ):
@@ -194,14 +297,26 @@ async def test_trafilatura_extract_returns_empty_when_trafilatura_returns_none(p
 # Playwright strategy: use the singleton browser_pool which the conftest already mocked.
 
 
-def _build_playwright_page_mock(html: str, current_url: str = "http://test.com") -> MagicMock:
+def _build_playwright_page_mock(
+    html: str, current_url: str = "http://test.com", events: list[tuple[str, str]] | None = None
+) -> MagicMock:
+    """`events` are the (kind, value) pairs the in-page observer reports during navigation."""
     page = MagicMock()
     page.url = current_url
     page.content = AsyncMock(return_value=html)
-    page.goto = AsyncMock(return_value=MagicMock(status=200))
-    page.wait_for_load_state = AsyncMock(side_effect=Exception("nope"))
     page.wait_for_timeout = AsyncMock()
     page.route = AsyncMock()
+    page.route_web_socket = AsyncMock()
+    page.add_init_script = AsyncMock()
+    page.expose_binding = AsyncMock()
+
+    async def goto(url, **kwargs):
+        on_event = page.expose_binding.await_args.args[1]
+        for kind, value in [("ready", "quiet")] if events is None else events:
+            await on_event({"page": page}, {"kind": kind, "value": value, "url": url})
+        return MagicMock(status=200)
+
+    page.goto = AsyncMock(side_effect=goto)
 
     return page
 
@@ -230,11 +345,11 @@ async def test_playwright_extract_happy_path(monkeypatch):
             return_value=MagicMock(apply_stealth_async=AsyncMock()),
         ),
         patch(
-            "src.reader.strategies.playwright_strategy.trafilatura.extract",
+            "src.reader.html_utils.trafilatura.extract",
             return_value="Extracted",
         ),
     ):
-        strategy = PlaywrightStrategy(lambda: "ua", MagicMock())
+        strategy = PlaywrightStrategy(lambda: "ua", ResourcePolicy(MagicMock()))
         result = await strategy.extract("http://test.com")
     assert result == "Extracted"
 
@@ -249,11 +364,11 @@ async def test_playwright_extract_returns_empty_when_trafilatura_none(monkeypatc
             return_value=MagicMock(apply_stealth_async=AsyncMock()),
         ),
         patch(
-            "src.reader.strategies.playwright_strategy.trafilatura.extract",
+            "src.reader.html_utils.trafilatura.extract",
             return_value=None,
         ),
     ):
-        strategy = PlaywrightStrategy(lambda: "ua", MagicMock())
+        strategy = PlaywrightStrategy(lambda: "ua", ResourcePolicy(MagicMock()))
         result = await strategy.extract("http://test.com")
     assert result == ""
 
@@ -266,121 +381,135 @@ async def test_playwright_raises_challenge_on_login_redirect_url(monkeypatch):
         "src.reader.strategies.playwright_strategy.Stealth",
         return_value=MagicMock(apply_stealth_async=AsyncMock()),
     ):
-        strategy = PlaywrightStrategy(lambda: "ua", MagicMock())
+        strategy = PlaywrightStrategy(lambda: "ua", ResourcePolicy(MagicMock()))
         with pytest.raises(ChallengeDetectedException) as exc:
             await strategy.get_html("http://test.com?login=1")
     assert exc.value.intervention_type == "login"
 
 
 @pytest.mark.asyncio
-async def test_playwright_raises_challenge_on_login_wall_during_poll(monkeypatch):
-    page = _build_playwright_page_mock("<html></html>")
+async def test_playwright_raises_login_on_title_event(monkeypatch):
+    page = _build_playwright_page_mock("<html></html>", events=[("title", "Sign In | Indeed Accounts")])
     _wire_browser_pool(monkeypatch, page)
-    with (
-        patch(
-            "src.reader.strategies.playwright_strategy.Stealth",
-            return_value=MagicMock(apply_stealth_async=AsyncMock()),
-        ),
-        patch(
-            "src.reader.strategies.playwright_strategy.ChallengeDetector.is_login_required",
-            return_value=True,
-        ),
+    with patch(
+        "src.reader.strategies.playwright_strategy.Stealth",
+        return_value=MagicMock(apply_stealth_async=AsyncMock()),
     ):
-        strategy = PlaywrightStrategy(lambda: "ua", MagicMock())
+        strategy = PlaywrightStrategy(lambda: "ua", ResourcePolicy(MagicMock()))
         with pytest.raises(ChallengeDetectedException) as exc:
             await strategy.get_html("http://test.com")
     assert exc.value.intervention_type == "login"
+    page.content.assert_not_awaited()
 
 
 @pytest.mark.asyncio
-async def test_playwright_raises_challenge_on_blocked_during_poll(monkeypatch):
-    page = _build_playwright_page_mock("<html></html>")
+async def test_playwright_raises_captcha_on_confirmed_marker_event(monkeypatch):
+    page = _build_playwright_page_mock(
+        "<html><title>Just a moment...</title></html>",
+        events=[("title", "Just a moment..."), ("marker", "Just a moment...")],
+    )
     _wire_browser_pool(monkeypatch, page)
-    with (
-        patch(
-            "src.reader.strategies.playwright_strategy.Stealth",
-            return_value=MagicMock(apply_stealth_async=AsyncMock()),
-        ),
-        patch(
-            "src.reader.strategies.playwright_strategy.ChallengeDetector.is_login_required",
-            return_value=False,
-        ),
-        patch(
-            "src.reader.strategies.playwright_strategy.ChallengeDetector.is_blocked",
-            return_value=True,
-        ),
+    with patch(
+        "src.reader.strategies.playwright_strategy.Stealth",
+        return_value=MagicMock(apply_stealth_async=AsyncMock()),
     ):
-        strategy = PlaywrightStrategy(lambda: "ua", MagicMock())
+        strategy = PlaywrightStrategy(lambda: "ua", ResourcePolicy(MagicMock()))
         with pytest.raises(ChallengeDetectedException) as exc:
             await strategy.get_html("http://test.com")
     assert exc.value.intervention_type == "captcha"
+    page.content.assert_awaited_once()
 
 
 @pytest.mark.asyncio
-async def test_playwright_raises_late_login_wall(monkeypatch):
-    page = _build_playwright_page_mock("<html></html>")
-    page.wait_for_load_state = AsyncMock(return_value=None)
+async def test_playwright_keeps_waiting_when_detector_rejects_marker(monkeypatch):
+    # A marker quoted in the middle of a long article is outside the detector's windows.
+    filler = "<p>" + "a" * 50_000 + "</p>"
+    html = f"<html><body>{filler}Just a moment...{filler}</body></html>"
+    page = _build_playwright_page_mock(html, events=[("marker", "Just a moment..."), ("ready", "quiet")])
     _wire_browser_pool(monkeypatch, page)
+    with patch(
+        "src.reader.strategies.playwright_strategy.Stealth",
+        return_value=MagicMock(apply_stealth_async=AsyncMock()),
+    ):
+        strategy = PlaywrightStrategy(lambda: "ua", ResourcePolicy(MagicMock()))
+        assert await strategy.get_html("http://test.com") == html
+    assert page.content.await_count == 2
 
-    # First poll round clean, late-stage check positive
-    call_count = [0]
-
-    def is_login(_url, _html):
-        call_count[0] += 1
-        return call_count[0] > 1  # only the late-stage call returns True
 
+@pytest.mark.asyncio
+async def test_playwright_extracts_what_rendered_when_page_never_settles(monkeypatch):
+    page = _build_playwright_page_mock("<html><body>partial</body></html>", events=[])
+    _wire_browser_pool(monkeypatch, page)
     with (
         patch(
             "src.reader.strategies.playwright_strategy.Stealth",
             return_value=MagicMock(apply_stealth_async=AsyncMock()),
         ),
-        patch(
-            "src.reader.strategies.playwright_strategy.ChallengeDetector.is_login_required",
-            side_effect=is_login,
-        ),
+        patch("src.reader.strategies.playwright_strategy.settings.EXTRACT_TIMEOUT", 0.01),
     ):
-        strategy = PlaywrightStrategy(lambda: "ua", MagicMock())
+        strategy = PlaywrightStrategy(lambda: "ua", ResourcePolicy(MagicMock()))
+        assert await strategy.get_html("http://test.com") == "<html><body>partial</body></html>"
+    page.content.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_playwright_raises_late_login_wall(monkeypatch):
+    page = _build_playwright_page_mock("<html><head><title>Log In | Example</title></head></html>")
+    _wire_browser_pool(monkeypatch, page)
+    with patch(
+        "src.reader.strategies.playwright_strategy.Stealth",
+        return_value=MagicMock(apply_stealth_async=AsyncMock()),
+    ):
+        strategy = PlaywrightStrategy(lambda: "ua", ResourcePolicy(MagicMock()))
         with pytest.raises(ChallengeDetectedException) as exc:
             await strategy.get_html("http://test.com")
     assert exc.value.intervention_type == "login"
 
 
+@pytest.mark.asyncio
+async def test_playwright_raises_late_block(monkeypatch):
+    page = _build_playwright_page_mock("<html><body><div class='cf-turnstile'></div></body></html>")
+    _wire_browser_pool(monkeypatch, page)
+    with patch(
+        "src.reader.strategies.playwright_strategy.Stealth",
+        return_value=MagicMock(apply_stealth_async=AsyncMock()),
+    ):
+        strategy = PlaywrightStrategy(lambda: "ua", ResourcePolicy(MagicMock()))
+        with pytest.raises(ChallengeDetectedException) as exc:
+            await strategy.get_html("http://test.com")
+    assert exc.value.intervention_type == "captcha"
+
+
 # Crawlee strategy
 
 
 @pytest.mark.asyncio
 async def test_crawlee_strategy_extract_returns_trafilatura_result():
     with (
-        patch("src.reader.strategies.crawlee_strategy.AdaptivePlaywrightCrawler") as mock_crawler_cls,
         patch(
-            "src.reader.strategies.crawlee_strategy.trafilatura.extract",
+            "src.reader.strategies.crawlee_strategy.crawlee_service.fetch",
+            AsyncMock(return_value="<html><p>Crawlee</p></html>"),
+        ) as fetch,
+        patch(
+            "src.reader.html_utils.trafilatura.extract",
             return_value="Crawlee",
         ),
     ):
-        mock_crawler = MagicMock()
-        mock_crawler.run = AsyncMock()
-        mock_crawler.router.default_handler = lambda f: f
-        mock_crawler.pre_navigation_hook = lambda f: f
-        mock_crawler_cls.with_beautifulsoup_static_parser.return_value = mock_crawler
         strategy = CrawleeStrategy(MagicMock())
         result = await strategy.extract("http://test.com")
     assert result == "Crawlee"
+    fetch.assert_awaited_once_with("http://test.com")
 
 
 @pytest.mark.asyncio
 async def test_crawlee_strategy_raises_challenge_on_login_wall():
     with (
-        patch("src.reader.strategies.crawlee_strategy.AdaptivePlaywrightCrawler") as mock_crawler_cls,
+        patch("src.reader.strategies.crawlee_strategy.crawlee_service.fetch", AsyncMock(return_value="")),
         patch(
             "src.reader.strategies.crawlee_strategy.ChallengeDetector.is_login_required",
             return_value=True,
         ),
     ):
-        mock_crawler = MagicMock()
-        mock_crawler.run = AsyncMock()
-        mock_crawler.router.default_handler = lambda f: f
-        mock_crawler.pre_navigation_hook = lambda f: f
-        mock_crawler_cls.with_beautifulsoup_static_parser.return_value = mock_crawler
         strategy = CrawleeStrategy(MagicMock())
         with pytest.raises(ChallengeDetectedException) as exc:
             await strategy.get_html("http://test.com")
@@ -390,7 +519,7 @@ async def test_crawlee_strategy_raises_challenge_on_login_wall():
 @pytest.mark.asyncio
 async def test_crawlee_strategy_raises_challenge_on_waf_block():
     with (
-        patch("src.reader.strategies.crawlee_strategy.AdaptivePlaywrightCrawler") as mock_crawler_cls,
+        patch("src.reader.strategies.crawlee_strategy.crawlee_service.fetch", AsyncMock(return_value="")),
         patch(
             "src.reader.strategies.crawlee_strategy.ChallengeDetector.is_login_required",
             return_value=False,
@@ -400,11 +529,6 @@ async def test_crawlee_strategy_raises_challenge_on_waf_block():
             return_value=True,
         ),
     ):
-        mock_crawler = MagicMock()
-        mock_crawler.run = AsyncMock()
-        mock_crawler.router.default_handler = lambda f: f
-        mock_crawler.pre_navigation_hook = lambda f: f
-        mock_crawler_cls.with_beautifulsoup_static_parser.return_value = mock_crawler
         strategy = CrawleeStrategy(MagicMock())
         with pytest.raises(ChallengeDetectedException) as exc:
             await strategy.get_html("http://test.com")
@@ -412,108 +536,100 @@ async def test_crawlee_strategy_raises_challenge_on_waf_block():
 
 
 @pytest.mark.asyncio
-async def test_crawlee_handle_request_playwright_context():
-    from crawlee.crawlers import PlaywrightCrawlingContext
-
-    strategy = CrawleeStrategy(MagicMock())
-    context = MagicMock(spec=PlaywrightCrawlingContext)
-    context.page = MagicMock()
-    context.page.content = AsyncMock(return_value="<html>from playwright</html>")
-    result_container = {"html": ""}
-    await strategy._handle_crawlee_request(context, result_container)
-    assert "playwright" in result_container["html"]
-
+async def test_crawlee_strategy_registers_resource_policy_page_hooks():
+    url_validator = MagicMock()
+    url_validator.route_handler = AsyncMock()
+    resource_policy = ResourcePolicy(url_validator)
+    page = MagicMock()
+    page.route = AsyncMock()
+    page.route_web_socket = AsyncMock()
+    with patch("src.reader.strategies.crawlee_strategy.crawlee_service.configure_pages") as configure:
+        CrawleeStrategy(resource_policy)
 
-@pytest.mark.asyncio
-async def test_crawlee_handle_request_soup_context():
-    strategy = CrawleeStrategy(MagicMock())
-    context = MagicMock(spec=[])
-    context.soup = "<html>soup</html>"
-    result_container = {"html": ""}
-    await strategy._handle_crawlee_request(context, result_container)
-    assert "soup" in result_container["html"]
+    page_setup, page_done = configure.call_args.args
+    await page_setup(page)
+    page.route.assert_awaited_once()
+    page.route_web_socket.assert_awaited_once()
+    assert page_done == resource_policy.record
 
 
 @pytest.mark.asyncio
-async def test_crawlee_handle_request_response_context():
-    strategy = CrawleeStrategy(MagicMock())
-    context = MagicMock(spec=[])
-    response = MagicMock()
-    response.text = "<html>response</html>"
-    context.response = response
-    result_container = {"html": ""}
-    await strategy._handle_crawlee_request(context, result_container)
-    assert "response" in result_container["html"]
+async def test_crawlee_extract_empty_when_trafilatura_none():
+    with (
+        patch("src.reader.strategies.crawlee_strategy.crawlee_service.fetch", AsyncMock(return_value="")),
+        patch(
+            "src.reader.html_utils.trafilatura.extract",
+            return_value=None,
+        ),
+    ):
+        strategy = CrawleeStrategy(MagicMock())
+        result = await strategy.extract("http://test.com")
+    assert result == ""
 
 
 @pytest.mark.asyncio
-async def test_crawlee_handle_request_unknown_context_no_op():
-    strategy = CrawleeStrategy(MagicMock())
-    context = MagicMock(spec=[])  # no soup, no response, not PlaywrightCrawlingContext
-    result_container = {"html": ""}
-    await strategy._handle_crawlee_request(context, result_container)
-    assert result_container["html"] == ""
+async def test_curl_cffi_fetcher_captures_validators_when_requested(patch_cookies_none):
+    from src.reader.strategies.curl_cffi_fetcher import response_validators_ctx
+
+    response = _MockResponse(SAMPLE_HTML)
+    response.headers.update({"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"})
+    session = _make_curl_session(response)
+    captured: dict[str, str] = {}
+    token = response_validators_ctx.set(captured)
+    try:
+        with patch("src.runtime.curl_session_pool.requests.AsyncSession", return_value=session):
+            await fetch_with_curl_cffi("http://test.com", lambda: "ua", "TestStrat")
+    finally:
+        response_validators_ctx.reset(token)
+    assert captured == {"etag": '"v1"', "last_modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
 
 
 @pytest.mark.asyncio
-async def test_crawlee_decorated_handlers_executed():
-    """The crawlee strategy registers two decorated inner functions
-    (request_handler and enable_adblock). Capture them and invoke directly so
-    their bodies are covered."""
-    captured: dict[str, Any] = {}
-
-    def capture_default(fn):
-        captured["default"] = fn
+async def test_revalidate_sends_conditional_headers_and_detects_304(patch_cookies_none):
+    from src.reader.strategies.curl_cffi_fetcher import revalidate_with_curl_cffi
 
-        return fn
+    session = _make_curl_session(_MockResponse("", status=304))
+    with patch("src.runtime.curl_session_pool.requests.AsyncSession", return_value=session):
+        not_modified = await revalidate_with_curl_cffi(
+            "http://test.com", lambda: "ua", {"etag": '"v1"', "last_modified": "yesterday"}
+        )
+    assert not_modified is True
+    headers = session.get.await_args.kwargs["headers"]
+    assert headers["If-None-Match"] == '"v1"'
+    assert headers["If-Modified-Since"] == "yesterday"
 
-    def capture_pre_nav(fn):
-        captured["pre_nav"] = fn
 
-        return fn
-
-    with patch("src.reader.strategies.crawlee_strategy.AdaptivePlaywrightCrawler") as mock_crawler_cls:
-        mock_crawler = MagicMock()
-        mock_crawler.run = AsyncMock()
-        mock_crawler.router.default_handler = capture_default
-        mock_crawler.pre_navigation_hook = capture_pre_nav
-        mock_crawler_cls.with_beautifulsoup_static_parser.return_value = mock_crawler
+@pytest.mark.asyncio
+async def test_revalidate_returns_false_on_200_or_error(patch_cookies_none):
+    from src.reader.strategies.curl_cffi_fetcher import revalidate_with_curl_cffi
 
-        url_validator = MagicMock()
-        url_validator.route_handler = AsyncMock()
-        strategy = CrawleeStrategy(url_validator)
-        await strategy.get_html("http://test.com")
+    session = _make_curl_session(_MockResponse(SAMPLE_HTML, status=200))
+    with patch("src.runtime.curl_session_pool.requests.AsyncSession", return_value=session):
+        assert await revalidate_with_curl_cffi("http://test.com", lambda: "ua", {"etag": '"v1"'}) is False
 
-    # Now invoke the captured handlers directly to cover their bodies.
-    context_playwright = MagicMock()
-    context_playwright.page = MagicMock()
-    context_playwright.page.content = AsyncMock(return_value="<html>x</html>")
-    context_playwright.page.route = AsyncMock()
+    with patch("src.runtime.curl_session_pool.requests.AsyncSession", side_effect=RuntimeError("boom")):
+        assert await revalidate_with_curl_cffi("http://test.com", lambda: "ua", {"etag": '"v1"'}) is False
 
-    await captured["pre_nav"](context_playwright)
-    context_playwright.page.route.assert_awaited_once()
 
-    container_handler = captured["default"]
-    # The default handler routes through _handle_crawlee_request which we already cover.
-    soup_context = MagicMock(spec=[])
-    soup_context.soup = "<html>handled</html>"
-    await container_handler(soup_context)
+@pytest.mark.asyncio
+async def test_curl_cffi_fetcher_connects_to_pinned_addresses(patch_cookies_none):
+    from curl_cffi import CurlOpt
 
+    from src.validator.dns_resolver import pinned_addresses_ctx
 
-@pytest.mark.asyncio
-async def test_crawlee_extract_empty_when_trafilatura_none():
-    with (
-        patch("src.reader.strategies.crawlee_strategy.AdaptivePlaywrightCrawler") as mock_crawler_cls,
-        patch(
-            "src.reader.strategies.crawlee_strategy.trafilatura.extract",
-            return_value=None,
-        ),
-    ):
-        mock_crawler = MagicMock()
-        mock_crawler.run = AsyncMock()
-        mock_crawler.router.default_handler = lambda f: f
-        mock_crawler.pre_navigation_hook = lambda f: f
-        mock_crawler_cls.with_beautifulsoup_static_parser.return_value = mock_crawler
-        strategy = CrawleeStrategy(MagicMock())
-        result = await strategy.extract("http://test.com")
-    assert result == ""
+    session = _make_curl_session(_MockResponse(SAMPLE_HTML))
+    token = pinned_addresses_ctx.set({"test.com": ("2001:db8::1", "93.184.216.34")})
+    try:
+        with patch(
+            "src.runtime.curl_session_pool.requests.AsyncSession", return_value=session
+        ) as session_cls:
+            await fetch_with_curl_cffi("http://test.com:8080/page", lambda: "ua", "TestStrat")
+            await fetch_with_curl_cffi("http://other.com/", lambda: "ua", "TestStrat")
+    finally:
+        pinned_addresses_ctx.reset(token)
+
+    pinned, unpinned = (call.kwargs["curl_options"] for call in session_cls.call_args_list)
+    assert pinned == {
+        CurlOpt.RESOLVE: [f"test.com:{port}:[2001:db8::1],93.184.216.34" for port in (80, 443, 8080)]
+    }
+    assert unpinned == {}
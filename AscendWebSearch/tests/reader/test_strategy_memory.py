@@ -0,0 +1,139 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import fakeredis
+import pytest
+
+from src.reader.strategy_memory import StrategyMemory
+
+
+def _local_memory() -> StrategyMemory:
+    memory = StrategyMemory()
+    memory.redis_client = None
+
+    return memory
+
+
+def _redis_memory() -> StrategyMemory:
+    memory = StrategyMemory()
+    # protocol=2: fakeredis' RESP3 HGETALL path ignores decode_responses and returns bytes.
+    memory.redis_client = fakeredis.FakeAsyncRedis(decode_responses=True, protocol=2)
+
+    return memory
+
+
+@pytest.mark.asyncio
+async def test_local_records_success_and_failures_per_registrable_domain():
+    memory = _local_memory()
+    await memory.record_failure("https://www.example.co.uk/a", "1-beautifulsoup", 4.0)
+    await memory.record_failure("https://api.example.co.uk/b", "1-beautifulsoup", 2.0)
+    await memory.record_success("https://example.co.uk/c", "4-playwright_stealth")
+
+    profile = await memory.get_profile("https://blog.example.co.uk/")
+    assert profile is not None
+    assert profile["last_success"] == "4-playwright_stealth"
+    assert profile["failures"] == {"1-beautifulsoup": 2}
+    assert memory.mean_failure_seconds(profile, "1-beautifulsoup") == 3.0
+    assert await memory.get_profile("https://other.co.uk/") is None
+
+
+@pytest.mark.asyncio
+async def test_success_clears_the_winning_tiers_failure_history():
+    memory = _local_memory()
+    await memory.record_failure("https://example.com", "2-trafilatura", 1.0)
+    await memory.record_success("https://example.com", "2-trafilatura")
+
+    profile = await memory.get_profile("https://example.com")
+    assert profile is not None
+    assert "2-trafilatura" not in profile["failures"]
+    assert memory.mean_failure_seconds(profile, "2-trafilatura") == 0.0
+
+
+@pytest.mark.asyncio
+async def test_local_entries_expire_after_ttl():
+    memory = _local_memory()
+    with patch("src.reader.strategy_memory.settings.STRATEGY_MEMORY_TTL_SECONDS", -1):
+        await memory.record_success("https://example.com", "2-trafilatura")
+    assert await memory.get_profile("https://example.com") is None
+    assert await memory.snapshot() == {}
+
+
+@pytest.mark.asyncio
+async def test_local_table_is_bounded():
+    memory = _local_memory()
+    with patch("src.reader.strategy_memory._LOCAL_MAX_DOMAINS", 2):
+        for host in ("a.com", "b.com", "c.com"):
+            await memory.record_success(f"https://{host}", "1-beautifulsoup")
+    assert list(memory._memory_store) == ["b.com", "c.com"]
+
+
+@pytest.mark.asyncio
+async def test_empty_domain_is_ignored():
+    memory = _local_memory()
+    await memory.record_success("", "1-beautifulsoup")
+    await memory.record_failure("", "1-beautifulsoup", 1.0)
+    assert await memory.get_profile("") is None
+    assert memory._memory_store == {}
+
+
+@pytest.mark.asyncio
+async def test_redis_round_trip_and_ttl():
+    memory = _redis_memory()
+    await memory.record_failure("https://www.example.com", "1-beautifulsoup", 5.0)
+    await memory.record_success("https://example.com", "3-flaresolverr")
+
+    profile = await memory.get_profile("https://example.com")
+    assert profile == {
+        "last_success": "3-flaresolverr",
+        "failures": {"1-beautifulsoup": 1},
+        "failure_seconds": {"1-beautifulsoup": 5.0},
+    }
+    assert await memory.redis_client.ttl("strategy_memory:example.com") > 0
+    assert memory._memory_store == {}
+
+
+@pytest.mark.asyncio
+async def test_snapshot_merges_redis_and_local_entries():
+    memory = _redis_memory()
+    await memory.record_success("https://example.com", "2-trafilatura")
+    memory._put_local(
+        "local-only.org", {"last_success": "1-beautifulsoup", "failures": {}, "failure_seconds": {}}
+    )
+
+    table = await memory.snapshot()
+    assert table["example.com"]["last_success"] == "2-trafilatura"
+    assert table["local-only.org"]["last_success"] == "1-beautifulsoup"
+
+
+@pytest.mark.asyncio
+async def test_snapshot_is_capped():
+    memory = _redis_memory()
+    for host in ("a.com", "b.com", "c.com"):
+        await memory.record_success(f"https://{host}", "1-beautifulsoup")
+    memory._put_local("d.com", memory._empty_profile())
+    with patch("src.reader.strategy_memory._SNAPSHOT_MAX_DOMAINS", 2):
+        assert len(await memory.snapshot()) == 2
+    with patch("src.reader.strategy_memory._SNAPSHOT_MAX_DOMAINS", 4):
+        assert len(await memory.snapshot()) == 4
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_fall_back_to_local_table():
+    memory = StrategyMemory()
+    broken = MagicMock()
+    broken.hgetall = AsyncMock(side_effect=ConnectionError("down"))
+    broken.pipeline = MagicMock(side_effect=ConnectionError("down"))
+    broken.scan_iter = MagicMock(side_effect=ConnectionError("down"))
+    memory.redis_client = broken
+
+    await memory.record_failure("https://example.com", "1-beautifulsoup", 1.0)
+    await memory.record_success("https://example.com", "2-trafilatura")
+    profile = await memory.get_profile("https://example.com")
+    assert profile is not None
+    assert profile["last_success"] == "2-trafilatura"
+    assert "example.com" in await memory.snapshot()
+
+
+def test_init_survives_redis_client_construction_failure():
+    with patch("src.reader.strategy_memory.redis.from_url", side_effect=ValueError("bad dsn")):
+        memory = StrategyMemory()
+    assert memory.redis_client is None
@@ -1,9 +1,17 @@
+import asyncio
+from concurrent.futures.process import BrokenProcessPool
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from src.api.exceptions import ChallengeDetectedException, HumanInterventionRequiredException
+from src.api.exceptions import (
+    ChallengeDetectedException,
+    CircuitOpenException,
+    HumanInterventionRequiredException,
+    NonHtmlContentException,
+)
 from src.reader.web_reader import WebReader
+from src.runtime.circuit_breaker import circuit_breakers
 
 
 @pytest.mark.asyncio
@@ -52,11 +60,73 @@ async def test_read_heavy_mode_skips_lightweight():
             new=AsyncMock(return_value="PW Content"),
         ),
         patch("src.validator.content_validator.ContentValidator.validate", return_value=True),
+        patch("src.reader.web_reader.probe_content_type", new=AsyncMock(return_value="text/html")),
     ):
         result = await WebReader().read("http://test.com", heavy_mode=True)
     assert result["mode"] == "4-playwright_stealth"
 
 
+@pytest.mark.asyncio
+async def test_read_routes_non_html_without_escalating():
+    playwright = AsyncMock(return_value="PW Content")
+    with (
+        patch(
+            "src.reader.strategies.beautifulsoup_strategy.BeautifulSoupStrategy.extract",
+            new=AsyncMock(side_effect=NonHtmlContentException("json", "application/json", b'{"a": 1}')),
+        ),
+        patch("src.reader.strategies.playwright_strategy.PlaywrightStrategy.extract", new=playwright),
+    ):
+        result = await WebReader().read("http://test.com/data.json")
+    assert result["status"] == "success"
+    assert result["mode"] == "content-json"
+    assert result["content"] == '{"a": 1}'
+    playwright.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_read_with_links_routes_non_html_in_hedged_mode():
+    with (
+        patch("src.reader.web_reader.settings.READ_HEDGE_ENABLED", True),
+        patch(
+            "src.reader.strategies.beautifulsoup_strategy.BeautifulSoupStrategy.get_html",
+            new=AsyncMock(side_effect=NonHtmlContentException("binary", "image/png")),
+        ),
+    ):
+        result = await WebReader().read_with_links("http://test.com/logo.png")
+    assert result["status"] == "error"
+    assert result["reason"] == "unsupported_content_type"
+
+
+@pytest.mark.asyncio
+async def test_heavy_read_probes_content_type_and_routes_non_html():
+    fetch = AsyncMock(side_effect=NonHtmlContentException("text", "text/plain", b"plain words"))
+    playwright = AsyncMock(return_value="PW Content")
+    with (
+        patch("src.reader.web_reader.probe_content_type", new=AsyncMock(return_value="text/plain")),
+        patch("src.reader.web_reader.fetch_with_curl_cffi", new=fetch),
+        patch("src.reader.strategies.playwright_strategy.PlaywrightStrategy.extract", new=playwright),
+    ):
+        result = await WebReader().read("http://test.com/notes.txt", heavy_mode=True)
+    assert result["mode"] == "content-text"
+    assert result["content"] == "plain words"
+    playwright.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_read_skips_probe_when_chain_starts_with_curl_tier():
+    probe = AsyncMock(return_value="application/pdf")
+    with (
+        patch("src.reader.web_reader.probe_content_type", new=probe),
+        patch(
+            "src.reader.strategies.beautifulsoup_strategy.BeautifulSoupStrategy.extract",
+            new=AsyncMock(return_value="Extracted Content"),
+        ),
+        patch("src.validator.content_validator.ContentValidator.validate", return_value=True),
+    ):
+        await WebReader().read("http://test.com")
+    probe.assert_not_awaited()
+
+
 @pytest.mark.asyncio
 async def test_read_propagates_human_intervention():
     exc = HumanInterventionRequiredException("http://vnc", "captcha")
@@ -154,6 +224,28 @@ async def test_read_with_links_filter_keeps_matching_only():
     assert result["links"][1] == "https://example.com/job-offer/senior"
 
 
+@pytest.mark.asyncio
+async def test_read_with_links_falls_through_when_extraction_workers_crash():
+    raw_html = (
+        "<html><body>This is filler text to pass the ten word minimum validation limit "
+        "<a href='https://example.com/job1'>Job</a></body></html>"
+    )
+    run = AsyncMock(side_effect=[BrokenProcessPool("worker died"), ("Annotated content", {}), True])
+    with (
+        patch(
+            "src.reader.strategies.beautifulsoup_strategy.BeautifulSoupStrategy.get_html",
+            new=AsyncMock(return_value=raw_html),
+        ),
+        patch(
+            "src.reader.strategies.trafilatura_strategy.TrafilaturaStrategy.get_html",
+            new=AsyncMock(return_value=raw_html),
+        ),
+        patch("src.reader.web_reader.extraction_pool.run", run),
+    ):
+        result = await WebReader().read_with_links("http://test.com")
+    assert (result["status"], result["mode"]) == ("success", "2-trafilatura")
+
+
 @pytest.mark.asyncio
 async def test_read_with_links_falls_through_when_first_returns_empty():
     raw_html = (
@@ -257,6 +349,72 @@ async def test_execute_html_strategy_returns_empty_on_exception():
     assert result == ""
 
 
+@pytest.mark.asyncio
+async def test_execute_strategies_skip_a_tier_whose_circuit_is_open():
+    reader = WebReader()
+    strategy = MagicMock()
+    strategy.extract = AsyncMock(side_effect=CircuitOpenException("chromium", 12.0))
+    strategy.get_html = AsyncMock(side_effect=CircuitOpenException("chromium", 12.0))
+
+    assert await reader._execute_strategy("4-playwright_stealth", strategy, "http://test.com") is None
+    assert await reader._execute_html_strategy("4-playwright_stealth", strategy, "http://test.com") == ""
+
+
+@pytest.mark.asyncio
+async def test_execute_strategies_size_timeouts_from_past_successes():
+    from src.reader.adaptive_timeouts import attempt_timeout
+
+    reader = WebReader()
+    seen: list[float] = []
+
+    async def fetch(url):
+        seen.append(attempt_timeout(30.0))
+        return "<html>content</html>"
+
+    strategy = MagicMock()
+    strategy.extract = AsyncMock(side_effect=fetch)
+    strategy.get_html = AsyncMock(side_effect=fetch)
+    with (
+        patch("src.reader.web_reader.settings.ADAPTIVE_TIMEOUT_MIN_SAMPLES", 1),
+        patch("src.validator.content_validator.ContentValidator.validate", return_value=True),
+    ):
+        assert await reader._execute_strategy("dummy", strategy, "http://test.com") is not None
+        assert await reader._execute_html_strategy("dummy", strategy, "http://test.com")
+    assert seen == [30.0, 5.0]  # the fast first success, floored at ADAPTIVE_TIMEOUT_FLOOR_SECONDS
+
+
+@pytest.mark.asyncio
+async def test_timeouts_from_one_domain_leave_the_browser_tier_open_for_others(monkeypatch):
+    from src.runtime.browser_pool import browser_pool
+
+    context = MagicMock()
+    context.new_page = AsyncMock(return_value=MagicMock(goto=AsyncMock()))
+    context.clear_cookies = AsyncMock()
+    context.close = AsyncMock()
+    browser = MagicMock(is_connected=MagicMock(return_value=True))
+    browser.new_context = AsyncMock(return_value=context)
+    monkeypatch.setattr(browser_pool, "get_browser", AsyncMock(return_value=browser))
+
+    async def render(url: str) -> str:
+        async with browser_pool.page():
+            if "hostile.com" in url:
+                raise TimeoutError("navigation timed out")
+            return "<html>content</html>"
+
+    strategy = MagicMock()
+    strategy.get_html = AsyncMock(side_effect=render)
+    reader = WebReader()
+    monkeypatch.setattr(browser_pool, "_page_setup", None)
+    for n in range(10):
+        assert (
+            await reader._execute_html_strategy("4-playwright_stealth", strategy, f"http://hostile.com/{n}")
+            == ""
+        )
+
+    assert await reader._execute_html_strategy("4-playwright_stealth", strategy, "http://other.com") != ""
+    assert {circuit["state"] for circuit in circuit_breakers.snapshot().values()} == {"closed"}
+
+
 @pytest.mark.asyncio
 async def test_execute_html_strategy_returns_empty_string_when_html_blank():
     reader = WebReader()
@@ -370,3 +528,435 @@ async def test_execute_html_strategy_aborts_on_recursive_challenge():
     strategy.get_html = AsyncMock(side_effect=ChallengeDetectedException(intervention_type="login"))
     result = await reader._execute_html_strategy("6-novnc", strategy, "http://test.com", escalating=True)
     assert result == ""
+
+
+def _stub_strategy(extract) -> MagicMock:
+    strategy = MagicMock()
+    strategy.extract = extract
+
+    return strategy
+
+
+@pytest.mark.asyncio
+async def test_hedged_read_starts_next_tier_after_delay_and_cancels_loser():
+    cancelled = asyncio.Event()
+
+    async def slow_extract(_url):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return "never"
+
+    reader = WebReader()
+    reader.strategies = {
+        "1-beautifulsoup": _stub_strategy(slow_extract),
+        "2-trafilatura": _stub_strategy(AsyncMock(return_value="Fast content")),
+    }
+    with (
+        patch("src.reader.web_reader.settings.READ_HEDGE_ENABLED", True),
+        patch("src.reader.web_reader.settings.READ_HEDGE_DELAYS", {"1-beautifulsoup": 0.01}),
+        patch("src.validator.content_validator.ContentValidator.validate", return_value=True),
+    ):
+        result = await reader.read("http://test.com")
+    assert result["mode"] == "2-trafilatura"
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_hedged_read_launches_next_tier_immediately_on_failure():
+    reader = WebReader()
+    reader.strategies = {
+        "1-beautifulsoup": _stub_strategy(AsyncMock(return_value="")),
+        "2-trafilatura": _stub_strategy(AsyncMock(return_value="Second tier content")),
+    }
+    with (
+        patch("src.reader.web_reader.settings.READ_HEDGE_ENABLED", True),
+        patch("src.reader.web_reader.settings.READ_HEDGE_DEFAULT_DELAY", 60.0),
+        patch("src.reader.web_reader.settings.READ_HEDGE_DELAYS", {}),
+        patch("src.validator.content_validator.ContentValidator.validate", side_effect=bool),
+    ):
+        result = await asyncio.wait_for(reader.read("http://test.com"), timeout=2)
+    assert result["status"] == "success"
+    assert result["mode"] == "2-trafilatura"
+
+
+@pytest.mark.asyncio
+async def test_hedged_read_falls_back_to_novnc_sequentially():
+    reader = WebReader()
+    reader.strategies = {
+        "1-beautifulsoup": _stub_strategy(AsyncMock(return_value="")),
+        "6-novnc": _stub_strategy(AsyncMock(return_value="NoVNC out")),
+    }
+    with (
+        patch("src.reader.web_reader.settings.READ_HEDGE_ENABLED", True),
+        patch("src.validator.content_validator.ContentValidator.validate", side_effect=bool),
+    ):
+        result = await reader.read("http://test.com")
+    assert result["mode"] == "6-novnc"
+
+
+@pytest.mark.asyncio
+async def test_hedged_read_propagates_human_intervention_and_cancels_siblings():
+    cancelled = asyncio.Event()
+
+    async def slow_extract(_url):
+        try:
+            await asyncio.sleep(5)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return "never"
+
+    async def intervention(_url):
+        await asyncio.sleep(0.02)
+        raise HumanInterventionRequiredException("http://vnc", "captcha")
+
+    reader = WebReader()
+    reader.strategies = {
+        "1-beautifulsoup": _stub_strategy(slow_extract),
+        "2-trafilatura": _stub_strategy(intervention),
+    }
+    with (
+        patch("src.reader.web_reader.settings.READ_HEDGE_ENABLED", True),
+        patch("src.reader.web_reader.settings.READ_HEDGE_DELAYS", {"1-beautifulsoup": 0.01}),
+    ):
+        with pytest.raises(HumanInterventionRequiredException):
+            await reader.read("http://test.com")
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_hedged_read_reports_budget_exhausted():
+    reader = WebReader()
+    with (
+        patch("src.reader.web_reader.settings.READ_HEDGE_ENABLED", True),
+        patch("src.reader.web_reader.settings.READ_TOTAL_BUDGET", 0.0),
+    ):
+        result = await reader.read("http://test.com")
+    assert result["reason"] == "budget_exhausted"
+
+
+@pytest.mark.asyncio
+async def test_hedged_read_with_links_returns_first_valid_annotation():
+    raw_html = (
+        "<html><body>This is filler text to pass the ten word minimum validation limit "
+        "<a href='https://example.com/job1'>Job One</a></body></html>"
+    )
+    reader = WebReader()
+    html_strategy = MagicMock()
+    html_strategy.get_html = AsyncMock(return_value=raw_html)
+    reader.strategies = {"1-beautifulsoup": html_strategy}
+    with patch("src.reader.web_reader.settings.READ_HEDGE_ENABLED", True):
+        result = await reader.read_with_links("http://test.com")
+    assert result["status"] == "success"
+    assert result["links"][1] == "https://example.com/job1"
+
+
+@pytest.mark.asyncio
+async def test_execute_strategy_records_cancellation():
+    reader = WebReader()
+    strategy = _stub_strategy(AsyncMock(side_effect=asyncio.CancelledError()))
+    with pytest.raises(asyncio.CancelledError):
+        await reader._execute_strategy("dummy", strategy, "http://test.com")
+
+
+@pytest.mark.asyncio
+async def test_execute_html_strategy_records_cancellation():
+    reader = WebReader()
+    strategy = MagicMock()
+    strategy.get_html = AsyncMock(side_effect=asyncio.CancelledError())
+    with pytest.raises(asyncio.CancelledError):
+        await reader._execute_html_strategy("dummy", strategy, "http://test.com")
+
+
+def _profile(last_success, failures=None, failure_seconds=None):
+    return {
+        "last_success": last_success,
+        "failures": failures or {},
+        "failure_seconds": failure_seconds or {},
+    }
+
+
+def test_select_strategies_promotes_remembered_tier_and_skips_repeat_failures():
+    reader = WebReader()
+    profile = _profile("4-playwright_stealth", failures={"1-beautifulsoup": 3, "2-trafilatura": 1})
+    selected = reader._select_strategies("http://test.com", False, profile)
+    assert list(selected) == [
+        "4-playwright_stealth",
+        "2-trafilatura",
+        "3-flaresolverr",
+        "5-crawlee_adaptive",
+        "6-novnc",
+    ]
+
+
+def test_select_strategies_ignores_memory_without_useful_winner():
+    reader = WebReader()
+    default_order = list(reader.strategies)
+    assert list(reader._select_strategies("http://test.com", False, _profile(None))) == default_order
+    assert list(reader._select_strategies("http://test.com", False, _profile("6-novnc"))) == default_order
+    assert (
+        list(reader._select_strategies("http://test.com", False, _profile("1-beautifulsoup")))
+        == default_order
+    )
+    heavy = reader._select_strategies("http://test.com", True, _profile("2-trafilatura"))
+    assert list(heavy) == ["4-playwright_stealth", "5-crawlee_adaptive", "6-novnc"]
+
+
+def test_select_strategies_ignores_memory_when_disabled():
+    reader = WebReader()
+    with patch("src.reader.web_reader.settings.STRATEGY_MEMORY_ENABLED", False):
+        selected = reader._select_strategies("http://test.com", False, _profile("4-playwright_stealth"))
+    assert next(iter(selected)) == "1-beautifulsoup"
+
+
+@pytest.mark.asyncio
+async def test_read_learns_winning_tier_and_starts_there_next_time():
+    reader = WebReader()
+    first = AsyncMock(return_value="")
+    second = AsyncMock(return_value="Second tier content")
+    reader.strategies = {
+        "1-beautifulsoup": _stub_strategy(first),
+        "2-trafilatura": _stub_strategy(second),
+    }
+    with patch("src.validator.content_validator.ContentValidator.validate", side_effect=bool):
+        await reader.read("http://www.test.com/a")
+        result = await reader.read("http://test.com/b")
+    assert result["mode"] == "2-trafilatura"
+    assert first.await_count == 1
+    assert second.await_count == 2
+
+    profile = await reader.strategy_memory.get_profile("http://test.com")
+    assert profile is not None
+    assert profile["last_success"] == "2-trafilatura"
+    assert profile["failures"] == {"1-beautifulsoup": 1}
+
+
+@pytest.mark.asyncio
+async def test_read_does_not_record_novnc_outcomes():
+    reader = WebReader()
+    reader.strategies = {"6-novnc": _stub_strategy(AsyncMock(return_value="NoVNC out"))}
+    with patch("src.validator.content_validator.ContentValidator.validate", return_value=True):
+        await reader.read("http://test.com")
+    assert await reader.strategy_memory.get_profile("http://test.com") is None
+
+
+@pytest.mark.asyncio
+async def test_read_does_not_record_tiers_skipped_by_an_open_circuit():
+    from src.runtime.circuit_breaker import FAILURE
+
+    for _ in range(5):
+        circuit_breakers.get("chromium").record(FAILURE)
+    reader = WebReader()
+    reader.strategies = {
+        "4-playwright_stealth": _stub_strategy(AsyncMock(side_effect=CircuitOpenException("chromium", 30.0))),
+        "5-crawlee_adaptive": _stub_strategy(AsyncMock(return_value="Fifth tier content")),
+    }
+    with patch("src.validator.content_validator.ContentValidator.validate", side_effect=bool):
+        result = await reader.read("http://test.com")
+    assert result["mode"] == "5-crawlee_adaptive"
+
+    profile = await reader.strategy_memory.get_profile("http://test.com")
+    assert profile is not None
+    assert profile["failures"] == {}
+
+
+@pytest.mark.asyncio
+async def test_read_counts_flaresolverr_skipped_by_its_open_circuit():
+    from src.observability.metrics import STRATEGY_ATTEMPTS_TOTAL
+    from src.reader.strategies.flaresolverr_strategy import FlareSolverrStrategy
+    from src.runtime.circuit_breaker import FAILURE
+
+    for _ in range(5):
+        circuit_breakers.get("flaresolverr").record(FAILURE)
+    skipped = STRATEGY_ATTEMPTS_TOTAL.labels(strategy="3-flaresolverr", outcome="circuit_open")
+    before = skipped._value.get()
+    reader = WebReader()
+    reader.strategies = {
+        "3-flaresolverr": FlareSolverrStrategy(),
+        "4-playwright_stealth": _stub_strategy(AsyncMock(return_value="Fourth tier content")),
+    }
+    with (
+        patch(
+            "src.reader.strategies.flaresolverr_strategy.settings.FLARESOLVERR_URL", "http://solver:8191/v1"
+        ),
+        patch("src.validator.content_validator.ContentValidator.validate", side_effect=bool),
+    ):
+        result = await reader.read("http://test.com")
+    assert result["mode"] == "4-playwright_stealth"
+    assert skipped._value.get() - before == 1
+
+    profile = await reader.strategy_memory.get_profile("http://test.com")
+    assert profile is not None
+    assert profile["failures"] == {}
+
+
+@pytest.mark.asyncio
+async def test_read_skips_memory_when_disabled():
+    reader = WebReader()
+    with (
+        patch("src.reader.web_reader.settings.STRATEGY_MEMORY_ENABLED", False),
+        patch(
+            "src.reader.strategies.beautifulsoup_strategy.BeautifulSoupStrategy.extract",
+            new=AsyncMock(return_value="Extracted Content"),
+        ),
+        patch("src.validator.content_validator.ContentValidator.validate", return_value=True),
+    ):
+        await reader.read("http://test.com")
+    assert await reader.strategy_memory.get_profile("http://test.com") is None
+
+
+def test_record_time_saved_counts_bypassed_tiers_only_for_promoted_winner():
+    from src.observability.metrics import STRATEGY_MEMORY_TIME_SAVED_SECONDS
+
+    reader = WebReader()
+    profile = _profile(
+        "3-flaresolverr",
+        failures={"1-beautifulsoup": 2, "2-trafilatura": 1},
+        failure_seconds={"1-beautifulsoup": 10.0, "2-trafilatura": 4.0},
+    )
+    before = STRATEGY_MEMORY_TIME_SAVED_SECONDS._value.get()
+    reader._record_time_saved(profile, "3-flaresolverr")
+    reader._record_time_saved(profile, "2-trafilatura")
+    reader._record_time_saved(_profile("9-unknown"), "9-unknown")
+    reader._record_time_saved(_profile("1-beautifulsoup"), "1-beautifulsoup")
+    assert STRATEGY_MEMORY_TIME_SAVED_SECONDS._value.get() - before == 9.0
+
+
+@pytest.mark.asyncio
+async def test_read_serves_second_call_from_cache():
+    reader = WebReader()
+    extract = AsyncMock(return_value="Extracted Content")
+    reader.strategies = {"1-beautifulsoup": _stub_strategy(extract)}
+    with patch("src.validator.content_validator.ContentValidator.validate", return_value=True):
+        first = await reader.read("http://test.com/page")
+        second = await reader.read("HTTP://TEST.COM/page#frag")
+    assert first["cache"] == "miss"
+    assert second["cache"] == "hit"
+    assert second["content"] == "Extracted Content"
+    assert extract.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_read_and_read_with_links_use_separate_cache_entries():
+    raw_html = (
+        "<html><body>This is filler text to pass the ten word minimum validation limit "
+        "<a href='https://example.com/job1'>Job One</a></body></html>"
+    )
+    reader = WebReader()
+    strategy = MagicMock()
+    strategy.extract = AsyncMock(return_value="Extracted Content")
+    strategy.get_html = AsyncMock(return_value=raw_html)
+    reader.strategies = {"1-beautifulsoup": strategy}
+    with patch("src.validator.content_validator.ContentValidator.validate", return_value=True):
+        await reader.read("http://test.com")
+        linked = await reader.read_with_links("http://test.com")
+        filtered = await reader.read_with_links("http://test.com", link_filter="/job")
+    assert linked["cache"] == "miss"
+    assert filtered["cache"] == "miss"
+    assert linked["links"][1] == "https://example.com/job1"
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_with_validators_is_revalidated_without_rerunning_chain():
+    reader = WebReader()
+    key = reader.read_cache.build_key("http://test.com", "read:heavy=False")
+    await reader.read_cache.put(
+        key, {"content": "Cached", "status": "success", "mode": "1-beautifulsoup"}, {"etag": '"v1"'}
+    )
+    extract = AsyncMock(return_value="Fresh")
+    reader.strategies = {"1-beautifulsoup": _stub_strategy(extract)}
+    revalidate = AsyncMock(return_value=True)
+    with (
+        patch("src.reader.web_reader.settings.READ_CACHE_FRESH_TTL_SECONDS", 0),
+        patch("src.reader.web_reader.revalidate_with_curl_cffi", new=revalidate),
+    ):
+        result = await reader.read("http://test.com")
+    assert result["cache"] == "revalidated"
+    assert result["content"] == "Cached"
+    assert revalidate.await_args.args[2] == {"etag": '"v1"'}
+    extract.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_is_refetched_when_origin_changed():
+    reader = WebReader()
+    key = reader.read_cache.build_key("http://test.com", "read:heavy=False")
+    await reader.read_cache.put(
+        key, {"content": "Cached", "status": "success", "mode": "1-beautifulsoup"}, {"etag": '"v1"'}
+    )
+    reader.strategies = {"1-beautifulsoup": _stub_strategy(AsyncMock(return_value="Fresh"))}
+    with (
+        patch("src.reader.web_reader.settings.READ_CACHE_FRESH_TTL_SECONDS", 0),
+        patch("src.reader.web_reader.revalidate_with_curl_cffi", new=AsyncMock(return_value=False)),
+        patch("src.validator.content_validator.ContentValidator.validate", return_value=True),
+    ):
+        result = await reader.read("http://test.com")
+    assert result["cache"] == "miss"
+    assert result["content"] == "Fresh"
+
+
+@pytest.mark.asyncio
+async def test_stale_entry_without_validators_skips_revalidation():
+    reader = WebReader()
+    key = reader.read_cache.build_key("http://test.com", "read:heavy=False")
+    await reader.read_cache.put(
+        key, {"content": "Cached", "status": "success", "mode": "4-playwright_stealth"}
+    )
+    reader.strategies = {"1-beautifulsoup": _stub_strategy(AsyncMock(return_value="Fresh"))}
+    revalidate = AsyncMock(return_value=True)
+    with (
+        patch("src.reader.web_reader.settings.READ_CACHE_FRESH_TTL_SECONDS", 0),
+        patch("src.reader.web_reader.revalidate_with_curl_cffi", new=revalidate),
+        patch("src.validator.content_validator.ContentValidator.validate", return_value=True),
+    ):
+        result = await reader.read("http://test.com")
+    assert result["content"] == "Fresh"
+    revalidate.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_read_stores_captured_validators_only_for_raw_html_tiers():
+    from src.reader.strategies.curl_cffi_fetcher import response_validators_ctx
+
+    async def fetch_and_capture(_url):
+        captured = response_validators_ctx.get()
+        captured["etag"] = '"abc"'
+        return "Extracted Content"
+
+    reader = WebReader()
+    reader.strategies = {"1-beautifulsoup": _stub_strategy(fetch_and_capture)}
+    with patch("src.validator.content_validator.ContentValidator.validate", return_value=True):
+        await reader.read("http://test.com")
+    entry = await reader.read_cache.get(reader.read_cache.build_key("http://test.com", "read:heavy=False"))
+    assert entry["validators"] == {"etag": '"abc"'}
+
+    reader.strategies = {"4-playwright_stealth": _stub_strategy(fetch_and_capture)}
+    with patch("src.validator.content_validator.ContentValidator.validate", return_value=True):
+        await reader.read("http://other.com")
+    entry = await reader.read_cache.get(reader.read_cache.build_key("http://other.com", "read:heavy=False"))
+    assert entry["validators"] == {}
+    assert response_validators_ctx.get() is None
+
+
+@pytest.mark.asyncio
+async def test_failed_reads_are_not_cached():
+    reader = WebReader()
+    reader.strategies = {"1-beautifulsoup": _stub_strategy(AsyncMock(return_value=""))}
+    await reader.read("http://test.com")
+    assert reader.read_cache._memory_store == {}
+
+
+@pytest.mark.asyncio
+async def test_read_cache_bypass_when_disabled():
+    reader = WebReader()
+    reader.strategies = {"1-beautifulsoup": _stub_strategy(AsyncMock(return_value="Extracted Content"))}
+    with (
+        patch("src.reader.web_reader.settings.READ_CACHE_ENABLED", False),
+        patch("src.validator.content_validator.ContentValidator.validate", return_value=True),
+    ):
+        result = await reader.read("http://test.com")
+    assert result["cache"] == "bypass"
+    assert reader.read_cache._memory_store == {}
@@ -1,7 +1,10 @@
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+from collections import deque
+from unittest.mock import ANY, AsyncMock, MagicMock, patch
 
 import pytest
 
+from src.api.exceptions import CircuitOpenException
 from src.runtime.browser_pool import BrowserPool
 
 
@@ -166,3 +169,222 @@ async def test_get_browser_double_check_inside_lock():
     pool._browser = None  # outer check fails → fall through to lock
     result = await pool.get_browser()
     assert result is connected_after_lock
+
+
+def _make_context_browser() -> MagicMock:
+    """A connected browser whose new_context() returns a fresh context/page pair each call."""
+    browser = MagicMock()
+    browser.is_connected = MagicMock(return_value=True)
+    browser.close = AsyncMock()
+
+    def new_context(**_kwargs):
+        page = MagicMock()
+        page.goto = AsyncMock()
+        context = MagicMock()
+        context.new_page = AsyncMock(return_value=page)
+        context.clear_cookies = AsyncMock()
+        context.close = AsyncMock()
+        context.new_cdp_session = AsyncMock(return_value=MagicMock(send=AsyncMock()))
+        return context
+
+    browser.new_context = AsyncMock(side_effect=new_context)
+
+    return browser
+
+
+def _pool_with_browser(browser: MagicMock) -> tuple[BrowserPool, AsyncMock]:
+    pool = BrowserPool()
+    pool._browser = browser
+    setup = AsyncMock()
+    pool.configure_contexts(lambda: "ua-1", setup)
+
+    return pool, setup
+
+
+@pytest.mark.asyncio
+async def test_page_reuses_context_and_resets_it_between_uses():
+    browser = _make_context_browser()
+    pool, setup = _pool_with_browser(browser)
+
+    async with pool.page() as first:
+        pass
+    async with pool.page() as second:
+        pass
+
+    assert first is second
+    assert browser.new_context.await_count == 1
+    assert browser.new_context.await_args.kwargs["user_agent"] == "ua-1"
+    setup.assert_awaited_once_with(first)
+    context = next(iter(pool._contexts)).context
+    assert context.clear_cookies.await_count == 2
+    first.goto.assert_awaited_with("about:blank")
+
+
+@pytest.mark.asyncio
+async def test_checkin_clears_storage_of_every_origin_the_read_visited():
+    browser = _make_context_browser()
+    pool, _ = _pool_with_browser(browser)
+
+    async with pool.page() as page:
+        event, on_navigated = page.on.call_args.args
+        for url in ("https://site.com/a", "https://cdn.site.com/frame", "https://site.com/b", "about:blank"):
+            on_navigated(MagicMock(url=url))
+
+    pooled = next(iter(pool._contexts))
+    cleared = {call.args[1]["origin"] for call in pooled.cdp.send.await_args_list}
+    assert event == "framenavigated"
+    assert browser.new_context.await_args.kwargs["service_workers"] == "block"
+    assert cleared == {"https://site.com", "https://cdn.site.com"}
+    pooled.cdp.send.assert_awaited_with("Storage.clearDataForOrigin", {"origin": ANY, "storageTypes": "all"})
+
+    # Nothing visited on the next read, nothing to clear; the CDP session is reused.
+    async with pool.page():
+        pass
+    assert pooled.cdp.send.await_count == 2
+    pooled.context.new_cdp_session.assert_awaited_once_with(page)
+
+
+@pytest.mark.asyncio
+async def test_context_whose_storage_cannot_be_cleared_is_recycled():
+    browser = _make_context_browser()
+    pool, _ = _pool_with_browser(browser)
+
+    async with pool.page() as page:
+        page.on.call_args.args[1](MagicMock(url="https://site.com/"))
+        pooled = next(iter(pool._contexts))
+        pooled.context.new_cdp_session.side_effect = RuntimeError("Target closed")
+
+    assert pool._contexts == set()
+    pooled.context.close.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_context_is_recycled_after_max_uses_and_after_a_failed_use():
+    browser = _make_context_browser()
+    pool, _ = _pool_with_browser(browser)
+
+    with patch("src.runtime.browser_pool.settings.PLAYWRIGHT_CONTEXT_MAX_USES", 2):
+        async with pool.page() as first:
+            pass
+        async with pool.page():
+            pass
+        async with pool.page() as third:
+            pass
+
+    assert third is not first
+    assert browser.new_context.await_count == 2
+
+    with pytest.raises(RuntimeError):
+        async with pool.page():
+            raise RuntimeError("navigation failed")
+
+    assert pool._idle == deque()
+    assert pool._contexts == set()
+
+
+@pytest.mark.asyncio
+async def test_failing_checkouts_open_the_chromium_circuit():
+    browser = _make_context_browser()
+    browser.new_context.side_effect = RuntimeError("Target closed")
+    pool, _ = _pool_with_browser(browser)
+
+    for _ in range(5):
+        with pytest.raises(RuntimeError):
+            async with pool.page():
+                pass
+
+    with pytest.raises(CircuitOpenException):
+        async with pool.page():
+            pass
+    assert browser.new_context.await_count == 5
+
+
+@pytest.mark.asyncio
+async def test_checkout_queues_when_the_pool_is_exhausted():
+    browser = _make_context_browser()
+    with patch("src.runtime.browser_pool.settings.PLAYWRIGHT_CONTEXT_POOL_SIZE", 1):
+        pool, _ = _pool_with_browser(browser)
+    order: list[str] = []
+
+    async def hold(name: str) -> None:
+        async with pool.page():
+            order.append(f"{name}-in")
+            await asyncio.sleep(0.01)
+            order.append(f"{name}-out")
+
+    await asyncio.gather(hold("a"), hold("b"))
+
+    assert order == ["a-in", "a-out", "b-in", "b-out"]
+    assert browser.new_context.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_additional_browser_is_launched_when_per_browser_limit_is_reached():
+    primary = _make_context_browser()
+    extra = _make_context_browser()
+    pool, _ = _pool_with_browser(primary)
+    pool._playwright = MagicMock()
+    pool._playwright.chromium.launch = AsyncMock(return_value=extra)
+
+    with patch("src.runtime.browser_pool.settings.PLAYWRIGHT_CONTEXTS_PER_BROWSER", 1):
+        async with pool.page(), pool.page():
+            pass
+
+    assert primary.new_context.await_count == 1
+    assert extra.new_context.await_count == 1
+    assert pool._extra_browsers == [extra]
+
+
+@pytest.mark.asyncio
+async def test_start_prewarms_contexts_and_stop_closes_them():
+    browser = _make_context_browser()
+    factory, pw = _make_playwright_factory(browser)
+    pool = BrowserPool()
+    pool.configure_contexts(lambda: "ua", AsyncMock())
+
+    with (
+        patch("src.runtime.browser_pool.async_playwright", return_value=factory),
+        patch("src.runtime.browser_pool.settings.PLAYWRIGHT_CONTEXT_PREWARM", 2),
+    ):
+        await pool.start()
+
+    assert len(pool._idle) == 2
+    contexts = [pooled.context for pooled in pool._idle]
+
+    await pool.stop()
+
+    assert all(context.close.await_count == 1 for context in contexts)
+    assert pool._contexts == set()
+    pw.stop.assert_awaited()
+
+
+@pytest.mark.asyncio
+async def test_prewarm_failure_does_not_fail_start():
+    browser = _make_context_browser()
+    browser.new_context = AsyncMock(side_effect=RuntimeError("no memory"))
+    factory, _ = _make_playwright_factory(browser)
+    pool = BrowserPool()
+    pool.configure_contexts(lambda: "ua", AsyncMock())
+
+    with patch("src.runtime.browser_pool.async_playwright", return_value=factory):
+        await pool.start()
+
+    assert pool._idle == deque()
+
+
+@pytest.mark.asyncio
+async def test_idle_context_on_a_disconnected_browser_is_discarded():
+    stale_browser = _make_context_browser()
+    pool, _ = _pool_with_browser(stale_browser)
+    async with pool.page() as stale_page:
+        pass
+
+    stale_browser.is_connected = MagicMock(return_value=False)
+    fresh = _make_context_browser()
+    factory, _ = _make_playwright_factory(fresh)
+    with patch("src.runtime.browser_pool.async_playwright", return_value=factory):
+        async with pool.page() as page:
+            pass
+
+    assert page is not stale_page
+    assert fresh.new_context.await_count == 1
@@ -0,0 +1,182 @@
+import asyncio
+
+import pytest
+
+from src.api.exceptions import CircuitOpenException
+from src.runtime import circuit_breaker as cb_module
+from src.runtime.circuit_breaker import (
+    CLOSED,
+    FAILURE,
+    HALF_OPEN,
+    OPEN,
+    SUCCESS,
+    TIMEOUT,
+    CircuitBreaker,
+    CircuitBreakers,
+    is_timeout,
+)
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = _Clock()
+    monkeypatch.setattr(cb_module.time, "monotonic", fake)
+    monkeypatch.setattr(cb_module.settings, "CIRCUIT_BREAKER_ENABLED", True)
+    monkeypatch.setattr(cb_module.settings, "CIRCUIT_WINDOW_SECONDS", 60.0)
+    monkeypatch.setattr(cb_module.settings, "CIRCUIT_MIN_CALLS", 4)
+    monkeypatch.setattr(cb_module.settings, "CIRCUIT_FAILURE_RATE", 0.5)
+    monkeypatch.setattr(cb_module.settings, "CIRCUIT_COOLDOWN_SECONDS", 30.0)
+    monkeypatch.setattr(cb_module.settings, "CIRCUIT_HALF_OPEN_TRIALS", 1)
+
+    return fake
+
+
+def _open(breaker: CircuitBreaker) -> None:
+    for _ in range(4):
+        breaker.record(FAILURE)
+
+
+def test_opens_once_enough_calls_fail(clock):
+    breaker = CircuitBreaker("dep")
+    for outcome in (SUCCESS, SUCCESS, FAILURE):
+        breaker.record(outcome)
+    assert breaker.state == CLOSED  # under CIRCUIT_MIN_CALLS
+
+    breaker.record(TIMEOUT)
+    assert breaker.state == OPEN
+    assert not breaker.allow()
+    assert breaker.retry_after() == 30.0
+
+
+def test_failures_outside_the_window_are_forgotten(clock):
+    breaker = CircuitBreaker("dep")
+    for _ in range(3):
+        breaker.record(FAILURE)
+    clock.now += 61
+    breaker.record(FAILURE)
+    assert breaker.state == CLOSED
+    assert breaker.snapshot()["calls"] == 1
+
+
+def test_half_open_trial_success_closes(clock):
+    breaker = CircuitBreaker("dep")
+    _open(breaker)
+    clock.now += 30
+    assert breaker.state == HALF_OPEN
+    assert breaker.allow()
+    assert not breaker.allow()  # one trial at a time
+
+    breaker.record(SUCCESS)
+    assert breaker.state == CLOSED
+    assert breaker.allow()
+
+
+def test_half_open_trial_failure_reopens_for_another_cooldown(clock):
+    breaker = CircuitBreaker("dep")
+    _open(breaker)
+    clock.now += 30
+    assert breaker.allow()
+    breaker.record(TIMEOUT)
+    assert breaker.state == OPEN
+    clock.now += 29
+    assert not breaker.allow()
+
+
+def test_trial_without_verdict_is_retried_after_a_cooldown(clock):
+    breaker = CircuitBreaker("dep")
+    _open(breaker)
+    clock.now += 30
+    assert breaker.allow()
+    clock.now += 10
+    assert not breaker.allow()
+    clock.now += 20
+    assert breaker.allow()
+
+
+def test_half_open_admits_the_configured_number_of_trials(clock, monkeypatch):
+    monkeypatch.setattr(cb_module.settings, "CIRCUIT_HALF_OPEN_TRIALS", 2)
+    breaker = CircuitBreaker("dep")
+    _open(breaker)
+    clock.now += 30
+    assert [breaker.allow() for _ in range(3)] == [True, True, False]
+
+
+def test_disabled_breaker_always_allows(clock, monkeypatch):
+    breaker = CircuitBreaker("dep")
+    _open(breaker)
+    monkeypatch.setattr(cb_module.settings, "CIRCUIT_BREAKER_ENABLED", False)
+    assert breaker.allow()
+
+
+@pytest.mark.asyncio
+async def test_guard_records_outcomes_and_rejects_when_open(clock):
+    breaker = CircuitBreaker("dep")
+    async with breaker.guard():
+        pass
+    with pytest.raises(ValueError, match="page verdict"):
+        async with breaker.guard(neutral=(ValueError,)):
+            raise ValueError("page verdict")
+    with pytest.raises(asyncio.CancelledError):
+        async with breaker.guard():
+            raise asyncio.CancelledError
+    for _ in range(3):
+        with pytest.raises(TimeoutError):
+            async with breaker.guard():
+                raise TimeoutError
+
+    assert breaker.snapshot() == {
+        "state": "open",
+        "calls": 0,
+        "failure_rate": 0.0,
+        "timeout_rate": 0.0,
+        "retry_after": 30.0,
+    }
+    with pytest.raises(CircuitOpenException) as exc:
+        async with breaker.guard():
+            pytest.fail("an open circuit must not run the call")
+    assert exc.value.name == "dep"
+
+
+def test_snapshot_reports_rates(clock):
+    breaker = CircuitBreaker("dep")
+    for outcome in (SUCCESS, SUCCESS, FAILURE):
+        breaker.record(outcome)
+    breaker.record(TIMEOUT)  # opens: 2 of 4
+    assert breaker.snapshot()["state"] == OPEN
+
+    breaker = CircuitBreaker("other")
+    for outcome in (SUCCESS, SUCCESS, TIMEOUT):
+        breaker.record(outcome)
+    snapshot = breaker.snapshot()
+    assert (snapshot["calls"], snapshot["failure_rate"], snapshot["timeout_rate"]) == (3, 0.0, 0.333)
+
+
+def test_calls_finishing_after_the_circuit_opened_are_ignored(clock):
+    breaker = CircuitBreaker("dep")
+    _open(breaker)
+    breaker.record(SUCCESS)
+    assert breaker.state == OPEN
+
+
+def test_is_timeout_recognises_library_timeouts():
+    class ReadTimeout(Exception):
+        pass
+
+    assert is_timeout(TimeoutError())
+    assert is_timeout(ReadTimeout())
+    assert not is_timeout(ConnectionError())
+
+
+def test_registry_reuses_breakers_and_snapshots_them_by_name():
+    breakers = CircuitBreakers()
+    assert breakers.get("redis") is breakers.get("redis")
+    breakers.get("flaresolverr")
+    assert list(breakers.snapshot()) == ["flaresolverr", "redis"]
@@ -0,0 +1,287 @@
+import asyncio
+import signal
+from types import SimpleNamespace
+from typing import ClassVar
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from crawlee.errors import ContextPipelineInterruptedError
+
+from src.runtime.circuit_breaker import circuit_breakers
+from src.runtime.crawlee_service import CrawleeService, _SharedChromiumController
+
+
+class _FakeCrawler:
+    """Stands in for AdaptivePlaywrightCrawler: runs until stopped and records what it is fed."""
+
+    instances: ClassVar[list["_FakeCrawler"]] = []
+
+    def __init__(self, **kwargs):
+        self.kwargs = kwargs
+        self.requests = []
+        self.stop_reasons = []
+        self.stopped = asyncio.Event()
+        self.handler = self.failed_handler = None
+        self.pre_navigation: list = []
+        self.router = SimpleNamespace(default_handler=self._register_handler)
+        _FakeCrawler.instances.append(self)
+
+    def _register_handler(self, handler):
+        self.handler = handler
+        return handler
+
+    def failed_request_handler(self, handler):
+        self.failed_handler = handler
+        return handler
+
+    def pre_navigation_hook(self, *, playwright_only=False):
+        def register(hook):
+            self.pre_navigation.append((hook, playwright_only))
+            return hook
+
+        return register
+
+    async def add_requests(self, requests):
+        self.requests.extend(requests)
+
+    async def run(self):
+        # Like BasicCrawler.run, claim SIGINT before the first suspension point.
+        asyncio.get_running_loop().add_signal_handler(signal.SIGINT, lambda: None)
+        await self.stopped.wait()
+
+    def stop(self, reason=""):
+        self.stop_reasons.append(reason)
+        self.stopped.set()
+
+
+@pytest.fixture
+def crawler_cls():
+    _FakeCrawler.instances = []
+    queue = MagicMock()
+    queue.drop = AsyncMock()
+    with (
+        patch(
+            "src.runtime.crawlee_service.AdaptivePlaywrightCrawler.with_beautifulsoup_static_parser",
+            side_effect=_FakeCrawler,
+        ),
+        patch("src.runtime.crawlee_service.RequestQueue.open", AsyncMock(return_value=queue)),
+    ):
+        yield _FakeCrawler
+
+
+async def _first_instance(crawler_cls) -> _FakeCrawler:
+    for _ in range(10):
+        if crawler_cls.instances:
+            return crawler_cls.instances[0]
+        await asyncio.sleep(0)
+
+    raise AssertionError("no crawler started")
+
+
+async def _queued(crawler: _FakeCrawler, count: int = 1) -> list:
+    for _ in range(100):
+        if len(crawler.requests) >= count:
+            return crawler.requests
+        await asyncio.sleep(0)
+
+    raise AssertionError(f"expected {count} queued requests, got {len(crawler.requests)}")
+
+
+async def _pre_navigate(crawler: _FakeCrawler, context) -> None:
+    """Runs the pre-navigation hooks in Crawlee's order: general hooks, then playwright-only ones."""
+    for hook, _ in sorted(crawler.pre_navigation, key=lambda registered: registered[1]):
+        await hook(context)
+
+
+class _StaticContext:
+    """A request the adaptive crawler served over HTTP: no page, only the parsed response."""
+
+    def __init__(self, unique_key: str, parsed_content: str) -> None:
+        self.request = SimpleNamespace(unique_key=unique_key)
+        self.parsed_content = parsed_content
+
+    @property
+    def page(self):
+        raise RuntimeError("Page was not crawled with PlaywrightCrawler.")
+
+
+def _browser_context(unique_key: str, html: str) -> MagicMock:
+    context = MagicMock()
+    context.request.unique_key = unique_key
+    context.page.content = AsyncMock(return_value=html)
+
+    return context
+
+
+async def test_reads_share_one_keep_alive_crawler_and_resolve_through_the_handler(crawler_cls):
+    service = CrawleeService()
+    page_setup, page_done = AsyncMock(), MagicMock()
+    service.configure_pages(page_setup, page_done)
+
+    first = asyncio.create_task(service.fetch("https://a.com/"))
+    second = asyncio.create_task(service.fetch("https://b.com/"))
+    crawler = await _first_instance(crawler_cls)
+    a, b = await _queued(crawler, 2)
+
+    await crawler.handler(_browser_context(b.unique_key, "<html>b</html>"))
+    context = _browser_context(a.unique_key, "<html>a</html>")
+    await _pre_navigate(crawler, context)
+    await crawler.handler(context)
+
+    assert await first == "<html>a</html>"
+    assert await second == "<html>b</html>"
+    assert len(crawler_cls.instances) == 1
+    assert crawler.kwargs["keep_alive"] is True
+    assert crawler.kwargs["use_session_pool"] is False
+    page_done.assert_called_with(context.page)
+
+    assert [playwright_only for _, playwright_only in crawler.pre_navigation] == [False, True]
+    page_setup.assert_awaited_once_with(context.page)
+    await service.stop()
+
+
+async def test_static_sub_crawl_returns_the_parsed_response(crawler_cls):
+    service = CrawleeService()
+    read = asyncio.create_task(service.fetch("https://a.com/"))
+    crawler = await _first_instance(crawler_cls)
+    (request,) = await _queued(crawler)
+
+    await crawler.handler(_StaticContext(request.unique_key, "<html>static</html>"))
+
+    assert await read == "<html>static</html>"
+    await service.stop()
+
+
+async def test_failed_request_reaches_the_caller(crawler_cls):
+    service = CrawleeService()
+    read = asyncio.create_task(service.fetch("https://a.com/"))
+    crawler = await _first_instance(crawler_cls)
+    (request,) = await _queued(crawler)
+
+    await crawler.failed_handler(SimpleNamespace(request=request), TimeoutError("navigation timed out"))
+
+    with pytest.raises(TimeoutError):
+        await read
+    await service.stop()
+
+
+async def test_cancelled_read_is_never_rendered(crawler_cls):
+    service = CrawleeService()
+    page_setup = AsyncMock()
+    service.configure_pages(page_setup, MagicMock())
+    read = asyncio.create_task(service.fetch("https://a.com/"))
+    crawler = await _first_instance(crawler_cls)
+    (request,) = await _queued(crawler)
+
+    read.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await read
+
+    context = _browser_context(request.unique_key, "<html>a</html>")
+    context.page.close = AsyncMock()
+    with pytest.raises(ContextPipelineInterruptedError):
+        await _pre_navigate(crawler, context)
+    context.page.close.assert_awaited_once()
+    page_setup.assert_not_awaited()
+
+    # Already past navigation when the caller left: the HTML is not even read.
+    await crawler.handler(context)
+    context.page.content.assert_not_awaited()
+    await service.stop()
+
+
+async def test_crawler_is_recycled_after_max_reads_once_its_reads_finish(crawler_cls):
+    service = CrawleeService()
+    with patch("src.runtime.crawlee_service.settings.CRAWLEE_RECYCLE_AFTER_READS", 2):
+        reads = [asyncio.create_task(service.fetch(f"https://site.com/{n}")) for n in range(3)]
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+    old, new = crawler_cls.instances
+    old_requests = await _queued(old, 2)
+    assert len(await _queued(new)) == 1
+
+    await old.handler(_browser_context(old_requests[0].unique_key, "0"))
+    assert await reads[0] == "0"
+    assert not old.stopped.is_set()
+
+    await old.handler(_browser_context(old_requests[1].unique_key, "1"))
+    assert await reads[1] == "1"
+    assert old.stop_reasons == ["retired"]
+    assert not new.stopped.is_set()
+
+    await service.stop()
+    with pytest.raises(RuntimeError):
+        await reads[2]
+
+
+async def test_crashed_crawler_fails_its_reads_and_is_replaced(crawler_cls):
+    service = CrawleeService()
+    read = asyncio.create_task(service.fetch("https://a.com/"))
+    crashed = await _first_instance(crawler_cls)
+    await _queued(crashed)
+
+    crashed.stopped.set()
+    with pytest.raises(RuntimeError, match="stopped before the read finished"):
+        await read
+    # The start succeeded, the crash did not.
+    assert circuit_breakers.get("crawlee").snapshot()["failure_rate"] == 0.5
+
+    retry = asyncio.create_task(service.fetch("https://a.com/"))
+    await asyncio.sleep(0)
+    assert len(crawler_cls.instances) == 2
+    retry.cancel()
+    await service.stop()
+
+
+async def test_server_keeps_its_sigint_handler(crawler_cls):
+    def host_handler(_signum, _frame):
+        return None
+
+    previous = signal.signal(signal.SIGINT, host_handler)
+    try:
+        service = CrawleeService()
+        read = asyncio.create_task(service.fetch("https://a.com/"))
+        await _queued(await _first_instance(crawler_cls))
+
+        assert signal.getsignal(signal.SIGINT) is host_handler
+        read.cancel()
+        await service.stop()
+    finally:
+        signal.signal(signal.SIGINT, previous)
+
+
+async def test_shared_controller_closes_contexts_but_never_the_browser():
+    browser = MagicMock()
+    browser.close = AsyncMock()
+    browser.is_connected = MagicMock(return_value=True)
+    controller = _SharedChromiumController(browser, use_incognito_pages=True, max_open_pages_per_browser=2)
+    page = MagicMock()
+    page.context.close = AsyncMock()
+    controller._pages.append(page)
+
+    assert controller.has_free_capacity
+    browser.is_connected.return_value = False
+    assert not controller.has_free_capacity
+
+    with pytest.raises(ValueError, match="open pages"):
+        await controller.close()
+    await controller.close(force=True)
+
+    page.context.close.assert_awaited_once()
+    browser.close.assert_not_awaited()
+
+
+async def test_shared_controller_closes_each_page_context_with_its_page():
+    controller = _SharedChromiumController(MagicMock(), use_incognito_pages=True)
+    page = MagicMock()
+    page.context.close = AsyncMock()
+    with patch(
+        "src.runtime.crawlee_service.PlaywrightBrowserController.new_page", AsyncMock(return_value=page)
+    ):
+        assert await controller.new_page() is page
+
+    event, on_close = page.once.call_args.args
+    assert event == "close"
+    await on_close(page)
+    page.context.close.assert_awaited_once()
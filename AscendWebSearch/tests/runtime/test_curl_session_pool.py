@@ -0,0 +1,157 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from curl_cffi import CurlOpt
+
+from src.runtime.curl_session_pool import CurlSessionPool
+
+
+@pytest.fixture
+def session_cls():
+    def make_session(**kwargs):
+        session = MagicMock()
+        session.close = AsyncMock()
+        session.kwargs = kwargs
+
+        return session
+
+    with patch("src.runtime.curl_session_pool.requests.AsyncSession", side_effect=make_session) as cls:
+        yield cls
+
+
+@pytest.fixture
+def clock():
+    now = [1000.0]
+    with patch("src.runtime.curl_session_pool.time.monotonic", side_effect=lambda: now[0]):
+        yield now
+
+
+async def _checkout(pool: CurlSessionPool, url: str, **kwargs) -> MagicMock:
+    async with pool.session(url, **kwargs) as session:
+        return session
+
+
+async def test_same_origin_reuses_one_session(session_cls):
+    pool = CurlSessionPool()
+
+    first = await _checkout(pool, "https://site.com/a", impersonate="chrome120")
+    second = await _checkout(pool, "https://SITE.com/b?page=2", impersonate="chrome120")
+
+    assert first is second
+    assert session_cls.call_count == 1
+    assert first.kwargs == {"impersonate": "chrome120", "curl_options": {}}
+
+
+@pytest.mark.parametrize(
+    ("url", "kwargs"),
+    [
+        ("http://site.com/a", {"impersonate": "chrome120"}),
+        ("https://site.com:8443/a", {"impersonate": "chrome120"}),
+        ("https://other.com/a", {"impersonate": "chrome120"}),
+        ("https://site.com/a", {"impersonate": None}),
+        ("https://site.com/a", {"impersonate": "chrome120", "identity": "ua|clearance"}),
+    ],
+)
+async def test_origin_profile_and_identity_each_get_their_own_session(session_cls, url, kwargs):
+    pool = CurlSessionPool()
+
+    base = await _checkout(pool, "https://site.com/", impersonate="chrome120")
+
+    assert await _checkout(pool, url, **kwargs) is not base
+
+
+async def test_changed_pins_retire_the_session(session_cls):
+    pool = CurlSessionPool()
+    old_pin = {CurlOpt.RESOLVE: ["site.com:443:93.184.216.34"]}
+    new_pin = {CurlOpt.RESOLVE: ["site.com:443:93.184.216.35"]}
+
+    async with pool.session("https://site.com/", curl_options=old_pin) as in_flight:
+        replacement = await _checkout(pool, "https://site.com/", curl_options=new_pin)
+        # Still serving the first read; closed only once that read releases it.
+        in_flight.close.assert_not_awaited()
+
+    in_flight.close.assert_awaited_once()
+    assert replacement.kwargs["curl_options"] == new_pin
+    assert await _checkout(pool, "https://site.com/", curl_options=new_pin) is replacement
+
+
+async def test_checkout_while_a_repinned_session_closes_shares_the_replacement(session_cls):
+    pool = CurlSessionPool()
+    new_pin = {CurlOpt.RESOLVE: ["site.com:443:93.184.216.35"]}
+    old = await _checkout(pool, "https://site.com/")
+    closing = asyncio.Event()
+    old.close.side_effect = closing.wait
+
+    first = asyncio.create_task(_checkout(pool, "https://site.com/", curl_options=new_pin))
+    await asyncio.sleep(0)
+    second = asyncio.create_task(_checkout(pool, "https://site.com/", curl_options=new_pin))
+    await asyncio.sleep(0)
+    closing.set()
+
+    assert await first is await second
+    assert session_cls.call_count == 2
+    old.close.assert_awaited_once()
+
+
+async def test_idle_sessions_are_closed_on_next_checkout(session_cls, clock):
+    pool = CurlSessionPool()
+    stale = await _checkout(pool, "https://stale.com/")
+    clock[0] += 30
+    fresh = await _checkout(pool, "https://fresh.com/")
+
+    clock[0] += 31
+    await _checkout(pool, "https://other.com/")
+
+    stale.close.assert_awaited_once()
+    fresh.close.assert_not_awaited()
+    assert await _checkout(pool, "https://stale.com/") is not stale
+
+
+async def test_session_repinned_while_idle_sessions_close_is_not_retired_twice(session_cls, clock):
+    pool = CurlSessionPool()
+    new_pin = {CurlOpt.RESOLVE: ["site.com:443:93.184.216.35"]}
+    slow = await _checkout(pool, "https://slow.com/")
+    old = await _checkout(pool, "https://site.com/")
+    closing = asyncio.Event()
+    slow.close.side_effect = closing.wait
+    clock[0] += 61
+
+    # Expires slow.com and site.com, and is stuck closing slow.com ...
+    expiring = asyncio.create_task(_checkout(pool, "https://other.com/"))
+    await asyncio.sleep(0)
+    # ... while site.com is repinned; the expiry must not touch its replacement.
+    replacement = await _checkout(pool, "https://site.com/", curl_options=new_pin)
+    closing.set()
+    await expiring
+
+    old.close.assert_awaited_once()
+    assert await _checkout(pool, "https://site.com/", curl_options=new_pin) is replacement
+
+
+async def test_least_recently_used_idle_session_is_evicted_over_capacity(session_cls):
+    pool = CurlSessionPool()
+
+    with patch("src.runtime.curl_session_pool.settings.CURL_SESSION_POOL_MAX_SESSIONS", 2):
+        a = await _checkout(pool, "https://a.com/")
+        async with pool.session("https://b.com/") as busy:
+            await _checkout(pool, "https://a.com/")
+            await _checkout(pool, "https://c.com/")
+            # a.com was used more recently, but b.com is busy and c.com was just opened.
+            await _checkout(pool, "https://d.com/")
+
+    busy.close.assert_not_awaited()
+    a.close.assert_awaited_once()
+
+
+async def test_close_shuts_every_session_and_tolerates_errors(session_cls):
+    pool = CurlSessionPool()
+    first = await _checkout(pool, "https://a.com/")
+    second = await _checkout(pool, "https://b.com/")
+    first.close.side_effect = RuntimeError("already closed")
+
+    await pool.close()
+
+    first.close.assert_awaited_once()
+    second.close.assert_awaited_once()
+    assert await _checkout(pool, "https://a.com/") is not first
@@ -0,0 +1,115 @@
+import asyncio
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.reader.html_utils import extract_visible_text
+from src.runtime.extraction_pool import ExtractionPool
+
+_HTML = "<html><body><script>var x = 1;</script>" + "<p>Readable paragraph text.</p>" * 50 + "</body></html>"
+
+
+@pytest.fixture
+def pool():
+    pool = ExtractionPool()
+    yield pool
+    pool.close()
+
+
+async def test_small_documents_stay_on_the_event_loop(pool):
+    func = MagicMock(return_value="text")
+    with patch("src.runtime.extraction_pool.settings.EXTRACTION_INLINE_MAX_CHARS", len(_HTML)):
+        assert await pool.run(func, _HTML, "extra") == "text"
+
+    func.assert_called_once_with(_HTML, "extra")
+    assert pool._executor is None
+
+
+async def test_large_documents_are_extracted_in_a_worker_process(pool):
+    with patch("src.runtime.extraction_pool.settings.EXTRACTION_INLINE_MAX_CHARS", 10):
+        text = await pool.run(extract_visible_text, _HTML)
+
+    assert text == extract_visible_text(_HTML)
+    assert "var x" not in text
+    assert pool._executor is not None
+
+
+async def test_zero_workers_runs_everything_inline(pool):
+    func = MagicMock(return_value="text")
+    with (
+        patch("src.runtime.extraction_pool.settings.EXTRACTION_POOL_WORKERS", 0),
+        patch("src.runtime.extraction_pool.settings.EXTRACTION_INLINE_MAX_CHARS", 10),
+    ):
+        assert await pool.run(func, _HTML) == "text"
+
+    assert pool._executor is None
+
+
+def _executor(*outcomes) -> MagicMock:
+    """An executor whose submit() answers with each outcome in turn: a result or an exception."""
+    executor = MagicMock()
+
+    def submit(*_args):
+        future: Future = Future()
+        outcome = outcomes[min(executor.submit.call_count - 1, len(outcomes) - 1)]
+        if isinstance(outcome, BaseException):
+            future.set_exception(outcome)
+        else:
+            future.set_result(outcome)
+        return future
+
+    executor.submit.side_effect = submit
+    return executor
+
+
+async def test_broken_pool_is_replaced_and_the_call_retried_in_a_fresh_worker(pool):
+    broken, fresh = _executor(BrokenProcessPool("worker died")), _executor("text")
+    pool._executor = broken
+    func = MagicMock()
+
+    with (
+        patch("src.runtime.extraction_pool.settings.EXTRACTION_INLINE_MAX_CHARS", 10),
+        patch("src.runtime.extraction_pool.ProcessPoolExecutor", return_value=fresh),
+    ):
+        assert await pool.run(func, _HTML) == "text"
+
+    func.assert_not_called()
+    broken.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+    assert pool._executor is fresh
+
+
+async def test_document_that_breaks_the_fresh_pool_too_is_never_run_inline(pool):
+    pool._executor = _executor(BrokenProcessPool("worker died"))
+    func = MagicMock()
+
+    with (
+        patch("src.runtime.extraction_pool.settings.EXTRACTION_INLINE_MAX_CHARS", 10),
+        patch(
+            "src.runtime.extraction_pool.ProcessPoolExecutor",
+            return_value=_executor(BrokenProcessPool("worker died again")),
+        ),
+        pytest.raises(BrokenProcessPool),
+    ):
+        await pool.run(func, _HTML)
+
+    func.assert_not_called()
+    assert pool._executor is None
+
+
+async def test_calls_in_flight_on_a_broken_pool_share_one_replacement(pool):
+    broken, fresh = _executor(BrokenProcessPool("worker died")), _executor("text")
+    pool._executor = broken
+
+    with (
+        patch("src.runtime.extraction_pool.settings.EXTRACTION_INLINE_MAX_CHARS", 10),
+        patch("src.runtime.extraction_pool.ProcessPoolExecutor", return_value=fresh) as pool_cls,
+    ):
+        assert await asyncio.gather(pool.run(MagicMock(), _HTML), pool.run(MagicMock(), _HTML)) == [
+            "text",
+            "text",
+        ]
+
+    pool_cls.assert_called_once()
+    fresh.shutdown.assert_not_called()
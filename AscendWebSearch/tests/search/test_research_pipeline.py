@@ -0,0 +1,106 @@
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from src.reader.batch_reader import BatchReader
+from src.search.research_pipeline import ResearchPipeline, trim_to_budget
+
+
+def _hit(url: str, title: str = "t") -> dict:
+    return {
+        "title": title,
+        "url": url,
+        "content": f"snippet {url}",
+        "engine": "brave",
+        "score": 1.0,
+        "published_date": None,
+    }
+
+
+def _pipeline(hits: list[dict], read) -> tuple[ResearchPipeline, AsyncMock]:
+    search_client = MagicMock()
+    search_client.search = AsyncMock(return_value=hits)
+    web_reader = MagicMock()
+    web_reader.read = read
+    web_reader.read_with_links = read
+
+    return ResearchPipeline(search_client, BatchReader(web_reader)), search_client.search
+
+
+@pytest.fixture(autouse=True)
+def allow_all_urls(monkeypatch):
+    monkeypatch.setattr("src.reader.batch_reader.is_safe_external_url", AsyncMock(return_value=True))
+
+
+@pytest.mark.asyncio
+async def test_find_sources_dedupes_by_canonical_url_and_over_fetches():
+    hits = [
+        _hit("https://a.com/page?utm_source=x"),
+        _hit("https://A.com/page"),
+        _hit("https://b.com/"),
+        _hit("https://c.com/"),
+    ]
+    pipeline, search = _pipeline(hits, AsyncMock())
+
+    sources = await pipeline.find_sources("query", k=2)
+
+    assert [source["url"] for source in sources] == ["https://a.com/page?utm_source=x", "https://b.com/"]
+    search.assert_awaited_once_with(query="query", limit=4)
+
+
+@pytest.mark.asyncio
+async def test_research_streams_documents_with_search_metadata_as_they_finish():
+    delays = {"https://slow.com/": 0.05, "https://fast.com/": 0.0}
+
+    async def read(url, heavy_mode=False):
+        await asyncio.sleep(delays[url])
+        return {"content": f"body of {url}", "status": "success", "mode": "1-beautifulsoup"}
+
+    pipeline, _ = _pipeline([_hit("https://slow.com/", "Slow"), _hit("https://fast.com/", "Fast")], read)
+
+    documents = [document async for document in pipeline.research("q", k=2, deadline_seconds=5)]
+
+    assert [document["title"] for document in documents] == ["Fast", "Slow"]
+    assert documents[0]["index"] == 1
+    assert documents[0]["snippet"] == "snippet https://fast.com/"
+    assert documents[0]["content"] == "body of https://fast.com/"
+    assert "truncated" not in documents[0]
+
+
+@pytest.mark.asyncio
+async def test_research_trims_content_to_the_character_budget():
+    async def read(url, heavy_mode=False):
+        return {"content": "word " * 100, "status": "success"}
+
+    pipeline, _ = _pipeline([_hit("https://a.com/")], read)
+
+    documents = [document async for document in pipeline.research("q", k=1, deadline_seconds=5, max_chars=52)]
+
+    assert documents[0]["content"] == ("word " * 10).strip()
+    assert documents[0]["truncated"] is True
+
+
+@pytest.mark.asyncio
+async def test_read_sources_honours_the_shared_deadline():
+    async def read(url, heavy_mode=False):
+        await asyncio.sleep(10)
+
+    pipeline, _ = _pipeline([], read)
+
+    documents = [
+        document
+        async for document in pipeline.read_sources(
+            [_hit("https://a.com/")], deadline=time.monotonic() + 0.02
+        )
+    ]
+
+    assert documents[0]["status"] == "timeout"
+    assert documents[0]["title"] == "t"
+
+
+def test_trim_to_budget_prefers_word_boundary_but_caps_backtracking():
+    assert trim_to_budget("short", 10) == ("short", False)
+    assert trim_to_budget("alpha beta gamma", 12) == ("alpha beta", True)
+    assert trim_to_budget("a " + "x" * 50, 20) == ("a " + "x" * 18, True)
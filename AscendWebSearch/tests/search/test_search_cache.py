@@ -0,0 +1,149 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import fakeredis
+import pytest
+
+from src.search.search_cache import SearchCache
+
+RESULTS = [{"title": "T", "url": "http://example.com", "content": "C"}]
+
+
+def _local_cache() -> SearchCache:
+    cache = SearchCache()
+    cache.redis_client = None
+
+    return cache
+
+
+@pytest.mark.parametrize(("limit", "bucket"), [(1, 5), (5, 5), (6, 10), (20, 20), (21, 50), (80, 80)])
+def test_limit_bucket(limit, bucket):
+    assert SearchCache.limit_bucket(limit) == bucket
+
+
+def test_build_key_normalizes_query_whitespace_and_case():
+    assert SearchCache.build_key("  Python   Asyncio ", None, "en-US", 5) == SearchCache.build_key(
+        "python asyncio", "", "en-US", 5
+    )
+    assert SearchCache.build_key("q", "news", "en-US", 5) != SearchCache.build_key("q", None, "en-US", 5)
+    assert SearchCache.build_key("q", None, "de-DE", 5) != SearchCache.build_key("q", None, "en-US", 5)
+
+
+@pytest.mark.asyncio
+async def test_second_lookup_is_a_hit():
+    cache = _local_cache()
+    fetch = AsyncMock(return_value=RESULTS)
+    assert await cache.get_or_fetch("k", fetch) == RESULTS
+    assert await cache.get_or_fetch("k", fetch) == RESULTS
+    assert fetch.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_searches_share_one_upstream_call():
+    cache = _local_cache()
+    release = asyncio.Event()
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return RESULTS
+
+    waiters = [asyncio.create_task(cache.get_or_fetch("k", fetch)) for _ in range(5)]
+    await asyncio.sleep(0)
+    release.set()
+    assert await asyncio.gather(*waiters) == [RESULTS] * 5
+    assert calls == 1
+    assert cache._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_leader_does_not_abort_followers():
+    cache = _local_cache()
+    release = asyncio.Event()
+
+    async def fetch():
+        await release.wait()
+        return RESULTS
+
+    leader = asyncio.create_task(cache.get_or_fetch("k", fetch))
+    await asyncio.sleep(0)
+    follower = asyncio.create_task(cache.get_or_fetch("k", fetch))
+    await asyncio.sleep(0)
+    leader.cancel()
+    release.set()
+    assert await follower == RESULTS
+
+
+@pytest.mark.asyncio
+async def test_upstream_error_reaches_every_waiter_and_is_not_cached():
+    cache = _local_cache()
+    fetch = AsyncMock(side_effect=RuntimeError("searxng down"))
+    results = await asyncio.gather(
+        cache.get_or_fetch("k", fetch), cache.get_or_fetch("k", fetch), return_exceptions=True
+    )
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert cache._memory_store == {}
+    assert cache._inflight == {}
+
+
+@pytest.mark.asyncio
+async def test_empty_results_are_not_cached():
+    cache = _local_cache()
+    fetch = AsyncMock(return_value=[])
+    await cache.get_or_fetch("k", fetch)
+    await cache.get_or_fetch("k", fetch)
+    assert fetch.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_entries_expire_after_ttl():
+    cache = _local_cache()
+    fetch = AsyncMock(return_value=RESULTS)
+    with patch("src.search.search_cache.settings.SEARXNG_CACHE_TTL_SECONDS", -1):
+        await cache.get_or_fetch("k", fetch)
+    await cache.get_or_fetch("k", fetch)
+    assert fetch.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_local_lru_is_bounded():
+    cache = _local_cache()
+    with patch("src.search.search_cache.settings.SEARXNG_CACHE_MAX_ENTRIES", 2):
+        for key in ("a", "b", "c"):
+            await cache.get_or_fetch(key, AsyncMock(return_value=RESULTS))
+    assert list(cache._memory_store) == ["b", "c"]
+
+
+@pytest.mark.asyncio
+async def test_redis_tier_is_shared_between_processes():
+    shared = fakeredis.FakeAsyncRedis(decode_responses=True, protocol=2)
+    writer = SearchCache()
+    writer.redis_client = shared
+    await writer.get_or_fetch("k", AsyncMock(return_value=RESULTS))
+
+    reader = SearchCache()
+    reader.redis_client = shared
+    fetch = AsyncMock(return_value=[])
+    assert await reader.get_or_fetch("k", fetch) == RESULTS
+    fetch.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_degrade_to_local_cache():
+    cache = SearchCache()
+    broken = MagicMock()
+    broken.get = AsyncMock(side_effect=ConnectionError("down"))
+    broken.setex = AsyncMock(side_effect=ConnectionError("down"))
+    cache.redis_client = broken
+    fetch = AsyncMock(return_value=RESULTS)
+    await cache.get_or_fetch("k", fetch)
+    await cache.get_or_fetch("k", fetch)
+    assert fetch.await_count == 1
+
+
+def test_init_survives_redis_client_construction_failure():
+    with patch("src.search.search_cache.redis.from_url", side_effect=ValueError("bad dsn")):
+        cache = SearchCache()
+    assert cache.redis_client is None
@@ -1,11 +1,27 @@
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
+import orjson
 import pytest
 
+from src.api.exceptions import CircuitOpenException
 from src.search.search_client import SearxngClient
 
 
+def _html_client() -> SearxngClient:
+    client = SearxngClient()
+    client.json_enabled = False
+
+    return client
+
+
+def _json_client(handler) -> SearxngClient:
+    client = SearxngClient()
+    client.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    return client
+
+
 def _build_html_with_articles(count: int = 1) -> str:
     articles = "".join(
         f"""
@@ -29,7 +45,7 @@ async def test_search_returns_results_for_async_client():
     mock_response.text = html
     mock_response.raise_for_status = MagicMock()
 
-    client = SearxngClient()
+    client = _html_client()
     with patch.object(client.client, "get", new=AsyncMock(return_value=mock_response)):
         results = await client.search("query")
 
@@ -50,7 +66,7 @@ async def test_search_limits_results():
     mock_response.text = html
     mock_response.raise_for_status = MagicMock()
 
-    client = SearxngClient()
+    client = _html_client()
     with patch.object(client.client, "get", new=AsyncMock(return_value=mock_response)):
         results = await client.search("query", limit=2)
 
@@ -75,7 +91,7 @@ async def test_search_skips_article_without_title():
     mock_response.text = html
     mock_response.raise_for_status = MagicMock()
 
-    client = SearxngClient()
+    client = _html_client()
     with patch.object(client.client, "get", new=AsyncMock(return_value=mock_response)):
         results = await client.search("query")
 
@@ -93,7 +109,7 @@ async def test_search_with_categories_forwards_param():
     mock_response.text = "<html></html>"
     mock_response.raise_for_status = MagicMock()
 
-    client = SearxngClient()
+    client = _html_client()
     mock_get = AsyncMock(return_value=mock_response)
     with patch.object(client.client, "get", new=mock_get):
         await client.search("q", categories="news")
@@ -108,7 +124,7 @@ async def test_search_raises_on_http_status_error():
     response = httpx.Response(500, request=request)
     mock_get = AsyncMock(side_effect=httpx.HTTPStatusError("boom", request=request, response=response))
 
-    client = SearxngClient()
+    client = _html_client()
     with patch.object(client.client, "get", new=mock_get):
         with pytest.raises(httpx.HTTPStatusError):
             await client.search("q")
@@ -120,7 +136,7 @@ async def test_search_raises_on_http_status_error():
 async def test_search_raises_on_timeout():
     mock_get = AsyncMock(side_effect=httpx.TimeoutException("timed out"))
 
-    client = SearxngClient()
+    client = _html_client()
     with patch.object(client.client, "get", new=mock_get):
         with pytest.raises(httpx.TimeoutException):
             await client.search("q")
@@ -132,9 +148,175 @@ async def test_search_raises_on_timeout():
 async def test_search_raises_on_transport_error():
     mock_get = AsyncMock(side_effect=httpx.ConnectError("nope"))
 
-    client = SearxngClient()
+    client = _html_client()
     with patch.object(client.client, "get", new=mock_get):
         with pytest.raises(httpx.ConnectError):
             await client.search("q")
 
     await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_search_fails_fast_once_the_searxng_circuit_opens():
+    mock_get = AsyncMock(side_effect=httpx.ConnectError("nope"))
+
+    client = _html_client()
+    with patch.object(client.client, "get", new=mock_get):
+        for _ in range(5):
+            with pytest.raises(httpx.ConnectError):
+                await client.search("q")
+        with pytest.raises(CircuitOpenException):
+            await client.search("q")
+    assert mock_get.await_count == 5
+
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_search_serves_smaller_limits_from_the_cached_bucket():
+    mock_response = MagicMock()
+    mock_response.text = _build_html_with_articles(5)
+    mock_response.raise_for_status = MagicMock()
+
+    client = _html_client()
+    get = AsyncMock(return_value=mock_response)
+    with patch.object(client.client, "get", new=get):
+        first = await client.search("query", limit=5)
+        second = await client.search("Query", limit=2)
+
+    assert len(first) == 5
+    assert len(second) == 2
+    assert get.await_count == 1
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_search_bypasses_cache_when_disabled():
+    mock_response = MagicMock()
+    mock_response.text = _build_html_with_articles(1)
+    mock_response.raise_for_status = MagicMock()
+
+    client = _html_client()
+    get = AsyncMock(return_value=mock_response)
+    with (
+        patch("src.search.search_client.settings.SEARXNG_CACHE_ENABLED", False),
+        patch.object(client.client, "get", new=get),
+    ):
+        await client.search("query")
+        await client.search("query")
+
+    assert get.await_count == 2
+    assert client.cache._memory_store == {}
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_search_parses_json_results_with_engine_score_and_date():
+    payload = {
+        "results": [
+            {
+                "title": " Title 0 ",
+                "url": "http://example.com/0",
+                "content": "Body 0",
+                "engine": "duckduckgo",
+                "score": 2.5,
+                "publishedDate": "2026-01-02T03:04:05",
+            },
+            {"title": "", "url": "http://example.com/untitled"},
+            {"title": "Title 1", "url": "http://example.com/1", "content": None},
+        ]
+    }
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return httpx.Response(200, content=orjson.dumps(payload))
+
+    client = _json_client(handler)
+    results = await client.search("query", categories="news")
+
+    assert requests[0].url.params["format"] == "json"
+    assert requests[0].url.params["categories"] == "news"
+    assert results == [
+        {
+            "title": "Title 0",
+            "url": "http://example.com/0",
+            "content": "Body 0",
+            "engine": "duckduckgo",
+            "score": 2.5,
+            "published_date": "2026-01-02T03:04:05",
+        },
+        {
+            "title": "Title 1",
+            "url": "http://example.com/1",
+            "content": "",
+            "engine": None,
+            "score": None,
+            "published_date": None,
+        },
+    ]
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_search_falls_back_to_html_once_json_is_forbidden():
+    formats: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        formats.append(request.url.params["format"])
+        if request.url.params["format"] == "json":
+            return httpx.Response(403)
+        return httpx.Response(200, text=_build_html_with_articles(1))
+
+    client = _json_client(handler)
+    first = await client.search("one")
+    second = await client.search("two")
+
+    assert formats == ["json", "html", "html"]
+    assert first[0]["title"] == "Title 0"
+    assert second[0]["url"] == "http://example.com/0"
+    assert client.json_enabled is False
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_search_raises_on_json_http_status_error():
+    client = _json_client(lambda request: httpx.Response(502))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        await client.search("q")
+
+    assert client.json_enabled is True
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_html_results_expose_engine_and_published_date():
+    html = """
+    <html><body>
+        <article class="result">
+            <h3><a href="http://example.com/a"><span>Split</span> <b>title</b></a></h3>
+            <p class="content">  Body  </p>
+            <div class="engines"><span>brave</span><span>bing</span></div>
+            <time class="published_date" datetime="2026-02-03 00:00:00">Feb 3, 2026</time>
+        </article>
+    </body></html>
+    """
+
+    results = SearxngClient._parse_html_results(html, limit=5)
+
+    assert results == [
+        {
+            "title": "Splittitle",
+            "url": "http://example.com/a",
+            "content": "Body",
+            "engine": "brave",
+            "score": None,
+            "published_date": "2026-02-03 00:00:00",
+        }
+    ]
+
+
+def test_html_parser_returns_nothing_for_blank_or_unparseable_pages():
+    assert SearxngClient._parse_html_results("   ", limit=5) == []
+    assert SearxngClient._parse_html_results("<!-- only a comment -->", limit=5) == []
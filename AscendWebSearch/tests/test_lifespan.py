@@ -1,4 +1,5 @@
-from unittest.mock import AsyncMock, MagicMock, patch
+import asyncio
+from unittest.mock import AsyncMock, patch
 
 import pytest
 from asgi_lifespan import LifespanManager
@@ -10,13 +11,11 @@ async def test_lifespan_raises_when_blocklist_load_fails():
     """The lifespan must fail hard if BlocklistLoader cannot initialise."""
     from src import main as main_module
 
-    with patch(
-        "src.main.BlocklistLoader",
-    ) as mock_loader_cls:
-        mock_loader = MagicMock()
-        mock_loader.load_rules.side_effect = RuntimeError("network down")
-        mock_loader_cls.return_value = mock_loader
-
+    with patch.object(
+        main_module.blocklist_loader,
+        "load_matcher",
+        side_effect=RuntimeError("no snapshot and network down"),
+    ):
         # Build a fresh app so we exercise the new lifespan.
         app = main_module.create_app()
         with pytest.raises(RuntimeError):
@@ -64,3 +63,73 @@ async def test_lifespan_logs_warning_when_mcp_search_client_close_fails():
         app: FastAPI = main_module.create_app()
         async with LifespanManager(app):
             pass
+
+
+@pytest.mark.asyncio
+async def test_lifespan_runs_blocklist_refresh_in_background_until_shutdown():
+    from src import main as main_module
+
+    cancelled = asyncio.Event()
+
+    async def refresh_loop():
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with patch.object(main_module.blocklist_loader, "run_refresh_loop", side_effect=refresh_loop):
+        app: FastAPI = main_module.create_app()
+        async with LifespanManager(app):
+            assert not cancelled.is_set()
+
+        await asyncio.wait_for(cancelled.wait(), timeout=1)
+
+
+@pytest.mark.asyncio
+async def test_lifespan_waits_for_background_tasks_before_closing_pools():
+    from src import main as main_module
+
+    order: list[str] = []
+
+    async def refresh_loop():
+        try:
+            await asyncio.sleep(3600)
+        except asyncio.CancelledError:
+            # Still using its clients while it unwinds.
+            await asyncio.sleep(0)
+            order.append("refresh stopped")
+            raise
+
+    async def close_pools():
+        order.append("pools closed")
+
+    with (
+        patch.object(main_module.blocklist_loader, "run_refresh_loop", side_effect=refresh_loop),
+        patch.object(main_module.curl_session_pool, "close", side_effect=close_pools),
+    ):
+        app: FastAPI = main_module.create_app()
+        async with LifespanManager(app):
+            pass
+
+    assert order == ["refresh stopped", "pools closed"]
+
+
+@pytest.mark.asyncio
+async def test_lifespan_starts_no_background_tasks_when_the_browser_fails_to_start():
+    from src import main as main_module
+
+    with (
+        patch.object(main_module.browser_pool, "start", AsyncMock(side_effect=RuntimeError("no chromium"))),
+        patch.object(main_module.blocklist_loader, "run_refresh_loop") as refresh_loop,
+        patch.object(main_module.cookie_manager, "run_invalidation_listener") as listener,
+        patch.object(main_module, "monitor_event_loop_lag") as loop_lag,
+    ):
+        app: FastAPI = main_module.create_app()
+        with pytest.raises(RuntimeError, match="no chromium"):
+            async with LifespanManager(app):
+                pass
+
+    refresh_loop.assert_not_called()
+    listener.assert_not_called()
+    loop_lag.assert_not_called()
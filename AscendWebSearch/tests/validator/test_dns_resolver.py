@@ -0,0 +1,136 @@
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import dns.exception
+import dns.resolver
+import pytest
+
+from src.validator.dns_resolver import DNSResolver, pin_addresses, pinned_addresses_ctx
+
+
+def _answers(ttls_and_addresses: dict[int, list[str]]) -> MagicMock:
+    answers = MagicMock()
+    answers.addresses.return_value = iter([a for addresses in ttls_and_addresses.values() for a in addresses])
+    answers.values.return_value = [MagicMock(rrset=MagicMock(ttl=ttl)) for ttl in ttls_and_addresses]
+
+    return answers
+
+
+def _resolver(*results) -> tuple[DNSResolver, AsyncMock]:
+    backend = MagicMock()
+    backend.resolve_name = AsyncMock(side_effect=list(results))
+
+    return DNSResolver(backend), backend.resolve_name
+
+
+@pytest.fixture
+def clock():
+    now = [1000.0]
+    with patch("src.validator.dns_resolver.time.monotonic", side_effect=lambda: now[0]):
+        yield now
+
+
+async def test_answer_is_cached_for_the_record_ttl(clock):
+    resolver, resolve_name = _resolver(_answers({60: ["93.184.216.34"]}), _answers({60: ["93.184.216.35"]}))
+
+    assert await resolver.resolve("Example.com.") == ("93.184.216.34",)
+    clock[0] += 59
+    assert await resolver.resolve("example.com") == ("93.184.216.34",)
+    assert resolve_name.await_count == 1
+
+    clock[0] += 2
+    assert await resolver.resolve("example.com") == ("93.184.216.35",)
+    assert resolve_name.await_count == 2
+
+
+async def test_shortest_ttl_wins_and_is_capped(clock):
+    resolver, resolve_name = _resolver(
+        _answers({30: ["2001:db8::1"], 600: ["93.184.216.34"]}),
+        _answers({86400: ["93.184.216.34"]}),
+        _answers({86400: ["93.184.216.34"]}),
+    )
+
+    await resolver.resolve("example.com")
+    clock[0] += 31
+    await resolver.resolve("example.com")
+    clock[0] += 299
+    await resolver.resolve("example.com")
+    assert resolve_name.await_count == 2
+
+    clock[0] += 2
+    await resolver.resolve("example.com")
+    # The one-day TTL was capped at DNS_CACHE_MAX_TTL_SECONDS.
+    assert resolve_name.await_count == 3
+
+
+async def test_zero_ttl_is_never_cached(clock):
+    resolver, resolve_name = _resolver(_answers({0: ["93.184.216.34"]}), _answers({0: ["93.184.216.34"]}))
+
+    await resolver.resolve("example.com")
+    await resolver.resolve("example.com")
+
+    assert resolve_name.await_count == 2
+
+
+@pytest.mark.parametrize("error", [dns.resolver.NXDOMAIN(), dns.resolver.NoAnswer()])
+async def test_nonexistent_names_are_cached_negatively(clock, error):
+    resolver, resolve_name = _resolver(error, _answers({60: ["93.184.216.34"]}))
+
+    assert await resolver.resolve("nope.invalid") == ()
+    clock[0] += 29
+    assert await resolver.resolve("nope.invalid") == ()
+    assert resolve_name.await_count == 1
+
+    clock[0] += 2
+    assert await resolver.resolve("nope.invalid") == ("93.184.216.34",)
+
+
+async def test_timeouts_are_not_cached(clock):
+    resolver, resolve_name = _resolver(dns.exception.Timeout(), _answers({60: ["93.184.216.34"]}))
+
+    assert await resolver.resolve("slow.example") == ()
+    assert await resolver.resolve("slow.example") == ("93.184.216.34",)
+    assert resolve_name.await_count == 2
+
+
+async def test_concurrent_lookups_of_one_host_share_a_query():
+    release = asyncio.Event()
+    backend = MagicMock()
+
+    async def resolve_name(host, **kwargs):
+        await release.wait()
+        return _answers({60: ["93.184.216.34"]})
+
+    backend.resolve_name = AsyncMock(side_effect=resolve_name)
+    resolver = DNSResolver(backend)
+
+    readers = [asyncio.create_task(resolver.resolve("example.com")) for _ in range(5)]
+    await asyncio.sleep(0)
+    readers[0].cancel()
+    release.set()
+    results = await asyncio.gather(*readers, return_exceptions=True)
+
+    assert backend.resolve_name.await_count == 1
+    assert isinstance(results[0], asyncio.CancelledError)
+    assert results[1:] == [("93.184.216.34",)] * 4
+
+
+async def test_cache_is_bounded(clock):
+    resolver, _ = _resolver(*(_answers({60: [f"93.184.216.{i}"]}) for i in range(3)))
+
+    with patch("src.validator.dns_resolver._CACHE_MAX_HOSTS", 2):
+        for host in ("a.com", "b.com", "c.com"):
+            await resolver.resolve(host)
+
+    assert list(resolver._cache) == ["b.com", "c.com"]
+
+
+def test_pins_accumulate_per_host():
+    token = pinned_addresses_ctx.set(None)
+    try:
+        pin_addresses("A.com", ("93.184.216.34",))
+        pin_addresses("b.com", ("2001:db8::1",))
+
+        assert pinned_addresses_ctx.get() == {"a.com": ("93.184.216.34",), "b.com": ("2001:db8::1",)}
+    finally:
+        pinned_addresses_ctx.reset(token)
@@ -0,0 +1,207 @@
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.validator.resource_policy import PageTraffic, ResourcePolicy
+
+
+def _policy(adblocked: bool = False) -> ResourcePolicy:
+    url_validator = MagicMock()
+    url_validator.should_block.return_value = adblocked
+
+    return ResourcePolicy(url_validator)
+
+
+def _request(
+    url: str = "https://site.com/app.js",
+    resource_type: str = "script",
+    navigation: bool = False,
+    main_frame: bool = True,
+) -> MagicMock:
+    request = MagicMock()
+    request.url = url
+    request.resource_type = resource_type
+    request.is_navigation_request.return_value = navigation
+    request.frame.parent_frame = None if main_frame else MagicMock()
+
+    return request
+
+
+def _page() -> tuple[MagicMock, dict]:
+    listeners: dict = {}
+    page = MagicMock()
+    page.on = MagicMock(side_effect=listeners.__setitem__)
+    page.route = AsyncMock()
+    page.route_web_socket = AsyncMock()
+
+    return page, listeners
+
+
+def _web_socket(url: str = "wss://site.com/live") -> MagicMock:
+    ws = MagicMock()
+    ws.url = url
+    ws.close = AsyncMock()
+
+    return ws
+
+
+@pytest.mark.parametrize("resource_type", ["image", "media", "font"])
+def test_default_blocked_resource_types(resource_type):
+    assert _policy().block_reason(_request(resource_type=resource_type), PageTraffic("t")) == "resource_type"
+
+
+def test_stylesheets_load_unless_configured():
+    stylesheet = _request(resource_type="stylesheet")
+    assert _policy().block_reason(stylesheet, PageTraffic("t")) is None
+
+    with patch(
+        "src.validator.resource_policy.settings.BROWSER_BLOCKED_RESOURCE_TYPES",
+        ["image", "stylesheet"],
+    ):
+        assert _policy().block_reason(stylesheet, PageTraffic("t")) == "resource_type"
+
+
+def test_blocklist_applies_to_every_request_including_the_document():
+    document = _request(resource_type="document", navigation=True)
+
+    assert _policy(adblocked=True).block_reason(document, PageTraffic("t")) == "adblock"
+
+
+def test_main_document_is_exempt_from_type_and_budget():
+    traffic = PageTraffic("t")
+    traffic.bytes = 10**9
+    document = _request(resource_type="document", navigation=True)
+
+    with patch("src.validator.resource_policy.settings.BROWSER_BLOCKED_RESOURCE_TYPES", ["document"]):
+        assert _policy().block_reason(document, traffic) is None
+
+
+def test_byte_budget_blocks_once_reached_and_zero_disables_it():
+    traffic = PageTraffic("t")
+    traffic.bytes = 1000
+    iframe = _request(resource_type="document", navigation=True, main_frame=False)
+
+    with patch("src.validator.resource_policy.settings.BROWSER_PAGE_BYTE_BUDGET", 1000):
+        assert _policy().block_reason(iframe, traffic) == "byte_budget"
+        assert _policy().block_reason(_request(), PageTraffic("t")) is None
+
+    with patch("src.validator.resource_policy.settings.BROWSER_PAGE_BYTE_BUDGET", 0):
+        assert _policy().block_reason(_request(), traffic) is None
+
+
+@pytest.mark.parametrize(
+    ("request_", "is_stream"),
+    [
+        (_request(resource_type="eventsource"), True),
+        (_request(url="https://site.com/socket.io/?EIO=4&transport=polling", resource_type="xhr"), True),
+        (_request(url="https://site.com/api/longpoll?since=1", resource_type="fetch"), True),
+        (_request(url="https://site.com/updates/poll", resource_type="xhr"), True),
+        (_request(url="https://site.com/api/polls/results", resource_type="xhr"), False),
+        (_request(url="https://site.com/api/article", resource_type="fetch"), False),
+        (_request(url="https://site.com/longpoll.js", resource_type="script"), False),
+    ],
+)
+def test_streams_are_cut_only_after_dom_content_loaded(request_, is_stream):
+    policy = _policy()
+    traffic = PageTraffic("t")
+    assert policy.block_reason(request_, traffic) is None
+
+    traffic.dom_content_loaded = True
+    assert policy.block_reason(request_, traffic) == ("stream" if is_stream else None)
+
+    with patch("src.validator.resource_policy.settings.BROWSER_CUT_STREAMS_AFTER_DOMCONTENTLOADED", False):
+        assert _policy().block_reason(request_, traffic) is None
+
+
+@pytest.mark.asyncio
+async def test_route_handler_continues_or_aborts_and_counts():
+    policy = _policy()
+    page, _ = _page()
+    await policy.attach(page, "4-playwright_stealth")
+
+    allowed, blocked = MagicMock(request=_request()), MagicMock(request=_request(resource_type="image"))
+    for route in (allowed, blocked):
+        route.continue_ = AsyncMock()
+        route.abort = AsyncMock()
+        await policy.handle_route(page, route)
+
+    allowed.continue_.assert_awaited_once()
+    blocked.abort.assert_awaited_once()
+    traffic = policy.record(page)
+    assert traffic is not None
+    assert traffic.requests == 2
+    assert traffic.blocked == {"resource_type": 1}
+
+
+@pytest.mark.asyncio
+async def test_attach_registers_routes_once_and_reattach_resets_counters():
+    policy = _policy()
+    page, listeners = _page()
+
+    await policy.attach(page, "5-crawlee_adaptive")
+    policy.record(page).requests = 7
+    await policy.attach(page, "5-crawlee_adaptive")
+
+    page.route.assert_awaited_once()
+    page.route_web_socket.assert_awaited_once()
+    assert set(listeners) == {"domcontentloaded", "requestfinished"}
+    assert policy.record(page).requests == 0
+
+
+@pytest.mark.asyncio
+async def test_request_finished_adds_transfer_sizes():
+    policy = _policy()
+    page, listeners = _page()
+    await policy.attach(page, "t")
+
+    request = MagicMock()
+    request.sizes = AsyncMock(return_value={"responseBodySize": 1200, "responseHeadersSize": 300})
+    await listeners["requestfinished"](request)
+    request.sizes = AsyncMock(return_value={"responseBodySize": -1, "responseHeadersSize": 100})
+    await listeners["requestfinished"](request)
+    request.sizes = AsyncMock(side_effect=RuntimeError("page closed"))
+    await listeners["requestfinished"](request)
+
+    assert policy.record(page).bytes == 1600
+
+
+@pytest.mark.asyncio
+async def test_web_sockets_are_closed_at_dom_content_loaded():
+    policy = _policy()
+    page, listeners = _page()
+    await policy.attach(page, "t")
+
+    early = _web_socket()
+    await policy.handle_web_socket(page, early)
+    early.connect_to_server.assert_called_once()
+
+    await listeners["domcontentloaded"](page)
+    early.close.assert_awaited_once()
+
+    late = _web_socket()
+    await policy.handle_web_socket(page, late)
+    late.connect_to_server.assert_not_called()
+    late.close.assert_awaited_once()
+    assert policy.record(page).blocked == {"stream": 2}
+
+
+@pytest.mark.asyncio
+async def test_blocklisted_web_socket_is_never_connected():
+    policy = _policy(adblocked=True)
+    page, _ = _page()
+    await policy.attach(page, "t")
+
+    ws = _web_socket("wss://tracker.example/collect")
+    await policy.handle_web_socket(page, ws)
+
+    ws.connect_to_server.assert_not_called()
+    assert policy.record(page).blocked == {"adblock": 1}
+
+
+def test_record_and_reset_ignore_unattached_pages():
+    policy = _policy()
+    page, _ = _page()
+
+    policy.reset(page)
+
+    assert policy.record(page) is None
@@ -1,8 +1,8 @@
-import socket
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
+from src.validator.dns_resolver import pinned_addresses_ctx
 from src.validator.url_validator import URLValidator, is_safe_external_url
 
 
@@ -47,52 +47,82 @@ async def test_route_handler_aborts_for_blocked(mock_blocklist):
     route.abort.assert_awaited_once()
 
 
-def _addr(ip: str):
-    return (socket.AF_INET, 0, 0, "", (ip, 0))
+def _resolves_to(*addresses: str):
+    return patch(
+        "src.validator.url_validator.dns_resolver.resolve",
+        new=AsyncMock(return_value=addresses),
+    )
 
 
-def test_is_safe_external_url_valid_public_address():
-    with patch("src.validator.url_validator.socket.getaddrinfo", return_value=[_addr("93.184.216.34")]):
-        assert is_safe_external_url("https://example.com") is True
+@pytest.fixture(autouse=True)
+def _fresh_pins():
+    token = pinned_addresses_ctx.set(None)
+    yield
+    pinned_addresses_ctx.reset(token)
 
 
-def test_is_safe_external_url_rejects_non_http_scheme():
-    assert is_safe_external_url("ftp://example.com") is False
+async def test_is_safe_external_url_valid_public_address():
+    with _resolves_to("93.184.216.34"):
+        assert await is_safe_external_url("https://example.com") is True
 
 
-def test_is_safe_external_url_rejects_no_host():
-    assert is_safe_external_url("http://") is False
+async def test_is_safe_external_url_pins_the_vetted_addresses():
+    with _resolves_to("2606:2800:220:1::1", "93.184.216.34"):
+        assert await is_safe_external_url("https://Example.com/page") is True
 
+    assert pinned_addresses_ctx.get() == {"example.com": ("2606:2800:220:1::1", "93.184.216.34")}
 
-def test_is_safe_external_url_unresolvable_returns_false():
-    with patch("src.validator.url_validator.socket.getaddrinfo", side_effect=socket.gaierror("nope")):
-        assert is_safe_external_url("http://nope.invalid") is False
 
+async def test_is_safe_external_url_does_not_pin_rejected_hosts():
+    with _resolves_to("10.0.0.1"):
+        assert await is_safe_external_url("http://internal") is False
 
-def test_is_safe_external_url_rejects_loopback():
-    with patch("src.validator.url_validator.socket.getaddrinfo", return_value=[_addr("127.0.0.1")]):
-        assert is_safe_external_url("http://localhost") is False
+    assert pinned_addresses_ctx.get() is None
 
 
-def test_is_safe_external_url_rejects_private():
-    with patch("src.validator.url_validator.socket.getaddrinfo", return_value=[_addr("10.0.0.1")]):
-        assert is_safe_external_url("http://internal") is False
+async def test_is_safe_external_url_ip_literal_skips_dns():
+    with _resolves_to() as resolve:
+        assert await is_safe_external_url("http://93.184.216.34/") is True
+        assert await is_safe_external_url("http://[::1]:8080/") is False
 
+    resolve.assert_not_awaited()
 
-def test_is_safe_external_url_rejects_link_local_aws_imds():
-    with patch("src.validator.url_validator.socket.getaddrinfo", return_value=[_addr("169.254.169.254")]):
-        assert is_safe_external_url("http://imds") is False
 
+async def test_is_safe_external_url_rejects_non_http_scheme():
+    assert await is_safe_external_url("ftp://example.com") is False
 
-def test_is_safe_external_url_handles_value_error_in_ip_parse():
-    # malformed address returned by getaddrinfo (artificial)
-    with patch(
-        "src.validator.url_validator.socket.getaddrinfo",
-        return_value=[(socket.AF_INET, 0, 0, "", ("not-an-ip", 0))],
-    ):
-        assert is_safe_external_url("http://example.com") is False
 
+async def test_is_safe_external_url_rejects_no_host():
+    assert await is_safe_external_url("http://") is False
 
-def test_is_safe_external_url_handles_urlparse_exception():
+
+async def test_is_safe_external_url_unresolvable_returns_false():
+    with _resolves_to():
+        assert await is_safe_external_url("http://nope.invalid") is False
+
+
+@pytest.mark.parametrize(
+    "address",
+    [
+        "127.0.0.1",  # loopback
+        "10.0.0.1",  # RFC1918
+        "169.254.169.254",  # link-local, AWS IMDS
+        "::ffff:127.0.0.1",  # IPv4-mapped loopback
+        "0.0.0.0",
+    ],
+)
+async def test_is_safe_external_url_rejects_non_routable(address):
+    # One bad address is enough: the fetch could connect to any of them.
+    with _resolves_to("93.184.216.34", address):
+        assert await is_safe_external_url("http://example.com") is False
+
+
+async def test_is_safe_external_url_handles_value_error_in_ip_parse():
+    # malformed address returned by the resolver (artificial)
+    with _resolves_to("not-an-ip"):
+        assert await is_safe_external_url("http://example.com") is False
+
+
+async def test_is_safe_external_url_handles_urlparse_exception():
     with patch("src.validator.url_validator.urlparse", side_effect=ValueError("bad")):
-        assert is_safe_external_url("http://example.com") is False
+        assert await is_safe_external_url("http://example.com") is False